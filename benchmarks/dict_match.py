@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Dict & FIX match benchmark.
+
+Matches FIX message sized dicts (``--tags`` tags with a repeating group of
+``--groups`` entries and a few callable / regex expectations) many times,
+as a testcase checking every message of a session would, and reports the
+time per match of each report mode with plain and compiled expected dicts.
+
+Usage::
+
+    python benchmarks/dict_match.py --count 2000 --tags 500
+"""
+from __future__ import print_function
+
+import argparse
+import re
+import time
+
+from testplan.common.utils import comparison
+from testplan.testing.multitest.entries import assertions
+
+REPORT_MODES = (
+    comparison.ReportOptions.ALL,
+    comparison.ReportOptions.FAILS_ONLY,
+)
+
+
+def make_messages(tags, groups):
+    """
+    Returns an actual FIX message like dict and the expected dict matching
+    it, numeric tags are mapped to strings and ints.
+    """
+    value = {tag: 'value{}'.format(tag) if tag % 2 else tag
+             for tag in range(1, tags + 1)}
+    value[555] = [{600: 'SYM{}'.format(idx), 623: idx, 624: '1'}
+                  for idx in range(groups)]
+
+    expected = dict(value)
+    expected[38] = comparison.Greater(0)
+    expected[55] = re.compile(r'value\d+')
+    expected[555] = [dict(group) for group in value[555]]
+    return value, expected
+
+
+def measure(value, expected, count, report_mode, cmp_func):
+    """Returns the time in seconds of ``count`` DictMatch entries."""
+    start = time.time()
+    for _ in range(count):
+        entry = assertions.DictMatch(
+            value=value, expected=expected, report_mode=report_mode,
+            value_cmp_func=cmp_func)
+        assert entry.passed
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=2000,
+                        help='Number of matches of each variant.')
+    parser.add_argument('--tags', type=int, default=500,
+                        help='Number of tags of the messages.')
+    parser.add_argument('--groups', type=int, default=10,
+                        help='Number of entries of the repeating group.')
+    args = parser.parse_args()
+
+    value, expected = make_messages(args.tags, args.groups)
+    compiled = comparison.compile_dict(expected)
+
+    for cmp_name in ('native_equality', 'stringify'):
+        cmp_func = comparison.COMPARE_FUNCTIONS[cmp_name]
+        for report_mode in REPORT_MODES:
+            for label, rhs in (('dict', expected), ('compiled', compiled)):
+                elapsed = measure(
+                    value, rhs, args.count, report_mode, cmp_func)
+                print('{:<16} {:<11} {:<9} {:>10.1f} us/match'.format(
+                    cmp_name, report_mode.name, label,
+                    elapsed * 1e6 / args.count))
+
+
+if __name__ == '__main__':
+    main()
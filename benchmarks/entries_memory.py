@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Memory benchmark of assertion entries.
+
+Creates a large number of ``Equal`` / ``DictMatch`` entries, as a testcase
+making that many assertions would, and reports the memory they hold until
+they get serialized.
+
+Usage::
+
+    python benchmarks/entries_memory.py --count 1000000
+"""
+from __future__ import print_function
+
+import argparse
+import gc
+import time
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+    import resource
+
+from testplan.testing.multitest.entries import assertions
+
+
+def make_equal(idx):
+    return assertions.Equal(idx, idx, description='Equal')
+
+
+def make_dict_match(idx):
+    return assertions.DictMatch(
+        value={'key': idx, 'nested': {'value': 'abc'}},
+        expected={'key': idx, 'nested': {'value': 'abc'}},
+        description='DictMatch')
+
+
+FACTORIES = {
+    'Equal': make_equal,
+    'DictMatch': make_dict_match,
+}
+
+
+def _memory_usage():
+    """Current traced memory in bytes (peak RSS on Python 2)."""
+    if tracemalloc is not None:
+        return tracemalloc.get_traced_memory()[0]
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure(factory, count):
+    """
+    Returns the memory held by ``count`` entries created by ``factory`` and
+    the time taken to create them.
+    """
+    gc.collect()
+    before = _memory_usage()
+    start = time.time()
+    entries = [factory(idx) for idx in range(count)]
+    elapsed = time.time() - start
+    gc.collect()
+    used = _memory_usage() - before
+    assert len(entries) == count
+    del entries
+    return used, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=1000000,
+                        help='Number of entries of each type to create.')
+    parser.add_argument('--entry', choices=sorted(FACTORIES),
+                        action='append', help='Entry types to measure.')
+    args = parser.parse_args()
+
+    if tracemalloc is not None:
+        tracemalloc.start()
+
+    for name in args.entry or sorted(FACTORIES):
+        used, elapsed = measure(FACTORIES[name], args.count)
+        print('{:<10} {:>10} entries {:>10.1f} MB {:>8.1f} bytes/entry'
+              ' {:>8.2f} s'.format(name, args.count, used / 1024.0 ** 2,
+                                    float(used) / args.count, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Import time benchmark of testplan.
+
+Imports ``testplan`` (and the child worker module) in a fresh interpreter
+with ``python -X importtime`` and reports the cumulative import time. Exits
+with a non zero code if startup regresses: heavy optional modules got
+imported eagerly again, or the import time exceeds ``--max-ms``.
+
+Usage::
+
+    python benchmarks/import_time.py --max-ms 500
+"""
+from __future__ import print_function
+
+import argparse
+import re
+import subprocess
+import sys
+
+MODULES = ('testplan', 'testplan.runners.pools.child')
+
+# Only needed for exporting reports, interactive mode or by optional drivers.
+LAZY_MODULES = (
+    'reportlab',
+    'flask',
+    'flask_restplus',
+    'zmq',
+    'requests',
+    'pytest',
+    'webbrowser',
+    'testplan.exporters.testing.pdf',
+    'testplan.exporters.testing.xml',
+    'testplan.exporters.testing.json',
+    'testplan.exporters.testing.webserver',
+    'testplan.runnable.interactive',
+    'testplan.web_ui',
+)
+
+IMPORT_TIME_LINE = re.compile(
+    r'^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|'
+    r'(?P<indent>\s+)(?P<module>\S+)$')
+
+
+def import_times(module):
+    """
+    Import ``module`` in a new interpreter.
+
+    :return: Cumulative import time in microseconds of each imported module.
+    :rtype: ``dict``
+    """
+    proc = subprocess.Popen(
+        [sys.executable, '-X', 'importtime', '-c',
+         'import {}'.format(module)],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    _, stderr = proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError('Could not import {}:{}{}'.format(
+            module, '\n', stderr))
+
+    times = {}
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            times[match.group('module')] = int(match.group('cumulative'))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='Fail if an import takes longer (milliseconds).')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Best of N imports is reported.')
+    args = parser.parse_args()
+
+    if sys.version_info < (3, 7):
+        print('-X importtime requires Python 3.7+')
+        return 2
+
+    failed = False
+    for module in MODULES:
+        runs = [import_times(module) for _ in range(args.repeat)]
+        elapsed_ms = min(run[module] for run in runs) / 1000.0
+        eager = [name for name in LAZY_MODULES if name in runs[0]]
+        print('{:<32} {:>8.1f} ms'.format(module, elapsed_ms))
+
+        if eager:
+            failed = True
+            print('  eagerly imported: {}'.format(', '.join(eager)))
+        if args.max_ms is not None and elapsed_ms > args.max_ms:
+            failed = True
+            print('  slower than {} ms'.format(args.max_ms))
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
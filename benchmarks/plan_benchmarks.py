@@ -0,0 +1,384 @@
+#!/usr/bin/env python
+"""
+Plan level benchmark suite.
+
+Runs synthetic plans offline and measures the per testcase overhead of
+MultiTest, the throughput of ``Result`` assertions by type, the round trip
+latency of tasks through a thread & process pool, the merge / serialize /
+JSON export time of large reports and the start / stop latency of the
+TCP, HTTP & ZMQ server drivers. All results are times, lower is better.
+
+Results are written as JSON, and can be compared against a baseline
+written by a previous run: the exit code is non zero if a result is slower
+than its baseline by more than ``--tolerance``.
+
+Usage::
+
+    python benchmarks/plan_benchmarks.py --output baseline.json
+    python benchmarks/plan_benchmarks.py --baseline baseline.json
+    python benchmarks/plan_benchmarks.py --only report --entries 1000000
+"""
+from __future__ import print_function
+
+import argparse
+import collections
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import timeit
+
+from testplan import Testplan
+from testplan.common.utils import logger
+from testplan.common.utils.logger import TESTPLAN_LOGGER
+from testplan.common.utils.testing import log_propagation_disabled
+from testplan.exporters.testing import JSONExporter
+from testplan.report.testing import (
+    TestReport, TestGroupReport, TestCaseReport)
+from testplan.report.testing.styles import Style, StyleEnum
+from testplan.runners.pools import ThreadPool, ProcessPool
+from testplan.runners.pools.tasks import Task
+from testplan.testing.multitest import MultiTest, testsuite, testcase
+from testplan.testing.multitest.result import Result
+
+# Bumped when results are not comparable with those of previous versions.
+VERSION = 1
+
+QUIET = Style(passing=StyleEnum.RESULT, failing=StyleEnum.RESULT)
+
+BENCHMARKS = collections.OrderedDict()
+
+
+def benchmark(name):
+    """Register a benchmark, it returns its results by name."""
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def best_of(func, repeat):
+    """Shortest time in seconds of ``repeat`` calls of ``func``."""
+    times = []
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        func()
+        times.append(timeit.default_timer() - start)
+    return min(times)
+
+
+def result(value, unit):
+    """A benchmark result, ``value`` is in ``unit``."""
+    return {'value': round(value, 3), 'unit': unit}
+
+
+def make_multitest(name, testcases=1, runpath=None):
+    """MultiTest of ``testcases`` testcases doing (almost) nothing."""
+    def noop(self, env, result, value):
+        result.true(True)
+
+    suite_cls = testsuite(type('NoopSuite', (object,), {
+        'noop': testcase(parameters=range(testcases))(noop)}))
+    return MultiTest(name=name, suites=[suite_cls()], runpath=runpath,
+                     stdout_style=QUIET)
+
+
+@benchmark('multitest')
+def multitest_overhead(args, workdir):
+    """Time MultiTest spends per testcase, beyond its fixed cost."""
+    def run(testcases):
+        def _run():
+            mtest = make_multitest(
+                'Bench', testcases, runpath=os.path.join(workdir, 'mtest'))
+            with log_propagation_disabled(TESTPLAN_LOGGER):
+                mtest.run()
+            assert mtest.report.passed
+        return best_of(_run, args.repeat)
+
+    single, many = run(1), run(args.testcases)
+    return {
+        'run': result(single * 1e3, 'ms'),
+        'testcase_overhead': result(
+            (many - single) * 1e6 / (args.testcases - 1), 'us/testcase'),
+    }
+
+
+def _assertions():
+    """Assertions by type, as called with a ``Result``."""
+    table = [['name', 'value']] + [['n{}'.format(i), i] for i in range(20)]
+    message = {i: 'value{}'.format(i) for i in range(1, 50)}
+    return collections.OrderedDict([
+        ('true', lambda res: res.true(True)),
+        ('equal', lambda res: res.equal(1, 1)),
+        ('less', lambda res: res.less(1, 2)),
+        ('contain', lambda res: res.contain(1, [0, 1, 2])),
+        ('regex.match', lambda res: res.regex.match(r'a+b', 'aaab')),
+        ('dict.match', lambda res: res.dict.match(message, message)),
+        ('fix.match', lambda res: res.fix.match(message, message)),
+        ('table.match', lambda res: res.table.match(table, table)),
+        ('log', lambda res: res.log('message')),
+    ])
+
+
+@benchmark('assertions')
+def assertion_throughput(args, workdir):
+    """Time per assertion by type, including its serialization."""
+    results = {}
+    for name, assertion in _assertions().items():
+        def run():
+            res = Result(stdout_style=QUIET)
+            for _ in range(args.assertions):
+                assertion(res)
+            assert len(res.serialized_entries) == args.assertions
+        elapsed = best_of(run, args.repeat)
+        results[name] = result(elapsed * 1e6 / args.assertions, 'us/call')
+    return results
+
+
+def _pool_run(pool_cls, tasks, workdir):
+    """Time to execute ``tasks`` one testcase MultiTests on a pool."""
+    plan = Testplan(
+        name='Bench', parse_cmdline=False, exporters=[],
+        runpath=os.path.join(workdir, 'plan'), stdout_style=QUIET,
+        logger_level=logger.WARNING)
+    plan.add_resource(pool_cls(name='Pool', size=1))
+    for idx in range(tasks):
+        plan.schedule(
+            Task(target='make_multitest', module='plan_benchmarks',
+                 path=os.path.dirname(os.path.abspath(__file__)),
+                 args=('MTest{}'.format(idx),)),
+            resource='Pool')
+
+    start = timeit.default_timer()
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        assert plan.run().run is True
+    elapsed = timeit.default_timer() - start
+    assert plan.report.passed
+    return elapsed
+
+
+@benchmark('pools')
+def pool_round_trip(args, workdir):
+    """
+    Time each task adds to a plan run through a single worker pool: the
+    scheduling, transport and execution of a one testcase MultiTest.
+    """
+    results = {}
+    for name, pool_cls in (('thread', ThreadPool), ('process', ProcessPool)):
+        single = min(_pool_run(pool_cls, 1, workdir)
+                     for _ in range(args.repeat))
+        many = min(_pool_run(pool_cls, args.tasks, workdir)
+                   for _ in range(args.repeat))
+        results['{}_task'.format(name)] = result(
+            (many - single) * 1e3 / (args.tasks - 1), 'ms/task')
+    return results
+
+
+def make_report(entries, per_testcase=100, testcases_per_suite=100):
+    """Test report of a MultiTest holding ``entries`` assertion entries."""
+    res = Result(stdout_style=QUIET)
+    for idx in range(per_testcase):
+        res.equal(idx, idx, description='Equal')
+    serialized = res.serialized_entries
+
+    mtest = TestGroupReport(name='Bench', category='multitest')
+    suite = None
+    for idx in range(max(entries // per_testcase, 1)):
+        if idx % testcases_per_suite == 0:
+            suite = TestGroupReport(
+                name='Suite{}'.format(idx // testcases_per_suite),
+                category='suite')
+            mtest.append(suite)
+        case = TestCaseReport(name='case{}'.format(idx))
+        case.extend(list(serialized))
+        suite.append(case)
+    return TestReport(name='Bench', entries=[mtest])
+
+
+@benchmark('report')
+def report_processing(args, workdir):
+    """Merge, serialize & JSON export time of a report of ``--entries``."""
+    report = make_report(args.entries)
+    json_path = os.path.join(workdir, 'report.json')
+
+    def merge():
+        # Parts of a test are merged into its placeholder report.
+        placeholder = TestGroupReport(
+            name='Bench', category='multitest', uid=report.entries[0].uid,
+            entries=[TestGroupReport(name=suite.name, uid=suite.uid,
+                                     category='suite')
+                     for suite in report.entries[0]])
+        placeholder.merge(report.entries[0], strict=False)
+
+    def export():
+        with log_propagation_disabled(TESTPLAN_LOGGER):
+            JSONExporter(json_path=json_path).export(report)
+
+    unit = 'ms'
+    return {
+        'merge': result(best_of(merge, args.repeat) * 1e3, unit),
+        'serialize': result(
+            best_of(report.serialize, args.repeat) * 1e3, unit),
+        'export_json': result(best_of(export, args.repeat) * 1e3, unit),
+    }
+
+
+def _drivers():
+    """Server drivers by name, those of missing dependencies are skipped."""
+    drivers = collections.OrderedDict()
+    from testplan.testing.multitest.driver.tcp import TCPServer
+    drivers['tcp_server'] = lambda runpath: TCPServer(
+        name='server', host='localhost', port=0, runpath=runpath)
+    try:
+        from testplan.testing.multitest.driver.http import HTTPServer
+    except ImportError:
+        pass
+    else:
+        drivers['http_server'] = lambda runpath: HTTPServer(
+            name='server', host='localhost', port=0, runpath=runpath)
+    try:
+        import zmq
+        from testplan.testing.multitest.driver.zmq import ZMQServer
+    except ImportError:
+        pass
+    else:
+        drivers['zmq_server'] = lambda runpath: ZMQServer(
+            name='server', host='127.0.0.1', port=0,
+            message_pattern=zmq.PAIR, runpath=runpath)
+    return drivers
+
+
+@benchmark('drivers')
+def driver_latency(args, workdir):
+    """Start & stop latency of server drivers."""
+    results = {}
+    for name, factory in _drivers().items():
+        starts, stops = [], []
+        for _ in range(args.repeat):
+            driver = factory(os.path.join(workdir, name))
+            start = timeit.default_timer()
+            driver.start()
+            driver._wait_started()
+            starts.append(timeit.default_timer() - start)
+            start = timeit.default_timer()
+            driver.stop()
+            driver._wait_stopped()
+            stops.append(timeit.default_timer() - start)
+        results['{}_start'.format(name)] = result(min(starts) * 1e3, 'ms')
+        results['{}_stop'.format(name)] = result(min(stops) * 1e3, 'ms')
+    return results
+
+
+def run_benchmarks(args):
+    """Results of the selected benchmarks, by ``<benchmark>.<name>``."""
+    results = collections.OrderedDict()
+    workdir = tempfile.mkdtemp(prefix='testplan_benchmarks_')
+    try:
+        for name, func in BENCHMARKS.items():
+            if args.only and not any(
+                    fnmatch.fnmatch(name, pattern) for pattern in args.only):
+                continue
+            print('Running {} benchmark...'.format(name), file=sys.stderr)
+            for key, value in func(args, workdir).items():
+                results['{}.{}'.format(name, key)] = value
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results with those of a baseline.
+
+    :return: Comparison lines and names of the regressed results.
+    :rtype: ``tuple`` of (``list`` of ``str``, ``list`` of ``str``)
+    """
+    lines, regressions = [], []
+    for name, current in results.items():
+        previous = baseline['results'].get(name)
+        if previous is None or previous['unit'] != current['unit']:
+            lines.append('{:<40} {:>12.3f} {:<12} (new)'.format(
+                name, current['value'], current['unit']))
+            continue
+        ratio = current['value'] / previous['value'] \
+            if previous['value'] else 1.0
+        status = ''
+        if ratio > 1 + tolerance:
+            status = 'REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 - tolerance:
+            status = 'improved'
+        lines.append('{:<40} {:>12.3f} {:<12} {:>12.3f} {:>7.2f}x {}'.format(
+            name, current['value'], current['unit'], previous['value'],
+            ratio, status))
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--only', action='append', metavar='PATTERN',
+                        help='Glob pattern of the benchmarks to run ({}).'
+                        .format(', '.join(BENCHMARKS)))
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs of each measure, the best one is kept.')
+    parser.add_argument('--testcases', type=int, default=500,
+                        help='Testcases of the MultiTest benchmark (at least 2).')
+    parser.add_argument('--assertions', type=int, default=2000,
+                        help='Assertions of each type.')
+    parser.add_argument('--tasks', type=int, default=20,
+                        help='Tasks scheduled on each pool (at least 2).')
+    parser.add_argument('--entries', type=int, default=10000,
+                        help='Assertion entries of the report benchmark.')
+    parser.add_argument('--output', help='Write the results to this file.')
+    parser.add_argument('--baseline',
+                        help='Compare the results with this results file.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Slowdown ratio over the baseline considered as'
+                             ' a regression (default 0.2, i.e. 20%%).')
+    args = parser.parse_args()
+    # Per testcase & per task costs are measured against a single one.
+    for option in ('testcases', 'tasks'):
+        if getattr(args, option) < 2:
+            parser.error('--{} must be at least 2.'.format(option))
+
+    data = {
+        'version': VERSION,
+        'time': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': {
+            'repeat': args.repeat, 'testcases': args.testcases,
+            'assertions': args.assertions, 'tasks': args.tasks,
+            'entries': args.entries},
+        'results': run_benchmarks(args),
+    }
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(data, output, indent=2)
+    else:
+        print(json.dumps(data, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get('version') != VERSION:
+            parser.error('Baseline of another version of the benchmarks.')
+        if baseline['parameters'] != data['parameters']:
+            print('Baseline parameters differ: {}'.format(
+                baseline['parameters']), file=sys.stderr)
+        lines, regressions = compare(
+            data['results'], baseline, args.tolerance)
+        print('\n'.join(lines), file=sys.stderr)
+        if regressions:
+            print('Regressions: {}'.format(', '.join(regressions)),
+                  file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -590,6 +590,9 @@ class SampleSuite(object):
         # information stored. By default all comparisons are stored and added
         # to the report, but you can choose to discard some comparisons to
         # reduce the size of the report when comparing very large dicts.
+        # Passing comparisons are then not even formatted, and an expected
+        # dict matched many times can be compiled once beforehand with
+        # `comparison.compile_dict` to match its plain values natively.
         actual = {'key{}'.format(i): i for i in range(10)}
         expected = actual.copy()
         expected['bad_key'] = 'expected'
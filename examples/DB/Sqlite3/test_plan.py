@@ -62,6 +62,21 @@ class DBQueries(object):
             expected=expected_table
         )
 
+    @testcase
+    def sample_streamed_match(self, env, result):
+        """
+        Table match of rows streamed from the db, large tables are matched
+        without being fetched as a list first.
+        """
+        result.table.match(
+            actual=env.db.iter_table('users', columns=['name', 'email']),
+            expected=[
+                ['name', 'email'],
+                ['John', 'john@email'],
+                ['Mary', 'mary@email']
+            ]
+        )
+
     @testcase
     def sample_column_query(self, env, result):
         """Table column content assertion after fetching the whole table."""
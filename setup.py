@@ -37,6 +37,7 @@ REQUIRED = [
     'scikit-learn',
     'scipy',
     "functools32; python_version <= '2.7'",
+    "futures; python_version <= '2.7'",
     'requests>=2.4.3',
     'flask',
     'flask_restplus',
@@ -1,3 +1,4 @@
 """TODO."""
 
-from .base import Config, ConfigOption, Configurable, validate_func
\ No newline at end of file
+from .base import (Config, ConfigOption, Configurable, DefaultFactory,
+                   validate_func)
\ No newline at end of file
@@ -3,8 +3,12 @@ Module containing configuration objects and utilities.
 """
 
 import copy
+import enum
 import inspect
+import numbers
+import weakref
 
+import six
 from schema import Schema, Optional, And, Or, Use
 
 from testplan.common.utils.interface import check_signature
@@ -34,6 +38,37 @@ class DefaultValueWrapper(object):
         )
 
 
+class DefaultFactory(object):
+    """
+    Default value of a config option computed for each configuration, e.g.
+    a random seed, rather than once for the configuration class.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.factory)
+
+
+# Default values of these types are shared by the configurations of a class.
+_IMMUTABLE_DEFAULTS = six.string_types + (
+    type(None), bool, numbers.Number, bytes, tuple, frozenset, enum.Enum)
+
+
+def _shared_default(value):
+    """Whether a default value can be shared by all configurations."""
+    return isinstance(value, _IMMUTABLE_DEFAULTS) or \
+        inspect.isclass(value) or inspect.isroutine(value)
+
+
+def _instance_default(value):
+    """Default value of an option for a new configuration."""
+    if isinstance(value, DefaultFactory):
+        return value.factory()
+    return copy.deepcopy(value)
+
+
 def ConfigOption(key, default=ABSENT, block_propagation=True):
     """
     Wrapper around Optional, subclassing is not an option
@@ -58,6 +93,9 @@ def ConfigOption(key, default=ABSENT, block_propagation=True):
 
     With `block_propagation` set to be False, the default value defined in
     parent class has higher priority to be retrieved.
+
+    Default values that are not immutable are copied for each configuration,
+    a :py:class:`DefaultFactory` default is computed for each configuration.
     """
 
     optional = Optional(key, default=default)
@@ -110,14 +148,34 @@ class Config(object):
     Configurations can have a parent-child relationship so that
     options not defined in the child, can be retrieved from parent.
     Supports composition of multiple config options via multiple inheritance.
+
+    Schemas are compiled once per class and resolved option values are
+    cached on the instance, so that reading an option is a plain attribute
+    lookup. The cache is reset whenever the parent of the configuration,
+    or the parent of one of its ancestors, is set.
     """
 
     ignore_extra_keys = False
 
     def __init__(self, **options):
         self._parent = None
+        self._children = weakref.WeakSet()
+        self._resolved = {}
         self._cfg_input = options
-        self._options = self.build_schema().validate(options)
+        schema, instance_defaults = self._compiled_schema()
+        self._options = schema.validate(options)
+
+        # Validation returns the default objects of the compiled schema,
+        # those which cannot be shared are created for each instance.
+        for key, default in instance_defaults.items():
+            if self._options.get(key) is not default:
+                continue
+            if isinstance(default, DefaultValueWrapper):
+                self._options[key] = DefaultValueWrapper(
+                    _instance_default(default.value),
+                    default.block_propagation)
+            else:
+                self._options[key] = _instance_default(default)
 
     def __getattr__(self, name):
         options = self.__getattribute__('_options')
@@ -126,7 +184,7 @@ class Config(object):
 
         if local_val is not ABSENT and not isinstance(local_val,
                                                       DefaultValueWrapper):
-            return local_val
+            return self._cache_resolved(name, local_val)
         elif local_val is ABSENT or not getattr(local_val,
                                                 'block_propagation', True):
             parent_val = getattr(self.parent, name,
@@ -136,13 +194,51 @@ class Config(object):
             raise AttributeError('Name: {}'.format(name)) 
 
         if parent_val is not ABSENT:
-            return parent_val
+            return self._cache_resolved(name, parent_val)
         elif isinstance(local_val, DefaultValueWrapper):
-            return local_val.value
+            return self._cache_resolved(name, local_val.value)
 
         raise RuntimeError('Error fetching attribute ({}) from {}'.format(
             name, self))
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name, value in self._resolved.items():
+            if state.get(name, ABSENT) is value:
+                del state[name]
+        state['_resolved'] = {}
+        del state['_children']
+        return state
+
+    def __setstate__(self, state):
+        # Children may have been registered while unpickling the state.
+        children = self.__dict__.get('_children', weakref.WeakSet())
+        self.__dict__.update(state)
+        self._children = children
+        if isinstance(self._parent, Config):
+            self._parent.__dict__.setdefault(
+                '_children', weakref.WeakSet()).add(self)
+
+    def _cache_resolved(self, name, value):
+        """Store the resolved value of an option as an instance attribute."""
+        self.__dict__[name] = value
+        self._resolved[name] = value
+        return value
+
+    def _reset_resolved(self):
+        """Drop resolved option values of this and the child configs."""
+        for name, value in self._resolved.items():
+            if self.__dict__.get(name, ABSENT) is value:
+                del self.__dict__[name]
+        self._resolved.clear()
+        for child in list(self._children):
+            child._reset_resolved()
+
+    def set_local(self, name, value):
+        """Override the local value of an option."""
+        self._options[name] = value
+        self._reset_resolved()
+
     def __repr__(self):
         return '{}{}'.format(self.__class__.__name__,
                              self._cfg_input or self._options)
@@ -159,6 +255,9 @@ class Config(object):
             raise AttributeError('Cannot overwrite parent: {}'.format(
                 self._parent))
         self._parent = value
+        if isinstance(value, Config):
+            value._children.add(self)
+        self._reset_resolved()
 
     def denormalize(self):
         """
@@ -202,3 +301,24 @@ class Config(object):
             config_options,
             ignore_extra_keys=cls.ignore_extra_keys
         )
+
+    @classmethod
+    def _compiled_schema(cls):
+        """
+        Schema built once per class, along with the default values of its
+        options that cannot be shared by its instances.
+        """
+        compiled = cls.__dict__.get('_compiled')
+        if compiled is None:
+            schema = cls.build_schema()
+            instance_defaults = {}
+            for key in schema.schema:
+                default = getattr(key, 'default', ABSENT)
+                if default is ABSENT:
+                    continue
+                value = default.value \
+                    if isinstance(default, DefaultValueWrapper) else default
+                if not _shared_default(value):
+                    instance_defaults[key.key] = default
+            compiled = cls._compiled = (schema, instance_defaults)
+        return compiled
@@ -3,6 +3,7 @@ Module containing base classes that represent object entities that can accept
 configuration, start/stop/run/abort, create results and have some state.
 """
 import atexit
+import contextlib
 import getpass
 import os
 import sys
@@ -21,12 +22,18 @@ from schema import Or, And, Use
 from testplan.common.config import Config
 from testplan.common.config import ConfigOption
 from testplan.common.utils.exceptions import format_trace
-from testplan.common.utils.thread import execute_as_thread
+from testplan.common.utils.thread import (
+    execute_as_thread, shared_executor_threads)
 from testplan.common.utils.timing import wait
 from testplan.common.utils.path import makeemptydirs, makedirs, default_runpath
 from testplan.common.utils import logger
+from testplan.common.utils.profiling import DRIVER
 
 
+# Timeout of the waits for resources to stop once the environment stop
+# timeout has expired.
+MIN_STOP_WAIT = 0.1
+
 
 class Environment(object):
     """
@@ -41,6 +48,9 @@ class Environment(object):
         self.parent = parent
         self.start_exceptions = OrderedDict()
         self.stop_exceptions = OrderedDict()
+        # Records the time resources take to start & stop if set, see
+        # `testplan.common.utils.profiling.Timings`
+        self.timings = None
         self._logger = None
 
     @property
@@ -124,6 +134,16 @@ class Environment(object):
             return '{}[{}]'.format(self.__class__.__name__,
                                    list(self._resources.items()))
 
+    @contextlib.contextmanager
+    def _timed(self, resource, action):
+        """Record the time of an action on a resource, if timings are set."""
+        if self.timings is None:
+            yield
+        else:
+            with self.timings.record(
+                    DRIVER, '{} - {}'.format(resource.uid(), action)):
+                yield
+
     def all_status(self, target):
         """
         Check all resources has target status.
@@ -139,9 +159,10 @@ class Environment(object):
         for resource in self._resources.values():
             try:
                 self.logger.debug('Starting {}'.format(resource))
-                resource.start()
-                if resource.cfg.async_start is False:
-                    resource.wait(resource.STATUS.STARTED)
+                with self._timed(resource, 'start'):
+                    resource.start()
+                    if resource.cfg.async_start is False:
+                        resource.wait(resource.STATUS.STARTED)
                 self.logger.debug('Started {}'.format(resource))
             except Exception as exc:
                 msg = 'While starting resource [{}]{}{}'.format(
@@ -159,11 +180,17 @@ class Environment(object):
             if resource.cfg.async_start is False:
                 continue
             else:
-                resource.wait(resource.STATUS.STARTED)
+                with self._timed(resource, 'wait started'):
+                    resource.wait(resource.STATUS.STARTED)
 
     def stop(self, reversed=False):
         """
         Stop all resources in reverse order and log exceptions.
+
+        The stop of every resource is triggered before waiting for any of
+        them, so that resources (e.g. application processes) stop
+        concurrently. The waits share the ``environment_stop_timeout`` of
+        the parent object if set.
         """
         resources = list(self._resources.values())
         if reversed is True:
@@ -177,7 +204,8 @@ class Environment(object):
                 continue
             try:
                 self.logger.debug('Stopping {}'.format(resource))
-                resource.stop()
+                with self._timed(resource, 'stop'):
+                    resource.stop()
                 self.logger.debug('Stopped {}'.format(resource))
             except Exception as exc:
                 msg = 'While stopping resource [{}]{}{}'.format(
@@ -185,6 +213,9 @@ class Environment(object):
                     format_trace(inspect.trace(), exc))
                 self.stop_exceptions[resource] = msg
 
+        stop_timeout = getattr(self.cfg, 'environment_stop_timeout', None)
+        end_time = time.time() + stop_timeout if stop_timeout else None
+
         # Wait resources status to be STOPPED.
         for resource in resources:
             if resource in self.stop_exceptions:
@@ -192,8 +223,15 @@ class Environment(object):
             elif resource.status.tag is None:
                 # Skip resources not even triggered to start.
                 continue
+            elif end_time is None:
+                with self._timed(resource, 'wait stopped'):
+                    resource.wait(resource.STATUS.STOPPED)
             else:
-                resource.wait(resource.STATUS.STOPPED)
+                # A zero timeout would mean the default wait timeout.
+                with self._timed(resource, 'wait stopped'):
+                    resource.wait(
+                        resource.STATUS.STOPPED,
+                        timeout=max(end_time - time.time(), MIN_STOP_WAIT))
 
     def __enter__(self):
         self.start()
@@ -226,6 +264,16 @@ class EntityStatus(object):
         self._current = self.NONE
         self._metadata = OrderedDict()
         self._transitions = self.transitions()
+        self._changed = threading.Condition()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_changed']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._changed = threading.Condition()
 
     @property
     def tag(self):
@@ -238,18 +286,42 @@ class EntityStatus(object):
         return self._metadata
 
     def change(self, new):
-        """Transition to new state."""
-        current = self._current
-        try:
-            if current == new or new in self._transitions[current]:
-                self._current = new
-            else:
-                msg = 'On status change from {} to {}'.format(current, new)
+        """Transition to new state and notify the waiting threads."""
+        with self._changed:
+            current = self._current
+            try:
+                if current == new or new in self._transitions[current]:
+                    self._current = new
+                else:
+                    msg = 'On status change from {} to {}'.format(
+                        current, new)
+                    raise StatusTransitionException(msg)
+            except KeyError as exc:
+                msg = 'On status change from {} to {} - {}'.format(
+                    current, new, exc)
                 raise StatusTransitionException(msg)
-        except KeyError as exc:
-            msg = 'On status change from {} to {} - {}'.format(
-                current, new, exc)
-            raise StatusTransitionException(msg)
+            self._changed.notify_all()
+
+    def wait(self, target, timeout):
+        """
+        Block until the status becomes the target status, woken up by
+        :py:meth:`change` instead of polling.
+
+        :param target: Status to wait for.
+        :type target: ``str``
+        :param timeout: Maximum time to wait in seconds.
+        :type timeout: ``int`` or ``float``
+        :return: True if target status was reached before timeout.
+        :rtype: ``bool``
+        """
+        end_time = time.time() + timeout
+        with self._changed:
+            while self._current != target:
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    return False
+                self._changed.wait(remaining)
+            return True
 
     def update_metadata(self, **metadata):
         """TODO."""
@@ -436,7 +508,7 @@ class Entity(logger.Loggable):
         if target_status in self._wait_handlers:
             self._wait_handlers[target_status](timeout=timeout)
         else:
-            wait(lambda: self.status.tag == target_status, timeout=timeout)
+            self.status.wait(target_status, timeout=timeout)
 
     def uid(self):
         """Unique identifier of self."""
@@ -699,7 +771,9 @@ class RunnableConfig(EntityConfig):
                 default=hasattr(sys.modules['__main__'], '__file__')): bool,
             ConfigOption('interactive_handler', default=RunnableIHandler): object,
             ConfigOption('interactive_runner', default=RunnableIRunner): object,
-            ConfigOption('enable_profiler', default=False, block_propagation=False): bool
+            ConfigOption('enable_profiler', default=False, block_propagation=False): bool,
+            ConfigOption('environment_stop_timeout', default=None):
+                Or(None, And(Or(int, float), lambda x: x > 0)),
         }
 
 
@@ -739,6 +813,10 @@ class Runnable(Entity):
     :param interactive_runner: Interactive runner set for the runnable.
     :type interactive_runner: Subclass of
       :py:class:`~testplan.common.entity.base.RunnableIRunner`
+    :param environment_stop_timeout: Overall time in seconds the resources
+        of the environment are given to stop, resources still stopping
+        after it are waited for with a minimal timeout.
+    :type environment_stop_timeout: ``int`` or ``float``
 
     Also inherits all
     :py:class:`~testplan.common.entity.base.Entity` options.
@@ -863,7 +941,12 @@ class Runnable(Entity):
         we have either gained or lost threads or processes during the run,
         which may indicate insufficient cleanup. Warnings will be logged.
         """
-        end_threads = threading.enumerate()
+        # Threads of the shared executor are kept alive across runs.
+        executor_threads = shared_executor_threads()
+        start_threads = [thr for thr in start_threads
+                         if thr not in executor_threads]
+        end_threads = [thr for thr in threading.enumerate()
+                       if thr not in executor_threads]
         if start_threads != end_threads:
             new_threads = [
                 thr.name for thr in end_threads if thr not in start_threads]
@@ -1,8 +1,10 @@
 """TODO."""
 import inspect
+import time
 
 from testplan.common.config import Config, Configurable
 from testplan.common.utils.exceptions import format_trace
+from testplan.common.utils.profiling import EXPORTER, cpu_time
 
 
 class ExporterResult(object):
@@ -11,19 +13,41 @@ class ExporterResult(object):
         self.exporter = exporter
         self.type = type
         self.traceback = None
+        # Start, wall & CPU time of the export in seconds.
+        self.start_time = None
+        self.wall_time = None
+        self.cpu_time = None
 
     @property
     def success(self):
         return not self.traceback
 
+    @property
+    def timing(self):
+        """
+        Wall & CPU time of the export as a profile timing record of kind
+        ``exporter``, see :py:class:`~testplan.common.utils.profiling.Timings`.
+        """
+        return {
+            'kind': EXPORTER,
+            'name': self.exporter.__class__.__name__,
+            'start': self.start_time,
+            'wall': round(self.wall_time, 6),
+            'cpu': round(self.cpu_time, 6),
+        }
+
     @classmethod
     def run_exporter(cls, exporter, source, type):
         result = ExporterResult(exporter=exporter, type=type)
 
+        start, start_cpu = time.time(), cpu_time()
+        result.start_time = start
         try:
             exporter.export(source)
         except Exception as exc:
             result.traceback = format_trace(inspect.trace(), exc)
+        result.wall_time = time.time() - start
+        result.cpu_time = cpu_time() - start_cpu
         return result
 
 
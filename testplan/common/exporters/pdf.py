@@ -5,9 +5,6 @@
 import itertools
 import six
 
-from reportlab.platypus import Table
-from reportlab.lib import colors
-
 from testplan.common.utils.comparison import is_regex
 from testplan.common.exporters import constants
 
@@ -97,6 +94,8 @@ def create_base_tables(data, style, col_widths, max_rows=MAX_TABLE_ROWS):
     :return: a list of new tables
     :rtype: ``list`` of ``Table``
     """
+    from reportlab.platypus import Table
+
     zipped = six.moves.zip(
         _partition_data(data, max_rows=max_rows),
         _partition_style(style, len(data), max_rows=max_rows))
@@ -185,6 +184,8 @@ def _create_cell_styles(colour_matrix, display_index):
     :return: List of RowStyle objects indicating the colour of each cell.
     :rtype: ``list`` of ``testplan.common.exporters.pdf.RowStyle``
     """
+    from reportlab.lib import colors
+
     cell_styles = []
     for row_idx in range(len(colour_matrix)):
         for col_idx in range(len(colour_matrix[row_idx])):
@@ -230,6 +231,8 @@ def _create_sub_table(columns, rows, column_start, column_end, style,
     :return: The formatted ReportLab table.
     :rtype: ``list``
     """
+    from reportlab.platypus import Table
+
     # Select subsection of columns and rows.
     sub_columns = columns[column_start:column_end]
     sub_rows = [row[column_start:column_end] for row in rows]
@@ -15,6 +15,11 @@ import itertools
 from .log import create_logging_adapter
 
 
+# Versions given to reports when they change, unique among all reports so
+# that a report and its copies never share a version once either changes.
+_VERSIONS = itertools.count(1)
+
+
 class MergeError(Exception):
     """Raised when a merge operation fails."""
 
@@ -47,6 +52,10 @@ class Report(object):
 
     exception_logger = ExceptionLogger
 
+    # Changed by the methods modifying the report, so that serialized
+    # copies of the report can be reused until it changes.
+    _version = 0
+
     def __init__(self, name, description=None, uid=None, entries=None):
         self.name = name
         self.description = description
@@ -55,7 +64,17 @@ class Report(object):
         self.entries = entries or []
 
         self.logs = []
-        self.logger = create_logging_adapter(report=self)
+        self._logger = None
+
+    @property
+    def logger(self):
+        """
+        Logging adapter appending messages to ``logs``, created on first use
+        as most reports never log anything.
+        """
+        if self._logger is None:
+            self._logger = create_logging_adapter(report=self)
+        return self._logger
 
     def __str__(self):
         return '{kls}(name="{name}", id="{uid}")'.format(
@@ -82,7 +101,7 @@ class Report(object):
 
     def __getstate__(self):
         # Omitting logger as it is not compatible with deep copy.
-        return {k: v for k, v in self.__dict__.items() if k != 'logger'}
+        return {k: v for k, v in self.__dict__.items() if k != '_logger'}
 
     def _get_comparison_attrs(self):  # pylint: disable=no-self-use
         return ['name', 'description', 'uid', 'entries', 'logs']
@@ -94,7 +113,7 @@ class Report(object):
         return True
 
     def __setstate__(self, data):
-        data['logger'] = create_logging_adapter(report=self)
+        data['_logger'] = None
         self.__dict__.update(data)
 
     def logged_exceptions(self, *exception_classes, **kwargs):
@@ -111,6 +130,15 @@ class Report(object):
         kwargs['report'] = self
         return self.exception_logger(*exception_classes, **kwargs)
 
+    def bump_version(self):
+        """
+        Record that the report changed, so that serialized copies of it are
+        not reused. The methods of the report modifying it call this already,
+        callers must only call it after changing the report attributes
+        directly, e.g. after replacing its ``entries``.
+        """
+        self._version = next(_VERSIONS)
+
     def _check_report(self, report):
         """
         Utility method for checking `report` `type` and `uid`.
@@ -141,16 +169,19 @@ class Report(object):
         :type strict: ``bool``
         """
         self._check_report(report)
+        self.bump_version()
         # Merge logs
         log_ids = [rec['uid'] for rec in self.logs]
         self.logs += [rec for rec in report.logs if rec['uid'] not in log_ids]
 
     def append(self, item):
         """Append ``item`` to ``self.entries``, no restrictions."""
+        self.bump_version()
         self.entries.append(item)
 
     def extend(self, items):
         """Extend ``self.entries`` with ``items``, no restrictions."""
+        self.bump_version()
         self.entries.extend(items)
 
     def filter(self, *functions, **kwargs):
@@ -163,9 +194,12 @@ class Report(object):
         if kwargs.get('__copy', True):
             report_obj = copy.deepcopy(self)
 
-        report_obj.entries = [
+        entries = [
             e for e in self.entries
             if any(func(e) for func in functions)]
+        if len(entries) != len(report_obj.entries):
+            report_obj.bump_version()
+        report_obj.entries = entries
 
         return report_obj
 
@@ -175,6 +209,7 @@ class Report(object):
         a standard UUID instead of the current one.
         """
         self.uid = uuid.uuid4() if uid is None else uid
+        self.bump_version()
 
     def flattened_entries(self, depth):
         """
@@ -289,6 +324,8 @@ class ReportGroup(Report):
                     entry = entry.filter(*functions, __copy=False)
                 entries.append(entry)
 
+        if len(entries) != len(report_obj.entries):
+            report_obj.bump_version()
         report_obj.entries = entries
         if is_root:
             report_obj.build_index(recursive=True)
@@ -301,6 +338,7 @@ class ReportGroup(Report):
         when need to generate standard UUIDs instead of the current ones.
         """
         self.uid = uuid.uuid4() if uid is None else uid
+        self.bump_version()
         for entry in self:
             if isinstance(entry, (Report, ReportGroup)):
                 entry.reset_uid()
@@ -3,8 +3,9 @@ We'd like to use python's logging interface when we log messages through Report
 objects. The most lightweight way to do it is to use a `logging.LoggingAdapter`
 which is a thin wrapper around a `logging.Logger`.
 
-We can then use a global mapping and a custom handler to append log messages
-to the report object's `logs` list.
+Each adapter holds a weak reference to its report and a custom handler appends
+log messages to the report object's `logs` list, so that reports are not kept
+alive by logging.
 """
 import logging
 import datetime
@@ -16,30 +17,108 @@ from dateutil.tz import tzutc
 
 LOGGER = logging.getLogger(__name__)
 
-REPORT_MAP = weakref.WeakValueDictionary()
+
+class ReportLogRecord(object):
+    """
+    Compact log record of a report. The timezone aware creation time and the
+    uid are only created when accessed, i.e. on serialization or merge.
+
+    Supports item access like the ``dict`` records of deserialized reports.
+    """
+
+    __slots__ = ('message', 'levelno', 'timestamp', 'funcName', 'lineno',
+                 '_uid')
+
+    KEYS = ('message', 'levelname', 'levelno', 'created', 'funcName',
+            'lineno', 'uid')
+
+    def __init__(self, message, levelno, timestamp, funcName, lineno):
+        self.message = message
+        self.levelno = levelno
+        self.timestamp = timestamp
+        self.funcName = funcName  # pylint: disable=invalid-name
+        self.lineno = lineno
+        self._uid = None
+
+    @property
+    def levelname(self):
+        """Name of the level, shared between records."""
+        return logging.getLevelName(self.levelno)
+
+    @property
+    def created(self):
+        """Creation time of the record in UTC."""
+        return datetime.datetime.utcfromtimestamp(
+            self.timestamp).replace(tzinfo=tzutc())
+
+    @property
+    def uid(self):
+        """Unique id of the record, used when merging report logs."""
+        if self._uid is None:
+            self._uid = uuid.uuid4()
+        return self._uid
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        """``dict.get`` equivalent."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        """``dict.keys`` equivalent."""
+        return list(self.KEYS)
+
+    def to_dict(self):
+        """Materialize the record as a ``dict``."""
+        return {key: self[key] for key in self.KEYS}
+
+    def __eq__(self, other):
+        if isinstance(other, ReportLogRecord):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __getstate__(self):
+        # Copies must have the same uid for log merges to be idempotent.
+        self.uid  # pylint: disable=pointless-statement
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    def __repr__(self):
+        return '{}({!r}, {!r})'.format(
+            self.__class__.__name__, self.levelname, self.message)
 
 
 class ReportLogHandler(logging.Handler):
     """
-    Log handler that uses the global report map for appending log messages to
-    report objects.
+    Log handler that appends log messages to the report object referenced by
+    the log record.
     """
 
     def emit(self, record):
-        if hasattr(record, 'report_obj_id'):
-            report = REPORT_MAP.get(record.report_obj_id)
-            if report is not None:
-                created = datetime.datetime.utcfromtimestamp(
-                    record.created).replace(tzinfo=tzutc())
-                report.logs.append({
-                    'message': self.format(record),
-                    'levelname': record.levelname,
-                    'levelno': record.levelno,
-                    'created': created,
-                    'funcName': record.funcName,
-                    'lineno': record.lineno,
-                    'uid': uuid.uuid4()
-                })
+        report_ref = getattr(record, 'report_ref', None)
+        report = report_ref() if report_ref is not None else None
+        if report is not None:
+            report.logs.append(ReportLogRecord(
+                message=self.format(record),
+                levelno=record.levelno,
+                timestamp=record.created,
+                funcName=record.funcName,
+                lineno=record.lineno,
+            ))
 
 
 LOGGER.addHandler(ReportLogHandler())
@@ -47,13 +126,7 @@ LOGGER.addHandler(ReportLogHandler())
 
 def create_logging_adapter(report):
     """
-    Create a new adapter and bind the report to global `REPORT_MAP` so handler
+    Create a new adapter holding a weak reference to the report so handler
     can access it.
     """
-
-    obj_id = id(report)
-
-    if REPORT_MAP.get(obj_id) is None:
-        REPORT_MAP[obj_id] = report
-
-    return logging.LoggerAdapter(LOGGER, {'report_obj_id': obj_id})
+    return logging.LoggerAdapter(LOGGER, {'report_ref': weakref.ref(report)})
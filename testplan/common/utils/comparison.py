@@ -1,3 +1,4 @@
+import collections
 import operator
 import inspect
 try:
@@ -471,30 +472,49 @@ def _partition(results):
     return lhs_vals, rhs_vals
 
 
+def _should_ignore_key(key, ignore, only):
+    """
+    Decide if a key should be ignored.
+
+    Decision is based on ``ignore`` and ``only``.
+    If ``only`` is ``True`` then keys that are
+     not in ``lhs`` will be ignored.
+    """
+    if key in ignore:
+        return True
+    elif only is not None:
+        return key not in only
+    return False
+
+
+def _plain_keys(lhs, rhs):
+    """
+    Keys of the values known to be plain data, because one of the dicts is a
+    :py:class:`CompiledDict`.
+    """
+    keys = frozenset()
+    for obj in (lhs, rhs):
+        if type(obj) is CompiledDict:
+            keys = keys | obj.plain_keys
+    return keys
+
+
 def _cmp_dicts(lhs, rhs, ignore, only, report_mode, value_cmp_func):
     """
     Compares dictionaries
     """
-    def should_ignore_key(key):
-        """
-            Decide if a key should be ignored.
-
-            Decision is based on ``ignore`` and ``only``.
-            If ``only`` is ``True`` then keys that are
-             not in ``lhs`` will be ignored.
-        """
-        if key in ignore:
-            should_ignore = True
-        elif only is not None:
-            should_ignore = key not in only
-        else:
-            should_ignore = False
-        return should_ignore
+    # Passing keys are not reported when only failures are, so they are
+    # matched without formatting and only failing keys are compared fully,
+    # as well as keys whose match depends on callables so that these are
+    # only called once.
+    fails_only = report_mode == ReportOptions.FAILS_ONLY
+    shortcut = _can_shortcut(ignore, only, value_cmp_func)
+    plain_keys = _plain_keys(lhs, rhs) if shortcut else frozenset()
 
     results = []
     match = Match.IGNORED
     for iter_key, lhs_val, rhs_val in _idictzip_all(lhs, rhs):
-        if should_ignore_key(iter_key):
+        if _should_ignore_key(iter_key, ignore, only):
             if report_mode == ReportOptions.ALL:
                 results.append(_build_res(
                     key=iter_key,
@@ -502,6 +522,19 @@ def _cmp_dicts(lhs, rhs, ignore, only, report_mode, value_cmp_func):
                     lhs=fmt(lhs_val),
                     rhs=fmt(rhs_val)))
         else:
+            if fails_only:
+                key_match = _rec_match(
+                    lhs_val,
+                    rhs_val,
+                    ignore,
+                    only,
+                    value_cmp_func,
+                    shortcut,
+                    iter_key in plain_keys)
+                if key_match is not None and Match.to_bool(key_match):
+                    match = Match.combine(match, key_match)
+                    continue
+
             result = _rec_compare(
                 lhs_val,
                 rhs_val,
@@ -607,11 +640,18 @@ def _rec_compare(lhs,
         response = value_cmp_func(lhs, rhs)
 
         match = Match.from_bool(response)
+        lhs_fmt = fmt(lhs)
+        # Equal native values of the same type are formatted the same way
+        if response and type(lhs) is type(rhs) and \
+                issubclass(type(lhs), NATIVE_TYPES) and lhs == rhs:
+            rhs_fmt = lhs_fmt
+        else:
+            rhs_fmt = fmt(rhs)
         return _build_res(
             key=key,
             match=match,
-            lhs=fmt(lhs),
-            rhs=fmt(rhs))
+            lhs=lhs_fmt,
+            rhs=rhs_fmt)
 
     ## ITERABLE
     if lhs_cat == rhs_cat == Category.ITERABLE:
@@ -660,6 +700,231 @@ def _rec_compare(lhs,
         rhs=fmt(rhs))
 
 
+# Containers whose equality is the recursive equality of their items.
+_PLAIN_CONTAINERS = (dict, list, tuple)
+
+# Exact types of the most common values, categorised without any checks.
+_NATIVE_LEAVES = frozenset(
+    six.string_types + six.integer_types + (float, bool, bytes))
+
+
+def _is_plain(obj):
+    """
+    Check that an object is plain data: ``None``, native values other than
+    NaN, or dicts, lists & tuples of plain data. Plain objects hold no
+    callables nor regexes, two plain objects that are natively equal match.
+    """
+    if isinstance(obj, dict):
+        return all(_is_plain(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_is_plain(item) for item in obj)
+    if obj is None:
+        return True
+    # NaN is not equal to itself but equal containers may share it
+    return isinstance(obj, NATIVE_TYPES) and obj == obj
+
+
+def _can_shortcut(ignore, only, value_cmp_func):
+    """
+    Whether equal plain subtrees can be matched with native equality, i.e.
+    values are compared natively and no nested keys are ignored.
+    """
+    return value_cmp_func is operator.eq and not ignore and only is None
+
+
+def _plain_equal(lhs, rhs, known_plain=False):
+    """
+    Check that two containers are equal and plain, ``known_plain`` can be
+    passed when either of them is known to be plain already.
+    """
+    if not (isinstance(lhs, _PLAIN_CONTAINERS) and
+            isinstance(rhs, _PLAIN_CONTAINERS)):
+        return False
+    try:
+        equal = lhs == rhs
+    except Exception:  # e.g. items with an elementwise equality
+        return False
+    return equal is True and (known_plain or _is_plain(rhs))
+
+
+def _match_dicts(lhs, rhs, ignore, only, value_cmp_func, shortcut):
+    """
+    Match of two dictionaries as computed by :py:func:`_cmp_dicts` without
+    building the comparison results, ``None`` if it depends on a callable.
+    """
+    plain_keys = _plain_keys(lhs, rhs) if shortcut else frozenset()
+    match = Match.IGNORED
+    for iter_key, lhs_val, rhs_val in _idictzip_all(lhs, rhs):
+        if _should_ignore_key(iter_key, ignore, only):
+            continue
+        key_match = _rec_match(
+            lhs_val,
+            rhs_val,
+            ignore,
+            only,
+            value_cmp_func,
+            shortcut,
+            iter_key in plain_keys)
+        if key_match is None:
+            return None
+        match = Match.combine(match, key_match)
+        if match == Match.FAIL:
+            break
+    return match
+
+
+def _rec_match(lhs,
+               rhs,
+               ignore,
+               only,
+               value_cmp_func,
+               shortcut=False,
+               known_plain=False,
+               _regex_adapter=RegexAdapter):
+    """
+    Match of two objects as computed by :py:func:`_rec_compare`, without
+    formatting anything. If ``shortcut`` is set, equal plain subtrees match
+    without being walked. Callables are not called: ``None`` is returned
+    if the match depends on one, unless a mismatch is found before it.
+    """
+    if type(lhs) in _NATIVE_LEAVES and type(rhs) in _NATIVE_LEAVES:
+        return Match.from_bool(value_cmp_func(lhs, rhs))
+
+    lhs_cat = _categorise(lhs)
+    rhs_cat = _categorise(rhs)
+
+    ## NO VALS
+    if ((lhs_cat == Category.ABSENT) or (rhs_cat == Category.ABSENT)) and \
+            (lhs_cat != Category.CALLABLE) and (rhs_cat != Category.CALLABLE):
+        return Match.PASS if lhs_cat == rhs_cat else Match.FAIL
+
+    ## CALLABLES
+    if lhs_cat == rhs_cat == Category.CALLABLE:
+        return Match.from_bool(lhs == rhs)
+
+    if lhs_cat == Category.CALLABLE or rhs_cat == Category.CALLABLE:
+        return None
+
+    ## REGEXES
+    if lhs_cat == rhs_cat == Category.REGEX:
+        return _regex_adapter.compare(lhs, rhs)
+
+    if lhs_cat == Category.REGEX:
+        return _regex_adapter.match(regex=lhs, value=rhs)
+
+    if rhs_cat == Category.REGEX:
+        return _regex_adapter.match(regex=rhs, value=lhs)
+
+    ## VALUES
+    if lhs_cat == rhs_cat == Category.VALUE:
+        return Match.from_bool(value_cmp_func(lhs, rhs))
+
+    if lhs_cat == rhs_cat and shortcut and \
+            _plain_equal(lhs, rhs, known_plain):
+        return Match.PASS
+
+    ## ITERABLE
+    if lhs_cat == rhs_cat == Category.ITERABLE:
+        match = Match.IGNORED
+        for lhs_item, rhs_item in six.moves.zip_longest(lhs, rhs):
+            item_match = _rec_match(
+                lhs_item, rhs_item, ignore, only, value_cmp_func, shortcut)
+            if item_match is None:
+                return None
+            match = Match.combine(match, item_match)
+            if match == Match.FAIL:
+                break
+        return match
+
+    ## DICTS
+    if lhs_cat == rhs_cat == Category.DICT:
+        return _match_dicts(lhs, rhs, ignore, only, value_cmp_func, shortcut)
+
+    ## DIFF TYPES
+    return Match.FAIL
+
+
+class CompiledDict(Mapping):
+    """
+    Read-only view of an expected dict that is matched against many values,
+    e.g. a FIX message template, to be passed to :py:func:`compare` or to
+    ``result.dict.match`` & ``result.fix.match`` in its place.
+
+    Values holding plain data only (no callables nor regexes) are found once,
+    when only failures are reported they are matched with native equality.
+    Nested dicts are compiled as well. The dict must not be modified once it
+    has been compiled.
+
+    :param data: Expected dict.
+    :type data: ``dict`` interface
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self._values = collections.OrderedDict()
+        plain_keys = set()
+        for key, value in data.items():
+            if _is_plain(value):
+                plain_keys.add(key)
+                self._values[key] = value
+            else:
+                self._values[key] = _compile_value(value)
+        self.plain_keys = frozenset(plain_keys)
+
+    @property
+    def typed_values(self):
+        """Whether the values of a compiled FIX message are typed."""
+        return getattr(self.data, 'typed_values', False)
+
+    def is_plain(self, key):
+        """Whether the value under ``key`` is plain data."""
+        return key in self.plain_keys
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def items(self):
+        return self._values.items()
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.data)
+
+
+def _compile_value(value):
+    """Compile the dicts nested in a value of an expected dict."""
+    if isinstance(value, Mapping):
+        return CompiledDict(value)
+    if type(value) in (list, tuple):
+        return type(value)(_compile_value(item) for item in value)
+    return value
+
+
+def compile_dict(data):
+    """
+    Compile an expected dict that will be matched many times.
+
+    :param data: Expected dict.
+    :type data: ``dict`` interface
+    :return: Compiled dict, ``data`` itself if it is compiled already.
+    :rtype: :py:class:`CompiledDict`
+    """
+    if isinstance(data, CompiledDict):
+        return data
+    return CompiledDict(data)
+
+
 # Built-in functions for comparing values in a dict.
 COMPARE_FUNCTIONS = {
 
@@ -22,6 +22,9 @@ Function unified_diff(a, b):
 Class SequenceMatcher:
     A flexible class for comparing pairs of sequences of any type.
 
+Class PatienceMatcher:
+    A SequenceMatcher running in close to linear time on large sequences.
+
 Class Differ:
     For producing human-readable deltas from sequences of lines of text.
 """
@@ -29,18 +32,31 @@ Class Differ:
 import os
 import re
 import heapq
+import bisect
 import six
 from collections import namedtuple as _namedtuple
 from functools import reduce
 from datetime import datetime
 
 
-__all__ = ['Match', 'SequenceMatcher', 'get_close_matches',
+__all__ = ['Match', 'SequenceMatcher', 'PatienceMatcher', 'get_close_matches',
            'Differ', 'IS_CHARACTER_JUNK', 'IS_LINE_JUNK',
            'diff', 'context_diff', 'unified_diff', ]
 
 Match = _namedtuple('Match', 'a b size')
 
+# Differ compares lines with PatienceMatcher instead of SequenceMatcher when
+# both texts have more lines than that in total.
+PATIENCE_THRESHOLD = 2000
+
+# Edits Myers' algorithm may explore in a PatienceMatcher comparison before
+# giving up on matching the remaining lines.
+MAX_DIFF_COST = 1000
+
+# Largest replace block (lines of a * lines of b) in which Differ searches
+# similar lines when comparing with PatienceMatcher.
+FANCY_REPLACE_LIMIT = 2500
+
 
 def _calculate_ratio(matches, length):
     if length:
@@ -747,6 +763,201 @@ class SequenceMatcher(object):
         return _calculate_ratio(min(la, lb), la + lb)
 
 
+def _myers_blocks(a, b, alo, ahi, blo, bhi, max_cost):
+    """
+    Matching blocks of a[alo:ahi] and b[blo:bhi] on a shortest edit script,
+    with Myers' O(ND) greedy algorithm.
+
+    Return (blocks, cost), blocks being None if more than `max_cost` edits
+    (insertions & deletions) are required, in which case cost is max_cost.
+    """
+    n, m = ahi - alo, bhi - blo
+    offset = max_cost + 1
+    # v[offset + k] is the furthest x reached on diagonal k = x - y
+    v = [0] * (2 * offset + 1)
+    trace = []
+    for cost in range(max_cost + 1):
+        # keep diagonals -cost-1 .. cost+1 to walk the path back
+        trace.append(v[offset - cost - 1:offset + cost + 2])
+        for k in range(-cost, cost + 1, 2):
+            if k == -cost or \
+                    k != cost and v[offset + k - 1] < v[offset + k + 1]:
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x, y = x + 1, y + 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, n, m, alo, blo), cost
+    return None, max_cost
+
+
+def _myers_backtrack(trace, x, y, alo, blo):
+    'Matching blocks on the path ending at (x, y), see _myers_blocks()'
+    blocks = []
+    for cost in range(len(trace) - 1, -1, -1):
+        v = trace[cost]
+        k = x - y
+        if k == -cost or k != cost and v[k + cost] < v[k + cost + 2]:
+            prev_k = k + 1
+            mid_x = prev_x = v[prev_k + cost + 1]
+        else:
+            prev_k = k - 1
+            prev_x = v[prev_k + cost + 1]
+            mid_x = prev_x + 1
+        if x > mid_x:
+            blocks.append((alo + mid_x, blo + mid_x - k, x - mid_x))
+        x, y = prev_x, prev_x - prev_k
+    blocks.reverse()
+    return blocks
+
+
+class PatienceMatcher(SequenceMatcher):
+
+    """
+    PatienceMatcher matches two sequences of hashable elements like
+    SequenceMatcher does, in close to linear time on large sequences where
+    SequenceMatcher is quadratic or worse:
+
+    - common prefixes & suffixes are matched first;
+    - elements appearing once in both sequences are matched along their
+      longest common subsequence (patience diff), the gaps between these
+      anchors are matched the same way;
+    - gaps without anchors are matched with Myers' O(ND) algorithm, within
+      a budget of `max_cost` edits for the whole comparison. Once it is
+      spent, remaining gaps are left unmatched, i.e. reported as coarse
+      replace blocks.
+
+    >>> s = PatienceMatcher("abxcd", "abcd")
+    >>> s.get_matching_blocks()
+    [Match(a=0, b=0, size=2), Match(a=3, b=2, size=2), Match(a=5, b=4, size=0)]
+    """
+
+    def __init__(self, a='', b='', max_cost=None):
+        self.isjunk = None
+        self.a = self.b = None
+        self.max_cost = MAX_DIFF_COST if max_cost is None else max_cost
+        self.set_seqs(a, b)
+
+    def set_seq1(self, a):
+        'Set the first sequence to be compared.'
+        self.a = a
+        self.a_real_content = None
+        self.matching_blocks = self.opcodes = self._ratio = None
+
+    def set_seq2(self, b):
+        'Set the second sequence to be compared.'
+        self.b = b
+        self.b_real_content = None
+        self.matching_blocks = self.opcodes = self._ratio = None
+        self.fullbcount = None
+
+    def _anchors(self, alo, ahi, blo, bhi):
+        """
+        Longest increasing sequence of (i, j) pairs, a[i] == b[j] appearing
+        once in both a[alo:ahi] and b[blo:bhi].
+        """
+        a, b = self.a, self.b
+        # index of the element in the range, -1 if not unique
+        a_index, b_index = {}, {}
+        for i in range(alo, ahi):
+            a_index[a[i]] = -1 if a[i] in a_index else i
+        for j in range(blo, bhi):
+            if b[j] in a_index:
+                b_index[b[j]] = -1 if b[j] in b_index else j
+        pairs = sorted((i, b_index[elt]) for elt, i in a_index.items()
+                       if i >= 0 and b_index.get(elt, -1) >= 0)
+
+        # patience sorting, tails[n] is the smallest j ending a sequence
+        # of n + 1 pairs, previous links each pair to its predecessor
+        tails, tail_pairs, previous = [], [], [None] * len(pairs)
+        for idx, (_, j) in enumerate(pairs):
+            pos = bisect.bisect_left(tails, j)
+            if pos:
+                previous[idx] = tail_pairs[pos - 1]
+            if pos == len(tails):
+                tails.append(j)
+                tail_pairs.append(idx)
+            else:
+                tails[pos], tail_pairs[pos] = j, idx
+
+        anchors = []
+        idx = tail_pairs[-1] if tail_pairs else None
+        while idx is not None:
+            anchors.append(pairs[idx])
+            idx = previous[idx]
+        anchors.reverse()
+        return anchors
+
+    def get_matching_blocks(self):
+        """Return list of triples describing matching subsequences.
+
+        Same as SequenceMatcher.get_matching_blocks().
+        """
+
+        if self.matching_blocks is not None:
+            return self.matching_blocks
+        a, b = self.a, self.b
+        budget = self.max_cost
+
+        queue = [(0, len(a), 0, len(b))]
+        matching_blocks = []
+        while queue:
+            alo, ahi, blo, bhi = queue.pop()
+            size = 0
+            while alo + size < ahi and blo + size < bhi and \
+                    a[alo + size] == b[blo + size]:
+                size += 1
+            if size:
+                matching_blocks.append((alo, blo, size))
+                alo, blo = alo + size, blo + size
+            size = 0
+            while alo < ahi - size and blo < bhi - size and \
+                    a[ahi - size - 1] == b[bhi - size - 1]:
+                size += 1
+            if size:
+                ahi, bhi = ahi - size, bhi - size
+                matching_blocks.append((ahi, bhi, size))
+            if alo == ahi or blo == bhi:
+                continue
+
+            anchors = self._anchors(alo, ahi, blo, bhi)
+            if anchors:
+                for i, j in anchors:
+                    matching_blocks.append((i, j, 1))
+                    if alo < i and blo < j:
+                        queue.append((alo, i, blo, j))
+                    alo, blo = i + 1, j + 1
+                if alo < ahi and blo < bhi:
+                    queue.append((alo, ahi, blo, bhi))
+            elif budget > 0:
+                blocks, cost = _myers_blocks(
+                    a, b, alo, ahi, blo, bhi,
+                    min(budget, ahi - alo + bhi - blo))
+                budget -= cost
+                matching_blocks.extend(blocks or [])
+        matching_blocks.sort()
+
+        # collapse adjacent blocks, as SequenceMatcher does
+        i1 = j1 = k1 = 0
+        non_adjacent = []
+        for i2, j2, k2 in matching_blocks:
+            if i1 + k1 == i2 and j1 + k1 == j2:
+                k1 += k2
+            else:
+                if k1:
+                    non_adjacent.append((i1, j1, k1))
+                i1, j1, k1 = i2, j2, k2
+        if k1:
+            non_adjacent.append((i1, j1, k1))
+
+        non_adjacent.append((len(a), len(b), 0))
+        self.matching_blocks = [Match._make(block) for block in non_adjacent]
+        return self.matching_blocks
+
+
 def get_close_matches(word, possibilities, n=3, cutoff=0.6):
     """Use SequenceMatcher to return list of the best "good enough" matches.
 
@@ -836,15 +1047,21 @@ class SpaceIgnoredString(FuzzyMatchingString):
         self.ignore_whitespaces = ignore_whitespaces
 
     def real_content(self):
-        if self.ignore_whitespaces:
-            return re.sub(r'\s+', '', self)
-        elif self.ignore_space_change:
-            # gnu diff ignores all whitespace (include line-feed) in the
-            # right side when compare with -b or --ignore-space-change,
-            # just simulatethat behavior
-            return re.sub(r'\s+', ' ', self).rstrip()
-        else:
-            return str(self)
+        return _ignore_spaces(
+            str(self), self.ignore_space_change, self.ignore_whitespaces)
+
+
+def _ignore_spaces(line, ignore_space_change, ignore_whitespaces):
+    'Content of a line compared when ignoring whitespaces or their changes'
+    if ignore_whitespaces:
+        return re.sub(r'\s+', '', line)
+    elif ignore_space_change:
+        # gnu diff ignores all whitespace (include line-feed) in the
+        # right side when compare with -b or --ignore-space-change,
+        # just simulatethat behavior
+        return re.sub(r'\s+', ' ', line).rstrip()
+    else:
+        return line
 
 
 class Differ(object):
@@ -897,7 +1114,9 @@ class Differ(object):
         self, linejunk=None, charjunk=None,
         ignore_space_change=False,
         ignore_whitespaces=False,
-        ignore_blank_lines=False
+        ignore_blank_lines=False,
+        patience_threshold=PATIENCE_THRESHOLD,
+        max_cost=MAX_DIFF_COST
     ):
         """
         Construct a text differencer, with optional filters.
@@ -923,6 +1142,12 @@ class Differ(object):
         - `ignore_whitespaces`: refer to gnu diff option -w
 
         - `ignore_blank_lines`: refer to gnu diff option -B
+
+        - `patience_threshold`: texts with more lines than that in total are
+          compared with PatienceMatcher, which scales to large texts, and
+          similar lines are only searched in small replace blocks.
+
+        - `max_cost`: edit budget of PatienceMatcher, see its documentation.
         """
 
         self.linejunk = linejunk
@@ -930,6 +1155,8 @@ class Differ(object):
         self.ignore_space_change = ignore_space_change
         self.ignore_whitespaces = ignore_whitespaces
         self.ignore_blank_lines = ignore_blank_lines
+        self.patience_threshold = patience_threshold
+        self.max_cost = max_cost
 
     def get_opcodes(self, a, b):
         r"""
@@ -953,6 +1180,11 @@ class Differ(object):
         """
 
         assert all(str(i) != '' for i in a) and all(str(j) != '' for j in b)
+        if len(a) + len(b) > self.patience_threshold:
+            for opcode in self._get_patience_opcodes(a, b):
+                yield opcode
+            return
+
         if self.ignore_space_change or self.ignore_whitespaces:
             new_a, new_b = [], []
             for i in a:
@@ -979,6 +1211,46 @@ class Differ(object):
             for tag, alo, ahi, blo, bhi in g:
                 yield (tag, alo, ahi, blo, bhi)
 
+    def _get_patience_opcodes(self, a, b):
+        """
+        Opcodes of large texts: lines are matched by PatienceMatcher on
+        integer ids of their (whitespace normalized) content, and similar
+        lines are only searched in replace blocks of at most
+        FANCY_REPLACE_LIMIT pairs of lines.
+        """
+        ids = {}
+        ignore_spaces = self.ignore_space_change or self.ignore_whitespaces
+        if ignore_spaces:
+            key = lambda line: _ignore_spaces(
+                str(line), self.ignore_space_change, self.ignore_whitespaces)
+        else:
+            key = str
+        a_ids = [ids.setdefault(key(line), len(ids)) for line in a]
+        b_ids = [ids.setdefault(key(line), len(ids)) for line in b]
+
+        cruncher = PatienceMatcher(a_ids, b_ids, max_cost=self.max_cost)
+        for tag, alo, ahi, blo, bhi in cruncher.get_opcodes():
+            if tag == 'replace' and \
+                    (ahi - alo) * (bhi - blo) <= FANCY_REPLACE_LIMIT:
+                if not ignore_spaces:
+                    for opcode in self._fancy_replace(
+                            a, alo, ahi, b, blo, bhi):
+                        yield opcode
+                    continue
+                # similar lines are compared ignoring spaces as in
+                # `get_opcodes`, only lines of the block get wrapped
+                new_a = [SpaceIgnoredString(i, self.ignore_space_change,
+                                            self.ignore_whitespaces)
+                         for i in a[alo:ahi]]
+                new_b = [SpaceIgnoredString(j, self.ignore_space_change,
+                                            self.ignore_whitespaces)
+                         for j in b[blo:bhi]]
+                for op, i1, i2, j1, j2 in self._fancy_replace(
+                        new_a, 0, ahi - alo, new_b, 0, bhi - blo):
+                    yield (op, alo + i1, alo + i2, blo + j1, blo + j2)
+            else:
+                yield (tag, alo, ahi, blo, bhi)
+
     def get_merged_opcodes(self, a, b):
         r"""
         Similar like get_opcodes(), but the adjacent items might be merge
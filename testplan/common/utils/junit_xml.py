@@ -0,0 +1,148 @@
+"""
+Merging of test results XML outputs in the GTest format, which is JUnit like
+(``testsuites`` of ``testsuite`` elements of ``testcase`` elements).
+"""
+import collections
+import heapq
+
+from lxml import etree
+
+
+def merge_xml(paths, output_path, test_context):
+    """
+    Merge XML files in the GTest (JUnit like) format, e.g. of the shards or
+    parts of a test, into a single file. Suites & testcases are ordered as in
+    the given test context.
+
+    The files are parsed incrementally and testcases are written as they are
+    read, so the XML outputs are never fully loaded into memory. Testcases of
+    a suite are expected in test context order within each file, as GTest
+    writes them.
+
+    :param paths: Paths of the XML files to merge.
+    :type paths: ``list`` of ``str``
+    :param output_path: Path of the merged XML file.
+    :type output_path: ``str``
+    :param test_context: Suite names & their testcase names.
+    :type test_context: ``list`` of (``str``, ``list`` of ``str``)
+    """
+    root_tag, root_attrib = None, {}
+    # Suite name -> (tag, summed attributes, indices of the files having it)
+    suites = collections.OrderedDict()
+
+    for idx, path in enumerate(paths):
+        reader = _SuiteReader(path)
+        if root_tag is None:
+            root_tag, root_attrib = reader.root.tag, dict(reader.root.attrib)
+        else:
+            _sum_attributes(root_attrib, reader.root.attrib, max_time=True)
+
+        while reader.suite is not None:
+            name = reader.suite.get('name')
+            if name not in suites:
+                suites[name] = (
+                    reader.suite.tag, dict(reader.suite.attrib), [idx])
+            elif idx not in suites[name][2]:
+                _sum_attributes(suites[name][1], reader.suite.attrib)
+                suites[name][2].append(idx)
+            for _ in reader.cases():
+                pass
+
+    order = {
+        suite_name: (idx, {name: pos for pos, name in enumerate(cases)})
+        for idx, (suite_name, cases) in enumerate(test_context or [])
+    }
+    default = (len(order), {})
+
+    readers = {}
+    with etree.xmlfile(output_path, encoding='UTF-8') as xml_file:
+        xml_file.write_declaration()
+        with xml_file.element(root_tag, root_attrib):
+            for name in sorted(suites, key=lambda name: order.get(
+                    name, default)[0]):
+                tag, attrib, indices = suites[name]
+                case_order = order.get(name, default)[1]
+                cases = []
+                for idx in indices:
+                    # Suites are read in order, a file is only parsed again
+                    # if its suites are not in test context order.
+                    if idx not in readers or not readers[idx].seek(name):
+                        readers[idx] = _SuiteReader(paths[idx])
+                        readers[idx].seek(name)
+                    cases.append(
+                        _ordered_cases(readers[idx], idx, case_order))
+                with xml_file.element(tag, attrib):
+                    for _, case in heapq.merge(*cases):
+                        xml_file.write(case)
+
+
+class _SuiteReader(object):
+    """
+    Incremental reader of the suites of an XML file, elements are cleared
+    once they are read.
+    """
+
+    def __init__(self, path):
+        self._events = etree.iterparse(
+            path, events=('start', 'end'), huge_tree=True)
+        _, self.root = next(self._events)
+        self.suite = None
+        self._next_suite()
+
+    def _next_suite(self):
+        """Move to the next suite, ``suite`` is None at the end of the file."""
+        self.suite = None
+        for event, element in self._events:
+            if event == 'start' and element.getparent() is self.root:
+                self.suite = element
+                return
+
+    def cases(self):
+        """Yield the testcases of the suite, then move to the next suite."""
+        suite = self.suite
+        for event, element in self._events:
+            if event != 'end':
+                continue
+            if element is suite:
+                break
+            if element.getparent() is suite:
+                yield element
+                _clear(element)
+        _clear(suite)
+        self._next_suite()
+
+    def seek(self, name):
+        """
+        Move forward to the suite with the given name.
+
+        :return: Whether the suite was found.
+        :rtype: ``bool``
+        """
+        while self.suite is not None and self.suite.get('name') != name:
+            for _ in self.cases():
+                pass
+        return self.suite is not None
+
+
+def _ordered_cases(reader, idx, case_order):
+    """Testcases of a suite with their sort keys for ``heapq.merge``."""
+    for pos, case in enumerate(reader.cases()):
+        key = case_order.get(case.get('name'), len(case_order))
+        yield (key, idx, pos), case
+
+
+def _clear(element):
+    """Clear an element and drop the already read elements before it."""
+    element.clear()
+    while element.getprevious() is not None:
+        del element.getparent()[0]
+
+
+def _sum_attributes(target, source, max_time=False):
+    """Add up the test counts & time of XML elements attributes."""
+    for attr in ('tests', 'failures', 'disabled', 'errors'):
+        if attr in source:
+            target[attr] = str(int(target.get(attr, 0)) + int(source[attr]))
+    if 'time' in source:
+        times = float(target.get('time', 0)), float(source['time'])
+        target['time'] = str(max(times) if max_time else sum(times))
@@ -1,7 +1,28 @@
 """
 Module of utility types and functions that perform matching.
 """
+import collections
+import mmap
 import os
+import re
+
+import six
+
+# Bytes of context kept around matches found by scan_file, on their line.
+SNIPPET_CONTEXT = 80
+
+# Size of the chunks newlines are counted in, by scan_file.
+_COUNT_CHUNK = 1 << 24
+
+# Leading inline flags of a bytes pattern, e.g. (?i).
+_GLOBAL_FLAGS = re.compile(br'^(?:\(\?[aiLmsux]+\))+')
+
+# Named groups of a bytes pattern, unless the parenthesis is escaped.
+_NAMED_GROUP = re.compile(br'(?<!\\)\(\?P<\w+>')
+
+# References to groups of a bytes pattern, by number or name, including
+# conditional groups.
+_BACK_REFERENCE = re.compile(br'\\[1-9]|\(\?P=|\(\?\(')
 
 
 def match_regexps_in_file(logpath, log_extracts, return_unmatched=False):
@@ -73,3 +94,182 @@ class LogMatcher(object):
                     return match
 
         raise ValueError('No matches found')
+
+
+def bytes_regexp(pattern, flags=0, encoding='utf-8', line_start=False):
+    """
+    Compile a regular expression to search bytes, e.g. memory mapped files.
+
+    :param pattern: String pattern or compiled regexp object, the flags of
+        the latter are kept.
+    :type pattern: ``str`` or ``bytes`` or compiled regex
+    :param flags: Regex flags of string patterns.
+    :type flags: ``int``
+    :param encoding: Encoding of string patterns.
+    :type encoding: ``str``
+    :param line_start: Only match at the start of lines.
+    :type line_start: ``bool``
+    :return: Compiled bytes regexp.
+    :rtype: compiled regex
+    """
+    if not isinstance(pattern, (six.string_types, six.binary_type)):
+        pattern, flags = pattern.pattern, pattern.flags
+    if isinstance(pattern, six.text_type):
+        pattern = pattern.encode(encoding)
+    # Bytes patterns cannot be unicode
+    flags &= ~re.UNICODE
+    # Leading inline flags, e.g. (?i), are turned into flags of the regexp,
+    # they must stay at the start of the patterns wrapping or combining it
+    flags = re.compile(pattern, flags).flags
+    pattern = _GLOBAL_FLAGS.sub(b'', pattern)
+    if line_start:
+        pattern = b'^(?:' + pattern + b')'
+        flags |= re.MULTILINE
+    return re.compile(pattern, flags)
+
+
+def _alternation(regexps, indexes):
+    """
+    Single regexp matching any of the regexps at the given indexes, which
+    must share their flags. Alternatives are not captured and their named
+    groups are made non capturing, so that group names can be repeated:
+    capturing groups also disable the first character prefilter of ``re``,
+    making searches of large files several times slower.
+    """
+    return re.compile(
+        b'|'.join(b'(?:' + _NAMED_GROUP.sub(b'(?:', regexps[idx].pattern) +
+                  b')' for idx in indexes),
+        regexps[indexes[0]].flags)
+
+
+def _alternations(regexps, indexes):
+    """
+    Regexps matching any of the regexps at the given indexes, one
+    alternation per group of regexps sharing the same flags. Regexps with
+    back references, whose group numbers or names would change, and the
+    regexps of alternations that do not compile are searched on their own.
+    """
+    groups = collections.OrderedDict()
+    alone = []
+    for idx in indexes:
+        if _BACK_REFERENCE.search(regexps[idx].pattern):
+            alone.append(regexps[idx])
+        else:
+            groups.setdefault(regexps[idx].flags, []).append(idx)
+
+    alternations = []
+    for group in groups.values():
+        try:
+            alternations.append(_alternation(regexps, group))
+        except re.error:
+            alternations.extend(regexps[idx] for idx in group)
+    return alternations + alone
+
+
+def _next_start(alternations, starts, data, pos):
+    """
+    Start of the first match of any of the alternations from ``pos``, or
+    ``None``. ``starts`` holds the start of the next match of each
+    alternation found by previous calls, ``None`` if it is to be searched
+    and ``-1`` if there is none, only the alternations whose next match
+    starts before ``pos`` are searched again.
+    """
+    for group, alternation in enumerate(alternations):
+        if starts[group] is None or 0 <= starts[group] < pos:
+            match = alternation.search(data, pos)
+            starts[group] = -1 if match is None else match.start()
+    found = [start for start in starts if start != -1]
+    return min(found) if found else None
+
+
+def _snippet(data, start, end, encoding):
+    """Line of a match, cut at SNIPPET_CONTEXT bytes around it."""
+    begin = data.rfind(b'\n', max(start - SNIPPET_CONTEXT, 0), start) + 1 \
+        or max(start - SNIPPET_CONTEXT, 0)
+    stop = data.find(b'\n', end, end + SNIPPET_CONTEXT)
+    if stop == -1:
+        stop = min(end + SNIPPET_CONTEXT, len(data))
+    stop = max(stop, begin)
+    return (data[begin:stop].decode(encoding, 'replace'),
+            [start - begin, min(end, stop) - begin])
+
+
+def scan_file(path, regexps, stop_at_first=False, encoding='utf-8',
+              single_line=False):
+    """
+    Search a file for several regexps in a single pass. The file is memory
+    mapped rather than read, and the regexps sharing the same flags are
+    combined in a single alternation, so scanning a large file for many
+    patterns is about as fast as scanning it for one. Scanning stops once
+    every regexp matched, or at the first match if ``stop_at_first`` is set.
+
+    Each regexp is matched at the start of every match of the alternation,
+    so that the first match of each one is found even when matches overlap.
+    With ``single_line`` set, it is matched against the rest of the line
+    only, as if the file was matched line by line.
+
+    :param path: Path of the file.
+    :type path: ``str``
+    :param regexps: Bytes regexps, see :py:func:`bytes_regexp`.
+    :type regexps: ``list`` of compiled regex
+    :param stop_at_first: Stop at the first match of any regexp.
+    :type stop_at_first: ``bool``
+    :param encoding: Encoding of the snippets of the file.
+    :type encoding: ``str``
+    :param single_line: Matches do not span several lines.
+    :type single_line: ``bool``
+    :return: First match of each regexp by index of the regexp: its
+        ``start`` & ``end`` offsets, (0 based) ``line_no``, ``snippet``, the
+        line of the match cut around it, and ``snippet_span``, offsets of
+        the match in the snippet.
+    :rtype: ``dict`` of ``int``: ``dict``
+    """
+    found = {}
+    with open(path, 'rb') as source:
+        try:
+            data = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            data = b''
+        try:
+            remaining = list(range(len(regexps)))
+            alternations = _alternations(regexps, remaining)
+            starts = [None] * len(alternations)
+            pos = counted = line_no = 0
+            while remaining:
+                start = _next_start(alternations, starts, data, pos)
+                if start is None:
+                    break
+                for offset in range(counted, start, _COUNT_CHUNK):
+                    line_no += data[
+                        offset:min(offset + _COUNT_CHUNK, start)].count(b'\n')
+                counted = max(counted, start)
+
+                end_pos = len(data)
+                if single_line:
+                    line_end = data.find(b'\n', start)
+                    if line_end != -1:
+                        end_pos = line_end
+                for idx in remaining:
+                    found_match = regexps[idx].match(data, start, end_pos)
+                    if found_match is None:
+                        continue
+                    end = found_match.end()
+                    snippet, snippet_span = _snippet(
+                        data, start, end, encoding)
+                    found[idx] = {
+                        'start': start, 'end': end, 'line_no': line_no,
+                        'snippet': snippet, 'snippet_span': snippet_span}
+
+                if stop_at_first:
+                    break
+                if any(idx in found for idx in remaining):
+                    # Patterns found are not searched any more
+                    remaining = [idx for idx in remaining if idx not in found]
+                    alternations = _alternations(regexps, remaining)
+                    starts = [None] * len(alternations)
+                pos = start + 1
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+    return found
@@ -1,12 +1,16 @@
 """Dirs/file path utilities."""
 
 import os
+import uuid
 import errno
 import shutil
 import getpass
+import hashlib
 import contextlib
 import tempfile
 
+import six
+
 from .strings import slugify
 
 from testplan.vendor.tempita import Template
@@ -139,6 +143,218 @@ class StdFiles(object):
         self.out.close()
 
 
+# Stat & content digest of files by path.
+_DIGESTS = {}
+MAX_DIGESTS = 4096
+
+# Parsed templates & the names they reference by content digest.
+_TEMPLATES = {}
+
+# Renderings of templates by content digest & values of referenced names.
+_RENDERED = {}
+MAX_RENDERED = 1024
+
+# Values of these types can be part of a rendering key.
+_PLAIN_VALUE_TYPES = (six.text_type, six.binary_type, float, bool,
+                      type(None)) + six.integer_types
+
+# Names through which a template can depend on more than the values of the
+# names it references.
+_DYNAMIC_NAMES = frozenset((
+    'eval', 'exec', 'compile', 'locals', 'globals', 'vars', 'open',
+    '__import__'))
+
+
+def file_digest(path):
+    """
+    SHA1 digest of the content of a file, computed once per path as long as
+    the size & modification time of the file are unchanged.
+
+    :param path: File path.
+    :type path: ``str``
+    :return: Hexadecimal digest.
+    :rtype: ``str``
+    """
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    key = (stat.st_size, getattr(stat, 'st_mtime_ns', stat.st_mtime),
+           stat.st_ino)
+    cached = _DIGESTS.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as source:
+        for chunk in iter(lambda: source.read(1024 * 1024), b''):
+            sha1.update(chunk)
+    digest = sha1.hexdigest()
+    # The digest of a changed file replaces its stale one.
+    if path not in _DIGESTS and len(_DIGESTS) >= MAX_DIGESTS:
+        _DIGESTS.clear()
+    _DIGESTS[path] = (key, digest)
+    return digest
+
+
+def link_or_copy(source, destination):
+    """
+    Hardlink a file to a destination, or copy it along with its permission
+    bits if it cannot be linked (e.g. on another filesystem).
+
+    :param source: File path.
+    :type source: ``str``
+    :param destination: Destination file path.
+    :type destination: ``str``
+    :return: Whether the file was linked.
+    :rtype: ``bool``
+    """
+    try:
+        os.link(source, destination)
+        return True
+    except (AttributeError, OSError):
+        shutil.copyfile(source, destination)
+        shutil.copymode(source, destination)
+        return False
+
+
+def cached_copy(source, destination, cache_dir):
+    """
+    Copy a file through a content-addressed cache directory: the file is
+    copied to the cache once per content and the destination is a hardlink
+    to the cached copy. Processes can share the cache directory.
+
+    :param source: File path.
+    :type source: ``str``
+    :param destination: Destination file path.
+    :type destination: ``str``
+    :param cache_dir: Cache directory, created if missing.
+    :type cache_dir: ``str``
+    """
+    makedirs(cache_dir)
+    entry = os.path.join(cache_dir, file_digest(source))
+    if not os.path.exists(entry):
+        partial = '{}.{}'.format(entry, uuid.uuid4().hex)
+        shutil.copyfile(source, partial)
+        shutil.copymode(source, partial)
+        try:
+            os.rename(partial, entry)
+        except OSError:
+            # Another process cached the same content.
+            if not os.path.exists(entry):
+                raise
+            os.remove(partial)
+
+    if os.path.lexists(destination):
+        os.remove(destination)
+    link_or_copy(entry, destination)
+
+
+def _code_names(code):
+    """Global names referenced by a code object and its nested code."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, 'co_names'):
+            names.update(_code_names(const))
+    return names
+
+
+def _template_names(parsed):
+    """
+    Names referenced by the parsed chunks of a template, ``None`` if its
+    rendering can depend on more than the values of these names (e.g. it
+    executes python blocks).
+    """
+    names = set()
+    for chunk in parsed:
+        if isinstance(chunk, six.string_types):
+            continue
+        kind = chunk[0]
+        nested = []
+        if kind == 'expr':
+            codes = chunk[2].split('|')
+        elif kind == 'for':
+            codes = [chunk[3]]
+            nested.append(chunk[4])
+        elif kind == 'cond':
+            codes = [part[2] for part in chunk[2:] if part[0] != 'else']
+            nested.extend(part[3] for part in chunk[2:])
+        elif kind == 'default':
+            codes = [chunk[3]]
+            names.add(chunk[2])
+        elif kind in ('comment', 'continue', 'break'):
+            continue
+        else:
+            return None
+
+        for code in codes:
+            try:
+                names.update(_code_names(
+                    compile(code.strip(), '<template>', 'eval')))
+            except SyntaxError:
+                return None
+        for chunks in nested:
+            nested_names = _template_names(chunks)
+            if nested_names is None:
+                return None
+            names.update(nested_names)
+
+    if names & _DYNAMIC_NAMES:
+        return None
+    return names
+
+
+def _rendering_key(digest, names, values):
+    """
+    Key of the rendering of a template with a set of values, ``None`` if
+    the template references values that cannot be part of a key.
+    """
+    if names is None:
+        return None
+    items = []
+    for name in sorted(names):
+        if name not in values:
+            continue
+        value = values[name]
+        if type(value) not in _PLAIN_VALUE_TYPES:
+            return None
+        items.append((name, type(value), value))
+    return digest, tuple(items)
+
+
+def render_template(template, values):
+    """
+    Render a templated file with a set of values. Templates are parsed once
+    per content, renderings of templates that only reference plain values
+    (strings, numbers etc.) are memoised by template content & values.
+
+    :param template: the path to the templated file
+    :type template: ``str``
+    :param values: the context dict to be used when
+                   instantiating the templated file
+    :type values: ``dict``
+    :return: Rendered template.
+    :rtype: ``str``
+    """
+    digest = file_digest(template)
+    cached = _TEMPLATES.get(digest)
+    if cached is None:
+        with open(template, 'r') as source:
+            tmplt = Template(source.read())
+        # pylint: disable=protected-access
+        cached = _TEMPLATES[digest] = (tmplt, _template_names(tmplt._parsed))
+
+    tmplt, names = cached
+    key = _rendering_key(digest, names, values)
+    if key is not None and key in _RENDERED:
+        return _RENDERED[key]
+
+    rendered = tmplt.substitute(values)
+    if key is not None:
+        if len(_RENDERED) >= MAX_RENDERED:
+            _RENDERED.clear()
+        _RENDERED[key] = rendered
+    return rendered
+
+
 def instantiate(template, values, destination):
     """
     Instantiate a templated file with a set of values and
@@ -160,14 +376,12 @@ def instantiate(template, values, destination):
     if os.path.isdir(destination):
         destination = os.path.join(destination, os.path.basename(template))
     with open(destination, 'w') as target:
-        with open(template, 'r') as source:
-            try:
-                tmplt = Template(source.read())
-                target.write(tmplt.substitute(values))
-            except Exception as exc:
-                raise Exception(
-                    'On reading/writing template: {} - of file {}'.format(
-                        exc, template))
+        try:
+            target.write(render_template(template, values))
+        except Exception as exc:
+            raise Exception(
+                'On reading/writing template: {} - of file {}'.format(
+                    exc, template))
 
 
 def unique_name(name, names):
@@ -1,6 +1,9 @@
 """System process utilities module."""
 
+import os
 import time
+import errno
+import select
 import signal
 import psutil
 import warnings
@@ -10,6 +13,8 @@ import platform
 import threading
 import functools
 
+import six
+
 from .timing import exponential_interval
 
 
@@ -23,56 +28,183 @@ def _log_proc(msg, warn=False, output=None):
         warnings.warn(msg)
 
 
-def kill_process(proc, timeout=5, signal_=None, output=None):
+def process_group_options():
     """
-    If alive, kills the process.
-    First call ``terminate()`` or pass ``signal_`` if specified
-    to terminate for up to time specified in timeout parameter.
+    Keyword arguments of ``subprocess.Popen`` starting the child process in
+    a new process group, so that it can be terminated along with all the
+    processes it starts.
 
-    If process hangs then call ``kill()``.
+    :return: ``subprocess.Popen`` keyword arguments.
+    :rtype: ``dict``
+    """
+    if platform.system() == 'Windows':
+        return {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    if six.PY2:
+        return {'preexec_fn': os.setsid}
+    return {'start_new_session': True}
 
-    :param proc: process to kill
+
+def _process_group(proc):
+    """Process group id of a process leading its own group, else ``None``."""
+    if not hasattr(os, 'killpg'):
+        return None
+    try:
+        pgid = os.getpgid(proc.pid)
+    except OSError:
+        return None
+    # Never signal the group of the current process.
+    if pgid != proc.pid or pgid == os.getpgrp():
+        return None
+    return pgid
+
+
+def _signal_group(pgid, signal_):
+    """Signal a process group, returns ``False`` if it no longer exists."""
+    try:
+        os.killpg(pgid, signal_)
+    except OSError as exc:
+        if exc.errno == errno.ESRCH:
+            return False
+        raise
+    return True
+
+
+def terminate_process(proc, signal_=None, output=None):
+    """
+    Send ``signal_`` (``SIGTERM`` by default) to a process and all its
+    descendants without waiting for them to exit. The whole process group
+    is signalled when the process leads its own group (see
+    :py:func:`process_group_options`), otherwise its descendants are
+    signalled one by one.
+
+    :param proc: Process to terminate.
     :type proc: ``subprocess.Popen``
-    :param timeout: timeout in seconds, defaults to 5 seconds
-    :type timeout: ``int``
+    :param signal_: Signal to send, ``terminate()`` is used by default.
+    :type signal_: ``int``
     :param output: Optional file like object for writing logs.
     :type output: ``file``
+    :return: Terminated processes, to be passed to :py:func:`reap_process`.
+    :rtype: ``tuple`` of process group id (or ``None``) and ``list`` of
+        ``psutil.Process`` descendants
     """
     _log = functools.partial(_log_proc, output=output)
 
-    retcode = proc.poll()
+    pgid = _process_group(proc)
+    if pgid is not None:
+        _signal_group(pgid, signal.SIGTERM if signal_ is None else signal_)
+        return pgid, []
 
-    if retcode is not None:
-        return retcode
+    try:
+        descendants = psutil.Process(proc.pid).children(recursive=True)
+    except psutil.NoSuchProcess:
+        descendants = []
 
-    parent = psutil.Process(proc.pid)
-    for child in parent.children():
+    for child in descendants:
         try:
             child.send_signal(signal.SIGTERM)
+        except psutil.NoSuchProcess:
+            continue
         except Exception as exc:
             _log(
                 msg='While terminating child proc - {}'.format(exc),
                 warn=True
             )
 
-    if signal_ is not None:
-        proc.send_signal(signal_)
-    else:
-        proc.terminate()
+    if proc.poll() is None:
+        if signal_ is not None:
+            proc.send_signal(signal_)
+        else:
+            proc.terminate()
+
+    return None, descendants
+
+
+def wait_process(proc, timeout):
+    """
+    Wait for a child process to exit for up to ``timeout`` seconds. The
+    wait is woken up by the exit of the process through a pidfd when the
+    platform supports it, ``waitpid`` is used otherwise.
+
+    :param proc: Process to wait for.
+    :type proc: ``subprocess.Popen``
+    :param timeout: Maximum time to wait in seconds.
+    :type timeout: ``int`` or ``float``
+    :return: Return code of the process, ``None`` if still running.
+    :rtype: ``int`` or ``NoneType``
+    """
+    timeout = max(timeout, 0)
+    if proc.poll() is not None:
+        return proc.returncode
+
+    pidfd_open = getattr(os, 'pidfd_open', None)
+    if pidfd_open is not None:
+        try:
+            pidfd = pidfd_open(proc.pid)  # pylint: disable=not-callable
+        except OSError:
+            pass
+        else:
+            try:
+                select.select([pidfd], [], [], timeout)
+            finally:
+                os.close(pidfd)
+            return proc.poll()
+
+    if six.PY3:
+        try:
+            return proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return None
+
+    end_time = time.time() + timeout
+    intervals = exponential_interval(initial=0.01, multiplier=1.5, maximum=0.5)
+    while proc.poll() is None:
+        remaining = end_time - time.time()
+        if remaining <= 0:
+            break
+        time.sleep(min(next(intervals), remaining))
+    return proc.returncode
 
-    begin = time.time()
-    intervals = exponential_interval(initial=0.05, multiplier=1.1, maximum=1)
 
-    while time.time() - begin >= timeout and retcode is None:
-        retcode = proc.poll()
+def _wait_group(pgid, end_time):
+    """
+    Wait until a process group without its reaped leader is empty, returns
+    ``False`` if it is not by ``end_time``.
+    """
+    intervals = exponential_interval(initial=0.01, multiplier=1.5, maximum=0.5)
+    while _signal_group(pgid, 0):
+        remaining = end_time - time.time()
+        if remaining <= 0:
+            return False
+        time.sleep(min(next(intervals), remaining))
+    return True
 
-        if retcode is None:
-            time.sleep(next(intervals))
 
-    if retcode is None:
+def reap_process(proc, terminated, timeout=5, output=None):
+    """
+    Wait for a process and its descendants signalled by
+    :py:func:`terminate_process` to exit for up to ``timeout`` seconds in
+    total, then kill the ones still alive.
+
+    :param proc: Terminated process.
+    :type proc: ``subprocess.Popen``
+    :param terminated: Value returned by :py:func:`terminate_process`.
+    :type terminated: ``tuple``
+    :param timeout: Maximum time to wait in seconds.
+    :type timeout: ``int`` or ``float``
+    :param output: Optional file like object for writing logs.
+    :type output: ``file``
+    :return: Return code of the process.
+    :rtype: ``int``
+    """
+    _log = functools.partial(_log_proc, output=output)
+    pgid, descendants = terminated
+    end_time = time.time() + timeout
+
+    if wait_process(proc, timeout) is None:
+        _log(msg='Binary still alive, killing it')
         try:
-            _log(msg='Binary still alive, killing it')
-            proc.kill()
+            if pgid is None or not _signal_group(pgid, signal.SIGKILL):
+                proc.kill()
             proc.wait()
         except (RuntimeError, OSError) as error:
             _log(
@@ -80,9 +212,52 @@ def kill_process(proc, timeout=5, signal_=None, output=None):
                 warn=True
             )
 
+    try:
+        if pgid is not None:
+            if not _wait_group(pgid, end_time):
+                _log(msg='Process group still alive, killing it')
+                _signal_group(pgid, signal.SIGKILL)
+        elif descendants:
+            _, alive = psutil.wait_procs(
+                descendants, timeout=max(end_time - time.time(), 0))
+            for child in alive:
+                try:
+                    child.kill()
+                except psutil.NoSuchProcess:
+                    pass
+    except (RuntimeError, OSError, psutil.Error) as error:
+        _log(
+            msg='Could not kill child processes - {}'.format(error),
+            warn=True
+        )
+
     return proc.returncode
 
 
+def kill_process(proc, timeout=5, signal_=None, output=None):
+    """
+    If alive, kills the process and all its descendants.
+    First call ``terminate()`` or pass ``signal_`` if specified
+    to terminate for up to time specified in timeout parameter.
+
+    If process hangs then call ``kill()``.
+
+    :param proc: process to kill
+    :type proc: ``subprocess.Popen``
+    :param timeout: timeout in seconds, defaults to 5 seconds
+    :type timeout: ``int``
+    :param output: Optional file like object for writing logs.
+    :type output: ``file``
+    """
+    retcode = proc.poll()
+
+    if retcode is not None:
+        return retcode
+
+    terminated = terminate_process(proc, signal_=signal_, output=output)
+    return reap_process(proc, terminated, timeout=timeout, output=output)
+
+
 DEFAULT_CLOSE_FDS = platform.system() != 'Windows'
 
 
@@ -0,0 +1,366 @@
+"""
+Wall & CPU time of the steps of a test (testcases, suite setup & teardown,
+driver start & stop...) and profiling of selected testcases with cProfile or
+a sampling profiler, producing top-N hotspots & collapsed stacks that can be
+rendered as flame graphs (e.g. with ``flamegraph.pl`` or speedscope).
+"""
+import collections
+import contextlib
+import fnmatch
+import os
+import pstats
+import sys
+import threading
+import time
+
+from .path import makedirs
+from .strings import slugify
+
+# Profilers of the testcases.
+CPROFILE = 'cprofile'
+SAMPLING = 'sampling'
+PROFILERS = (CPROFILE, SAMPLING)
+
+# Kinds of timed steps.
+TESTCASE = 'testcase'
+SUITE = 'suite'
+DRIVER = 'driver'
+EXPORTER = 'exporter'
+
+SAMPLING_INTERVAL = 0.005
+
+
+def cpu_time():
+    """
+    CPU time of the current thread in seconds, of the process if the
+    platform cannot measure threads.
+    """
+    if hasattr(time, 'thread_time'):
+        return time.thread_time()
+    if hasattr(time, 'process_time'):
+        return time.process_time()
+    return sum(os.times()[:2])
+
+
+def _frame_label(code):
+    """Collapsed stack label of a code object, as used by py-spy."""
+    return '{} ({}:{})'.format(
+        code.co_name, os.path.basename(code.co_filename), code.co_firstlineno)
+
+
+class Timings(object):
+    """
+    Wall & CPU time of named steps, which can be recorded from several
+    threads. CPU time is the one of the thread executing the step.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def record(self, kind, name):
+        """
+        Record the wall & CPU time of the block.
+
+        :param kind: Kind of step, e.g. ``testcase`` or ``driver``.
+        :type kind: ``str``
+        :param name: Name of the step.
+        :type name: ``str``
+        """
+        start, start_cpu = time.time(), cpu_time()
+        try:
+            yield
+        finally:
+            record = {
+                'kind': kind,
+                'name': name,
+                'start': start,
+                'wall': round(time.time() - start, 6),
+                'cpu': round(cpu_time() - start_cpu, 6),
+            }
+            with self._lock:
+                self.records.append(record)
+
+    def to_list(self):
+        """
+        :return: Records in the order the steps completed.
+        :rtype: ``list`` of ``dict``
+        """
+        with self._lock:
+            return list(self.records)
+
+
+class SamplingProfiler(object):
+    """
+    Samples the stack of a thread on a background thread, counting the
+    collapsed stacks seen.
+
+    :param thread_id: Identifier of the sampled thread.
+    :type thread_id: ``int``
+    :param interval: Seconds between samples.
+    :type interval: ``float``
+    """
+
+    def __init__(self, thread_id, interval=SAMPLING_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = collections.Counter()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        labels = []
+        while frame is not None:
+            labels.append(_frame_label(frame.f_code))
+            frame = frame.f_back
+        if labels:
+            self.stacks[';'.join(reversed(labels))] += 1
+
+    def _loop(self):
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        """Start sampling."""
+        self._thread = threading.Thread(
+            target=self._loop, name='SamplingProfiler-{}'.format(
+                self.thread_id))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling."""
+        self._stop_event.set()
+        self._thread.join()
+
+    def hotspots(self, top):
+        """
+        Functions the sampled thread spent the most time in.
+
+        :param top: Number of functions.
+        :type top: ``int``
+        :return: Function, estimated self & cumulative seconds.
+        :rtype: ``list`` of ``dict``
+        """
+        own = collections.Counter()
+        cumulative = collections.Counter()
+        for stack, count in self.stacks.items():
+            labels = stack.split(';')
+            own[labels[-1]] += count
+            for label in set(labels):
+                cumulative[label] += count
+        return [
+            {'function': label, 'calls': None,
+             'self': round(count * self.interval, 6),
+             'cumulative': round(cumulative[label] * self.interval, 6)}
+            for label, count in own.most_common(top)
+        ]
+
+    def collapsed(self):
+        """
+        :return: Collapsed stacks, one ``frame;frame;... count`` line each.
+        :rtype: ``str``
+        """
+        return ''.join('{} {}\n'.format(stack, count)
+                       for stack, count in sorted(self.stacks.items()))
+
+
+class ScopedProfiler(object):
+    """
+    Profiles the current thread while in its context.
+
+    :param profiler: ``cprofile`` (deterministic, every call is recorded)
+        or ``sampling`` (low overhead, also produces collapsed stacks).
+    :type profiler: ``str``
+    """
+
+    def __init__(self, profiler=CPROFILE):
+        self.profiler = profiler
+        self._profile = None
+        self._sampler = None
+
+    def __enter__(self):
+        if self.profiler == CPROFILE:
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = SamplingProfiler(threading.current_thread().ident)
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *args):
+        if self._profile is not None:
+            self._profile.disable()
+        else:
+            self._sampler.stop()
+        return False
+
+    def hotspots(self, top):
+        """
+        Functions the profiled code spent the most time in (excluding the
+        functions they call).
+
+        :param top: Number of functions.
+        :type top: ``int``
+        :return: Function, number of calls (``None`` if sampled), self &
+            cumulative seconds.
+        :rtype: ``list`` of ``dict``
+        """
+        if self._sampler is not None:
+            return self._sampler.hotspots(top)
+
+        stats = pstats.Stats(self._profile).stats
+        ranked = sorted(stats.items(), key=lambda item: -item[1][2])[:top]
+        return [
+            {'function': '{} ({}:{})'.format(
+                func, os.path.basename(filename), line),
+             'calls': calls, 'self': round(own, 6),
+             'cumulative': round(cumulative, 6)}
+            for (filename, line, func), (_, calls, own, cumulative, _)
+            in ranked
+        ]
+
+    def save(self, directory, name):
+        """
+        Save the profile: ``.pstat`` statistics for cProfile (for pstats,
+        snakeviz...), ``.collapsed`` stacks for the sampling profiler.
+
+        :param directory: Directory of the profiles, must exist.
+        :type directory: ``str``
+        :param name: Name of the profile, e.g. of the testcase.
+        :type name: ``str``
+        :return: Path of the profile.
+        :rtype: ``str``
+        """
+        name = slugify(name.replace(':', ' '))
+        if self._profile is not None:
+            path = os.path.join(directory, '{}.pstat'.format(name))
+            self._profile.dump_stats(path)
+        else:
+            path = os.path.join(directory, '{}.collapsed'.format(name))
+            with open(path, 'w') as collapsed:
+                collapsed.write(self._sampler.collapsed())
+        return path
+
+
+class Profiling(object):
+    """
+    Timings & profiles of the steps of a test.
+
+    :param timings: Record the wall & CPU time of every step.
+    :type timings: ``bool``
+    :param pattern: Glob pattern of the names of the testcases to profile,
+        matched against ``<suite>:<testcase>`` if it contains a colon and
+        against the testcase name otherwise.
+    :type pattern: ``str``
+    :param profiler: Profiler of the testcases, see :py:class:`ScopedProfiler`.
+    :type profiler: ``str``
+    :param top: Number of hotspots kept per testcase profile.
+    :type top: ``int``
+    :param directory: Directory the profiles are saved in, created if
+        missing.
+    :type directory: ``str``
+    """
+
+    def __init__(self, timings=False, pattern=None, profiler=CPROFILE,
+                 top=20, directory=None):
+        self.timings = Timings() if timings else None
+        self.pattern = pattern
+        self.profiler = profiler
+        self.top = top
+        self.directory = directory
+        self.profiles = {}
+        self._lock = threading.Lock()
+
+    def matches(self, suite, testcase):
+        """Whether the testcase of a suite is profiled."""
+        if not self.pattern:
+            return False
+        if ':' in self.pattern:
+            return fnmatch.fnmatch(
+                '{}:{}'.format(suite, testcase), self.pattern)
+        return fnmatch.fnmatch(testcase, self.pattern)
+
+    @contextlib.contextmanager
+    def testcase(self, suite, testcase):
+        """Time & profile, if it matches the pattern, a testcase."""
+        name = '{}:{}'.format(suite, testcase)
+        if not self.matches(suite, testcase):
+            with self.step(TESTCASE, name):
+                yield
+            return
+
+        profiler = ScopedProfiler(self.profiler)
+        with self.step(TESTCASE, name):
+            with profiler:
+                yield
+
+        makedirs(self.directory)
+        profile = {
+            'profiler': self.profiler,
+            'hotspots': profiler.hotspots(self.top),
+            'path': profiler.save(self.directory, name),
+        }
+        with self._lock:
+            self.profiles[name] = profile
+
+    @contextlib.contextmanager
+    def step(self, kind, name):
+        """Time a step if timings are recorded."""
+        if self.timings is None:
+            yield
+        else:
+            with self.timings.record(kind, name):
+                yield
+
+    def to_dict(self):
+        """
+        :return: Timings of the steps & profiles by testcase, ``None`` if
+            nothing was recorded.
+        :rtype: ``dict``
+        """
+        timings = self.timings.to_list() if self.timings else []
+        if not timings and not self.profiles:
+            return None
+        with self._lock:
+            profiles = dict(self.profiles)
+        return {'timings': timings, 'profiles': profiles}
+
+
+def merge_profile(profile, other):
+    """
+    Merge the profiles of two reports (e.g. of parts of a test).
+
+    :param profile: Profile to update, may be ``None``.
+    :type profile: ``dict``
+    :param other: Profile to merge, may be ``None``.
+    :type other: ``dict``
+    :return: Merged profile.
+    :rtype: ``dict``
+    """
+    if not other:
+        return profile
+    if not profile:
+        return other
+    profiles = dict(profile['profiles'])
+    profiles.update(other['profiles'])
+    # Timings already merged, e.g. when a report is merged again, are kept
+    # once so that merging is idempotent.
+    seen = set(_timing_key(timing) for timing in profile['timings'])
+    timings = list(profile['timings'])
+    for timing in other['timings']:
+        key = _timing_key(timing)
+        if key not in seen:
+            seen.add(key)
+            timings.append(timing)
+    return {'timings': timings, 'profiles': profiles}
+
+
+def _timing_key(timing):
+    """Identity of a timing record, i.e. the step & when it started."""
+    return timing['kind'], timing['name'], timing.get('start')
@@ -53,6 +53,34 @@ def callable_name(callable_obj):
             callable_obj.__class__.__name__)
 
 
+def _render(obj, key=None):
+    """
+    Performs rendering to JSON dict
+    """
+    obj_t = type(obj)
+
+    if obj is Absent:
+        ret = (0, None, str(obj))
+    elif obj is None:
+        ret = (0, None, None)
+    elif issubclass(obj_t, (int,)):
+        ret = (0, obj_t.__name__, str(obj))
+    elif issubclass(obj_t, NATIVE_TYPES):
+        ret = (0, obj_t.__name__, obj)
+    elif callable(obj):
+        ret = (0, 'func', callable_name(obj))
+    elif issubclass(obj_t, Mapping):
+        ret = (2, [
+            _render(value, obj_key) for obj_key, value in obj.items()])
+    elif issubclass(obj_t, Iterable):
+        ret = (1, [_render(value) for value in obj])
+    else:
+        ret = (0, obj_t.__name__, str(obj))
+    if key:
+        return key, ret
+    return ret
+
+
 def fmt(obj):
     """
     Recursively formats an object as plain old data.
@@ -63,32 +91,4 @@ def fmt(obj):
              of "obj" that can be serialised to JSON
     :rtype: ``object`` or a ``(object, object)`` pair
     """
-
-    def render(obj, key=None):
-        """
-        Performs rendering to JSON dict
-        """
-        obj_t = type(obj)
-
-        if obj is Absent:
-            ret = (0, None, str(obj))
-        elif obj is None:
-            ret = (0, None, None)
-        elif issubclass(obj_t, (int,)):
-            ret = (0, obj_t.__name__, str(obj))
-        elif issubclass(obj_t, NATIVE_TYPES):
-            ret = (0, obj_t.__name__, obj)
-        elif callable(obj):
-            ret = (0, 'func', callable_name(obj))
-        elif issubclass(obj_t, Mapping):
-            ret = (2, [
-                render(value, obj_key) for obj_key, value in obj.items()])
-        elif issubclass(obj_t, Iterable):
-            ret = (1, [render(value) for value in obj])
-        else:
-            ret = (0, obj_t.__name__, str(obj))
-        if key:
-            return key, ret
-        return ret
-
-    return render(obj)
+    return _render(obj)
@@ -0,0 +1,233 @@
+"""
+Sampling of the resources (CPU, memory, file descriptors & threads) used by
+processes, recorded as compact time series with peak & average summaries.
+"""
+import os
+import threading
+import time
+
+import psutil
+
+# Values of a sample, after its time in seconds since sampling started.
+FIELDS = ('cpu_percent', 'rss', 'num_fds', 'num_threads')
+
+# Older samples are thinned out beyond that many samples per process.
+MAX_SAMPLES = 1000
+
+
+def _num_fds(proc):
+    """Open file descriptors of a process, handles on Windows."""
+    if hasattr(proc, 'num_fds'):
+        return proc.num_fds()
+    return proc.num_handles()
+
+
+class ProcessSeries(object):
+    """
+    Time series of the resources used by a process, including its children
+    for driver processes. Peaks & averages are computed over all samples
+    even once the series is thinned out.
+
+    :param pid: Process id.
+    :type pid: ``int``
+    """
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.samples = []
+        self._stride = 1
+        self._skipped = 0
+        self._count = 0
+        self._peaks = [0] * len(FIELDS)
+        self._totals = [0] * len(FIELDS)
+
+    def add(self, elapsed, values):
+        """
+        Add a sample.
+
+        :param elapsed: Seconds since sampling started.
+        :type elapsed: ``float``
+        :param values: Values of :py:data:`FIELDS`.
+        :type values: ``list``
+        """
+        self._count += 1
+        for idx, value in enumerate(values):
+            self._peaks[idx] = max(self._peaks[idx], value)
+            self._totals[idx] += value
+
+        self._skipped += 1
+        if self._skipped < self._stride:
+            return
+        self._skipped = 0
+        self.samples.append([round(elapsed, 3)] + list(values))
+        if len(self.samples) > MAX_SAMPLES:
+            self.samples = self.samples[::2]
+            self._stride *= 2
+
+    def summary(self):
+        """
+        :return: Peak & average of each field.
+        :rtype: ``dict`` of ``str``: ``dict``
+        """
+        return {
+            field: {
+                'peak': self._peaks[idx],
+                'avg': round(float(self._totals[idx]) / self._count, 1)
+                if self._count else 0,
+            }
+            for idx, field in enumerate(FIELDS)
+        }
+
+    def to_dict(self):
+        """Serializable representation, as stored in reports."""
+        return {
+            'pid': self.pid,
+            'samples': self.samples,
+            'summary': self.summary(),
+        }
+
+
+class ResourceSampler(object):
+    """
+    Samples processes on a background thread every ``interval`` seconds.
+
+    The processes to sample are queried on each sample, so that processes
+    started (e.g. drivers) or stopped while sampling are handled.
+
+    :param targets: Returns the processes to sample as ``(label, pid,
+        recursive)`` tuples, ``recursive`` includes the children of the
+        process. Processes without a pid yet can be given with ``None``.
+    :type targets: ``callable`` returning a ``list`` of ``tuple``
+    :param interval: Seconds between samples.
+    :type interval: ``float``
+    """
+
+    def __init__(self, targets, interval=1.0):
+        self.targets = targets
+        self.interval = interval
+        self.series = {}
+        self._processes = {}
+        self._start_time = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _process(self, pid, processes):
+        """
+        Cached process, as CPU usage is measured since its previous sample.
+        Processes sampled are added to ``processes``.
+        """
+        proc = self._processes.get(pid)
+        if proc is None or not proc.is_running():
+            proc = psutil.Process(pid)
+            proc.cpu_percent(interval=None)
+        processes[pid] = proc
+        return proc
+
+    def _measure(self, pid, recursive, processes):
+        """Values of a process, summed with its children if recursive."""
+        proc = self._process(pid, processes)
+        procs = [proc]
+        if recursive:
+            for child in proc.children(recursive=True):
+                try:
+                    procs.append(self._process(child.pid, processes))
+                except psutil.NoSuchProcess:
+                    continue
+
+        values = [0] * len(FIELDS)
+        for proc in procs:
+            try:
+                with proc.oneshot():
+                    measured = (
+                        proc.cpu_percent(interval=None),
+                        proc.memory_info().rss,
+                        _num_fds(proc),
+                        proc.num_threads(),
+                    )
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            values = [total + value for total, value in zip(values, measured)]
+        values[0] = round(values[0], 1)
+        return values
+
+    def sample(self):
+        """Sample all target processes once."""
+        elapsed = time.time() - self._start_time
+        processes = {}
+        for label, pid, recursive in self.targets():
+            if pid is None:
+                continue
+            try:
+                values = self._measure(pid, recursive, processes)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            series = self.series.get(label)
+            if series is None:
+                series = self.series[label] = ProcessSeries(pid)
+            series.pid = pid
+            series.add(elapsed, values)
+        # Processes that are gone are not kept around.
+        self._processes = processes
+
+    def _loop(self):
+        while True:
+            self.sample()
+            if self._stop_event.wait(self.interval):
+                break
+
+    def start(self):
+        """Start sampling."""
+        self._start_time = time.time()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name='ResourceSampler-{}'.format(os.getpid()))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling, waits for the sample being taken if any."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._processes = {}
+
+    def to_dict(self):
+        """
+        Compact time series & summaries of the sampled processes by label.
+
+        :return: Sampling interval, names of the sample values (in order)
+            and per process data.
+        :rtype: ``dict``
+        """
+        return {
+            'interval': self.interval,
+            'fields': ['time'] + list(FIELDS),
+            'processes': {
+                label: series.to_dict()
+                for label, series in self.series.items()
+            },
+        }
+
+
+def merge_resource_usage(usage, other):
+    """
+    Merge the resource usage of two reports (e.g. of parts of a test),
+    processes of ``other`` are added to those of ``usage``.
+
+    :param usage: Resource usage to update, may be ``None``.
+    :type usage: ``dict``
+    :param other: Resource usage to merge, may be ``None``.
+    :type other: ``dict``
+    :return: Merged resource usage.
+    :rtype: ``dict``
+    """
+    if not other:
+        return usage
+    if not usage:
+        return other
+    merged = dict(usage)
+    merged['processes'] = dict(usage['processes'])
+    merged['processes'].update(other['processes'])
+    return merged
@@ -33,6 +33,7 @@ class Server(object):
         self._server_thread = None
 
         self._lock = threading.Lock()
+        self._new_connection = threading.Condition()
 
         self._connection_by_fd = {}
         self._fds = {}
@@ -96,9 +97,11 @@ class Server(object):
                     # New connection
                     conn, client_addr = sock.accept()
                     inputs.append(conn)
-                    self._connection_by_fd[conn.fileno()] = conn
-                    self._fds[self.active_connections] = conn.fileno()
-                    self.active_connections += 1
+                    with self._new_connection:
+                        self._connection_by_fd[conn.fileno()] = conn
+                        self._fds[self.active_connections] = conn.fileno()
+                        self.active_connections += 1
+                        self._new_connection.notify_all()
 
             for sock in exceptional:
                 inputs.remove(sock)
@@ -123,20 +126,24 @@ class Server(object):
 
         :param timeout: Timeout to wait for receiving connection.
         :type timeout: ``int``
-        :param accept_connection_sleep: Sleep time to retry accept connection.
+        :param accept_connection_sleep: Maximum time to block before
+          re-checking for a connection, the serving thread wakes up waiters
+          as soon as a new connection is received.
         :type accept_connection_sleep: ``float``
 
         :return: Index of connection
         :rtype: ``int``
         """
-        started = time.time()
-        while True:
-            if self.accepted_connections in self._fds:
-                self.accepted_connections += 1
-                return self.accepted_connections - 1
-            if time.time() > started + timeout:
-                return -1
-            time.sleep(accept_connection_sleep)
+        end_time = time.time() + timeout
+        with self._new_connection:
+            while self.accepted_connections not in self._fds:
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    return -1
+                self._new_connection.wait(
+                    min(remaining, accept_connection_sleep))
+            self.accepted_connections += 1
+            return self.accepted_connections - 1
 
     def receive(self, size=1024, conn_idx=None, timeout=30,
                 wait_full_size=True):
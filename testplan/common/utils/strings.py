@@ -12,8 +12,6 @@ import colorama
 colorama.init()
 from termcolor import colored
 
-from reportlab.pdfbase.pdfmetrics import stringWidth
-
 
 _DESCRIPTION_CUTOFF_REGEX = re.compile(r'^(\s|\t)+')
 
@@ -141,6 +139,8 @@ def split_line(line, max_width, get_width_func=None):
                            according to font and font size.
     :return: list of lines
     """
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
     result = []
     total_width = 0
     tmp_str = ''
@@ -178,6 +178,8 @@ def split_text(text, font_name, font_size, max_width,
                                     whitespace.
     :return: list of lines
     """
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
     def get_text_width(text, name=font_name, size=font_size):
         return stringWidth(text, name, size)
 
@@ -132,3 +132,47 @@ class TableEntry(object):
             formatted_table = table
 
         return formatted_table
+
+
+def iter_as_dict(rows, keep_column_order=False):
+    """
+    Generates the rows of a table given as an iterable of rows, the first
+    one being the column names, as ``dict``. Rows are consumed one at a
+    time, e.g. rows streamed from a database cursor.
+
+    :param rows: Column names followed by the table rows.
+    :type rows: iterable of ``list`` or ``tuple``
+    :param keep_column_order: Build ``OrderedDict`` rows.
+    :type keep_column_order: ``bool``
+    :return: the table rows
+    :rtype: generator of ``dict``
+    """
+    rows = iter(rows)
+    try:
+        columns = list(next(rows))
+    except StopIteration:
+        return
+
+    if not all(isinstance(col, six.string_types) for col in columns):
+        raise TypeError(
+            'Table headers must all be strings - got {}'.format(columns))
+
+    row_type = collections.OrderedDict if keep_column_order else dict
+    for row in rows:
+        yield row_type(zip(columns, row))
+
+
+def iter_as_list_of_dict(rows, keep_column_order=False):
+    """
+    Returns a table given as an iterable of rows, the first one being the
+    column names, as ``list`` of ``dict``. All rows are kept in the returned
+    list, see :py:func:`iter_as_dict` to process them one at a time.
+
+    :param rows: Column names followed by the table rows.
+    :type rows: iterable of ``list`` or ``tuple``
+    :param keep_column_order: Build ``OrderedDict`` rows.
+    :type keep_column_order: ``bool``
+    :return: the table
+    :rtype: ``list`` of ``dict``
+    """
+    return list(iter_as_dict(rows, keep_column_order=keep_column_order))
@@ -1,10 +1,21 @@
 """Threading utilities."""
 
 import time
+import itertools
 import threading
 
+from concurrent import futures
+from six.moves import queue
+
 from .timing import TimeoutException
 
+# Maximum number of threads of the executor shared within the process.
+SHARED_EXECUTOR_SIZE = 32
+SHARED_EXECUTOR_THREAD_PREFIX = 'TestplanSharedExecutor'
+
+_SHARED_EXECUTOR = None
+_SHARED_EXECUTOR_LOCK = threading.Lock()
+
 
 def execute_as_thread(target, args=None, kwargs=None, daemon=False, join=True,
                       break_join=None, join_sleep=0.01, timeout=None):
@@ -51,3 +62,117 @@ def interruptible_join(thread):
         time.sleep(0.1)
         if not thread.is_alive():
             break
+
+
+class DaemonThreadPoolExecutor(futures.Executor):
+    """
+    Thread pool executor whose worker threads are named daemon threads.
+
+    Unlike ``concurrent.futures.ThreadPoolExecutor``, its threads are not
+    joined at interpreter exit, so a callable that never returns does not
+    keep the process alive. Threads are started on demand when none is
+    idle, up to ``max_workers``, and are named after ``thread_name_prefix`` on every
+    Python version.
+
+    :param max_workers: Maximum number of worker threads.
+    :type max_workers: ``int``
+    :param thread_name_prefix: Prefix of the worker thread names.
+    :type thread_name_prefix: ``str``
+    """
+
+    def __init__(self, max_workers, thread_name_prefix):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._counter = itertools.count()
+        self._work_queue = queue.Queue()
+        self._threads = set()
+        # Released by workers waiting for a callable to execute.
+        self._idle_semaphore = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    @property
+    def threads(self):
+        """Worker threads started so far."""
+        with self._lock:
+            return frozenset(self._threads)
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule ``fn(*args, **kwargs)``, returns its future."""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError(
+                    'cannot schedule new futures after shutdown')
+            future = futures.Future()
+            self._work_queue.put((future, fn, args, kwargs))
+            if self._idle_semaphore.acquire(False):
+                return future
+            if len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name='{}_{}'.format(self._thread_name_prefix,
+                                        next(self._counter)))
+                thread.daemon = True
+                thread.start()
+                self._threads.add(thread)
+            return future
+
+    def _work(self):
+        """Execute queued callables until the executor is shut down."""
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                # Wake up the next worker.
+                self._work_queue.put(None)
+                return
+            future, fn, args, kwargs = item
+            del item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            del future, fn, args, kwargs
+            self._idle_semaphore.release()
+
+    def shutdown(self, wait=True):
+        """Stop the worker threads once the queued callables are executed."""
+        with self._lock:
+            self._shutdown = True
+            self._work_queue.put(None)
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+def shared_executor():
+    """
+    Process-wide thread pool executor, created on first use with
+    ``SHARED_EXECUTOR_SIZE`` daemon threads. Callers that need to limit their
+    own concurrency should bound the number of futures they keep running.
+
+    :return: Shared executor.
+    :rtype: :py:class:`DaemonThreadPoolExecutor`
+    """
+    global _SHARED_EXECUTOR
+    with _SHARED_EXECUTOR_LOCK:
+        if _SHARED_EXECUTOR is None:
+            _SHARED_EXECUTOR = DaemonThreadPoolExecutor(
+                max_workers=SHARED_EXECUTOR_SIZE,
+                thread_name_prefix=SHARED_EXECUTOR_THREAD_PREFIX)
+        return _SHARED_EXECUTOR
+
+
+def shared_executor_threads():
+    """
+    Threads of the shared executor, which are kept alive across runs.
+
+    :return: Threads started by the shared executor.
+    :rtype: ``frozenset`` of ``threading.Thread``
+    """
+    with _SHARED_EXECUTOR_LOCK:
+        executor = _SHARED_EXECUTOR
+    return executor.threads if executor is not None else frozenset()
@@ -117,31 +117,42 @@ def timeout(seconds, err_msg='Timeout after {} seconds.'):
     return timeout_decorator
 
 
-def wait(predicate, timeout, interval=0.05, raise_on_timeout=False):
+def wait(predicate, timeout, interval=0.05, raise_on_timeout=False,
+         min_interval=0.001):
     """
     Wait until a predicate evaluates to True.
 
+    The predicate is first re-checked after ``min_interval`` seconds, and the
+    sleep time doubles after every unsuccessful check until it reaches
+    ``interval``, so that conditions which become true quickly are noticed
+    without a fixed polling delay.
+
     :param predicate: Input predicate.
     :type predicate: ``callable``
     :param timeout:  Timeout duration.
     :type timeout: ``int``
-    :param interval: Sleep interval for predicate check.
+    :param interval: Maximum sleep interval between predicate checks.
     :type interval: ``float``
     :param raise_on_timeout: Raise exception if hits timeout.
     :type raise_on_timeout: ``bool``
+    :param min_interval: Initial sleep interval between predicate checks.
+    :type min_interval: ``float``
     :return: Predicate result.
     :rtype: ``bool``
     """
     start_time = time.time()
     end_time = start_time + timeout
+    sleep_interval = min(min_interval, interval)
     while True:
         res = predicate()
         error_msg = getattr(res, 'error_msg', '')
         if res is True:
             return res
-        elif time.time() < end_time:
+        now = time.time()
+        if now < end_time:
             # no timeout yet
-            time.sleep(interval)
+            time.sleep(min(sleep_interval, end_time - now))
+            sleep_interval = min(sleep_interval * 2, interval)
         else:
             if raise_on_timeout is True:
                 msg = 'Timeout after {} seconds.'.format(timeout)
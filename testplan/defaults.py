@@ -19,6 +19,7 @@ PDF_PATH = os.path.join(REPORT_DIR, 'report.pdf')
 JSON_PATH = os.path.join(REPORT_DIR, 'report.json')
 ATTACHMENTS = '_attachments'
 ATTACHMENTS_DIR = os.path.join(REPORT_DIR, ATTACHMENTS)
+REPORT_SHARDS = '_shards'
 
 WEB_SERVER_HOSTNAME = 'localhost'
 WEB_SERVER_PORT = 5000
@@ -1,5 +1,47 @@
-from .pdf import PDFExporter, TagFilteredPDFExporter
-from .xml import XMLExporter
-from .json import JSONExporter
-from .webserver import WebServerExporter
+import importlib
+import sys
+import types
+
 from .base import Exporter, save_attachments
+
+# Exporters depend on heavy optional libraries (reportlab, lxml, flask), they
+# are imported on first access.
+_LAZY_EXPORTERS = {
+    'PDFExporter': '.pdf',
+    'TagFilteredPDFExporter': '.pdf',
+    'XMLExporter': '.xml',
+    'JSONExporter': '.json',
+    'WebServerExporter': '.webserver',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTERS:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+    module = importlib.import_module(_LAZY_EXPORTERS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTERS))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ (PEP 562) is not supported, the package is
+    # replaced by a module object that resolves the exporters instead.
+    class _ExportersModule(types.ModuleType):
+
+        def __getattr__(self, name):
+            value = __getattr__(name)
+            setattr(self, name, value)
+            return value
+
+        def __dir__(self):
+            return sorted(set(self.__dict__) | set(_LAZY_EXPORTERS))
+
+    _module = _ExportersModule(__name__, __doc__)
+    _module.__dict__.update(sys.modules[__name__].__dict__)
+    sys.modules[__name__] = _module
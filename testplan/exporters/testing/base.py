@@ -1,4 +1,8 @@
+import collections
+import hashlib
+import json
 import os
+import shutil
 from shutil import copyfile
 
 from schema import Schema, Use
@@ -181,3 +185,76 @@ def save_attachments(report, directory):
             dst_path = os.path.join(directory, dst)
             makedirs(os.path.dirname(dst_path))
             copyfile(src=src, dst=dst_path)
+
+
+SKELETON_FILE = 'skeleton.json'
+ASSERTIONS_DIR = 'assertions'
+
+
+def assertions_uid(uid_path):
+    """
+    Stable identifier of the assertions of a testcase, it only depends on the
+    uids of the testcase and its parents (excluding the Testplan report).
+
+    :param uid_path: Uids from the top level test down to the testcase.
+    :type uid_path: ``list`` of ``str``
+    :return: Hex digest that can be used as a file name and in urls.
+    :rtype: ``str``
+    """
+    return hashlib.sha1(
+        '/'.join(uid_path).encode('utf-8')).hexdigest()
+
+
+def save_report_shards(data, directory):
+    """
+    Save a serialized Testplan report as a skeleton and one shard of
+    assertions per testcase, so that a report viewer can load the structure
+    of a large report first and fetch the assertions of a testcase on demand.
+
+    In the skeleton, testcases have their entries replaced by an
+    ``assertions_uid`` (the name of their shard) and an ``entry_count``,
+    the report and groups get the ``counts`` of testcases per status.
+
+    :param data: Serialized Testplan report.
+    :type data: ``dict``
+    :param directory: Directory to save the skeleton and shards in.
+    :type directory: ``str``
+    :return: Path of the skeleton.
+    :rtype: ``str``
+    """
+    assertions_dir = os.path.join(directory, ASSERTIONS_DIR)
+    # Shards of a previous report must not be served with the new skeleton.
+    shutil.rmtree(assertions_dir, ignore_errors=True)
+    makedirs(assertions_dir)
+
+    def _strip(node, uid_path):
+        skeleton = dict(node)
+        counts = collections.Counter()
+        entries = []
+
+        for entry in node['entries']:
+            entry_path = uid_path + [entry['uid']]
+            if 'category' in entry:
+                child = _strip(entry, entry_path)
+                counts.update(child['counts'])
+            else:
+                child = dict(entry)
+                child['assertions_uid'] = assertions_uid(entry_path)
+                child['entry_count'] = len(entry['entries'])
+                child['entries'] = []
+                counts[entry['status']] += 1
+
+                shard_path = os.path.join(
+                    assertions_dir, child['assertions_uid'] + '.json')
+                with open(shard_path, 'w') as shard_file:
+                    json.dump(entry['entries'], shard_file)
+            entries.append(child)
+
+        skeleton['entries'] = entries
+        skeleton['counts'] = dict(counts)
+        return skeleton
+
+    skeleton_path = os.path.join(directory, SKELETON_FILE)
+    with open(skeleton_path, 'w') as skeleton_file:
+        json.dump(_strip(data, []), skeleton_file)
+    return skeleton_path
@@ -12,10 +12,7 @@ from testplan import defaults
 from testplan.common.config import ConfigOption
 from testplan.common.exporters import ExporterConfig
 
-from testplan.report.testing.schemas import TestReportSchema
-
-
-from ..base import Exporter, save_attachments
+from ..base import Exporter, save_attachments, save_report_shards
 
 
 class JSONExporterConfig(ExporterConfig):
@@ -25,7 +22,8 @@ class JSONExporterConfig(ExporterConfig):
         return {
             ConfigOption(
                 'json_path', default=defaults.JSON_PATH,
-                block_propagation=False): str
+                block_propagation=False): str,
+            ConfigOption('split_json_report', default=False): bool
         }
 
 
@@ -39,8 +37,7 @@ class JSONExporter(Exporter):
             raise ValueError('`json_path` cannot be None.')
 
         if len(source):
-            test_plan_schema = TestReportSchema(strict=True)
-            data = test_plan_schema.dump(source).data
+            data = source.serialize()
 
             # Save the Testplan report.
             with open(self.cfg.json_path, 'w') as json_file:
@@ -53,6 +50,15 @@ class JSONExporter(Exporter):
             )
             save_attachments(report=source, directory=attachments_dir)
 
+            # Save the report skeleton and assertions per testcase, which
+            # the web UI loads on demand.
+            if self.cfg.split_json_report:
+                save_report_shards(
+                    data=data,
+                    directory=os.path.join(
+                        os.path.dirname(self.cfg.json_path),
+                        defaults.REPORT_SHARDS))
+
             self.logger.exporter_info(
                 'JSON generated at {}'.format(self.cfg.json_path))
         else:
@@ -22,6 +22,17 @@ def format_duration(seconds):
         return '{} seconds'.format(fmt).format(secs)
 
 
+def format_size(num_bytes):
+    """
+    Format a size in bytes into a human-readable string.
+    """
+    for unit in ('B', 'KB', 'MB'):
+        if num_bytes < 1024:
+            return '{:.1f} {}'.format(num_bytes, unit)
+        num_bytes /= 1024.0
+    return '{:.1f} GB'.format(num_bytes)
+
+
 class BaseRowRenderer(object):
     """Base class for row renderers."""
 
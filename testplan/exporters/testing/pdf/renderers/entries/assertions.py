@@ -342,6 +342,58 @@ class RegexMatchLineRenderer(AssertionRenderer):
                                  start=pattern.end)
 
 
+@registry.bind(
+    assertions.RegexFileSearch,
+    assertions.RegexFileMatchLine,
+    assertions.RegexFileSearchNotExists
+)
+class RegexFileRenderer(AssertionRenderer):
+    """RegexFile renderer for serialized assertion entries."""
+
+    def get_detail(self, source, depth, row_idx):
+        """
+        Return the path and the first match of each pattern, highlighted in
+        the snippet of its line.
+        """
+        text_style = [
+            RowStyle(
+                left_padding=const.INDENT * (depth + 1),
+                span=tuple()
+            ),
+        ]
+        if not source['passed']:
+            text_style.append(RowStyle(background=colors.whitesmoke))
+
+        colour = 'red' if source['type'] == 'RegexFileSearchNotExists' \
+            else 'green'
+        matches = {match['pattern']: match for match in source['matches']}
+        parts = ['Path: {}'.format(escape(source['path']))]
+        if source.get('error'):
+            parts.append(_format_text(
+                escape('Error: {}'.format(source['error'])), 'red'))
+        for idx, pattern in enumerate(source['patterns']):
+            match = matches.get(idx)
+            if match is None:
+                found = 'Not found'
+            else:
+                begin, end = match['snippet_span']
+                snippet = match['snippet']
+                found = 'Line {}: {}{}{}'.format(
+                    match['line_no'] + 1,
+                    escape(snippet[:begin]),
+                    _format_text(escape(snippet[begin:end]), colour),
+                    escape(snippet[end:]))
+            parts.append('Pattern: `{}` {}'.format(escape(pattern), found))
+
+        text = Paragraph(
+            text='<br />\n'.join(parts),
+            style=const.PARAGRAPH_STYLE
+        )
+        return RowData(content=[text, '', '', ''],
+                       style=text_style,
+                       start=row_idx)
+
+
 @registry.bind(
     assertions.Contain,
     assertions.NotContain
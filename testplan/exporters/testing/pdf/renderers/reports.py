@@ -13,7 +13,8 @@ from testplan.report.testing import (
 )
 from testplan.testing import tagging
 from . import constants as const
-from .base import format_duration, RowData, BaseRowRenderer, MetadataMixin
+from .base import (
+    format_duration, format_size, RowData, BaseRowRenderer, MetadataMixin)
 
 
 class ReportRendererRegistry(Registry):
@@ -318,6 +319,55 @@ class MultiTestRowBuilder(TestRowRenderer):
         """
         return 1, colors.black
 
+    def get_row_data(self, source, depth, row_idx):
+        """Display resource usage of the test processes as well."""
+        row_data = super(MultiTestRowBuilder, self).get_row_data(
+            source, depth, row_idx)
+
+        usage_data = self.get_resource_usage(
+            source, depth=depth + 1, row_idx=row_data.end)
+        if usage_data:
+            row_data += usage_data
+
+        return row_data
+
+    def get_resource_usage(self, source, depth, row_idx):
+        """
+        Render the peak & average resource usage of each process in the
+        format:
+
+        [<PROCESS>][CPU: <PEAK> / <AVG>][RSS: <PEAK> / <AVG>][FDs, threads]
+        """
+        usage = source.resource_usage
+        if not usage or not usage.get('processes'):
+            return None
+
+        content = [['Resource usage (peak / avg)', '', '', '']]
+        for label, process in sorted(usage['processes'].items()):
+            summary = process['summary']
+            content.append([
+                '{} (pid {})'.format(label, process['pid']),
+                'CPU: {}% / {}%'.format(
+                    summary['cpu_percent']['peak'],
+                    summary['cpu_percent']['avg']),
+                'RSS: {} / {}'.format(
+                    format_size(summary['rss']['peak']),
+                    format_size(summary['rss']['avg'])),
+                'FDs: {}, threads: {}'.format(
+                    summary['num_fds']['peak'],
+                    summary['num_threads']['peak']),
+            ])
+
+        return RowData(
+            start=row_idx,
+            content=content,
+            style=RowStyle(
+                font=(const.FONT, const.FONT_SIZE_SMALL),
+                left_padding=const.INDENT * depth,
+                text_color=colors.gray,
+            )
+        )
+
     def get_header(self, source, depth, row_idx):
         """Display short summary & run times along with pass/fail status."""
         row_data = RowData(
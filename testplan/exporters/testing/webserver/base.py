@@ -13,9 +13,8 @@ from testplan import defaults
 from testplan.common.utils.timing import wait
 from testplan.common.config import ConfigOption
 from testplan.common.exporters import ExporterConfig
-from testplan.report.testing.schemas import TestReportSchema
 from testplan.web_ui.web_app import _WebServer
-from ..base import Exporter, save_attachments
+from ..base import Exporter, save_attachments, save_report_shards
 
 
 class WebServerExporterConfig(ExporterConfig):
@@ -40,8 +39,7 @@ class WebServerExporter(Exporter):
         if self.cfg.ui_port is None:
             raise ValueError('`ui_port` cannot be None.')
         if len(source):
-            test_plan_schema = TestReportSchema(strict=True)
-            data = test_plan_schema.dump(source).data
+            data = source.serialize()
 
             # Save the Testplan report as a JSON.
             with open(defaults.JSON_PATH, 'w') as json_file:
@@ -53,6 +51,11 @@ class WebServerExporter(Exporter):
             attachments_dir = os.path.join(data_path, defaults.ATTACHMENTS)
             save_attachments(report=source, directory=attachments_dir)
 
+            # Save the report skeleton and assertions per testcase.
+            save_report_shards(
+                data=data,
+                directory=os.path.join(data_path, defaults.REPORT_SHARDS))
+
             self.logger.exporter_info(
                 'JSON generated at {}'.format(defaults.JSON_PATH))
 
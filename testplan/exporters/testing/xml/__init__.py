@@ -9,6 +9,7 @@ from lxml import etree
 from lxml.builder import E  # pylint: disable=no-name-in-module
 
 from testplan import defaults
+from testplan.common.utils.junit_xml import merge_xml
 from testplan.common.utils.logger import TESTPLAN_LOGGER
 from testplan.common.utils.path import unique_name
 from testplan.common.utils.strings import slugify
@@ -17,6 +18,7 @@ from testplan.common.config import ConfigOption
 from testplan.common.exporters import ExporterConfig
 
 from testplan.report.testing import TestCaseReport, TestGroupReport
+from testplan.report.testing.base import xml_parts
 from testplan.testing.multitest.base import Categories, Status
 
 from ..base import Exporter
@@ -194,6 +196,18 @@ class MultiTestRenderer(BaseRenderer):
         return testcase_reports
 
 
+def _local_xml_path(part):
+    """
+    Return the XML file path of a report part, given as a dictionary of its
+    XML source attributes, if the file was written on this host.
+    """
+    xml_path = part.get('xml_path')
+    if xml_path and part.get('xml_host') == socket.gethostname() and\
+            os.path.exists(xml_path):
+        return xml_path
+    return None
+
+
 class XMLExporterConfig(ExporterConfig):
     """Config for XML exporter"""
 
@@ -235,12 +249,26 @@ class XMLExporter(Exporter):
             files.add(filename)
             file_path = os.path.join(self.cfg.xml_dir, filename)
 
-            # If a report has XML string attribute it was mostly generated via parsing
-            # a JUnit compatible XML file already, meaning we don't need to re-generate
-            # the XML contents, but can directly write the contents to a file instead.
-            if hasattr(child_report, 'xml_string'):
-                with open(file_path, 'w') as xml_target:
-                    xml_target.write(child_report.xml_string)
+            # If a report has `xml_path` & `xml_host` attributes it was mostly
+            # generated via parsing a JUnit compatible XML file already, meaning
+            # we don't need to re-generate the XML contents, but can directly
+            # copy the file instead. The file is only copied if it is on this
+            # host, the files of remote workers are fetched with their runpath.
+            # A report merged from scheduled parts has the XML files of all its
+            # parts merged, they are streamed and never fully loaded in memory.
+            parts = xml_parts(child_report)
+            part_paths = [
+                path for path in map(_local_xml_path, parts) if path
+            ] if len(parts) > 1 else []
+            if len(parts) == 1 and _local_xml_path(parts[0]):
+                shutil.copyfile(parts[0]['xml_path'], file_path)
+            elif part_paths:
+                test_context = [
+                    (suite.name, [testcase.name for testcase in suite])
+                    for suite in child_report
+                    if isinstance(suite, TestGroupReport)
+                ]
+                merge_xml(part_paths, file_path, test_context)
             else:
                 renderer = self.renderer_map.get(child_report.category, BaseRenderer)()
                 element = etree.ElementTree(renderer.render(child_report))
@@ -49,6 +49,8 @@ from testplan.common.report import (
     ExceptionLogger as ExceptionLoggerBase, Report, ReportGroup)
 from testplan.common.utils import timing
 from testplan.common.utils.exceptions import format_trace
+from testplan.common.utils.profiling import merge_profile
+from testplan.common.utils.resource_usage import merge_resource_usage
 from testplan.testing import tagging
 
 
@@ -255,6 +257,9 @@ class TestReport(BaseReportGroup):
         self.meta = meta or {}
         self._tags_index = None
         self.attachments = attachments or {}
+        # Timings of the exporters of the plan, only set on the report once
+        # they have all run, see `testplan.common.utils.profiling`
+        self.profile = kwargs.pop('profile', None)
         super(TestReport, self).__init__(*args, **kwargs)
 
     @property
@@ -285,22 +290,29 @@ class TestReport(BaseReportGroup):
         """
         Attachments are saved at various levels of the report:
           * Fix spec file attached to multitests.
+          * Testcase profiles attached to multitests.
           * When implemented result.attach will attach files to assertions.
         This iterates through the report entries and bubbles up all the
         attachments to the top level. This top level dictionary of attachments
         will be used by Exporters to export attachments as well as the report.
         """
+        def attach(real_path):
+            hash_dir = hashlib.md5(real_path.encode('utf-8')).hexdigest()
+            # I think the basename should be slugified?
+            hash_path = os.path.join(hash_dir, os.path.basename(real_path))
+            self.attachments[hash_path] = real_path
+            return hash_path
+
         for child in self:
             if getattr(child, 'fix_spec_path', None):
-                real_path = child.fix_spec_path
-                hash_dir = hashlib.md5(real_path.encode('utf-8')).hexdigest()
-                # I think the basename should be slugified?
-                hash_path = os.path.join(
-                    hash_dir,
-                    os.path.basename(child.fix_spec_path)
-                )
-                child.fix_spec_path = hash_path
-                self.attachments[hash_path] = real_path
+                child.fix_spec_path = attach(child.fix_spec_path)
+
+            profile = getattr(child, 'profile', None)
+            if profile:
+                for testcase_profile in profile['profiles'].values():
+                    if os.path.isabs(testcase_profile['path']):
+                        testcase_profile['path'] = attach(
+                            testcase_profile['path'])
 
             # Add logic to find result.attach assertions.
 
@@ -310,9 +322,13 @@ class TestReport(BaseReportGroup):
 
     def serialize(self):
         """
-        Shortcut for serializing test report data to nested python dictionaries.
+        Shortcut for serializing test report data to nested python dictionaries,
+        groups & testcases are reused within a ``serialization_cache`` context.
         """
-        from .schemas import TestReportSchema
+        from .schemas import TestReportSchema, active_serialization_cache
+        cache = active_serialization_cache()
+        if cache is not None:
+            return cache.dump(self)
         return TestReportSchema(strict=True).dump(self).data
 
     @classmethod
@@ -325,6 +341,22 @@ class TestReport(BaseReportGroup):
         return TestReportSchema(strict=True).load(data).data
 
 
+# Attributes describing the XML output a report was parsed from.
+XML_SOURCE_ATTRS = ('xml_path', 'xml_host')
+
+
+def xml_parts(report):
+    """
+    Return the XML outputs of a report, as dictionaries of its XML source
+    attributes, a report merged from parts has the outputs of all its parts.
+    """
+    if hasattr(report, 'xml_parts'):
+        return list(report.xml_parts)
+    source = {attr: getattr(report, attr)
+              for attr in XML_SOURCE_ATTRS if hasattr(report, attr)}
+    return [source] if source else []
+
+
 class TestGroupReport(BaseReportGroup):
     """
     A middle-level container report, can contain both TestGroupReports and
@@ -334,7 +366,8 @@ class TestGroupReport(BaseReportGroup):
     def __init__(
         self, name, description=None,
         category=None, uid=None, entries=None,
-        tags=None, part=None, fix_spec_path=None
+        tags=None, part=None, fix_spec_path=None, resource_usage=None,
+        profile=None
     ):
         super(TestGroupReport, self).__init__(
             name=name, description=description, uid=uid, entries=entries)
@@ -353,6 +386,14 @@ class TestGroupReport(BaseReportGroup):
 
         self.fix_spec_path = fix_spec_path
 
+        # Time series of the resources used by the processes of the test,
+        # see `testplan.common.utils.resource_usage`
+        self.resource_usage = resource_usage
+
+        # Timings of the steps of the test & profiles of its testcases,
+        # see `testplan.common.utils.profiling`
+        self.profile = profile
+
         if entries:
             self.propagate_tag_indices()
 
@@ -440,8 +481,18 @@ class TestGroupReport(BaseReportGroup):
             tags_index, self._collect_tag_indices())
 
     def merge(self, report, strict=True):
-        """Propagate tag indices after merge operations."""
+        """
+        Propagate tag indices after merge operations, resource usage of the
+        processes of both reports is kept, as well as the XML outputs they
+        were parsed from, so that XML exporters can merge them.
+        """
         super(TestGroupReport, self).merge(report, strict=strict)
+        self.resource_usage = merge_resource_usage(
+            self.resource_usage, report.resource_usage)
+        self.profile = merge_profile(self.profile, report.profile)
+        parts = xml_parts(self) + xml_parts(report)
+        if parts:
+            self.xml_parts = parts
         self.propagate_tag_indices()
 
 
@@ -455,7 +506,7 @@ class TestCaseReport(Report):
     def __init__(
         self, name, description=None,
         uid=None, entries=None,
-        tags=None, suite_related=False
+        tags=None, suite_related=False, cached=None
     ):
         super(TestCaseReport, self).__init__(
             name=name, uid=uid, entries=entries, description=description)
@@ -463,13 +514,15 @@ class TestCaseReport(Report):
         self.tags = tagging.validate_tag_value(tags) if tags else {}
         self.tags_index = copy.deepcopy(self.tags)
         self.suite_related = suite_related
+        # Fingerprint & store time of reports reused from a result cache.
+        self.cached = cached
 
         self.status_override = None
         self.timer = timing.Timer()
 
     def _get_comparison_attrs(self):
         return super(TestCaseReport, self)._get_comparison_attrs() +\
-            ['status_override', 'timer', 'tags', 'tags_index']
+            ['status_override', 'timer', 'tags', 'tags_index', 'cached']
 
     @property
     def passed(self):
@@ -504,10 +557,12 @@ class TestCaseReport(Report):
                 Status.precedent([report.status]):
             return
 
+        self.bump_version()
         self.status_override = report.status_override
         self.logs = report.logs
         self.entries = report.entries
         self.timer = report.timer
+        self.cached = report.cached
 
     def flattened_entries(self, depth):
         """Need to take assertion groups into account."""
@@ -1,8 +1,10 @@
 """Schema classes for test Reports."""
 
+import contextlib
 import functools
+import threading
 
-from marshmallow import Schema, fields, post_load
+from marshmallow import Schema, fields, post_load, post_dump
 
 from testplan.common.serialization.schemas import load_tree_data
 from testplan.common.report.schemas import ReportSchema
@@ -16,7 +18,9 @@ from .base import TestCaseReport, TestGroupReport, TestReport
 __all__ = [
     'TestCaseReportSchema',
     'TestGroupReportSchema',
-    'TestReportSchema'
+    'TestReportSchema',
+    'SerializationCache',
+    'serialization_cache',
 ]
 
 
@@ -33,11 +37,14 @@ class IntervalSchema(Schema):
 
 
 class TagField(fields.Field):
-    """Field for serializing tag data, which is a ``dict`` of ``set``."""
+    """
+    Field for serializing tag data, which is a ``dict`` of ``set``. Tags are
+    serialized as sorted lists, which do not depend on the set order.
+    """
 
     def _serialize(self, value, attr, obj):
         return {
-            tag_name: list(tag_values)
+            tag_name: sorted(tag_values)
             for tag_name, tag_values in value.items()
             }
 
@@ -80,6 +87,14 @@ class TestCaseReportSchema(ReportSchema):
     suite_related = fields.Bool()
     timer = TimerField()
     tags = TagField()
+    cached = fields.Dict(allow_none=True)
+
+    @post_dump
+    def remove_not_cached(self, data):  # pylint: disable=no-self-use
+        """Only reports reused from a result cache have a ``cached`` key."""
+        if data.get('cached', False) is None:
+            del data['cached']
+        return data
 
     @post_load
     def make_report(self, data):
@@ -105,6 +120,8 @@ class TestGroupReportSchema(TestCaseReportSchema):
     category = fields.String(allow_none=True)
     part = fields.List(fields.Integer, allow_none=True)
     fix_spec_path = fields.String(allow_none=True)
+    resource_usage = fields.Dict(allow_none=True)
+    profile = fields.Dict(allow_none=True)
 
     entries = custom_fields.GenericNested(
         schema_context={
@@ -137,6 +154,7 @@ class TestReportSchema(Schema):
     status_override = fields.String(allow_none=True)
 
     attachments = fields.Dict()
+    profile = fields.Dict(allow_none=True)
 
     entries = custom_fields.GenericNested(
         schema_context={
@@ -165,3 +183,90 @@ class TestReportSchema(Schema):
         test_plan_report.status_override = status_override
         test_plan_report.timer = timer
         return test_plan_report
+
+
+class SerializationCache(object):
+    """
+    Memoized serialization of test reports. ``dump`` gives the same result as
+    ``TestReportSchema(strict=True).dump(report).data``, but each group and
+    testcase is serialized once and reused until it is modified.
+
+    Fragments are keyed by the uid path of the report node and its version
+    (incremented by the report methods modifying it), groups also by the keys
+    of their children. Filtered clones of a report share the serialized
+    testcases of the original. Serialized fragments are shared between the
+    results of ``dump`` so they must not be modified.
+    """
+
+    def __init__(self):
+        self._fragments = {}
+        self._report_schema = TestReportSchema(
+            strict=True, exclude=('entries',))
+        self._group_schema = TestGroupReportSchema(
+            strict=True, exclude=('entries',))
+        self._testcase_schema = TestCaseReportSchema(strict=True)
+
+    def dump(self, report):
+        """
+        Serialize a test report, reusing cached groups & testcases.
+
+        :param report: Test report to serialize.
+        :type report: :py:class:`~testplan.report.testing.base.TestReport`
+        :return: Serialized report.
+        :rtype: ``dict``
+        """
+        data = self._report_schema.dump(report).data
+        data['entries'] = [
+            self._dump_node(entry, (report.uid,))[1] for entry in report]
+        return data
+
+    def _dump_node(self, report, parent_path):
+        path = parent_path + (report.uid,)
+
+        if isinstance(report, TestGroupReport):
+            children = [self._dump_node(entry, path) for entry in report]
+            key = (path, report._version,
+                   tuple(child_key for child_key, _ in children))
+        else:
+            children = None
+            key = (path, report._version)
+
+        data = self._fragments.get(key)
+        if data is None:
+            if children is None:
+                data = self._testcase_schema.dump(report).data
+            else:
+                data = self._group_schema.dump(report).data
+                data['entries'] = [child for _, child in children]
+            self._fragments[key] = data
+        return key, data
+
+    def clear(self):
+        """Drop all serialized fragments."""
+        self._fragments.clear()
+
+
+_ACTIVE = threading.local()
+
+
+def active_serialization_cache():
+    """
+    :return: Serialization cache of the current thread if any.
+    :rtype: :py:class:`SerializationCache` or ``NoneType``
+    """
+    return getattr(_ACTIVE, 'cache', None)
+
+
+@contextlib.contextmanager
+def serialization_cache():
+    """
+    Share serialized groups & testcases between the ``TestReport.serialize``
+    calls made by the current thread in this context, e.g. by all exporters.
+    Reports must only be modified via their methods meanwhile.
+    """
+    previous = active_serialization_cache()
+    _ACTIVE.cache = previous or SerializationCache()
+    try:
+        yield _ACTIVE.cache
+    finally:
+        _ACTIVE.cache = previous
@@ -4,29 +4,37 @@ import os
 import random
 import time
 import uuid
-import webbrowser
 from collections import OrderedDict
 
 from schema import Or, And, Use
 
 from testplan import defaults
 from testplan.common.utils import logger
-from testplan.common.config import ConfigOption
+from testplan.common.config import ConfigOption, DefaultFactory
 from testplan.common.entity import (Entity, RunnableConfig, RunnableStatus,
     RunnableResult, Runnable)
 from testplan.common.exporters import BaseExporter, ExporterResult
 from testplan.common.report import MergeError
 from testplan.common.utils.path import default_runpath
-from testplan.exporters import testing as test_exporters
+from testplan.common.utils.profiling import merge_profile
+from testplan.exporters.testing.base import Exporter
 from testplan.report.testing import TestReport, TestGroupReport, Status
 from testplan.report.testing.styles import Style
-from testplan.runnable.interactive import TestRunnerIHandler
 from testplan.runners.base import Executor
 from testplan.runners.pools.tasks import Task, TaskResult
 from testplan.testing import listing, filtering, ordering, tagging
 from testplan.testing.base import TestResult
 
 
+def interactive_handler(target):
+    """
+    Creates the default interactive handler of a test runner, the interactive
+    mode modules are only imported when it is used.
+    """
+    from testplan.runnable.interactive import TestRunnerIHandler
+    return TestRunnerIHandler(target=target)
+
+
 def get_default_exporters(config):
     """
     Instantiate certain exporters if related cmdline argument (e.g. --pdf)
@@ -34,15 +42,20 @@ def get_default_exporters(config):
     """
     result = []
     if config.pdf_path:
-        result.append(test_exporters.PDFExporter())
+        from testplan.exporters.testing.pdf import PDFExporter
+        result.append(PDFExporter())
     if config.report_tags or config.report_tags_all:
-        result.append(test_exporters.TagFilteredPDFExporter())
+        from testplan.exporters.testing.pdf import TagFilteredPDFExporter
+        result.append(TagFilteredPDFExporter())
     if config.json_path:
-        result.append(test_exporters.JSONExporter())
+        from testplan.exporters.testing.json import JSONExporter
+        result.append(JSONExporter())
     if config.xml_dir:
-        result.append(test_exporters.XMLExporter())
+        from testplan.exporters.testing.xml import XMLExporter
+        result.append(XMLExporter())
     if config.ui_port:
-        result.append(test_exporters.WebServerExporter())
+        from testplan.exporters.testing.webserver import WebServerExporter
+        result.append(WebServerExporter())
     return result
 
 
@@ -73,7 +86,12 @@ def result_for_failed_task(original_result):
     Create a new result entry for invalid result retrieved from a resource.
     """
     result = TestResult()
-    result.report = TestGroupReport(name=original_result.task.name)
+    # Keep the part of the report that was streamed before the failure.
+    partial_report = getattr(original_result.task, 'resume_report', None)
+    if partial_report is not None:
+        result.report = partial_report
+    else:
+        result.report = TestGroupReport(name=original_result.task.name)
     attrs = [attr for attr in original_result.task.all_attrs]
     result_lines = ['{}: {}'.format(attr, getattr(original_result.task, attr))\
                         if getattr(original_result.task, attr, None) else ''\
@@ -105,7 +123,9 @@ class TestRunnerConfig(RunnableConfig):
             ConfigOption('all_tasks_local', default=False): bool,
             ConfigOption('shuffle', default=[]): list, # list of string choices
             ConfigOption(
-                'shuffle_seed', default=float(random.randint(1, 9999))): float,
+                'shuffle_seed',
+                default=DefaultFactory(lambda: float(random.randint(1, 9999)))
+            ): float,
             ConfigOption(
                 'exporters', default=None): Use(get_exporters),
             ConfigOption(
@@ -153,7 +173,7 @@ class TestRunnerConfig(RunnableConfig):
             ConfigOption(
                 'timeout', default=None): Or(
                 None, And(Or(int, float), lambda t: t >= 0)),
-            ConfigOption('interactive_handler', default=TestRunnerIHandler):
+            ConfigOption('interactive_handler', default=interactive_handler):
                 object,
             ConfigOption('extra_deps', default=[]): list
         }
@@ -214,7 +234,7 @@ class TestRunner(Runnable):
     :type all_tasks_local: ``bool``
     :param shuffle: Shuffle strategy.
     :type shuffle: ``list`` of ``str``
-    :param shuffle_seed: Shuffle seed.
+    :param shuffle_seed: Shuffle seed, random for each plan by default.
     :type shuffle_seed: ``float``
     :param exporters: Exporters for reports creation.
     :type exporters: ``list``
@@ -247,8 +267,11 @@ class TestRunner(Runnable):
       :py:class:`BaseLister <testplan.testing.listing.BaseLister>`
     :param timeout: Timeout value for test execution.
     :type timeout: ``None`` or ``int`` or ``float`` greater than 0.
-    :param interactive_handler: Handler for interactive mode execution.
-    :type interactive_handler: Subclass of
+    :param interactive_handler: Handler for interactive mode execution,
+      called with the ``target`` keyword argument to create the handler.
+      Defaults to :py:func:`interactive_handler`, which creates a
+      :py:class:`TestRunnerIHandler <testplan.runnable.interactive.TestRunnerIHandler>`.
+    :type interactive_handler: ``callable``, e.g. a subclass of
       :py:class:`TestRunnerIHandler <testplan.runnable.interactive.TestRunnerIHandler>`
     :param extra_deps: Extra module dependencies for interactive reload.
     :type extra_deps: ``list`` of ``module``s
@@ -333,6 +356,50 @@ class TestRunner(Runnable):
         return self.add(task or Task(uid=uid, **options),
                         resource=resource, uid=uid)
 
+    def schedule_parts(self, resource, num_parts=None, part_arg='part',
+                       **options):
+        """
+        Schedules a :py:class:`~testplan.runners.pools.tasks.base.Task` for
+        each part of a test in a pool. The task target must create the test
+        given its part, i.e. ``(index, total)``, as the ``part_arg`` keyword
+        argument, like the ``part`` option of
+        :py:class:`~testplan.testing.multitest.base.MultiTest`.
+
+        :param resource: Target pool resource.
+        :type resource: ``str``
+        :param num_parts: Number of parts, by default the number of tasks
+            the pool executes concurrently.
+        :type num_parts: ``int``
+        :param part_arg: Keyword argument of the task target for the part.
+        :type part_arg: ``str``
+        :param options: Task input options, a ``uid`` option is suffixed
+            with the part index of each task.
+        :type options: ``dict``
+        :return: Assigned uids for tasks.
+        :rtype: ``list`` of ``str``
+        """
+        if resource not in self.resources:
+            raise RuntimeError('Resource "{}" does not exist.'.format(
+                resource))
+        if num_parts is None:
+            num_parts = getattr(self.resources[resource], 'capacity', None)
+            if num_parts is None:
+                raise ValueError(
+                    'Resource "{}" is not a pool, num_parts is'
+                    ' required.'.format(resource))
+
+        uid = options.pop('uid', None)
+        uids = []
+        for index in range(num_parts):
+            kwargs = dict(options.get('kwargs') or {})
+            # A test in a single part is not split.
+            kwargs[part_arg] = (index, num_parts) if num_parts > 1 else None
+            part_uid = '{}_{}'.format(uid, index) \
+                if uid is not None and num_parts > 1 else uid
+            uids.append(self.schedule(resource=resource, uid=part_uid,
+                                      **dict(options, kwargs=kwargs)))
+        return uids
+
     def add(self, runnable, resource=None, uid=None):
         """
         Adds a
@@ -519,8 +586,7 @@ class TestRunner(Runnable):
                         # a full structured report by dry_run(), thus the order
                         # of testcases can be retained in test report.
                         target = resource_result.task.materialize()
-                        # TODO: Any idea to avoid accessing private members?
-                        target.cfg._options['part'] = None
+                        target.cfg.set_local('part', None)
                         target._test_context = None
                         report = target.dry_run(status=Status.SKIPPED).report
                     else:
@@ -619,30 +685,44 @@ class TestRunner(Runnable):
         if hasattr(self._result.test_report, 'bubble_up_attachments'):
             self._result.test_report.bubble_up_attachments()
 
-        for exporter in exporters:
-
-            if hasattr(exporter, 'cfg'):
-                exporter.cfg.parent = self.cfg
-
-            if isinstance(exporter, test_exporters.Exporter):
-                exp_result = ExporterResult.run_exporter(
-                    exporter=exporter,
-                    source=self._result.test_report,
-                    type='test',
-                )
-
-                if not exp_result.success:
-                    logger.TESTPLAN_LOGGER.error(exp_result.traceback)
-                self._result.exporter_results.append(exp_result)
-            else:
-                raise NotImplementedError(
-                    'Exporter logic not'
-                    ' implemented for: {}'.format(type(exporter)))
+        # The report does not change anymore, exporters serializing it
+        # share the serialized groups & testcases.
+        from testplan.report.testing.schemas import serialization_cache
+        with serialization_cache():
+            for exporter in exporters:
+
+                if hasattr(exporter, 'cfg'):
+                    exporter.cfg.parent = self.cfg
+
+                if isinstance(exporter, Exporter):
+                    exp_result = ExporterResult.run_exporter(
+                        exporter=exporter,
+                        source=self._result.test_report,
+                        type='test',
+                    )
+
+                    if not exp_result.success:
+                        logger.TESTPLAN_LOGGER.error(exp_result.traceback)
+                    self._result.exporter_results.append(exp_result)
+                else:
+                    raise NotImplementedError(
+                        'Exporter logic not'
+                        ' implemented for: {}'.format(type(exporter)))
+
+        # Exporter timings are recorded in the profile of the plan report
+        # once all exporters have run, so they are not part of the exported
+        # reports (JSON, PDF, XML...) but only of the in-memory one.
+        timings = [result.timing for result in self._result.exporter_results]
+        if timings:
+            self._result.test_report.profile = merge_profile(
+                self._result.test_report.profile,
+                {'timings': timings, 'profiles': {}})
 
     def _post_exporters(self):
         report_opened = False
         for result in self._result.exporter_results:
             if getattr(result.exporter, 'url', None) and self.cfg.browse:
+                import webbrowser
                 webbrowser.open(result.exporter.url)
                 report_opened = True
             if getattr(result.exporter, '_web_server_thread', None):
@@ -1,14 +1,13 @@
 """Interactive code reloader module."""
 
 import os
+import ast
 import sys
 import time
 import inspect
 
 from six.moves import reload_module
 
-from modulefinder import ModuleFinder
-
 from testplan.common.utils.path import fix_home_prefix, pwd
 from testplan.testing.multitest import suite
 
@@ -80,6 +79,80 @@ def _update_suites(module, module_suites):
                 suite.set_testsuite_testcases(suite_obj)
 
 
+def _resolve_relative(modname, is_package, module, level):
+    """
+    Absolute name of a module imported with a relative import.
+
+    :param modname: Name of the importing module.
+    :type modname: ``str``
+    :param is_package: If the importing module is a package ``__init__``.
+    :type is_package: ``bool``
+    :param module: Module part of ``from <module> import ...``, can be None.
+    :type module: ``str`` or ``NoneType``
+    :param level: Number of leading dots of the import.
+    :type level: ``int``
+    :return: Absolute module name, None if it goes beyond the top package.
+    :rtype: ``str`` or ``NoneType``
+    """
+    parts = modname.split('.')
+    if not is_package:
+        parts = parts[:-1]
+    if level > 1:
+        if level - 1 > len(parts):
+            return None
+        parts = parts[:len(parts) - (level - 1)]
+    if module:
+        parts.append(module)
+    return '.'.join(parts) or None
+
+
+def scan_imports(filepath, modname):
+    """
+    Parse a python source file and collect the names of the modules it
+    imports, without executing or resolving them. ``from pkg import name``
+    yields both ``pkg`` and ``pkg.name`` as ``name`` may be a submodule.
+
+    :param filepath: Path of the python source file.
+    :type filepath: ``str``
+    :param modname: Module name of the file, to resolve relative imports.
+    :type modname: ``str``
+    :return: Imported module names.
+    :rtype: ``set`` of ``str``
+    """
+    with open(filepath, 'rb') as source_file:
+        source = source_file.read()
+    try:
+        tree = ast.parse(source, filepath)
+    except (SyntaxError, ValueError, TypeError):
+        return set()
+
+    is_package = os.path.basename(filepath).startswith('__init__.')
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                names.add(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                module = _resolve_relative(
+                    modname, is_package, node.module, node.level)
+            else:
+                module = node.module
+            if module is None:
+                continue
+            names.add(module)
+            for alias in node.names:
+                if alias.name != '*':
+                    names.add('{}.{}'.format(module, alias.name))
+
+    # import a.b.c also imports a & a.b
+    for name in list(names):
+        parts = name.split('.')
+        for idx in range(1, len(parts)):
+            names.add('.'.join(parts[:idx]))
+    return names
+
+
 class ModuleReloader(object):
     """
     Reloads modules and their dependencies if there was any file modification.
@@ -88,9 +161,13 @@ class ModuleReloader(object):
         self.logger = logger
         self._init_time = time.time()
 
-        # Stores filepaths and their dependencies as per ModuleFinder.
+        # Stores filepaths and the filepaths of the modules they import.
         self._dependencies = {}
 
+        # Filepath to (mtime, size, module name) and imported module names,
+        # files are only parsed again when they change.
+        self._scanned_imports = {}
+
         # Filepath to module names map.
         self._files_to_modname = {}
 
@@ -132,6 +209,7 @@ class ModuleReloader(object):
         all_files = set()
         self._dependencies = {}
         self._files_to_modname = {}
+        modname_to_file = {}
 
         for name, mod in sys.modules.items():
             try:
@@ -141,25 +219,20 @@ class ModuleReloader(object):
                        for directory in self.reload_dirs):
                     all_files.add(mod_filepath)
                     self._files_to_modname[mod_filepath] = name
+                    modname_to_file[name] = mod_filepath
             except:
                 pass
 
         for filepath in all_files:
             self._dependencies[filepath] = set()
-            finder = ModuleFinder(path=self.reload_dirs)
-            finder.run_script(filepath)
-
-            for name, mod in finder.modules.items():
-                if name == '__main__':
-                    continue
-                try:
-                    mod_filepath = self._module_filepath(
-                        inspect.getfile(sys.modules[name]))
-                    if any(mod_filepath.startswith(directory)
-                           for directory in self.reload_dirs):
-                        self._dependencies[filepath].add(mod_filepath)
-                except:
-                    pass
+            for name in self._imported_modules(filepath):
+                dependency = modname_to_file.get(name)
+                if dependency is not None and dependency != filepath:
+                    self._dependencies[filepath].add(dependency)
+
+        # Forget files which are not loaded anymore.
+        for filepath in set(self._scanned_imports) - all_files:
+            del self._scanned_imports[filepath]
 
         # Manipulating dependencies so that
         #   package/bob.py will not have package/__init__.py as dependency
@@ -172,14 +245,37 @@ class ModuleReloader(object):
                     self._dependencies[filepath].remove(child)
                     self._dependencies[child].add(filepath)
 
-    def _reload_deps(self, filepath, reloaded, suite_dict):
+    def _imported_modules(self, filepath):
+        """
+        Names of the modules imported by a file, only parsed again if the
+        file has changed since it was last scanned.
+        """
+        modname = self._files_to_modname[filepath]
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return set()
+
+        key = (stat.st_mtime, stat.st_size, modname)
+        cached = self._scanned_imports.get(filepath)
+        if cached is None or cached[0] != key:
+            cached = (key, scan_imports(filepath, modname))
+            self._scanned_imports[filepath] = cached
+        return cached[1]
+
+    def _reload_deps(self, filepath, reloaded, suite_dict, visited):
         """
         Reload all modules as per file changes and the dependency tree.
+        Each file is visited once per reload, which also breaks import cycles.
         """
+        if filepath in visited:
+            return False
+        visited.add(filepath)
+
         for child in self._dependencies[filepath]:
             if child in reloaded:
                 continue
-            self._reload_deps(child, reloaded, suite_dict)
+            self._reload_deps(child, reloaded, suite_dict, visited)
 
         any_child_reloaded = any(
             child in reloaded for child in self._dependencies[filepath])
@@ -215,5 +311,6 @@ class ModuleReloader(object):
             self._build_dependencies()
 
         reloaded = set()
+        visited = set()
         for filepath in self._dependencies:
-            self._reload_deps(filepath, reloaded, suite_dict)
+            self._reload_deps(filepath, reloaded, suite_dict, visited)
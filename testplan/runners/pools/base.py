@@ -1,8 +1,10 @@
 """Worker pool executor base classes."""
 
 import os
+import copy
 import time
 import psutil
+import functools
 import inspect
 import threading
 import logging
@@ -18,6 +20,7 @@ from testplan.common.utils.exceptions import format_trace
 from testplan.common.utils.strings import Color
 from testplan.common.utils.timing import wait_until_predicate
 from testplan.common.utils import logger
+from testplan.report import TestGroupReport
 
 from .communication import Message
 from testplan.runners.base import Executor, ExecutorConfig
@@ -281,6 +284,10 @@ class Worker(Resource):
                   target.parent = self
                 if not target.cfg.parent:
                   target.cfg.parent = self.cfg
+                if hasattr(target, 'report_delta_handler'):
+                    target.resume_report = task.resume_report
+                    target.report_delta_handler = functools.partial(
+                        self._send_report_delta, task)
                 result = target.run()
             elif callable(target):
                 result = target()
@@ -294,6 +301,16 @@ class Worker(Resource):
             task_result = TaskResult(task=task, result=result, status=True)
         return task_result
 
+    def _send_report_delta(self, task, report):
+        """
+        Streams a completed part of the task report to the pool while the
+        task is still executing.
+        """
+        message = Message(**self.metadata)
+        self._transport.send_and_receive(message.make(
+            message.TaskReportDelta, data=[(task.uid(), report)]),
+            expect=message.Ack)
+
     def respond(self, msg):
         """
         Method that the pull uses to respond with a message to the worker.
@@ -307,6 +324,46 @@ class Worker(Resource):
         return '{}[{}]'.format(self.__class__.__name__, self.cfg.index)
 
 
+def strip_streamed_entries(task_result, uids):
+    """
+    Copy of a task result whose test report entries of the given uids, that
+    were already streamed as report deltas, are replaced by empty
+    placeholders. The pool receiving the result restores them from the
+    partial report of the task.
+
+    :param task_result: Task result.
+    :type task_result: :py:class:`~testplan.runners.pools.tasks.base.TaskResult`
+    :param uids: Uids of the streamed report entries.
+    :type uids: ``iterable`` of ``str``
+    :return: Task result to send to the pool.
+    :rtype: :py:class:`~testplan.runners.pools.tasks.base.TaskResult`
+    """
+    report = getattr(task_result.result, 'report', None)
+    uids = set(uids)
+    if report is None or not uids:
+        return task_result
+
+    stripped = copy.copy(report)
+    stripped.entries = [
+        TestGroupReport(name=entry.name, category=entry.category,
+                        uid=entry.uid) if entry.uid in uids else entry
+        for entry in report]
+    stripped.bump_version()
+    stripped.build_index()
+    result = copy.copy(task_result.result)
+    result.report = stripped
+
+    task = copy.copy(task_result.task)
+    # The pool keeps its own partial report of the task.
+    task.resume_report = None
+    stripped_result = TaskResult(
+        task=task, result=result, status=task_result.status,
+        reason=task_result.reason, follow=task_result.follow)
+    stripped_result.streamed = [
+        entry.uid for entry in report if entry.uid in uids]
+    return stripped_result
+
+
 def default_check_reschedule(pool, task_result):
     """
     Determines if a task should be rescheduled based on the task result info.
@@ -379,11 +436,18 @@ class Pool(Executor):
         self._pool_lock = threading.Lock()
         self._request_handlers = {}
         self._metadata = {}
+        self._partial_reports = {}  # uid: report streamed by workers
+        self._report_delta_listener = None
 
     def uid(self):
         """Pool name."""
         return self.cfg.name
 
+    @property
+    def capacity(self):
+        """Number of tasks the pool executes concurrently."""
+        return self.cfg.size
+
     def add(self, task, uid):
         """
         Add a task for execution.
@@ -415,6 +479,25 @@ class Pool(Executor):
         validate_func('pool', 'task_result')(check_reschedule)
         self.should_reschedule = check_reschedule
 
+    @property
+    def partial_reports(self):
+        """
+        Reports of the ongoing tasks, built from the completed parts that
+        workers streamed so far.
+        """
+        return self._partial_reports
+
+    def set_report_delta_listener(self, listener):
+        """
+        Sets a callable to be notified of every report delta streamed by the
+        workers, after it has been merged to the partial report of the task.
+
+        :param listener: Report delta listener.
+        :type listener: ``callable`` that takes ``uid``, ``report`` arguments.
+        """
+        validate_func('uid', 'report')(listener)
+        self._report_delta_listener = listener
+
     def _loop(self):
         worker_monitor = threading.Thread(target=self._workers_monitoring)
         worker_monitor.daemon = True
@@ -491,6 +574,10 @@ class Pool(Executor):
                     else:
                         self.task_assign_cnt[uid] += 1
                         task = self._input[uid]
+                        if task.resume_report is not None:
+                            self.logger.test_info(
+                                'Resuming {} from its partial report'.format(
+                                    task))
                         self.logger.test_info(
                             'Scheduling {} to {}'.format(task, worker))
                         worker.assigned.add(uid)
@@ -526,10 +613,23 @@ class Pool(Executor):
                         self.unassigned.append(uid)
                         continue
 
+                if task_result.streamed:
+                    self._restore_streamed_entries(uid, task_result)
+                if task_result.status is False:
+                    # Keep the testcases that completed before the failure.
+                    task_result.task.resume_report =\
+                        self._input[uid].resume_report
+                self._partial_reports.pop(uid, None)
                 self._print_test_result(task_result)
                 self._results[uid] = task_result
                 self.ongoing.remove(uid)
             worker.respond(response.make(Message.Ack))
+        elif request.cmd == Message.TaskReportDelta:
+            for uid, report in request.data:
+                # Ignore late deltas of tasks already de-assigned.
+                if uid in worker.assigned:
+                    self._merge_report_delta(uid, report)
+            worker.respond(response.make(Message.Ack))
         elif request.cmd == Message.Heartbeat:
             worker.last_heartbeat = time.time()
             self.logger.debug(
@@ -550,6 +650,59 @@ class Pool(Executor):
                 request, dir(request), request.cmd, request.data))
             worker.respond(response.make(Message.Ack))
 
+    def _restore_streamed_entries(self, uid, task_result):
+        """
+        Replaces the placeholder entries of a task result report by the
+        streamed entries of the partial report of the task.
+        """
+        partial = self._partial_reports.get(uid)
+        streamed = {}
+        for entry_uid in task_result.streamed:
+            try:
+                streamed[entry_uid] = partial.get_by_uid(entry_uid)
+            except (AttributeError, KeyError):
+                self.logger.error(
+                    'Streamed report of {} is missing for {}'.format(
+                        entry_uid, self._input[uid]))
+
+        report = task_result.result.report
+        report.entries = [streamed.get(entry.uid, entry) for entry in report]
+        report.bump_version()
+        report.build_index()
+        task_result.streamed = []
+
+    def _merge_report_delta(self, uid, report):
+        """
+        Merges a report delta of a task into its partial report. Entries of
+        the delta replace the partial report entries with the same uid.
+        """
+        partial = self._partial_reports.get(uid)
+        if partial is None:
+            partial = TestGroupReport(
+                name=report.name,
+                description=report.description,
+                category=report.category,
+                uid=report.uid,
+                tags=report.tags,
+                part=report.part,
+                fix_spec_path=report.fix_spec_path,
+            )
+            self._partial_reports[uid] = partial
+
+        for entry in report:
+            try:
+                previous = partial.get_by_uid(entry.uid)
+            except KeyError:
+                partial.append(entry)
+            else:
+                partial.entries[partial.entries.index(previous)] = entry
+                partial.build_index()
+
+        # A rescheduled task resumes from the testcases it already has.
+        self._input[uid].resume_report = partial
+        if self._report_delta_listener is not None:
+            self._report_delta_listener(uid, report)
+
     def _deco_worker(self, worker, message):
         self.logger.critical(message.format(worker))
         if os.path.exists(worker.outfile):
@@ -105,6 +105,8 @@ class ChildLoop(object):
         self._pool_cfg = None
         self._worker_type = worker_type
         self._to_heartbeat = float(0)
+        self._report_deltas = []
+        self._streamed = {}
         self.runpath = runpath
         self.logger = logger
 
@@ -138,6 +140,12 @@ class ChildLoop(object):
             runpath=self.runpath)
         self._pool.parent = self
         self._pool.cfg.parent = self._pool_cfg
+
+        def forward_report_delta(uid, report):
+            self._streamed.setdefault(uid, set()).update(
+                entry.uid for entry in report)
+            self._report_deltas.append((uid, report))
+        self._pool.set_report_delta_listener(forward_report_delta)
         return self._pool
 
     def _handle_abort(self, signum, frame):
@@ -200,6 +208,13 @@ class ChildLoop(object):
         self.runpath = self.runpath or str(pool_metadata['runpath'])
         self._setup_logfiles()
 
+    def _result_to_send(self, uid):
+        """Result of a task of the local pool, to send to the main pool."""
+        from testplan.runners.pools.base import strip_streamed_entries
+        # Streamed entries are already known by the pool.
+        return strip_streamed_entries(
+            self._pool.results[uid], self._streamed.pop(uid, ()))
+
     def worker_loop(self):
         """
         Child process worker loop. Manages an underlying thread pool, pulls and
@@ -239,11 +254,23 @@ class ChildLoop(object):
                                 time.time() - hb_resp.data))
                     self._to_heartbeat = self._pool_cfg.worker_heartbeat
 
+                # Report deltas need to be sent before the results of the
+                # same tasks, so the results are checked first.
+                result_uids = list(self._pool.results.keys())
+
+                # Forward report deltas streamed by the local workers
+                if self._report_deltas:
+                    report_deltas = self._report_deltas[:]
+                    del self._report_deltas[:len(report_deltas)]
+                    self._transport.send_and_receive(message.make(
+                        message.TaskReportDelta,
+                        data=report_deltas), expect=message.Ack)
+
                 # Send back results
-                if self._pool.results:
+                if result_uids:
                     task_results = []
-                    for uid in list(self._pool.results.keys()):
-                        task_results.append(self._pool.results[uid])
+                    for uid in result_uids:
+                        task_results.append(self._result_to_send(uid))
                         self.logger.debug('Sending back result for {}'.format(
                             self._pool.results[uid].task))
                         del self._pool.results[uid]
@@ -315,6 +342,26 @@ class RemoteChildLoop(ChildLoop):
                                stdout=sys.stdout, stderr=sys.stderr):
                 raise RuntimeError('Setup script exited with non 0 code.')
 
+    def _result_to_send(self, uid):
+        """
+        The XML file a test report was parsed from only exists on this host,
+        it is fetched by the pool along with the runpath when the worker
+        stops. A file outside of the runpath is copied into it, rather than
+        loading its content in memory to send it with the result.
+        """
+        task_result = super(RemoteChildLoop, self)._result_to_send(uid)
+        report = getattr(task_result.result, 'report', None)
+        xml_path = getattr(report, 'xml_path', None)
+        if xml_path and os.path.exists(xml_path) and os.path.relpath(
+                xml_path, self.runpath).startswith(os.pardir):
+            xml_dir = os.path.join(self.runpath, 'xml')
+            if not os.path.exists(xml_dir):
+                os.makedirs(xml_dir)
+            report.xml_path = os.path.join(xml_dir, '{}_{}'.format(
+                uid, os.path.basename(xml_path)))
+            shutil.copyfile(xml_path, report.xml_path)
+        return task_result
+
     def exit_loop(self):
         if self._pool.cfg.delete_pushed:
             for item in self._setup_metadata.push_dirs:
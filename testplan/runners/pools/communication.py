@@ -7,6 +7,7 @@ class Message(object):
     Ack = 'Ack'
     TaskSending = 'TaskSending'
     TaskResults = 'TaskResults'
+    TaskReportDelta = 'TaskReportDelta'
     TaskPullRequest = 'TaskPullRequest'
     MetadataPull = 'MetadataPull'
     Metadata = 'Metadata'
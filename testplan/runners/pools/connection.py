@@ -2,8 +2,6 @@
 
 import pickle
 
-import zmq
-
 from .base import ConnectionManager
 
 
@@ -14,6 +12,8 @@ class TCPConnectionManager(ConnectionManager):
 
     def __init__(self, cfg):
         """TODO."""
+        import zmq
+        self._zmq = zmq
         self._context = zmq.Context()
         self._sock = self._context.socket(zmq.REP)
         if cfg.port == 0:
@@ -38,8 +38,8 @@ class TCPConnectionManager(ConnectionManager):
             :py:class:`~testplan.runners.pools.communication.Message`
         """
         try:
-            return pickle.loads(self._sock.recv(flags=zmq.NOBLOCK))
-        except zmq.Again:
+            return pickle.loads(self._sock.recv(flags=self._zmq.NOBLOCK))
+        except self._zmq.Again:
             return None
 
     def close(self):
@@ -3,7 +3,6 @@
 import os
 import re
 import sys
-import time
 import pickle
 import signal
 import subprocess
@@ -14,6 +13,7 @@ from testplan.common.utils.logger import TESTPLAN_LOGGER
 from testplan.common.config import ConfigOption
 from testplan.common.utils.process import kill_process
 from testplan.common.utils.match import match_regexps_in_file
+from testplan.common.utils.timing import wait
 
 from .base import Pool, PoolConfig, Worker, WorkerConfig
 from .connection import TCPConnectionManager
@@ -119,21 +119,25 @@ class ProcessWorker(Worker):
         self._handler.stdin.write(bytes('y\n'.encode('utf-8')))
 
     def _wait_started(self, timeout=None):
-        """TODO."""
-        st_time = time.time()
-        sleep_interval = 0.04
-        while time.time() - st_time < self.cfg.start_timeout:
-            time.sleep(min(sleep_interval, 0.5))
-            if match_regexps_in_file(
-                  self.outfile,
-                  [re.compile('Starting child process worker on')])[0] is True:
-                self.status.change(self.STATUS.STARTED)
-                return
-            sleep_interval *= 2
-        if self._handler.poll() is not None:
-            raise RuntimeError(
-                '{proc} process exited: {rc} (logfile = {log})'.format(
-                    proc=self, rc=self._handler.returncode, log=self.outfile))
+        """
+        Wait for the child process to log its start message, failing early
+        if the child process exits first.
+        """
+        start_pattern = [re.compile('Starting child process worker on')]
+
+        def started():
+            if match_regexps_in_file(self.outfile, start_pattern)[0] is True:
+                return True
+            if self._handler.poll() is not None:
+                raise RuntimeError(
+                    '{proc} process exited: {rc} (logfile = {log})'.format(
+                        proc=self, rc=self._handler.returncode,
+                        log=self.outfile))
+            return False
+
+        if wait(started, self.cfg.start_timeout, interval=0.5) is True:
+            self.status.change(self.STATUS.STARTED)
+            return
         raise RuntimeError(
             'Could not match starting pattern in {}'.format(self.outfile))
 
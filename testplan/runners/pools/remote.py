@@ -2,6 +2,7 @@
 
 import os
 import sys
+import posixpath
 import time
 import signal
 import socket
@@ -15,7 +16,7 @@ from schema import Or
 
 import testplan
 from testplan.common.utils.logger import TESTPLAN_LOGGER
-from testplan.common.config import ConfigOption
+from testplan.common.config import ConfigOption, DefaultFactory
 from testplan.common.utils.path import (module_abspath,
                                         pwd, makedirs, fix_home_prefix)
 from testplan.common.utils.strings import slugify
@@ -472,6 +473,26 @@ class RemoteWorker(ProcessWorker):
             remote_source=True,
             target=self.parent.runpath)
 
+    def fetched_path(self, path):
+        """
+        Local path a file of the remote runpath is fetched to when the worker
+        stops, ``None`` if the file is outside of the remote runpath.
+
+        :param path: Path of a file on the remote host.
+        :type path: ``str``
+        :return: Local path of the file.
+        :rtype: ``str``
+        """
+        if not path or not self._remote_testplan_runpath:
+            return None
+        relpath = posixpath.relpath(path, self._remote_testplan_runpath)
+        if relpath.startswith(posixpath.pardir):
+            return None
+        return os.path.join(
+            self.parent.runpath,
+            posixpath.basename(self._remote_testplan_runpath),
+            *relpath.split(posixpath.sep))
+
     def _add_testplan_import_path(self, cmd, flag=None):
         if self.cfg.testplan_path:
             if flag is not None:
@@ -627,7 +648,7 @@ class RemotePoolConfig(PoolConfig):
                 lambda x: callable(x),
             ConfigOption('ssh_cmd', default=ssh_cmd):
                 lambda x: callable(x),
-            ConfigOption('workspace', default=pwd()): str,
+            ConfigOption('workspace', default=DefaultFactory(pwd)): str,
             ConfigOption('workspace_exclude', default=[]): Or(list, None),
             ConfigOption('remote_workspace', default=None): Or(str, None),
             ConfigOption('copy_workspace_check',
@@ -661,6 +682,28 @@ class RemotePool(Pool):
         self._request_handlers[Message.MetadataPull] =\
             self._worker_setup_metadata
 
+    @property
+    def capacity(self):
+        """Number of tasks the local pools of all hosts execute concurrently."""
+        return sum(self.cfg.hosts.values())
+
+    def handle_request(self, request):
+        """
+        The XML files the reports of task results were parsed from are
+        fetched along with the runpath of their worker, their paths are
+        changed to the local ones before the results are handled.
+        """
+        if request.cmd == Message.TaskResults:
+            worker = self._workers[request.sender_metadata['index']]
+            for task_result in request.data:
+                report = getattr(task_result.result, 'report', None)
+                xml_path = worker.fetched_path(
+                    getattr(report, 'xml_path', None))
+                if xml_path:
+                    report.xml_path = xml_path
+                    report.xml_host = socket.gethostname()
+        super(RemotePool, self).handle_request(request)
+
     @staticmethod
     def _worker_setup_metadata(worker, response):
         worker.respond(response.make(
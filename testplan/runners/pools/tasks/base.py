@@ -68,6 +68,7 @@ class Task(object):
         self._kwargs = kwargs or dict()
         self._module = module
         self._uid = uid or str(uuid.uuid4())
+        self._resume_report = None
 
     def __str__(self):
         return '{}[{}]'.format(self.__class__.__name__, self._uid)
@@ -93,6 +94,18 @@ class Task(object):
             name = self._target
         return 'Task[{}]'.format(name)
 
+    @property
+    def resume_report(self):
+        """
+        Partial report streamed by a previous execution attempt of the task.
+        """
+        return self._resume_report
+
+    @resume_report.setter
+    def resume_report(self, report):
+        """Set the partial report the next execution attempt resumes from."""
+        self._resume_report = report
+
     @property
     def args(self):
         """Task target args."""
@@ -192,6 +205,7 @@ class TaskResult(object):
         self._status = status
         self._reason = reason
         self._follow = follow
+        self._streamed = tuple()
         self._uid = str(uuid.uuid4())
 
     def uid(self):
@@ -223,10 +237,23 @@ class TaskResult(object):
         """Follow up tasks that need to be scheduled next."""
         return self._follow
 
+    @property
+    def streamed(self):
+        """
+        Uids of the entries of the result report that were streamed as
+        report deltas, and so were sent as empty placeholders.
+        """
+        return self._streamed
+
+    @streamed.setter
+    def streamed(self, uids):
+        """Set the uids of the placeholder entries of the result report."""
+        self._streamed = tuple(uids)
+
     @property
     def all_attrs(self):
         return ('_task', '_status', '_reason',
-                '_result', '_follow', '_uid')
+                '_result', '_follow', '_streamed', '_uid')
 
     def dumps(self, check_loadable=False):
         """Serialize a task result."""
@@ -5,7 +5,6 @@ import subprocess
 import six
 import functools
 
-from lxml import objectify
 from schema import Or, Use, And
 
 from testplan import defaults
@@ -173,6 +172,12 @@ class Test(Runnable):
         self._test_context = None
         self._init_test_report()
 
+        # Set by pool workers, to stream the completed parts of the report
+        # (which are kept in the report of the test) and to resume from a
+        # partial report of a previous attempt.
+        self.report_delta_handler = None
+        self.resume_report = None
+
     def __str__(self):
         return '{}[{}]'.format(self.__class__.__name__, self.name)
 
@@ -587,6 +592,8 @@ class ProcessRunnerTest(Test):
         :return: Root node of parsed raw test data
         :rtype: ``xml.etree.Element``
         """
+        from lxml import objectify
+
         with self.result.report.logged_exceptions(), \
                 open(self.report_path) as report_file:
             return objectify.parse(report_file).getroot()
@@ -657,6 +664,7 @@ class ProcessRunnerTest(Test):
         self.result.report.entries = self.process_test_data(
             test_data=self.read_test_data()
         )
+        self.result.report.bump_version()
 
         retcode = self._test_process_retcode
 
@@ -1,6 +1,15 @@
-from schema import Or
+import os
+import shutil
+import socket
+
+import six
+from lxml import etree
+from schema import Or, And
 
 from testplan.common.config import ConfigOption
+from testplan.common.utils.junit_xml import merge_xml
+from testplan.common.utils.process import (
+    subprocess_popen, enforce_timeout, kill_process)
 
 from testplan.report.testing import TestGroupReport, TestCaseReport, Status
 from testplan.testing.multitest.entries.assertions import RawAssertion
@@ -42,6 +51,9 @@ class GTestConfig(ProcessRunnerTestConfig):
             ConfigOption('gtest_death_test_style', default='fast'): Or(
                 'fast', 'threadsafe'
             ),
+            ConfigOption('num_shards', default=1): And(int, lambda n: n >= 1),
+            ConfigOption('part', default=None): Or(None, And((int,),
+                lambda tp: len(tp) == 2 and 0 <= tp[0] < tp[1] and tp[1] > 1)),
         }
 
 
@@ -79,6 +91,16 @@ class GTest(ProcessRunnerTest):
     :param gtest_death_test_style: Test style flag, can either be
                         ``threadsafe`` or ``fast``. (Default value is ``fast``)
     :type gtest_death_test_style: ``str``
+    :param num_shards: Split the tests into this many shards, run
+                    concurrently as separate processes via GTest's native
+                    ``GTEST_TOTAL_SHARDS`` & ``GTEST_SHARD_INDEX``. Their
+                    outputs are merged into a single report.
+    :type num_shards: ``int``
+    :param part: Run only one shard of the tests, i.e. ``(index, total)``, so
+                 that shards can be scheduled as separate tasks on pools.
+                 Takes precedence over ``num_shards``, reports of the parts
+                 are merged if the plan has ``merge_scheduled_parts`` set.
+    :type part: ``tuple`` of (``int``, ``int``)
 
     Also inherits all
     :py:class:`~testplan.testing.base.ProcessTest` options.
@@ -86,6 +108,21 @@ class GTest(ProcessRunnerTest):
 
     CONFIG = GTestConfig
 
+    def __init__(self, **options):
+        super(GTest, self).__init__(**options)
+        self._shard_processes = []
+        self._missing_shards = []
+
+    def _new_test_report(self):
+        return TestGroupReport(
+            name=self.cfg.name,
+            description=self.cfg.description,
+            category=self.__class__.__name__.lower(),
+            uid=self.uid(),
+            tags=self.cfg.tags,
+            part=self.cfg.part,
+        )
+
     def base_command(self):
         cmd = [self.cfg.driver]
         if self.cfg.gtest_filter:
@@ -93,8 +130,11 @@ class GTest(ProcessRunnerTest):
         return cmd
 
     def test_command(self):
+        return self._test_command(self.report_path)
+
+    def _test_command(self, report_path):
         cmd = self.base_command() + [
-            '--gtest_output=xml:{}'.format(self.report_path),
+            '--gtest_output=xml:{}'.format(report_path),
             '--gtest_death_test_style={}'.format(
                 self.cfg.gtest_death_test_style
             )
@@ -120,40 +160,184 @@ class GTest(ProcessRunnerTest):
 
         return cmd
 
+    @staticmethod
+    def _shard_env(index, total):
+        return {
+            'GTEST_SHARD_INDEX': str(index),
+            'GTEST_TOTAL_SHARDS': str(total),
+        }
+
+    def _shard_path(self, path, index):
+        root, ext = os.path.splitext(path)
+        return '{}-shard{}{}'.format(root, index, ext)
+
+    def get_proc_env(self):
+        env = super(GTest, self).get_proc_env()
+        if self.cfg.part:
+            env.update(self._shard_env(*self.cfg.part))
+        return env
+
+    def run_tests(self):
+        """
+        Run the tests in a subprocess, or in ``num_shards`` concurrent
+        subprocesses each running a shard of the tests. Shard outputs are
+        merged into the usual stdout, stderr & report files.
+        """
+        if self.cfg.part or self.cfg.num_shards == 1:
+            super(GTest, self).run_tests()
+            return
+
+        with self.result.report.logged_exceptions():
+            if not os.path.exists(self.cfg.driver):
+                raise IOError('No runnable found at {} for {}'.format(
+                    self.cfg.driver,
+                    self
+                ))
+
+            if self.cfg.proc_cwd:
+                self.cfg.driver = os.path.abspath(self.cfg.driver)
+
+            total = self.cfg.num_shards
+            self._shard_processes = []
+            try:
+                for index in range(total):
+                    self._shard_processes.append(self._start_shard(index))
+
+                if self.cfg.timeout:
+                    with open(self.timeout_log, 'w') as timeout_log:
+                        for proc in self._shard_processes:
+                            enforce_timeout(
+                                process=proc,
+                                timeout=self.cfg.timeout,
+                                output=timeout_log,
+                                callback=self._shard_timeout_callback
+                            )
+                        retcodes = [
+                            proc.wait() for proc in self._shard_processes]
+                else:
+                    retcodes = [proc.wait() for proc in self._shard_processes]
+            finally:
+                for proc in self._shard_processes:
+                    if proc.returncode is None:
+                        kill_process(proc)
+
+            self._test_process_retcode = next(
+                (retcode for retcode in retcodes if retcode != 0), 0)
+            self._test_has_run = True
+
+            self._merge_shard_outputs(total)
+
+    def _start_shard(self, index):
+        """Start the process running the shard of the tests at ``index``."""
+        test_cmd = self._test_command(self._shard_path(self.report_path, index))
+        self.result.report.logger.debug(
+            'Running {} shard {} - Command: {}'.format(self, index, test_cmd))
+
+        env = self.get_proc_env()
+        env.update(self._shard_env(index, self.cfg.num_shards))
+
+        with open(self._shard_path(self.stderr, index), 'w') as stderr, \
+                open(self._shard_path(self.stdout, index), 'w') as stdout:
+            return subprocess_popen(
+                test_cmd,
+                stderr=stderr,
+                stdout=stdout,
+                cwd=self.cfg.proc_cwd,
+                env=env,
+            )
+
+    def _shard_timeout_callback(self):
+        """Log the timeout once, even if all shards time out."""
+        if not self._test_process_killed:
+            self.timeout_callback()
+
+    def _merge_shard_outputs(self, total):
+        """
+        Concatenate stdout & stderr of the shards and merge their XML reports,
+        keeping the order of suites & testcases of the test context.
+        """
+        for path in (self.stdout, self.stderr):
+            with open(path, 'wb') as merged:
+                for index in range(total):
+                    with open(self._shard_path(path, index), 'rb') as shard:
+                        shutil.copyfileobj(shard, merged)
+
+        self._missing_shards = []
+        shard_reports = []
+        for index in range(total):
+            shard_report = self._shard_path(self.report_path, index)
+            if os.path.exists(shard_report):
+                shard_reports.append(shard_report)
+            else:
+                self._missing_shards.append(index)
+
+        if shard_reports:
+            merge_xml(shard_reports, self.report_path, self.test_context)
+
     def list_command(self):
         return self.base_command() + ['--gtest_list_tests']
 
+    def read_test_data(self):
+        """
+        Parse the XML report incrementally, elements are cleared by
+        ``process_test_data`` once processed so that large reports are
+        never fully loaded into memory.
+
+        :return: Iterator of ``(event, element)`` parse events
+        :rtype: ``lxml.etree.iterparse``
+        """
+        with self.result.report.logged_exceptions():
+            return etree.iterparse(
+                self.report_path, events=('start', 'end'), huge_tree=True)
+
     def process_test_data(self, test_data):
         """
         XML output contains entries for skipped testcases
         as well, which are not included in the report.
         """
         result = []
-        for suite in test_data.getchildren():
-            suite_report = TestGroupReport(
-                name=suite.attrib['name'],
-                category='suite',
-            )
-            suite_has_run = False
-
-            for testcase in suite.getchildren():
-
-                testcase_report = TestCaseReport(name=testcase.attrib['name'])
-
-                for entry in testcase.getchildren():
-                    assertion_obj = RawAssertion(
-                        description=entry.tag,
-                        content=entry.text,
-                        passed=entry.tag != 'failure'
+        if test_data is None:
+            return result
+
+        suite_report = None
+        suite_has_run = False
+
+        with self.result.report.logged_exceptions():
+            for event, element in test_data:
+                if element.tag == 'testsuite':
+                    if event == 'start':
+                        suite_report = TestGroupReport(
+                            name=element.attrib['name'],
+                            uid=element.attrib['name'],
+                            category='suite',
+                        )
+                        suite_has_run = False
+                    else:
+                        if suite_has_run:
+                            result.append(suite_report)
+                        _free_element(element)
+
+                elif element.tag == 'testcase' and event == 'end':
+                    testcase_report = TestCaseReport(
+                        name=element.attrib['name'],
+                        uid=element.attrib['name'],
                     )
-                    testcase_report.append(registry.serialize(assertion_obj))
 
-                if testcase.attrib['status'] != 'notrun':
-                    suite_report.append(testcase_report)
-                    suite_has_run = True
-
-            if suite_has_run:
-                result.append(suite_report)
+                    for entry in element:
+                        if not isinstance(entry.tag, six.string_types):
+                            continue  # Comments
+                        assertion_obj = RawAssertion(
+                            description=entry.tag,
+                            content=entry.text,
+                            passed=entry.tag != 'failure'
+                        )
+                        testcase_report.append(
+                            registry.serialize(assertion_obj))
+
+                    if element.attrib['status'] != 'notrun':
+                        suite_report.append(testcase_report)
+                        suite_has_run = True
+                    _free_element(element)
         return result
 
     def parse_test_context(self, test_list_output):
@@ -192,20 +376,71 @@ class GTest(ProcessRunnerTest):
         #     ['SquareRootTest', ['PositiveNos', 'NegativeNos'],
         #     ['SquareRootTestNonFatal', ['PositiveNos', 'NegativeNos'],
         # ]
+        #
+        # Typed & value parametrized tests are followed by a comment, e.g.
+        # `TypedTest/0.  # TypeParam = int`, which is not part of the name.
         result = []
         for line in test_list_output.splitlines():
+            line = line.split('#', 1)[0].rstrip()
+            if not line:
+                continue
             if line.endswith('.'):
                 result.append([line[:-1], []])
             else:
                 result[-1][1].append(line.strip())
         return result
 
+    def dry_run(self, status=None):
+        """
+        Create a report of the suites & testcases of the test context without
+        running them, it is used as placeholder when merging scheduled parts.
+        """
+        self.result.report = self._new_test_report()
+        for suite_name, testcases in self.test_context:
+            suite_report = TestGroupReport(
+                name=suite_name, uid=suite_name, category='suite')
+            for testcase_name in testcases:
+                testcase_report = TestCaseReport(
+                    name=testcase_name, uid=testcase_name)
+                if status:
+                    testcase_report.status_override = status
+                suite_report.append(testcase_report)
+            self.result.report.append(suite_report)
+        return self.result
+
     def update_test_report(self):
         """
-        Attach XML report contents to the report, which can be
-        used by XML exporters, but will be discarded by serializers.
+        Attach the XML report path and the host it was written on to the
+        report, so that XML exporters can copy it, they are discarded by
+        serializers.
+        The test errors if any of the shards did not generate a report.
         """
         super(GTest, self).update_test_report()
 
-        with open(self.report_path) as report_xml:
-            self.result.report.xml_string = report_xml.read()
+        if self._missing_shards and not any(
+                entry.name == 'ProcessFailure'
+                for entry in self.result.report):
+            self.result.report.logger.error(
+                'No report generated by shards: {}'.format(
+                    self._missing_shards))
+            self.result.report.append(self.get_process_failure_report())
+
+        if os.path.exists(self.report_path):
+            self.result.report.xml_path = self.report_path
+            self.result.report.xml_host = socket.gethostname()
+
+    def aborting(self):
+        for proc in self._shard_processes:
+            if proc.returncode is None:
+                kill_process(proc)
+                self._test_process_killed = True
+        super(GTest, self).aborting()
+
+
+def _free_element(element):
+    """Release a processed element and its preceding siblings."""
+    element.clear()
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
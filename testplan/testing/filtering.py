@@ -7,7 +7,6 @@ import fnmatch
 from enum import Enum, unique
 
 from testplan.testing import tagging
-from testplan.testing.multitest.suite import get_testsuite_name
 
 
 class FilterLevel(Enum):
@@ -278,6 +277,8 @@ class Pattern(Filter):
         return fnmatch.fnmatch(test.name, self.test_pattern)
 
     def filter_suite(self, suite):
+        # Avoid importing the multitest package along with this module
+        from testplan.testing.multitest.suite import get_testsuite_name
         return fnmatch.fnmatch(
             get_testsuite_name(suite), self.suite_pattern)
 
@@ -6,12 +6,7 @@ import collections
 import functools
 import time
 
-try:
-    from Queue import Queue, Empty
-except ImportError:
-    from queue import Queue, Empty
-
-from threading import Thread, Lock
+from concurrent import futures
 from schema import Use, Or, And
 
 from testplan.common.config import ConfigOption
@@ -19,9 +14,12 @@ from testplan.common.entity import Runnable, RunnableIRunner
 from testplan.common.utils.interface import (
     check_signature, MethodSignatureMismatch
 )
-from testplan.common.utils.thread import interruptible_join
+from testplan.common.utils.thread import shared_executor
+from testplan.common.utils.exceptions import format_trace
 from testplan.common.utils.validation import is_subclass
 from testplan.common.utils.logger import TESTPLAN_LOGGER
+from testplan.common.utils import profiling
+from testplan.common.utils.resource_usage import ResourceSampler
 from testplan.common.utils.timing import timeout as timeout_deco
 from testplan.common.utils import callable as callable_utils
 from testplan.report import TestGroupReport, TestCaseReport
@@ -30,6 +28,7 @@ from testplan.report.testing import Status
 from testplan.testing import tagging, filtering
 from testplan.testing.filtering import Pattern
 
+from . import partitioning, result_cache
 from .entries.base import Summary
 from .result import Result
 from .suite import (
@@ -97,11 +96,26 @@ class MultiTestConfig(TestConfig):
             ConfigOption('thread_pool_size', default=0): int,
             ConfigOption('max_thread_pool_size', default=10): int,
             ConfigOption('stop_on_error', default=True): bool,
+            ConfigOption('parallel_suites', default=False): bool,
             ConfigOption('part', default=None): Or(None, And((int,),
                 lambda tp: len(tp) == 2 and 0 <= tp[0] < tp[1] and tp[1] > 1)),
+            ConfigOption('part_strategy', default=partitioning.MODULO):
+                Or(*partitioning.STRATEGIES),
+            ConfigOption('part_durations', default=None):
+                Or(None, dict, And(str, os.path.isfile)),
             ConfigOption('interactive_runner', default=MultitestIRunner):
                 object,
-            ConfigOption('fix_spec_path', default=None): Or(None, And(str, os.path.exists))
+            ConfigOption('fix_spec_path', default=None): Or(None, And(str, os.path.exists)),
+            ConfigOption('resource_usage_interval', default=None):
+                Or(None, And(Or(int, float), lambda interval: interval > 0)),
+            ConfigOption('result_cache', default=None): Or(None, str),
+            ConfigOption('result_cache_files', default=[]): list,
+            ConfigOption('result_cache_env', default=[]): list,
+            ConfigOption('profile_timings', default=False): bool,
+            ConfigOption('profile_testcases', default=None): Or(None, str),
+            ConfigOption('profiler', default=profiling.CPROFILE):
+                Or(*profiling.PROFILERS),
+            ConfigOption('profile_top', default=20): And(int, lambda n: n > 0),
         }
 
 
@@ -129,17 +143,73 @@ class MultiTest(Test):
     :type before_stop: ``callable`` taking environment and a result arguments.
     :param after_stop: Callable to execute after stopping the environment.
     :type after_stop: ``callable`` taking environment and a result arguments.
-    :param thread_pool_size: Size of the thread pool which executes testcases
-        with execution_group specified in parallel (default 0 means no pool).
+    :param thread_pool_size: Number of testcases with execution_group
+        specified that are executed in parallel on the daemon thread pool
+        shared by all MultiTest instances of the process (default 0 means
+        half of ``max_thread_pool_size`` but at least 2).
     :type thread_pool_size: ``int``
-    :param max_thread_pool_size: Maximum number of threads allowed in the pool.
+    :param max_thread_pool_size: Maximum number of testcases (or testsuites,
+        see ``parallel_suites``) allowed to be executed in parallel.
     :type max_thread_pool_size: ``int``
     :param stop_on_error: When exception raised, stop executing remaining
         testcases in the current test suite. Default: True
     :type stop_on_error: ``bool``
+    :param parallel_suites: Execute testsuites concurrently, as if all of
+        them were decorated with ``@testsuite(parallel=True)``. Testsuites
+        having testcases with execution_group specified, or not marked as
+        parallel, are still executed on their own. Default: False
+    :type parallel_suites: ``bool``
     :param part: Execute only a part of the total testcases. MultiTest needs to
         know which part of the total it is. Only works with Multitest.
     :type part: ``tuple`` of (``int``, ``int``)
+    :param part_strategy: How testcases are split into parts, ``modulo``
+        takes every n-th testcase of each suite, ``cost`` balances the
+        estimated duration of parts, see ``part_durations``. Default: modulo
+    :type part_strategy: ``str``
+    :param part_durations: Testcase durations used by the ``cost`` strategy,
+        either the path of a JSON report of a previous run, or a ``dict`` of
+        suite names to ``dict`` of testcase names to seconds, the suite
+        ``setup`` & ``teardown`` durations can be included. A report that
+        cannot be loaded is logged as an error of the test, whose testcases
+        are then assumed to take the same time.
+    :type part_durations: ``str`` or ``dict``
+    :param resource_usage_interval: Sample the CPU, memory, file descriptors
+        & threads used by the driver processes (with their children) and by
+        the process running the tests every that many seconds, the time
+        series & their peak / average are added to the report. Default: None
+        (no sampling)
+    :type resource_usage_interval: ``float``
+    :param result_cache: Directory of a cache of testcase results, passing
+        testcases are not executed again as long as the source of their
+        testsuite module, their parametrization arguments, the declared
+        input files & environment variables and the driver configurations
+        are unchanged, their previous report marked as ``cached`` is used.
+        See :py:mod:`~testplan.testing.multitest.result_cache` to list &
+        invalidate entries. Default: None (no cache)
+    :type result_cache: ``str``
+    :param result_cache_files: Paths of the files testcases depend on, for
+        the ``result_cache``.
+    :type result_cache_files: ``list`` of ``str``
+    :param result_cache_env: Names of the environment variables testcases
+        depend on, for the ``result_cache``.
+    :type result_cache_env: ``list`` of ``str``
+    :param profile_timings: Record the wall & CPU time of every testcase,
+        suite, suite setup & teardown and driver start & stop in the
+        ``profile`` of the report. Default: False
+    :type profile_timings: ``bool``
+    :param profile_testcases: Glob pattern of the testcases to profile,
+        matched against ``<suite>:<testcase>`` if it contains a colon and
+        against testcase names otherwise. The top hotspots of each profiled
+        testcase are added to the ``profile`` of the report and its profile
+        is attached to the report. Default: None (no profiling)
+    :type profile_testcases: ``str``
+    :param profiler: Profiler of the ``profile_testcases``, ``cprofile``
+        records every call and attaches ``.pstat`` statistics, ``sampling``
+        has a low overhead and attaches collapsed stacks that can be
+        rendered as flame graphs. Default: cprofile
+    :type profiler: ``str``
+    :param profile_top: Number of hotspots kept per profiled testcase.
+    :type profile_top: ``int``
 
     Also inherits all
     :py:class:`~testplan.testing.base.Test` options.
@@ -155,6 +225,13 @@ class MultiTest(Test):
 
     def __init__(self, **options):
         self._tags_index = None
+        self._part_durations = None
+        self._part_durations_error = None
+        self._resource_sampler = None
+        self._result_cache = None
+        self._cache_inputs = None
+        self._fingerprints = {}
+        self._profiling = profiling.Profiling()
 
         super(MultiTest, self).__init__(**options)
 
@@ -170,12 +247,15 @@ class MultiTest(Test):
 
         # The following members are used for parallel execution of testcases
         # which have been put in the same execution group.
-        self._testcase_queue = None
-        self._thread_pool = []
+        self._pending_testcases = collections.deque()
+        self._running_testcases = set()
         self._thread_pool_size = 0
-        self._thread_pool_active = False
         self._thread_pool_available = False
 
+        # Testsuites executed concurrently on the shared executor, in the
+        # order they were submitted.
+        self._running_testsuites = collections.OrderedDict()
+
         self.log_testcase_status = functools.partial(
             self._log_status, indent=TESTCASE_INDENT)
         self.log_suite_status = functools.partial(
@@ -194,6 +274,18 @@ class MultiTest(Test):
             fix_spec_path=self.cfg.fix_spec_path,
         )
 
+    def _init_test_report(self):
+        super(MultiTest, self)._init_test_report()
+        if self._part_durations_error:
+            self._log_part_durations_error()
+
+    def _log_part_durations_error(self):
+        """Log the error loading ``part_durations`` into the test report."""
+        self.report.logger.error(
+            'Failed to load part durations, testcases are assumed to take'
+            ' the same time:%s%s', os.linesep, self._part_durations_error)
+        self.report.status_override = Status.ERROR
+
     def _execute_step(self, step, *args, **kwargs):
         """
         Full override of the base class, as we can rely on report object
@@ -265,7 +357,8 @@ class MultiTest(Test):
                 if test_filter.filter(
                     test=self, suite=suite, case=case)]
 
-            if self.cfg.part and self.cfg.part[1] > 1:
+            if self.cfg.part and self.cfg.part[1] > 1 and \
+                    self.cfg.part_strategy == partitioning.MODULO:
                 testcases_to_run = [
                     testcase for (idx, testcase) in enumerate(testcases_to_run)
                     if idx % self.cfg.part[1] == self.cfg.part[0]
@@ -274,8 +367,44 @@ class MultiTest(Test):
             if testcases_to_run:
                 ctx.append((suite, testcases_to_run))
 
+        if self.cfg.part and self.cfg.part[1] > 1 and \
+                self.cfg.part_strategy == partitioning.COST:
+            ctx = self._cost_part(ctx)
+
         return ctx
 
+    def _cost_part(self, ctx):
+        """
+        Keep the testcases of the test context assigned to this part by the
+        cost strategy.
+        """
+        if self._part_durations is None:
+            self._part_durations = {}
+            if self.cfg.part_durations:
+                try:
+                    self._part_durations = partitioning.load_durations(
+                        self.cfg.part_durations, self.cfg.name)
+                except Exception as exc:
+                    # Kept to be logged again into the report created by
+                    # ``_init_test_report`` before running.
+                    self._part_durations_error = format_trace(
+                        inspect.trace(), exc)
+                    self._log_part_durations_error()
+
+        testcases = [(get_testsuite_name(suite), testcase.__name__)
+                     for suite, suite_testcases in ctx
+                     for testcase in suite_testcases]
+        parts = iter(partitioning.assign_parts(
+            testcases, self.cfg.part[1], self._part_durations))
+
+        part_ctx = []
+        for suite, suite_testcases in ctx:
+            testcases_to_run = [testcase for testcase in suite_testcases
+                                if next(parts) == self.cfg.part[0]]
+            if testcases_to_run:
+                part_ctx.append((suite, testcases_to_run))
+        return part_ctx
+
     def dry_run(self, status=None):
         """
         A testing process that creates a full structured report without
@@ -358,8 +487,11 @@ class MultiTest(Test):
         if patch_report is False:
             self._init_test_report()
             report = self.report
+            resumed = self._resumed_testsuite_reports()
+            self._open_result_cache()
         else:
             report = self._new_test_report()
+            resumed = {}
 
         with report.timer.record('run'):
             if any(getattr(testcase, 'execution_group', None)
@@ -376,28 +508,54 @@ class MultiTest(Test):
                     try:
                         next_suite, testcases = ctx.pop(0)
                     except IndexError:
+                        self._join_testsuites(patch_report)
                         style = self.get_stdout_style(report.passed)
                         if style.display_test:
                             self.log_multitest_status(report)
                         break
                     else:
+                        suite_uid = get_testsuite_name(next_suite)
+                        if suite_uid in resumed:
+                            self.logger.debug(
+                                'Reusing report of {} from a previous'
+                                ' attempt'.format(suite_uid))
+                            report.append(resumed[suite_uid])
+                            continue
+
+                        parallel = self._is_parallel_suite(
+                            next_suite, testcases)
+                        if not parallel:
+                            # Wait for concurrent testsuites to complete
+                            self._join_testsuites(patch_report)
+                            if not self.active:
+                                ctx.insert(0, (next_suite, testcases))
+                                break
+
+                        # Reports are appended in context order, even if
+                        # testsuites complete in a different one.
                         testsuite_report = TestGroupReport(
-                            name=get_testsuite_name(next_suite),
+                            name=suite_uid,
                             description=next_suite.__class__.__doc__,
                             category=Categories.SUITE,
-                            uid=get_testsuite_name(next_suite),
+                            uid=suite_uid,
                             tags=next_suite.__tags__,
                         )
                         report.append(testsuite_report)
-                        with testsuite_report.logged_exceptions():
-                            self._run_suite(
-                                next_suite, testcases, testsuite_report)
 
-                        if self.get_stdout_style(
-                              testsuite_report.passed).display_suite:
-                            self.log_suite_status(testsuite_report)
+                        if parallel:
+                            self._submit_testsuite(
+                                next_suite, testcases, testsuite_report,
+                                patch_report)
+                        else:
+                            self._run_testsuite(
+                                next_suite, testcases, testsuite_report)
+                            self._testsuite_done(
+                                testsuite_report, patch_report)
                 time.sleep(self.cfg.active_loop_sleep)
 
+            # Only left running if execution aborted
+            self._running_testsuites.clear()
+
             if ctx:  # Execution aborted and still some suites left there
                 report.logger.error('Not all of the suites are done.')
                 st = Status.precedent([report.status, Status.INCOMPLETE])
@@ -409,9 +567,184 @@ class MultiTest(Test):
 
         if patch_report is True:
             self.report.merge(report, strict=False)
+        elif self._result_cache is not None:
+            self._save_result_cache(report)
 
         return report
 
+    def _open_result_cache(self):
+        """
+        Load the result cache, if set, and the inputs the fingerprints of
+        the testcases depend on.
+        """
+        self._result_cache = None
+        self._fingerprints = {}
+        if not self.cfg.result_cache:
+            return
+
+        with self.report.logged_exceptions():
+            cache = result_cache.ResultCache(
+                self.cfg.result_cache, self.cfg.name, self.cfg.part)
+            cache.load()
+            self._cache_inputs = result_cache.environment_inputs(
+                files=self.cfg.result_cache_files,
+                env_vars=self.cfg.result_cache_env,
+                resources=self.resources)
+            self._result_cache = cache
+
+    def _cached_testcase_reports(self, testsuite, testcases):
+        """
+        Reports of the testcases of a testsuite that can be reused from the
+        result cache, by testcase name.
+        """
+        if self._result_cache is None:
+            return {}
+
+        suite_name = get_testsuite_name(testsuite)
+        cached = {}
+        for testcase in testcases:
+            fingerprint = result_cache.testcase_fingerprint(
+                testsuite, testcase, self._cache_inputs)
+            if fingerprint is None:
+                continue
+            self._fingerprints[(suite_name, testcase.__name__)] = fingerprint
+            report, changed = self._result_cache.lookup(
+                suite_name, testcase.__name__, fingerprint)
+            if report is None:
+                self.logger.debug(
+                    'Not reusing result of {} :: {} - {}'.format(
+                        suite_name, testcase.__name__, ', '.join(changed)))
+            else:
+                cached[testcase.__name__] = report
+        return cached
+
+    def _save_result_cache(self, report):
+        """
+        Record the results of the executed testcases in the result cache,
+        testcases of a testsuite whose setup or teardown failed are recorded
+        as failed since those are not executed if all testcases are reused.
+        """
+        def testcase_reports(group_report):
+            for entry in group_report:
+                if isinstance(entry, TestGroupReport):
+                    for case_report in testcase_reports(entry):
+                        yield case_report
+                else:
+                    yield entry
+
+        for suite_report in report:
+            suite_passed = not suite_report.status_override and all(
+                entry.passed for entry in suite_report
+                if isinstance(entry, TestCaseReport) and entry.suite_related)
+            for case_report in testcase_reports(suite_report):
+                fingerprint = self._fingerprints.get(
+                    (suite_report.name, case_report.name))
+                if fingerprint is None or case_report.cached or \
+                        not case_report.timer:
+                    continue
+                self._result_cache.record(
+                    suite_report.name, case_report, fingerprint,
+                    passed=case_report.passed and suite_passed)
+
+        with report.logged_exceptions():
+            self._result_cache.save()
+        self._result_cache = None
+
+    def _resumed_testsuite_reports(self):
+        """
+        Passing testsuite reports of the partial report set as
+        ``resume_report``, these testsuites will not be executed again.
+        """
+        resume_report = self.resume_report
+        if resume_report is None or resume_report.uid != self.uid() or\
+                resume_report.part != self.cfg.part:
+            return {}
+        # pylint: disable=not-an-iterable
+        return {testsuite_report.uid: testsuite_report
+                for testsuite_report in resume_report
+                if testsuite_report.passed}
+
+    def _stream_report_delta(self, testsuite_report):
+        """
+        Passes a report that only contains the completed testsuite to the
+        ``report_delta_handler``, if one is set. The testsuite report is kept
+        in the report of the test, which is still complete once the test has
+        run: only the transfer to the pool is incremental, the memory used by
+        the report on the worker is unchanged.
+        """
+        if self.report_delta_handler is None:
+            return
+
+        delta = self._new_test_report()
+        delta.append(testsuite_report)
+        try:
+            self.report_delta_handler(delta)  # pylint: disable=not-callable
+        except Exception as exc:
+            self.logger.error(
+                'Could not stream report of {} - {}'.format(
+                    testsuite_report.name, exc))
+
+    def _is_parallel_suite(self, testsuite, testcases):
+        """
+        Testsuites marked as parallel can be executed concurrently, unless
+        they run testcases of execution groups on the thread pool.
+        """
+        if not (self.cfg.parallel_suites or
+                getattr(testsuite, '__parallel__', False)):
+            return False
+        return not any(getattr(testcase, 'execution_group', None)
+                       for testcase in testcases)
+
+    def _run_testsuite(self, testsuite, testcases, testsuite_report):
+        """Runs a testsuite, exceptions are logged in its report."""
+        with testsuite_report.logged_exceptions():
+            self._run_suite(testsuite, testcases, testsuite_report)
+
+    def _testsuite_done(self, testsuite_report, patch_report):
+        """Logs the status and streams the report of a completed testsuite."""
+        if self.get_stdout_style(testsuite_report.passed).display_suite:
+            self.log_suite_status(testsuite_report)
+        if patch_report is False:
+            self._stream_report_delta(testsuite_report)
+
+    def _submit_testsuite(
+            self, testsuite, testcases, testsuite_report, patch_report):
+        """
+        Execute a testsuite on the shared executor, keeping at most
+        ``max_thread_pool_size`` testsuites running.
+        """
+        max_running = max(self.cfg.max_thread_pool_size, 1)
+        while self.active and len(self._running_testsuites) >= max_running:
+            self._collect_testsuites(timeout=1, patch_report=patch_report)
+
+        future = shared_executor().submit(
+            self._run_testsuite, testsuite, testcases, testsuite_report)
+        self._running_testsuites[future] = testsuite_report
+
+    def _collect_testsuites(self, timeout, patch_report=False):
+        """
+        Wait up to ``timeout`` seconds for a concurrent testsuite to complete,
+        completed testsuites are processed in submission order.
+        """
+        if not self._running_testsuites:
+            return
+        futures.wait(list(self._running_testsuites), timeout=timeout,
+                     return_when=futures.FIRST_COMPLETED)
+        for future in list(self._running_testsuites):
+            if future.done():
+                self._testsuite_done(
+                    self._running_testsuites.pop(future), patch_report)
+
+    def _join_testsuites(self, patch_report=False):
+        """
+        Wait for the concurrent testsuites to complete without ignoring
+        aborts.
+        """
+        while self.active and self._running_testsuites:
+            # Wakes up as soon as a testsuite completes, the timeout is only
+            # used to notice aborts.
+            self._collect_testsuites(timeout=1, patch_report=patch_report)
+
     def _run_suite(self, testsuite, testcases, testsuite_report):
         """Runs a testsuite object and populates its report object."""
         for tc in testcases:
@@ -426,14 +759,22 @@ class MultiTest(Test):
         current_exec_group = ''
         has_execution_group = False
 
-        def create_testcase_report(testcase):
-            """Creates report for testcase and append it to parent report."""
-            testcase_report = TestCaseReport(
-                name=testcase.__name__,
-                description=testcase.__doc__,
-                uid=testcase.__name__,
-                tags=testcase.__tags__,
-            )
+        cached_reports = self._cached_testcase_reports(testsuite, testcases)
+
+        def create_testcase_report(testcase, testcase_report=None):
+            """
+            Creates report for testcase, unless reused from the result cache,
+            and append it to parent report.
+            """
+            if testcase_report is None:
+                testcase_report = TestCaseReport(
+                    name=testcase.__name__,
+                    description=testcase.__doc__,
+                    uid=testcase.__name__,
+                    tags=testcase.__tags__,
+                )
+            elif self.get_stdout_style(testcase_report.passed).display_case:
+                self.log_testcase_status(testcase_report)
             param_template = getattr(
                 testcase, '_parametrization_template', None)
             if param_template:
@@ -453,7 +794,15 @@ class MultiTest(Test):
                 testsuite_report.append(testcase_report)
             return testcase_report
 
-        with testsuite_report.timer.record('run'):
+        with self._profiling.step(profiling.SUITE, testsuite_report.name), \
+                testsuite_report.timer.record('run'):
+            if testcases and len(cached_reports) == len(testcases):
+                # Nothing to execute, not even the suite setup & teardown.
+                for testcase in testcases:
+                    create_testcase_report(
+                        testcase, cached_reports[testcase.__name__])
+                return
+
             with testsuite_report.logged_exceptions():
                 self._run_suite_related(testsuite, 'setup', testsuite_report)
 
@@ -478,16 +827,21 @@ class MultiTest(Test):
                     except IndexError:
                         break
                     else:
+                        if testcase.__name__ in cached_reports:
+                            create_testcase_report(
+                                testcase, cached_reports[testcase.__name__])
+                            continue
+
                         exec_group = getattr(testcase, 'execution_group', '')
                         if exec_group:
                             if exec_group != current_exec_group:
-                                self._interruptible_testcase_queue_join()
+                                self._join_testcases()
                                 current_exec_group = exec_group
                             if not self._thread_pool_available:  # Error found
                                 break
-                            task = (testcase, pre_testcase, post_testcase,
-                                    create_testcase_report(testcase))
-                            self._testcase_queue.put(task)
+                            self._submit_testcase(
+                                testcase, pre_testcase, post_testcase,
+                                create_testcase_report(testcase))
                         else:
                             testcase_report = create_testcase_report(testcase)
                             self._run_testcase(
@@ -503,8 +857,8 @@ class MultiTest(Test):
 
                 time.sleep(self.cfg.active_loop_sleep)
 
-            # Do nothing if testcase queue and thread pool not created
-            self._interruptible_testcase_queue_join()
+            # Do nothing if no testcase submitted to the thread pool
+            self._join_testcases()
 
             with testsuite_report.logged_exceptions():
                 self._run_suite_related(
@@ -521,17 +875,20 @@ class MultiTest(Test):
         elif not callable(attr):
             raise RuntimeError('{} expected to be callable.'.format(method))
 
+        step = self._profiling.step(
+            profiling.SUITE, '{}:{}'.format(report.name, method))
         try:
             check_signature(attr, ['self', 'env', 'result'])
         except MethodSignatureMismatch:
             check_signature(attr, ['self', 'env'])
-            attr(self.resources)
+            with step:
+                attr(self.resources)
         else:
             method_report = TestCaseReport(
                 method, uid=method, suite_related=True)
             report.append(method_report)
             case_result = self.cfg.result(stdout_style=self.stdout_style)
-            with method_report.logged_exceptions():
+            with step, method_report.logged_exceptions():
                 attr(self.resources, case_result)
             method_report.extend(case_result.serialized_entries)
 
@@ -549,7 +906,9 @@ class MultiTest(Test):
             check_signature(method, ['name', 'self', 'env', 'result'])
             method(testcase.__name__, self.resources, case_result)
 
-        with testcase_report.timer.record('run'):
+        profiled = self._profiling.testcase(
+            get_testsuite_name(testcase.__self__), testcase.__name__)
+        with profiled, testcase_report.timer.record('run'):
             with testcase_report.logged_exceptions():
                 if pre_testcase and callable(pre_testcase):
                     _run_case_related(pre_testcase)
@@ -579,87 +938,76 @@ class MultiTest(Test):
         if self.get_stdout_style(testcase_report.passed).display_case:
             self.log_testcase_status(testcase_report)
 
-    def _run_testcase_in_separate_thread(self):
-        """Executes a testcase in a separate thread."""
-        while self._thread_pool_active and self.active:
-            if not self._thread_pool_available:
-                time.sleep(self.cfg.active_loop_sleep)
-                continue
-
-            try:
-                task = self._testcase_queue.get(
-                    timeout=self.cfg.active_loop_sleep)
-                testcase, pre_testcase, post_testcase, testcase_report = task
-            except Empty:
-                continue
+    def _run_testcase_in_separate_thread(
+            self, testcase, pre_testcase, post_testcase, testcase_report):
+        """Executes a testcase in a thread of the shared executor."""
+        if not (self._thread_pool_available and self.active):
+            return
 
-            self._run_testcase(
-                testcase, pre_testcase, post_testcase, testcase_report)
+        self._run_testcase(
+            testcase, pre_testcase, post_testcase, testcase_report)
 
-            if testcase_report.status == Status.ERROR:
-                if self.cfg.stop_on_error:
-                    self.logger.debug(
-                        'Error executing testcase {}'
-                        ' - will stop thread pool'.format(testcase.__name__))
-                    self._thread_pool_available = False
-
-            try:
-                # Call task_done() after setting thread pool unavailable, it
-                # makes sure that when self.cfg.stop_on_error is True and if
-                # a testcase in an execution group raises, no testcase in the
-                # next execution group has a chance to be put into task queue.
-                self._testcase_queue.task_done()
-            except ValueError:
-                # When error occurs, testcase queue might already be cleared
-                # and cannot accept 'task done' signal.
-                pass
+        if testcase_report.status == Status.ERROR:
+            if self.cfg.stop_on_error:
+                self.logger.debug(
+                    'Error executing testcase {}'
+                    ' - will stop thread pool'.format(testcase.__name__))
+                # No testcase of the current or next execution groups will
+                # be submitted once the thread pool becomes unavailable.
+                self._thread_pool_available = False
 
     def _start_thread_pool(self):
-        """Start a thread pool for executing testcases in parallel."""
-        if not self._testcase_queue:
-            self._testcase_queue = Queue()
-
+        """
+        Set how many testcases can be executed in parallel on the shared
+        executor.
+        """
         self._thread_pool_size = min(self.cfg.thread_pool_size,
                                      self.cfg.max_thread_pool_size) \
             if self.cfg.thread_pool_size > 0 \
             else max(int(self.cfg.max_thread_pool_size / 2), 2)
-        self._thread_pool_active = True
-
-        for _ in range(self._thread_pool_size):
-            thread = Thread(target=self._run_testcase_in_separate_thread)
-            thread.daemon = True
-            thread.start()
-            self._thread_pool.append(thread)
-
         self._thread_pool_available = True
 
     def _stop_thread_pool(self):
-        """Stop the thread pool after finish executing testcases."""
+        """Wait for submitted testcases after finish executing testcases."""
         self._thread_pool_available = False
-        self._thread_pool_active = False
+        self._join_testcases()
+        self._thread_pool_size = 0
 
-        for thread in self._thread_pool:
-            interruptible_join(thread)
+    def _submit_testcase(self, *task):
+        """Queue a testcase to be executed on the shared executor."""
+        self._pending_testcases.append(task)
+        self._dispatch_testcases()
 
-        self._thread_pool = []
-        self._thread_pool_size = 0
-        self._interruptible_testcase_queue_join()
-
-    def _interruptible_testcase_queue_join(self):
-        """Joining a queue without ignoring signal interrupts."""
-        while self._thread_pool_active and self.active:
-            if not self._thread_pool_available or \
-                    not self._testcase_queue or \
-                    self._testcase_queue.unfinished_tasks == 0:
+    def _dispatch_testcases(self):
+        """
+        Submit queued testcases to the shared executor, keeping at most
+        ``thread_pool_size`` of them running.
+        """
+        self._running_testcases = set(
+            future for future in self._running_testcases
+            if not future.done())
+
+        while self._pending_testcases and self._thread_pool_available and\
+                len(self._running_testcases) < self._thread_pool_size:
+            task = self._pending_testcases.popleft()
+            self._running_testcases.add(shared_executor().submit(
+                self._run_testcase_in_separate_thread, *task))
+
+    def _join_testcases(self):
+        """
+        Wait for the submitted testcases to finish without ignoring aborts,
+        queued testcases are given up if the thread pool became unavailable.
+        """
+        while self.active:
+            self._dispatch_testcases()
+            if not self._running_testcases:
                 break
-            time.sleep(self.cfg.active_loop_sleep)
+            # Wakes up as soon as a testcase finishes, the timeout is only
+            # used to notice aborts.
+            futures.wait(self._running_testcases, timeout=1,
+                         return_when=futures.FIRST_COMPLETED)
 
-        # Clear task queue and give up unfinished testcases
-        if self._testcase_queue and not self._testcase_queue.empty():
-            with self._testcase_queue.mutex:
-                self._testcase_queue.queue.clear()
-                self._testcase_queue.unfinished_tasks = 0
-                self._testcase_queue.all_tasks_done.notify_all()
+        self._pending_testcases.clear()
 
     def _check_testsuite_report(self, testsuite_report):
         """Wipe off reports of testcases which have no chance to run."""
@@ -684,6 +1032,7 @@ class MultiTest(Test):
                         changed = True
 
             group_report.entries = entries
+            group_report.bump_version()
             return changed
 
         if _remove_testcase_report_if_not_run(testsuite_report):
@@ -732,7 +1081,8 @@ class MultiTest(Test):
 
     def skip_step(self, step):
         """Step should be skipped."""
-        if step in (self.resources.start, self.resources.stop):
+        if step in (self.resources.start, self.resources.stop,
+                    self.stop_resource_sampler, self.stop_profiling):
             return False
         elif self.resources.start_exceptions or self.resources.stop_exceptions:
             TESTPLAN_LOGGER.critical('Skipping step %s', step.__name__)
@@ -760,9 +1110,63 @@ class MultiTest(Test):
                     if error_log:
                         self.result.report.logger.error(error_log)
 
+    def _resource_usage_targets(self):
+        """Processes of the drivers and of the tests, by label."""
+        suffix = ' - part({}/{})'.format(
+            self.cfg.part[0] + 1, self.cfg.part[1]) if self.cfg.part else ''
+        targets = [('testplan' + suffix, os.getpid(), False)]
+        for driver in self.resources:
+            pid = getattr(driver, 'pid', None)
+            if pid is not None:
+                targets.append((driver.uid() + suffix, pid, True))
+        return targets
+
+    def start_resource_sampler(self):
+        """Start sampling the resources used by the test processes."""
+        self._resource_sampler = ResourceSampler(
+            self._resource_usage_targets,
+            interval=self.cfg.resource_usage_interval)
+        self._resource_sampler.start()
+
+    def stop_resource_sampler(self):
+        """Stop sampling & add the resource usage to the test report."""
+        if self._resource_sampler is None:
+            return
+        self._resource_sampler.stop()
+        self.report.resource_usage = self._resource_sampler.to_dict()
+        self._resource_sampler = None
+
+    def start_profiling(self):
+        """Start recording timings & profiles of the test steps."""
+        profiler = self.cfg.profiler
+        if profiler == profiling.CPROFILE and self.cfg.enable_profiler:
+            # Only one cProfile profiler can be enabled per thread.
+            self.logger.warning(
+                'Sampling testcases of {} as the profiler is enabled'.format(
+                    self))
+            profiler = profiling.SAMPLING
+
+        self._profiling = profiling.Profiling(
+            timings=self.cfg.profile_timings,
+            pattern=self.cfg.profile_testcases,
+            profiler=profiler,
+            top=self.cfg.profile_top,
+            directory=os.path.join(self.runpath, 'profiles'))
+        self.resources.timings = self._profiling.timings
+
+    def stop_profiling(self):
+        """Add the timings & profiles of the test steps to the report."""
+        self.report.profile = self._profiling.to_dict()
+        self.resources.timings = None
+        self._profiling = profiling.Profiling()
+
     def pre_resource_steps(self):
         """Runnable steps to be executed before environment starts."""
         self._add_step(self.make_runpath_dirs)
+        if self.cfg.resource_usage_interval:
+            self._add_step(self.start_resource_sampler)
+        if self.cfg.profile_timings or self.cfg.profile_testcases:
+            self._add_step(self.start_profiling)
         if self.cfg.before_start:
             self._add_step(
                 self._wrap_run_step(
@@ -804,6 +1208,10 @@ class MultiTest(Test):
             )
 
         self._add_step(self.append_pre_post_step_report)
+        if self.cfg.resource_usage_interval:
+            self._add_step(self.stop_resource_sampler)
+        if self.cfg.profile_timings or self.cfg.profile_testcases:
+            self._add_step(self.stop_profiling)
 
     def should_run(self):
         """
@@ -812,7 +1220,9 @@ class MultiTest(Test):
         return bool(self.test_context)
 
     def aborting(self):
-        """Suppressing not implemented debug log from parent class."""
+        """Stop sampling resources, if they are."""
+        if self._resource_sampler is not None:
+            self._resource_sampler.stop()
 
     def _log_status(self, report, indent):
         """Log the test status for a report at the given indent level."""
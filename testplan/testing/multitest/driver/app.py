@@ -1,23 +1,29 @@
 """Generic application driver."""
 
 import os
+import time
 import uuid
 import shutil
 import warnings
 import subprocess
 
-from schema import Or
+from schema import Or, And
 
 from testplan.common.config import ConfigOption
-from testplan.common.utils.path import StdFiles, makedirs
+from testplan.common.utils.path import StdFiles, makedirs, cached_copy
 from testplan.common.utils.context import is_context, expand
-from testplan.common.utils.process import kill_process
+from testplan.common.utils.process import (
+    kill_process, process_group_options, terminate_process, reap_process)
 
 from testplan.common.utils.logger import TESTPLAN_LOGGER
 
 from .base import Driver, DriverConfig
 
 
+# Content-addressed copies of binaries, see ``binary_cache`` option.
+BINARY_CACHE_DIR = '.binary_cache'
+
+
 class AppConfig(DriverConfig):
     """
     Configuration object for
@@ -36,8 +42,11 @@ class AppConfig(DriverConfig):
             ConfigOption('shell', default=False): bool,
             ConfigOption('env', default=None): Or(None, dict),
             ConfigOption('binary_copy', default=False): bool,
+            ConfigOption('binary_cache', default=False): bool,
             ConfigOption('app_dir_name', default=None): Or(None, str),
             ConfigOption('working_dir', default=None): Or(None, str),
+            ConfigOption('stop_timeout', default=5):
+                And(Or(int, float), lambda x: x >= 0),
         }
 
 
@@ -61,10 +70,17 @@ class App(Driver):
     :type env: ``dict``
     :param binary_copy: Copy binary to a local binary path.
     :type binary_copy: ``bool``
+    :param binary_cache: Binary copies are hardlinks to a copy made once
+        per binary content for the whole run, instead of full copies. The
+        copies share their content, the binary must not be modified.
+    :type binary_cache: ``bool``
     :param app_dir_name: Application directory name.
     :type app_dir_name: ``str`
     :param working_dir: Application working directory. Default: runpath
     :type working_dir: ``str`
+    :param stop_timeout: Seconds the application process group is given to
+        exit on stop before it is killed.
+    :type stop_timeout: ``int`` or ``float``
 
     Also inherits all
     :py:class:`~testplan.testing.multitest.driver.base.DriverConfig` options.
@@ -80,6 +96,8 @@ class App(Driver):
         self._binpath = None
         self._etcpath = None
         self._retcode = None
+        self._terminated = None
+        self._stop_deadline = None
 
     @property
     def pid(self):
@@ -177,7 +195,10 @@ class App(Driver):
                                       uuid.uuid4())
 
             target = os.path.join(self._binpath, name)
-            shutil.copyfile(self.cfg.binary, target)
+            if self.cfg.binary_cache:
+                cached_copy(self.cfg.binary, target, self._binary_cache_dir())
+            else:
+                shutil.copyfile(self.cfg.binary, target)
             self.binary = target
         else:
             self.binary = self.cfg.binary
@@ -203,7 +224,7 @@ class App(Driver):
                 out=self.std.out_path, err=self.std.err_path))
             self.proc = subprocess.Popen(cmd, shell=self.cfg.shell,
                 stdout=self.std.out, stderr=self.std.err,
-                cwd=cwd, env=self.env)
+                cwd=cwd, env=self.env, **process_group_options())
         except Exception:
             TESTPLAN_LOGGER.error(
                 'Error while App[%s] driver executed command: %s',
@@ -211,17 +232,60 @@ class App(Driver):
             raise
 
     def stopping(self):
-        """Stops the application binary process."""
+        """
+        Signals the process group of the application binary to terminate,
+        the wait for it to exit happens on the wait for the stopped status
+        so that independent drivers are stopped concurrently. The binary is
+        reaped without blocking if it has already exited, so that a stop
+        without a wait does not leave a zombie behind.
+        """
         super(App, self).stopping()
+        self._stop_deadline = time.time() + self.cfg.stop_timeout
         try:
-            self._retcode = kill_process(self.proc)
+            self._terminated = terminate_process(self.proc)
         except Exception as exc:
-            warnings.warn('On killing driver {} process - {}'.format(
+            warnings.warn('On terminating driver {} process - {}'.format(
                 self.cfg.name, exc))
+        if self.proc is not None:
             self._retcode = self.proc.poll()
-        self.proc = None
-        if self.std:
-            self.std.close()
+
+    def _wait_stopped(self, timeout=None):
+        """
+        Waits for the application binary process group to exit for up to
+        ``stop_timeout`` seconds since it was signalled, or ``timeout`` if
+        shorter, then kills it.
+        """
+        if self.proc is not None:
+            if self._stop_deadline is None:
+                self._stop_deadline = time.time() + self.cfg.stop_timeout
+            wait_timeout = self._stop_deadline - time.time()
+            if timeout is not None:
+                wait_timeout = min(wait_timeout, timeout)
+            try:
+                if self._terminated is None:
+                    self._terminated = terminate_process(self.proc)
+                self._retcode = reap_process(
+                    self.proc, self._terminated, timeout=wait_timeout)
+            except Exception as exc:
+                warnings.warn('On killing driver {} process - {}'.format(
+                    self.cfg.name, exc))
+                self._retcode = self.proc.poll()
+            self.proc = None
+            self._terminated = None
+            self._stop_deadline = None
+            if self.std:
+                self.std.close()
+        super(App, self)._wait_stopped(timeout=timeout)
+
+    def _binary_cache_dir(self):
+        """
+        Binary cache directory, under the runpath of the top most parent
+        entity (e.g. the plan) so that it is shared by the whole run.
+        """
+        root = self
+        while getattr(root.parent, 'runpath', None):
+            root = root.parent
+        return os.path.join(root.runpath, BINARY_CACHE_DIR)
 
     def _make_dirs(self):
         bin_dir = os.path.join(self.runpath, 'bin')
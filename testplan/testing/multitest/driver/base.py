@@ -262,8 +262,10 @@ class Driver(Resource):
         raise NotImplementedError()
 
     def _install_files(self):
+        context = self.context_input()
         for template in self.cfg.install_files:
-            instantiate(template, self.context_input(), self._install_target())
+            # Rendering adds names (e.g. loop variables) to the values.
+            instantiate(template, dict(context), self._install_target())
 
     def _setup_file_logger(self, path):
         formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s')
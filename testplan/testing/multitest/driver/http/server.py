@@ -2,7 +2,7 @@
 
 import os
 import time
-from threading import Thread
+from threading import Thread, Event
 
 from schema import Use
 
@@ -281,8 +281,10 @@ class HTTPServer(Driver):
         self._server_thread.setName(self.name)
         self._server_thread.start()
 
-        while not hasattr(self._server_thread.server, 'server_port'):
-            time.sleep(0.1)
+        self._server_thread.ready.wait()
+        if self._server_thread.server is None:
+            raise RuntimeError('{} failed to bind to {}:{}'.format(
+                self, self.cfg.host, self.cfg.port))
         self._host, self._port = self._server_thread.server.server_address
         self.file_logger.debug(
             'Started HTTPServer listening on http://{host}:{port}'.format(
@@ -364,13 +366,18 @@ class _HTTPServerThread(Thread):
         self.interval = interval
         self.logger = logger
         self.server = None
+        self.ready = Event()
 
     def run(self):
         """Start the HTTP server thread."""
-        self.server = http_server.HTTPServer(
-          server_address=(self.host, self.port),
-          RequestHandlerClass=self.request_handler
-        )
+        try:
+            self.server = http_server.HTTPServer(
+              server_address=(self.host, self.port),
+              RequestHandlerClass=self.request_handler
+            )
+        finally:
+            # Wake up the driver whether or not the server could bind.
+            self.ready.set()
         self.server.requests = self.requests_queue
         self.server.responses = self.responses_queue
         self.server.handler_attributes = self.handler_attributes
@@ -1,16 +1,25 @@
 """Small wrapper driver around sqlite3 library."""
 
+import io
 import os
+import csv
 import sqlite3
 import functools
 
 from contextlib import contextmanager
 
+import six
+from schema import Or, And
+
 from testplan.common.config import ConfigOption
 
 from .base import Driver, DriverConfig
 
 
+JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+SYNCHRONOUS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+
 class Sqlite3Config(DriverConfig):
     """
     Configuration object for
@@ -24,16 +33,24 @@ class Sqlite3Config(DriverConfig):
         """
         return {
             'db_name': str,
-            ConfigOption('connect_at_start', default=True): bool
+            ConfigOption('connect_at_start', default=True): bool,
+            ConfigOption('in_memory', default=False): bool,
+            ConfigOption('shared_cache', default=False): bool,
+            ConfigOption('journal_mode', default=None):
+                Or(None, And(str, lambda mode: mode.upper() in JOURNAL_MODES)),
+            ConfigOption('synchronous', default=None):
+                Or(None, And(str, lambda mode: mode.upper() in SYNCHRONOUS)),
+            ConfigOption('arraysize', default=1000):
+                And(int, lambda size: size > 0),
         }
 
 
 def _rollback_on_error(func):
     """Rollback the databse if db operation raises."""
     @functools.wraps(func)
-    def wrap(self, *args):
+    def wrap(self, *args, **kwargs):
         try:
-            return func(self, *args)
+            return func(self, *args, **kwargs)
         except Exception as exc:
             self.logger.error('Exception while executing: {}{}{}'.format(
                 args, os.sep, exc))
@@ -52,6 +69,23 @@ class Sqlite3(Driver):
     :param connect_at_start: Connect to the database when driver starts.
       Default: True
     :type connect_at_start: ``bool``
+    :param in_memory: Keep the database in memory instead of a file under
+      the runpath, it is dropped once its last connection is closed.
+    :type in_memory: ``bool``
+    :param shared_cache: Open connections in shared-cache mode, so that all
+      the connections of the process to the database (e.g. to an in-memory
+      database) share it. Requires Python 3.
+    :type shared_cache: ``bool``
+    :param journal_mode: Journal mode set on connect, e.g. ``'WAL'`` for
+      readers not to block writers. Default: sqlite default.
+    :type journal_mode: ``str``
+    :param synchronous: Synchronous mode set on connect, ``'OFF'`` speeds up
+      bulk loads of test data that does not need to survive a crash.
+      Default: sqlite default.
+    :type synchronous: ``str``
+    :param arraysize: Number of rows fetched at a time when iterating over
+      query results. Default: 1000
+    :type arraysize: ``int``
     """
 
     CONFIG = Sqlite3Config
@@ -63,13 +97,49 @@ class Sqlite3(Driver):
 
     @property
     def db_path(self):
-        """Database file path."""
+        """Database file path, its name for an in-memory database."""
+        if self.cfg.in_memory:
+            return self.cfg.db_name
         return os.path.join(self.runpath, self.cfg.db_name)
 
+    def _database(self):
+        """Database argument of ``sqlite3.connect`` & whether it is a URI."""
+        if not self.cfg.shared_cache:
+            return (':memory:' if self.cfg.in_memory else self.db_path), False
+        if six.PY2:
+            raise RuntimeError(
+                'Shared-cache mode requires Python 3 (URI filenames).')
+        if self.cfg.in_memory:
+            return 'file:{}?mode=memory&cache=shared'.format(
+                self.cfg.db_name), True
+        return 'file:{}?cache=shared'.format(self.db_path), True
+
+    def new_connection(self):
+        """
+        Open a new connection to the database, configured with the
+        ``journal_mode`` & ``synchronous`` options of the driver.
+
+        :return: Connection to the database.
+        :rtype: ``sqlite3.Connection``
+        """
+        database, uri = self._database()
+        if uri:
+            connection = sqlite3.connect(database, uri=True)
+        else:
+            connection = sqlite3.connect(database)
+        if self.cfg.journal_mode:
+            connection.execute(
+                'PRAGMA journal_mode={}'.format(self.cfg.journal_mode))
+        if self.cfg.synchronous:
+            connection.execute(
+                'PRAGMA synchronous={}'.format(self.cfg.synchronous))
+        return connection
+
     def connect(self):
         """Connect to the database and set the internal db cursor."""
-        self.db = sqlite3.connect(self.db_path)
+        self.db = self.new_connection()
         self.cursor = self.db.cursor()
+        self.cursor.arraysize = self.cfg.arraysize
 
     def starting(self):
         """
@@ -124,6 +194,72 @@ class Sqlite3(Driver):
         """Invoke cursor fetchall."""
         return self.cursor.fetchall()
 
+    def _columns(self, table):
+        """Column names of a table."""
+        cursor = self.db.execute('PRAGMA table_info({})'.format(table))
+        return [str(col[1]) for col in cursor.fetchall()]
+
+    def iter_query(self, query, parameters=(), arraysize=None):
+        """
+        Execute a query and iterate over its results. The column names are
+        yielded first then the rows, fetched ``arraysize`` rows at a time,
+        so that the generator can be passed as a table to table assertions
+        without materialising the results as a list.
+
+        The query runs on its own cursor, the driver cursor can be used
+        while iterating.
+
+        :param query: SQL query.
+        :type query: ``str``
+        :param parameters: Query parameters.
+        :type parameters: ``tuple`` or ``dict``
+        :param arraysize: Rows fetched at a time, defaults to the driver
+            ``arraysize``.
+        :type arraysize: ``int``
+        :return: Column names followed by the rows.
+        :rtype: generator of ``list`` of ``str`` then ``tuple`` of values
+        """
+        arraysize = arraysize or self.cfg.arraysize
+        cursor = self.db.cursor()
+        try:
+            cursor.execute(query, parameters)
+            yield [str(col[0]) for col in cursor.description or ()]
+            while True:
+                rows = cursor.fetchmany(arraysize)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+        finally:
+            cursor.close()
+
+    def iter_table(self, table, columns=None, arraysize=None):
+        """
+        Iterate over the rows of a table, see
+        :py:meth:`~testplan.testing.multitest.driver.sqlite.Sqlite3.iter_query`.
+
+        .. code-block:: python
+
+            result.table.match(
+                actual=env.db.iter_table('users', columns=['name', 'email']),
+                expected=expected_table)
+
+        :param table: Table name in the db.
+        :type table: ``str``
+        :param columns: Names of columns to be fetched.
+        :type columns: ``list`` of ``str``
+        :param arraysize: Rows fetched at a time, defaults to the driver
+            ``arraysize``.
+        :type arraysize: ``int``
+        :return: Column names followed by the rows.
+        :rtype: generator of ``list`` of ``str`` then ``tuple`` of values
+        """
+        if columns is None:
+            columns = self._columns(table)
+        return self.iter_query(
+            'SELECT {} FROM {}'.format(', '.join(columns), table),
+            arraysize=arraysize)
+
     def fetch_table(self, table, columns=None):
         """
         Fetch a table from the db. The first row will be the column names
@@ -140,6 +276,9 @@ class Sqlite3(Driver):
               ['MSFT', 42]
             ]
 
+        Use :py:meth:`~testplan.testing.multitest.driver.sqlite.Sqlite3.iter_table`
+        for large tables.
+
         :param table: Table name in the db.
         :type table: ``str``
         :param columns: Names of columns to be fetched.
@@ -147,14 +286,62 @@ class Sqlite3(Driver):
         :return: The table contents.
         :rtype: ``list`` of ``list`` of values.
         """
+        return [list(row) for row in self.iter_table(table, columns=columns)]
+
+    @_rollback_on_error
+    def load_rows(self, table, rows, columns=None):
+        """
+        Insert rows into a table within a single transaction, committed
+        once all rows are inserted. Rows are consumed as they are inserted,
+        e.g. from a generator.
+
+        :param table: Table name in the db.
+        :type table: ``str``
+        :param rows: Rows to insert, values in ``columns`` order.
+        :type rows: iterable of ``list`` or ``tuple``
+        :param columns: Names of the columns of the values, all the table
+            columns by default.
+        :type columns: ``list`` of ``str``
+        :return: Number of rows inserted.
+        :rtype: ``int``
+        """
         if columns is None:
-            self.execute('PRAGMA table_info({})'.format(table))
-            columns = [str(col[1]) for col in self.cursor.fetchall()]
+            columns = self._columns(table)
+        statement = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            table, ', '.join(columns), ', '.join('?' * len(columns)))
+        with self.db:
+            cursor = self.db.executemany(statement, rows)
+        return cursor.rowcount
 
-        self.execute('SELECT {} FROM {}'.format(
-            ', '.join(columns), table))
+    def load_csv(self, table, path, columns=None, header=True, **fmtparams):
+        """
+        Insert the rows of a CSV file into a table within a single
+        transaction, see
+        :py:meth:`~testplan.testing.multitest.driver.sqlite.Sqlite3.load_rows`.
+        Values are inserted as strings, converted as per the column
+        affinities of the table.
 
-        table = [columns]
-        for row in self.cursor.fetchall():
-            table.append([item for item in row])
-        return table
+        :param table: Table name in the db.
+        :type table: ``str``
+        :param path: CSV file path.
+        :type path: ``str``
+        :param columns: Names of the columns of the values, the CSV header
+            if any or all the table columns by default.
+        :type columns: ``list`` of ``str``
+        :param header: The first row of the file holds the column names.
+        :type header: ``bool``
+        :param fmtparams: ``csv.reader`` formatting parameters.
+        :return: Number of rows inserted.
+        :rtype: ``int``
+        """
+        if six.PY2:
+            csv_file = open(path, 'rb')
+        else:
+            csv_file = io.open(path, 'r', newline='')
+        with csv_file:
+            reader = csv.reader(csv_file, **fmtparams)
+            if header:
+                names = next(reader, None)
+                if columns is None:
+                    columns = names
+            return self.load_rows(table, reader, columns=columns)
@@ -8,18 +8,19 @@ use the result of that call to set its ``passed`` attribute.
 import os
 import re
 import operator
+import itertools
 import collections
 import numbers
 import decimal
 import cmath
 import six
-import lxml
 import copy
 
 from testplan.common.utils.convert import make_tuple, flatten_dict_comparison
 from testplan.common.utils import comparison, difflib
+from testplan.common.utils.match import bytes_regexp, scan_file
 
-from .base import BaseEntry, get_table
+from .base import BaseEntry, get_table, iter_table, is_streamed_table
 
 
 __all__ = [
@@ -45,6 +46,10 @@ __all__ = [
     'RegexSearchNotExists',
     'RegexFindIter',
     'RegexMatchLine',
+    'RegexFileAssertion',
+    'RegexFileSearch',
+    'RegexFileSearchNotExists',
+    'RegexFileMatchLine',
     'ExceptionRaised',
     'EqualSlices',
     'EqualExcludeSlices',
@@ -64,6 +69,8 @@ __all__ = [
 
 class Assertion(BaseEntry):
 
+    __slots__ = ('passed',)
+
     meta_type = 'assertion'
 
     def __init__(self, description=None, category=None):
@@ -89,6 +96,8 @@ class RawAssertion(Assertion):
       integration with 3rd party testing libraries (unittest, qunit etc).
     """
 
+    __slots__ = ('_passed_override', 'content')
+
     def __init__(self, passed, content, description=None, category=None):
         self._passed_override = passed
         self.content = content
@@ -101,6 +110,8 @@ class RawAssertion(Assertion):
 
 class IsTrue(Assertion):
 
+    __slots__ = ('expr',)
+
     def __init__(self, expr, description=None, category=None):
         self.expr = expr
         super(IsTrue, self).__init__(
@@ -112,18 +123,24 @@ class IsTrue(Assertion):
 
 class IsFalse(IsTrue):
 
+    __slots__ = ()
+
     def evaluate(self):
         return not bool(self.expr)
 
 
 class Fail(Assertion):
 
+    __slots__ = ()
+
     def evaluate(self):
         return False
 
 
 class FuncAssertion(Assertion):
 
+    __slots__ = ('first', 'second')
+
     func = None
 
     def __init__(self, first, second, description=None, category=None):
@@ -137,36 +154,43 @@ class FuncAssertion(Assertion):
 
 
 class Equal(FuncAssertion):
+    __slots__ = ()
     label = '=='
     func = operator.eq
 
 
 class NotEqual(FuncAssertion):
+    __slots__ = ()
     label = '!='
     func = operator.ne
 
 
 class Less(FuncAssertion):
+    __slots__ = ()
     label = '<'
     func = operator.lt
 
 
 class LessEqual(FuncAssertion):
+    __slots__ = ()
     label = '<='
     func = operator.le
 
 
 class Greater(FuncAssertion):
+    __slots__ = ()
     label = '>'
     func = operator.gt
 
 
 class GreaterEqual(FuncAssertion):
+    __slots__ = ()
     label = '>='
     func = operator.ge
 
 
 class IsClose(Assertion):
+    __slots__ = ('first', 'second', 'rel_tol', 'abs_tol')
     label = '~='
 
     def __init__(
@@ -203,6 +227,8 @@ class IsClose(Assertion):
 
 class Contain(Assertion):
 
+    __slots__ = ('member', 'container')
+
     def __init__(self, member, container, description=None, category=None):
         self.member = member
         self.container = container
@@ -215,6 +241,8 @@ class Contain(Assertion):
 
 class NotContain(Contain):
 
+    __slots__ = ()
+
     def evaluate(self):
         return self.member not in self.container
 
@@ -317,6 +345,83 @@ class RegexMatchLine(RegexAssertion):
         return self.match_indexes
 
 
+class RegexFileAssertion(Assertion):
+    """
+    Scans a file for one or more patterns in a single pass without reading
+    it in memory, see :py:func:`testplan.common.utils.match.scan_file`.
+    Only the first match of each pattern is recorded, as ``matches``
+    giving the index of the pattern, its byte offsets, line number and a
+    snippet of its line. The assertion fails with an ``error`` if the file
+    cannot be read.
+    """
+    line_start = False
+    stop_at_first = False
+
+    def __init__(
+        self, path, regexps, flags=0, encoding='utf-8',
+        description=None, category=None
+    ):
+        if isinstance(regexps, (six.string_types, six.binary_type)) or \
+                not isinstance(regexps, (list, tuple)):
+            regexps = [regexps]
+        if not regexps:
+            raise ValueError('At least one pattern must be given.')
+
+        self.path = path
+        self.patterns = [
+            regexp if isinstance(regexp, six.string_types) else
+            regexp.decode(encoding) if isinstance(regexp, six.binary_type)
+            else regexp.pattern
+            for regexp in regexps
+        ]
+        self.flags = flags
+        self.encoding = encoding
+        self.regexps = [
+            bytes_regexp(regexp, flags=flags, encoding=encoding,
+                         line_start=self.line_start)
+            for regexp in regexps
+        ]
+        self.matches = []  # will be populated via self.evaluate
+        self.error = None  # set by self.evaluate if the file is unreadable
+
+        super(RegexFileAssertion, self).__init__(
+            description=description, category=category)
+
+    def evaluate(self):
+        try:
+            found = scan_file(
+                self.path, self.regexps, stop_at_first=self.stop_at_first,
+                encoding=self.encoding, single_line=self.line_start)
+        except (IOError, OSError) as exc:
+            self.error = str(exc)
+            return False
+        for idx, found_match in sorted(found.items()):
+            found_match['pattern'] = idx
+            self.matches.append(found_match)
+        return len(found) == len(self.regexps)
+
+
+class RegexFileSearch(RegexFileAssertion):
+    """Passes if every pattern is found in the file."""
+
+
+class RegexFileSearchNotExists(RegexFileAssertion):
+    """Passes if none of the patterns is found, stops at the first match."""
+    stop_at_first = True
+
+    def evaluate(self):
+        super(RegexFileSearchNotExists, self).evaluate()
+        return not (self.error or self.matches)
+
+
+class RegexFileMatchLine(RegexFileAssertion):
+    """
+    Passes if every pattern matches (``re.match``) a line of the file,
+    matches do not span several lines.
+    """
+    line_start = True
+
+
 class ExceptionRaised(Assertion):
 
     """TODO"""
@@ -534,8 +639,11 @@ class LineDiff(Assertion):
     """
     Assertion that checks if 2 blocks of textual content have difference.
 
-    If difference found, generates a list of strings as data.
+    If difference found, generates a list of strings as data, truncated
+    after ``max_delta_lines`` lines.
     """
+    max_delta_lines = 10000
+
     def __init__(
         self, first, second,
         ignore_space_change=False,
@@ -567,13 +675,19 @@ class LineDiff(Assertion):
             description=description, category=category)
 
     def evaluate(self):
-        self.delta = list(difflib.diff(
+        delta = difflib.diff(
             self.first, self.second,
             ignore_space_change=self.ignore_space_change,
             ignore_whitespaces=self.ignore_whitespaces,
             ignore_blank_lines=self.ignore_blank_lines,
             unified=self.unified, context=self.context
-        ))
+        )
+        # The delta is generated lazily, lines beyond the limit are never
+        # formatted.
+        self.delta = list(itertools.islice(delta, self.max_delta_lines))
+        if next(delta, None) is not None:
+            self.delta.append('\\ Difference truncated after {} lines{}'
+                              .format(self.max_delta_lines, os.linesep))
         return self.delta == []
 
 
@@ -585,17 +699,21 @@ class ColumnContain(Assertion):
     """
     Checks if the any of the ``value`` in ``values``
     exists in the ``column`` of ``table``.
+
+    A table given as an iterator of rows is checked as it is consumed and
+    only its failing rows are reported.
     """
     def __init__(
         self, table, values, column,
         limit=0, report_fails_only=False,
         description=None, category=None,
     ):
-        self.table = get_table(table)
+        streamed = is_streamed_table(table)
+        self.table = iter_table(table) if streamed else get_table(table)
         self.values = values
         self.column = column
         self.limit = limit
-        self.report_fails_only = report_fails_only
+        self.report_fails_only = report_fails_only or streamed
 
         self.data = []  # will be set by evaluate
         super(ColumnContain, self).__init__(
@@ -621,6 +739,10 @@ class ColumnContain(Assertion):
 
             if self.limit and len(self.data) >= self.limit:
                 break
+
+        if not isinstance(self.table, list):
+            # Release the iterator of the streamed rows.
+            self.table = None
         return passed
 
 
@@ -834,10 +956,37 @@ def compare_rows(
     return num_failures == 0, data
 
 
+class _CountedRows(object):
+    """Iterator over table rows counting the rows consumed."""
+
+    def __init__(self, rows):
+        self._rows = rows
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = next(self._rows)
+        self.count += 1
+        return row
+
+    next = __next__
+
+    def exhaust(self):
+        """Consume the remaining rows, returns the number of rows."""
+        for _ in self:
+            pass
+        return self.count
+
+
 class TableMatch(Assertion):
     """
       Match two tables using ``compare_rows``, may generate
       custom message if tables cannot be compared for certain reasons.
+
+      Tables given as iterators of rows are compared as they are consumed,
+      only the failing rows are reported along with the number of rows.
     """
 
     def __init__(
@@ -846,15 +995,21 @@ class TableMatch(Assertion):
         report_all=True, fail_limit=0, report_fail_only=False,
         strict=False, description=None, category=None
     ):
-        self.table = get_table(table)
-        self.expected_table = get_table(expected_table)
+        self.streamed = is_streamed_table(table) or\
+            is_streamed_table(expected_table)
+        if self.streamed:
+            self.table = iter_table(table)
+            self.expected_table = iter_table(expected_table)
+        else:
+            self.table = get_table(table)
+            self.expected_table = get_table(expected_table)
         self.include_columns = include_columns
         self.exclude_columns = exclude_columns
         self.strict = strict
         self.report_all = report_all
 
         self.fail_limit = fail_limit
-        self.report_fails_only = report_fail_only
+        self.report_fails_only = report_fail_only or self.streamed
 
         # these will populated by self.evaluate
         self.display_columns = []
@@ -865,6 +1020,9 @@ class TableMatch(Assertion):
             description=description, category=category)
 
     def evaluate(self):
+        if self.streamed:
+            return self._evaluate_streamed()
+
         len_table, len_expected = len(self.table), len(self.expected_table)
 
         if len_table != len_expected:
@@ -903,6 +1061,66 @@ class TableMatch(Assertion):
         )
         return passed
 
+    def _evaluate_streamed(self):
+        """
+        Compare the rows of tables given as iterators as they are consumed,
+        only failing rows are kept.
+        """
+        table = _CountedRows(self.table)
+        expected_table = _CountedRows(self.expected_table)
+        # Release the iterators once consumed.
+        self.table = self.expected_table = None
+
+        first, first_expected = next(table, None), next(expected_table, None)
+        if first is None and first_expected is None:
+            self.message = 'Both tables are empty.'
+            return True
+
+        passed = False
+        if first is not None and first_expected is not None:
+            try:
+                comparison_columns = get_comparison_columns(
+                    table_1=[first],
+                    table_2=[first_expected],
+                    include_columns=self.include_columns,
+                    exclude_columns=self.exclude_columns
+                )
+            except ValueError as exc:
+                self.message = str(exc)
+                return False  # Fail on invalid tables
+
+            self.display_columns = first.keys()\
+                if self.report_all else comparison_columns
+
+            passed, self.data = compare_rows(
+                table=itertools.chain([first], table),
+                expected_table=itertools.chain(
+                    [first_expected], expected_table),
+                comparison_columns=comparison_columns,
+                display_columns=self.display_columns,
+                strict=self.strict,
+                fail_limit=self.fail_limit,
+                report_fails_only=True,
+            )
+
+        len_table, len_expected = table.exhaust(), expected_table.exhaust()
+        if len_table != len_expected:
+            self.data = []
+            self.message = (
+                'Cannot run comparison on tables with different number '
+                'of rows ({} vs {}), make sure tables have the same size.'
+            ).format(len_table, len_expected)
+            return False
+
+        num_compared = self.data[-1].idx + 1 \
+            if self.fail_limit and len(self.data) >= self.fail_limit \
+            else len_table
+        self.message = (
+            '{} of {} rows compared, {} failed, only failing rows'
+            ' are reported.'
+        ).format(num_compared, len_table, len(self.data))
+        return passed
+
 
 class TableDiff(TableMatch):
     """
@@ -946,14 +1164,16 @@ class XMLCheck(Assertion):
         namespaces=None, description=None, category=None
     ):
 
+        from lxml import etree
+
         self.xpath = xpath
         self.tags = tags
 
         if isinstance(element, six.string_types):
-            element = lxml.etree.fromstring(element)
+            element = etree.fromstring(element)
 
         # pylint: disable=protected-access
-        elif not isinstance(element, lxml.etree._Element):
+        elif not isinstance(element, etree._Element):
             raise ValueError(
                 '`element` must be either an XML'
                 ' string or `lxml.etree.Element`.'
@@ -1085,6 +1305,11 @@ class DictMatch(Assertion):
       Match two dictionaries by comparing values under
       each key recursively.
     """
+
+    __slots__ = ('value', 'expected', 'include_keys', 'exclude_keys',
+                 'actual_description', 'expected_description',
+                 '_report_mode', '_value_cmp_func', 'comparison')
+
     def __init__(self,
                  value,
                  expected,
@@ -1127,6 +1352,9 @@ class FixMatch(DictMatch):
         Similar to DictMatch, however dict keys
         will have fix tag info popups on web UI
     """
+
+    __slots__ = ()
+
     def __init__(self,
                  value,
                  expected,
@@ -4,10 +4,17 @@
 import datetime
 import operator
 import re
+import time
+try:
+    from collections.abc import Iterator
+except ImportError:
+    from collections import Iterator
+
+import pytz
 
 from testplan.common.utils.convert import nested_groups
-from testplan.common.utils.timing import utcnow
-from testplan.common.utils.table import TableEntry
+from testplan.common.utils.table import (
+    TableEntry, iter_as_dict, iter_as_list_of_dict)
 from testplan.common.utils.reporting import fmt
 from testplan.common.utils.convert import flatten_formatted_object
 
@@ -37,13 +44,20 @@ def get_table(source, keep_column_order=True):
     """
     Return table formatted as a TableEntry.
 
-    :param source: Tabular data.
-    :type source: ``list`` of ``list`` or ``list`` of ``dict``
+    :param source: Tabular data, iterators (e.g. generators of database
+        rows) yield the column names first, all their rows are kept in the
+        returned table.
+    :type source: ``list`` of ``list`` or ``list`` of ``dict`` or iterator
+        of ``list`` or ``tuple``
     :param keep_column_order: Flag whether column order should be maintained.
     :type keep_column_order: ``bool``
     :return: Formatted table.
     :rtype: ``list`` of ``dict``
     """
+    if isinstance(source, Iterator):
+        return iter_as_list_of_dict(
+            source, keep_column_order=keep_column_order)
+
     if not source:
         return []
 
@@ -51,14 +65,46 @@ def get_table(source, keep_column_order=True):
     return table.as_list_of_dict(keep_column_order=keep_column_order)
 
 
+def iter_table(source, keep_column_order=True):
+    """
+    Return the rows of tabular data one at a time, iterators (e.g.
+    generators of database rows) are consumed as the rows are requested.
+
+    :param source: Tabular data, iterators yield the column names first.
+    :type source: ``list`` of ``list`` or ``list`` of ``dict`` or iterator
+        of ``list`` or ``tuple``
+    :param keep_column_order: Flag whether column order should be maintained.
+    :type keep_column_order: ``bool``
+    :return: Table rows.
+    :rtype: iterator of ``dict``
+    """
+    if isinstance(source, Iterator):
+        return iter_as_dict(source, keep_column_order=keep_column_order)
+    return iter(get_table(source, keep_column_order=keep_column_order))
+
+
+def is_streamed_table(source):
+    """Tabular data given as an iterator of rows."""
+    return isinstance(source, Iterator)
+
+
 class BaseEntry(object):
-    """Base class for all entries, stores common context like time etc."""
+    """
+    Base class for all entries, stores common context like time etc.
+
+    A testcase may create a large number of entries before they get
+    serialized, so entries use ``__slots__`` and store a single float
+    timestamp, subclasses should declare the ``__slots__`` of the attributes
+    they set.
+    """
+
+    __slots__ = ('timestamp', 'description', 'category', 'line_no',
+                 'file_path')
 
     meta_type = 'entry'
 
     def __init__(self, description, category=None):
-        self.utc_time = utcnow()
-        self.machine_time = datetime.datetime.now()
+        self.timestamp = time.time()
         self.description = description
         self.category = category or DEFAULT_CATEGORY
 
@@ -66,6 +112,17 @@ class BaseEntry(object):
         self.line_no = None
         self.file_path = None
 
+    @property
+    def utc_time(self):
+        """Timezone aware UTC time of the entry creation."""
+        return datetime.datetime.utcfromtimestamp(
+            self.timestamp).replace(tzinfo=pytz.UTC)
+
+    @property
+    def machine_time(self):
+        """Local time of the entry creation."""
+        return datetime.datetime.fromtimestamp(self.timestamp)
+
     def __str__(self):
         return repr(self)
 
@@ -216,6 +273,8 @@ class Summary(Group):
 
 class Log(BaseEntry):
 
+    __slots__ = ('message',)
+
     def __init__(self, message, description=None):
         self.message = message
 
@@ -249,6 +308,9 @@ class TableLog(BaseEntry):
 
 class DictLog(BaseEntry):
     """Log a dict object to the report."""
+
+    __slots__ = ('flattened_dict',)
+
     def __init__(self, dictionary, description=None):
         formatted_obj = fmt(dictionary)
         if len(formatted_obj) != 2 or formatted_obj[0] != 2:
@@ -260,6 +322,9 @@ class DictLog(BaseEntry):
 
 class FixLog(DictLog):
     """Log a fix message to the report."""
+
+    __slots__ = ()
+
     def __init__(self, msg, description=None):
         if not msg or not isinstance(msg, dict):
             raise TypeError('Invalid format of fix message')
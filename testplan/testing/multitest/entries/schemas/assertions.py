@@ -96,6 +96,20 @@ class RegexFindIterSchema(RegexSchema):
     condition = custom_fields.NativeOrPretty()
 
 
+@registry.bind(
+    asr.RegexFileSearch,
+    asr.RegexFileSearchNotExists,
+    asr.RegexFileMatchLine,
+)
+class RegexFileSchema(AssertionSchema):
+
+    path = fields.String()
+    patterns = fields.List(custom_fields.NativeOrPretty())
+    flags = fields.Integer()
+    matches = fields.List(fields.Dict())
+    error = fields.String(allow_none=True)
+
+
 @registry.bind(
     asr.ExceptionRaised,
     asr.ExceptionNotRaised
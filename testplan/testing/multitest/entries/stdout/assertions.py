@@ -177,6 +177,40 @@ class RegexNotMatchRenderer(RegexMatchRenderer):
     highlight_color = 'red'
 
 
+@registry.bind(
+    assertions.RegexFileSearch,
+    assertions.RegexFileMatchLine,
+    assertions.RegexFileSearchNotExists
+)
+class RegexFileRenderer(AssertionRenderer):
+
+    def get_assertion_details(self, entry):
+        """
+        Return the first match of each pattern, highlighted in the snippet
+        of its line.
+        """
+        color = 'red' if isinstance(
+            entry, assertions.RegexFileSearchNotExists) else 'green'
+        matches = {match['pattern']: match for match in entry.matches}
+        parts = ['Path: {}'.format(entry.path)]
+        if entry.error:
+            parts.append(Color.red('Error: {}'.format(entry.error)))
+        for idx, pattern in enumerate(entry.patterns):
+            match = matches.get(idx)
+            if match is None:
+                found = 'Not found' if color == 'red' \
+                    else Color.red('Not found')
+            else:
+                begin, end = match['snippet_span']
+                snippet = match['snippet']
+                found = 'Line {}: {}{}{}'.format(
+                    match['line_no'] + 1, snippet[:begin],
+                    Color.colored(snippet[begin:end], color), snippet[end:])
+            parts.append('Pattern: `{}`{}  {}'.format(
+                pattern, os.linesep, found))
+        return os.linesep.join(parts)
+
+
 @registry.bind(
     assertions.Contain,
     assertions.NotContain
@@ -212,6 +212,7 @@ def _generate_func(function, name_func, tag_func, docstring_func, tag_dict, kwar
         _generated.__tags__, tag_dict)
 
     _generated._parametrization_template = function.__name__
+    _generated._parametrization_kwargs = kwargs
 
     return _generated
 
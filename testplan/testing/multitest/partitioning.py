@@ -0,0 +1,172 @@
+"""
+Strategies splitting the testcases of a MultiTest into parts, see the
+``part`` & ``part_strategy`` options of
+:py:class:`~testplan.testing.multitest.base.MultiTest`.
+"""
+import collections
+import json
+
+from testplan.report.testing import TestGroupReport
+
+# Every n-th testcase of each suite belongs to the same part.
+MODULO = 'modulo'
+# Parts are balanced by the estimated duration of their testcases.
+COST = 'cost'
+
+STRATEGIES = (MODULO, COST)
+
+# Names under which the suite setup & teardown durations are recorded, they
+# cannot be used as testcase names.
+SUITE_OVERHEADS = ('setup', 'teardown')
+
+# Cost of testcases when no durations have been recorded at all.
+DEFAULT_COST = 1.0
+
+
+def _testcase_reports(report):
+    """Testcase reports of a group, including parametrized ones."""
+    for entry in report:
+        if isinstance(entry, TestGroupReport):
+            for case_report in _testcase_reports(entry):
+                yield case_report
+        else:
+            yield entry
+
+
+def _elapsed(report):
+    """Run duration of a report in seconds, ``None`` if not recorded."""
+    interval = report.timer.get('run')
+    return interval.elapsed if interval else None
+
+
+def durations_from_report(report, name):
+    """
+    Durations of the testcases of the test named ``name`` recorded in a
+    test report, the reports of its parts are included as well. The time
+    spent in a suite that is not spent in its testcases is recorded as the
+    duration of its ``setup``.
+
+    :param report: Test report of a previous run.
+    :type report: :py:class:`~testplan.report.testing.TestReport`
+    :param name: Name of the test.
+    :type name: ``str``
+    :return: Durations in seconds of testcases by suite & testcase names.
+    :rtype: ``dict`` of ``str``: ``dict`` of ``str``: ``float``
+    """
+    durations = {}
+    part_prefix = '{} - part('.format(name)
+
+    for test_report in report:
+        if test_report.name != name and \
+                not test_report.name.startswith(part_prefix):
+            continue
+
+        for suite_report in test_report:
+            suite_durations = durations.setdefault(suite_report.name, {})
+            cases_elapsed = 0
+            for case_report in _testcase_reports(suite_report):
+                elapsed = _elapsed(case_report)
+                if elapsed is not None:
+                    suite_durations[case_report.name] = elapsed
+                    cases_elapsed += elapsed
+
+            suite_elapsed = _elapsed(suite_report)
+            if suite_elapsed is not None:
+                suite_durations['setup'] = max(
+                    suite_durations.get('setup', 0),
+                    suite_elapsed - cases_elapsed)
+
+    return durations
+
+
+def load_durations(source, name):
+    """
+    Load the testcase durations of the test named ``name``.
+
+    :param source: Durations by suite & testcase names, or the path of a
+        JSON report of a previous run.
+    :type source: ``dict`` or ``str``
+    :param name: Name of the test.
+    :type name: ``str``
+    :return: Durations in seconds of testcases by suite & testcase names.
+    :rtype: ``dict`` of ``str``: ``dict`` of ``str``: ``float``
+    """
+    if isinstance(source, dict):
+        return source
+
+    from testplan.report.testing.schemas import TestReportSchema
+
+    with open(source) as report_file:
+        data = json.load(report_file)
+    return durations_from_report(
+        TestReportSchema(strict=True).load(data).data, name)
+
+
+def assign_parts(testcases, total, durations=None):
+    """
+    Assign testcases to ``total`` parts so that parts take about the same
+    time. Testcases are placed from the longest to the shortest on the part
+    that would finish first with it (LPT scheduling), placing the first
+    testcase of a suite on a part also costs the suite setup & teardown.
+    A suite whose setup & teardown take longer than the share of its
+    testcases a part would run is not split at all.
+
+    Testcases without a recorded duration are estimated to take the average
+    duration of the others. The assignment is deterministic, every part can
+    compute it independently.
+
+    :param testcases: Suite & testcase names of the testcases to run.
+    :type testcases: ``list`` of ``tuple`` of (``str``, ``str``)
+    :param total: Number of parts.
+    :type total: ``int``
+    :param durations: Durations in seconds of testcases by suite & testcase
+        names, with suite setup & teardown under their names.
+    :type durations: ``dict`` of ``str``: ``dict`` of ``str``: ``float``
+    :return: Part index of each testcase.
+    :rtype: ``list`` of ``int``
+    """
+    durations = durations or {}
+    recorded = [durations.get(suite, {}).get(case)
+                for suite, case in testcases]
+    known = [duration for duration in recorded if duration is not None]
+    default_cost = float(sum(known)) / len(known) if known \
+        else DEFAULT_COST
+    costs = [default_cost if duration is None else duration
+             for duration in recorded]
+
+    suite_indices = collections.OrderedDict()
+    for idx, (suite, _) in enumerate(testcases):
+        suite_indices.setdefault(suite, []).append(idx)
+
+    overheads = {
+        suite: sum(durations.get(suite, {}).get(name, 0)
+                   for name in SUITE_OVERHEADS)
+        for suite in suite_indices}
+
+    # Units placed on parts: (suite, testcase indices, cost without overhead)
+    units = []
+    for suite, indices in suite_indices.items():
+        suite_cost = sum(costs[idx] for idx in indices)
+        if overheads[suite] and \
+                overheads[suite] >= float(suite_cost) / total:
+            units.append((suite, indices, suite_cost))
+        else:
+            units.extend((suite, [idx], costs[idx]) for idx in indices)
+
+    loads = [0.0] * total
+    suites = [set() for _ in range(total)]
+    assignment = [None] * len(testcases)
+
+    for suite, indices, cost in sorted(units, key=lambda unit: -unit[2]):
+
+        def finish(part):
+            overhead = 0 if suite in suites[part] else overheads[suite]
+            return loads[part] + cost + overhead
+
+        best = min(range(total), key=lambda part: (finish(part), part))
+        loads[best] = finish(best)
+        suites[best].add(suite)
+        for idx in indices:
+            assignment[idx] = best
+
+    return assignment
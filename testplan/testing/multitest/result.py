@@ -10,7 +10,6 @@ from testplan.defaults import STDOUT_STYLE
 from testplan.common.utils import comparison
 
 from .entries import assertions, base
-from .entries.schemas.base import registry as schema_registry
 from .entries.stdout.base import registry as stdout_registry
 
 
@@ -399,6 +398,116 @@ class RegexNamespace(AssertionNamespace):
             category=category,
         )
 
+    @bind_entry
+    def search_file(
+        self, path, regexps, description=None, category=None,
+        flags=0, encoding='utf-8'
+    ):
+        r"""
+        Checks if each of the ``regexps`` exists in the file at ``path``
+        (``re.search``). Scanning stops once all of them are found, only the
+        position & line of their first match is reported.
+
+        .. code-block:: python
+
+            result.regex.search_file(
+                path=driver.logpath,
+                regexps=[r'Listening on port \d+', 'Connected'],
+            )
+
+        :param path: Path of the file, which is memory mapped rather than
+                     read in memory.
+        :type path: ``str``
+        :param regexps: Pattern(s) searched in a single pass over the file.
+        :type regexps: ``str`` or compiled regex, or ``list`` of them
+        :param flags: Regex flags of string patterns.
+        :type flags: ``int``
+        :param encoding: Encoding of string patterns and of the file.
+        :type encoding: ``str``
+        :param description: Text description for the assertion.
+        :type description: ``str``
+        :param category: Custom category that will be used for summarization.
+        :type category: ``str``
+        :return: Assertion pass status
+        :rtype: ``bool``
+        """
+        return assertions.RegexFileSearch(
+            path=path, regexps=regexps, flags=flags, encoding=encoding,
+            description=description, category=category)
+
+    @bind_entry
+    def search_file_empty(
+        self, path, regexps, description=None, category=None,
+        flags=0, encoding='utf-8'
+    ):
+        """
+        Checks if none of the ``regexps`` exists in the file at ``path``
+        (``re.search``). Scanning stops at the first match.
+
+        .. code-block:: python
+
+            result.regex.search_file_empty(
+                path=driver.logpath,
+                regexps=['ERROR', 'Segmentation fault'],
+            )
+
+        :param path: Path of the file, which is memory mapped rather than
+                     read in memory.
+        :type path: ``str``
+        :param regexps: Pattern(s) searched in a single pass over the file.
+        :type regexps: ``str`` or compiled regex, or ``list`` of them
+        :param flags: Regex flags of string patterns.
+        :type flags: ``int``
+        :param encoding: Encoding of string patterns and of the file.
+        :type encoding: ``str``
+        :param description: Text description for the assertion.
+        :type description: ``str``
+        :param category: Custom category that will be used for summarization.
+        :type category: ``str``
+        :return: Assertion pass status
+        :rtype: ``bool``
+        """
+        return assertions.RegexFileSearchNotExists(
+            path=path, regexps=regexps, flags=flags, encoding=encoding,
+            description=description, category=category)
+
+    @bind_entry
+    def matchline_file(
+        self, path, regexps, description=None, category=None,
+        flags=0, encoding='utf-8'
+    ):
+        r"""
+        Checks if each of the ``regexps`` returns a match (``re.match``)
+        for a line of the file at ``path``. Scanning stops once all of them
+        matched.
+
+        .. code-block:: python
+
+            result.regex.matchline_file(
+                path=driver.logpath,
+                regexps=[r'\d+ INFO Started', r'\d+ INFO Stopped'],
+            )
+
+        :param path: Path of the file, which is memory mapped rather than
+                     read in memory.
+        :type path: ``str``
+        :param regexps: Pattern(s) searched in a single pass over the file.
+        :type regexps: ``str`` or compiled regex, or ``list`` of them
+        :param flags: Regex flags of string patterns.
+        :type flags: ``int``
+        :param encoding: Encoding of string patterns and of the file.
+        :type encoding: ``str``
+        :param description: Text description for the assertion.
+        :type description: ``str``
+        :param category: Custom category that will be used for summarization.
+        :type category: ``str``
+        :return: Assertion pass status
+        :rtype: ``bool``
+        """
+        return assertions.RegexFileMatchLine(
+            path=path, regexps=regexps, flags=flags, encoding=encoding,
+            description=description, category=category)
+
 
 class TableNamespace(AssertionNamespace):
     """Contains logic for regular expression assertions."""
@@ -428,8 +537,11 @@ class TableNamespace(AssertionNamespace):
                 column='symbol',
             )
 
-        :param table: Tabular data
-        :type table: ``list`` of ``list`` or ``list`` of ``dict``.
+        :param table: Tabular data, or an iterator of the column names
+                    followed by the rows (e.g. ``Sqlite3.iter_table``),
+                    checked as they are consumed, only failing rows of an
+                    iterator are reported.
+        :type table: ``list`` of ``list`` or ``list`` of ``dict`` or iterator.
         :param values: Values that will be checked against each cell.
         :type values: ``iterable`` of ``object``
         :param column: Column name to check.
@@ -496,8 +608,11 @@ class TableNamespace(AssertionNamespace):
                 ]
             )
 
-        :param actual: Tabular data
-        :type actual: ``list`` of ``list`` or ``list`` of ``dict``.
+        :param actual: Tabular data, or an iterator of the column names
+                    followed by the rows (e.g. ``Sqlite3.iter_table``),
+                    compared as they are consumed, only failing rows of an
+                    iterator are reported.
+        :type actual: ``list`` of ``list`` or ``list`` of ``dict`` or iterator.
         :param expected: Tabular data, which can contain custom comparators.
         :type expected: ``list`` of ``list`` or ``list`` of ``dict``.
         :param include_columns: List of columns to include
@@ -575,8 +690,11 @@ class TableNamespace(AssertionNamespace):
                 ]
             )
 
-        :param actual: Tabular data
-        :type actual: ``list`` of ``list`` or ``list`` of ``dict``.
+        :param actual: Tabular data, or an iterator of the column names
+                    followed by the rows (e.g. ``Sqlite3.iter_table``),
+                    compared as they are consumed, only failing rows of an
+                    iterator are reported.
+        :type actual: ``list`` of ``list`` or ``list`` of ``dict`` or iterator.
         :param expected: Tabular data, which can contain custom comparators.
         :type expected: ``list`` of ``list`` or ``list`` of ``dict``.
         :param include_columns: List of columns to include
@@ -626,8 +744,10 @@ class TableNamespace(AssertionNamespace):
                 ]
             )
 
-        :param table: Tabular data.
-        :type table: ``list`` of ``list`` or ``list`` of ``dict``
+        :param table: Tabular data, or an iterator of the column names
+                    followed by the rows, all of which are kept in the
+                    report.
+        :type table: ``list`` of ``list`` or ``list`` of ``dict`` or iterator.
         :param display_index: Flag whether to display row indices.
         :type display_index: ``bool``
         :param description: Text description for the assertion.
@@ -1801,6 +1921,10 @@ class Result(object):
         """
         Line diff assertion. Fail if at least one difference found.
 
+        Large texts are compared with a patience diff, which may report
+        coarser differences when they are mostly different. The reported
+        differences are truncated after 10000 lines.
+
         .. code-block:: python
 
             text1 = 'a  b  c\nd\n'
@@ -1872,6 +1996,7 @@ class Result(object):
         Return entry data in dictionary form. This will then be stored
         in related ``TestCaseReport``'s ``entries`` attribute.
         """
+        from .entries.schemas.base import registry as schema_registry
         return [schema_registry.serialize(entry) for entry in self]
 
     def __repr__(self):
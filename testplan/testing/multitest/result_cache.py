@@ -0,0 +1,416 @@
+"""
+Cache of passing testcase results, see the ``result_cache`` option of
+:py:class:`~testplan.testing.multitest.base.MultiTest`.
+
+A testcase is not executed again while its fingerprint is the one recorded
+with its last passing report: the fingerprint covers the source of the
+testsuite module, the parametrization arguments of the testcase, the
+declared input files & environment variables and the configuration of the
+drivers. Failing testcases are recorded without a report, so that a cached
+report is never reused after a failure.
+
+Entries are stored in a JSON file per MultiTest (and per part) of the cache
+directory. They can be listed & invalidated from the command line::
+
+    python -m testplan.testing.multitest.result_cache CACHE_DIR
+    python -m testplan.testing.multitest.result_cache CACHE_DIR --clear \\
+        --test "My Multitest" --suite MySuite --case my_testcase
+"""
+from __future__ import print_function
+
+import argparse
+import datetime
+import hashlib
+import inspect
+import json
+import os
+import re
+import time
+import uuid
+
+import six
+
+from testplan.common.utils.path import file_digest, makedirs
+from testplan.common.utils.strings import slugify
+
+# Bumped when the fingerprint or the file format change.
+VERSION = 1
+
+CACHE_FILE_SUFFIX = '.json'
+
+_ADDRESS = re.compile(r' at 0x[0-9a-fA-F]+')
+_PATTERN_TYPE = type(re.compile(''))
+
+
+def _stable(value):
+    """
+    Representation of a value that does not change between processes:
+    containers are sorted, classes & functions are represented by their
+    qualified names and object addresses are removed.
+    """
+    if isinstance(value, dict):
+        return '{{{}}}'.format(', '.join(sorted(
+            '{}: {}'.format(_stable(key), _stable(item))
+            for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return '[{}]'.format(', '.join(_stable(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return '{{{}}}'.format(', '.join(sorted(
+            _stable(item) for item in value)))
+    if isinstance(value, _PATTERN_TYPE):
+        return 're({!r}, {})'.format(value.pattern, value.flags)
+    if inspect.isclass(value) or inspect.isroutine(value):
+        return '{}.{}'.format(
+            getattr(value, '__module__', None),
+            getattr(value, '__qualname__', getattr(value, '__name__', None)))
+    return _ADDRESS.sub('', repr(value))
+
+
+def _digest(value):
+    """SHA1 digest of the stable representation of a value."""
+    return hashlib.sha1(_stable(value).encode('utf-8')).hexdigest()
+
+
+def _source_digest(obj):
+    """Digest of the source file defining an object, ``None`` if unknown."""
+    try:
+        return file_digest(inspect.getsourcefile(obj))
+    except (TypeError, OSError, IOError):
+        return None
+
+
+def environment_inputs(files=(), env_vars=(), resources=()):
+    """
+    Inputs shared by all testcases of a MultiTest run.
+
+    :param files: Paths of the files the testcases depend on, missing files
+        are recorded as such.
+    :type files: ``list`` of ``str``
+    :param env_vars: Names of the environment variables the testcases
+        depend on.
+    :type env_vars: ``list`` of ``str``
+    :param resources: Drivers of the environment, their class, its source
+        and their configuration are recorded, along with the content of
+        the files their options refer to.
+    :type resources: ``iterable`` of
+        :py:class:`~testplan.testing.multitest.driver.base.Driver`
+    :return: Digests of the inputs.
+    :rtype: ``dict``
+    """
+    drivers = {}
+    for driver in resources:
+        options = driver.cfg._cfg_input
+        drivers[driver.uid()] = {
+            'class': _stable(driver.__class__),
+            'source': _source_digest(driver.__class__),
+            'config': _digest(options),
+            'files': {
+                name: file_digest(value)
+                for name, value in options.items()
+                if isinstance(value, six.string_types) and
+                os.path.isfile(value)
+            },
+        }
+
+    return {
+        'files': {
+            path: file_digest(path) if os.path.isfile(path) else None
+            for path in files
+        },
+        'env': _digest({name: os.environ.get(name) for name in env_vars}),
+        'drivers': _digest(drivers),
+    }
+
+
+def testcase_fingerprint(testsuite, testcase, inputs):
+    """
+    Fingerprint of a testcase, the components of the fingerprint are kept
+    so that the reason of a cache miss can be reported.
+
+    :param testsuite: Testsuite instance.
+    :type testsuite: ``object``
+    :param testcase: Testcase method of the testsuite.
+    :type testcase: ``callable``
+    :param inputs: Inputs from :py:func:`environment_inputs`.
+    :type inputs: ``dict``
+    :return: Fingerprint components, ``None`` if the source of the
+        testsuite cannot be found (the testcase is not cacheable).
+    :rtype: ``dict``
+    """
+    source = _source_digest(testsuite.__class__)
+    if source is None:
+        return None
+    return {
+        'version': VERSION,
+        'source': source,
+        'parameters': _digest(
+            getattr(testcase, '_parametrization_kwargs', None)),
+        'files': _digest(inputs['files']),
+        'env': inputs['env'],
+        'drivers': inputs['drivers'],
+    }
+
+
+def _cache_files(directory, test_name=None):
+    """Cache files of a test, or of all tests, in a directory."""
+    if not os.path.isdir(directory):
+        return []
+    prefix = slugify(test_name) if test_name is not None else None
+    paths = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(CACHE_FILE_SUFFIX):
+            continue
+        if prefix is not None and name != prefix + CACHE_FILE_SUFFIX and \
+                not name.startswith(prefix + '.part-'):
+            continue
+        paths.append(os.path.join(directory, name))
+    return paths
+
+
+def _read(path):
+    """Content of a cache file, ``None`` if unreadable or outdated."""
+    try:
+        with open(path) as cache_file:
+            data = json.load(cache_file)
+    except (IOError, OSError, ValueError):
+        return None
+    if data.get('version') != VERSION:
+        return None
+    return data
+
+
+def _write(path, data):
+    """Replace a cache file atomically, readers see the old or new one."""
+    partial = '{}.{}'.format(path, uuid.uuid4().hex)
+    with open(partial, 'w') as cache_file:
+        json.dump(data, cache_file)
+    getattr(os, 'replace', os.rename)(partial, path)
+
+
+class ResultCache(object):
+    """
+    Testcase results of a MultiTest, each part of a MultiTest stores its
+    results in its own file but looks testcases up in the files of all
+    parts, as testcases can move between parts.
+
+    :param directory: Cache directory, created on save.
+    :type directory: ``str``
+    :param test_name: Name of the MultiTest.
+    :type test_name: ``str``
+    :param part: Part of the MultiTest if split.
+    :type part: ``tuple`` of (``int``, ``int``)
+    """
+
+    def __init__(self, directory, test_name, part=None):
+        self.directory = directory
+        self.test_name = test_name
+        self.part = part
+        self.entries = {}
+        self._recorded = {}
+
+    @property
+    def path(self):
+        """Cache file of the MultiTest part."""
+        name = slugify(self.test_name)
+        if self.part:
+            name = '{}.part-{}-of-{}'.format(name, *self.part)
+        return os.path.join(self.directory, name + CACHE_FILE_SUFFIX)
+
+    def load(self):
+        """Load the entries of all parts, the latest entry of a testcase
+        is kept."""
+        self.entries = {}
+        for path in _cache_files(self.directory, self.test_name):
+            data = _read(path)
+            if data is None or data.get('test') != self.test_name:
+                continue
+            for suite, cases in data['entries'].items():
+                suite_entries = self.entries.setdefault(suite, {})
+                for case, entry in cases.items():
+                    previous = suite_entries.get(case)
+                    if previous is None or \
+                            previous['stored'] < entry['stored']:
+                        suite_entries[case] = entry
+
+    def lookup(self, suite, case, fingerprint):
+        """
+        Cached report of a testcase.
+
+        :param suite: Testsuite name.
+        :type suite: ``str``
+        :param case: Testcase name.
+        :type case: ``str``
+        :param fingerprint: Current fingerprint of the testcase.
+        :type fingerprint: ``dict``
+        :return: Report of the last run if it passed with the same
+            fingerprint, and the names of the fingerprint components that
+            changed otherwise.
+        :rtype: ``tuple`` of
+            (:py:class:`~testplan.report.testing.base.TestCaseReport`,
+            ``list`` of ``str``)
+        """
+        entry = self.entries.get(suite, {}).get(case)
+        if entry is None:
+            return None, ['missing']
+        changed = sorted(
+            key for key in set(fingerprint) | set(entry['fingerprint'])
+            if fingerprint.get(key) != entry['fingerprint'].get(key))
+        if changed:
+            return None, changed
+        if entry['report'] is None:
+            return None, ['failed']
+
+        from testplan.report.testing.schemas import TestCaseReportSchema
+
+        data = dict(entry['report'])
+        data.pop('type', None)
+        report = TestCaseReportSchema(strict=True).load(data).data
+        report.cached = {
+            'fingerprint': entry['fingerprint'], 'stored': entry['stored']}
+        return report, []
+
+    def record(self, suite, report, fingerprint, passed=None):
+        """
+        Record the result of a testcase that has been executed, the report
+        is only stored if it passed.
+
+        :param suite: Testsuite name.
+        :type suite: ``str``
+        :param report: Testcase report.
+        :type report: :py:class:`~testplan.report.testing.base.TestCaseReport`
+        :param fingerprint: Fingerprint of the testcase.
+        :type fingerprint: ``dict``
+        :param passed: Whether the testcase passed, defaults to the status
+            of its report.
+        :type passed: ``bool``
+        """
+        from testplan.report.testing.schemas import TestCaseReportSchema
+
+        if passed is None:
+            passed = report.passed
+        self._recorded.setdefault(suite, {})[report.name] = {
+            'fingerprint': fingerprint,
+            'stored': time.time(),
+            'report': TestCaseReportSchema(strict=True).dump(report).data
+            if passed else None,
+        }
+
+    def save(self):
+        """Add the recorded results to the cache file of the part."""
+        if not self._recorded:
+            return
+        data = _read(self.path)
+        if data is None:
+            data = {'version': VERSION, 'test': self.test_name,
+                    'part': self.part, 'entries': {}}
+        for suite, cases in self._recorded.items():
+            data['entries'].setdefault(suite, {}).update(cases)
+
+        makedirs(self.directory)
+        _write(self.path, data)
+        self._recorded = {}
+
+
+def list_entries(directory, test=None):
+    """
+    Entries of a cache directory.
+
+    :param directory: Cache directory.
+    :type directory: ``str``
+    :param test: Only list the entries of this MultiTest.
+    :type test: ``str``
+    :return: MultiTest, part, suite & testcase names, time stored and
+        whether the testcase passed of each entry.
+    :rtype: ``list`` of ``dict``
+    """
+    entries = []
+    for path in _cache_files(directory, test):
+        data = _read(path)
+        if data is None or test is not None and data['test'] != test:
+            continue
+        for suite, cases in sorted(data['entries'].items()):
+            for case, entry in sorted(cases.items()):
+                entries.append({
+                    'test': data['test'],
+                    'part': data['part'],
+                    'suite': suite,
+                    'testcase': case,
+                    'stored': entry['stored'],
+                    'passed': entry['report'] is not None,
+                })
+    return entries
+
+
+def invalidate(directory, test=None, suite=None, testcase=None):
+    """
+    Remove the entries of a cache directory matching all the given names,
+    all entries are removed if no name is given.
+
+    :param directory: Cache directory.
+    :type directory: ``str``
+    :param test: MultiTest name.
+    :type test: ``str``
+    :param suite: Testsuite name.
+    :type suite: ``str``
+    :param testcase: Testcase name.
+    :type testcase: ``str``
+    :return: Number of entries removed.
+    :rtype: ``int``
+    """
+    removed = 0
+    for path in _cache_files(directory, test):
+        data = _read(path)
+        if data is None or test is not None and data['test'] != test:
+            continue
+
+        for suite_name, cases in list(data['entries'].items()):
+            if suite is not None and suite_name != suite:
+                continue
+            for case in list(cases):
+                if testcase is None or case == testcase:
+                    del cases[case]
+                    removed += 1
+            if not cases:
+                del data['entries'][suite_name]
+
+        if data['entries']:
+            _write(path, data)
+        else:
+            os.remove(path)
+    return removed
+
+
+def main(argv=None):
+    """Command line to list & invalidate cache entries."""
+    parser = argparse.ArgumentParser(
+        description='List or invalidate the entries of a result cache.')
+    parser.add_argument('directory', help='Result cache directory.')
+    parser.add_argument('--test', help='Only entries of this MultiTest.')
+    parser.add_argument('--suite', help='Only entries of this testsuite.')
+    parser.add_argument('--case', help='Only entries of this testcase.')
+    parser.add_argument('--clear', action='store_true',
+                        help='Invalidate the entries instead of listing them.')
+    args = parser.parse_args(argv)
+
+    if args.clear:
+        removed = invalidate(
+            args.directory, test=args.test, suite=args.suite,
+            testcase=args.case)
+        print('Removed {} entries.'.format(removed))
+        return
+
+    for entry in list_entries(args.directory, test=args.test):
+        if args.suite is not None and entry['suite'] != args.suite or \
+                args.case is not None and entry['testcase'] != args.case:
+            continue
+        part = ' - part({}/{})'.format(
+            entry['part'][0] + 1, entry['part'][1]) if entry['part'] else ''
+        print('{}{} :: {} :: {}  {}  {}'.format(
+            entry['test'], part, entry['suite'], entry['testcase'],
+            'passed' if entry['passed'] else 'failed',
+            datetime.datetime.fromtimestamp(
+                entry['stored']).strftime('%Y-%m-%d %H:%M:%S')))
+
+
+if __name__ == '__main__':
+    main()
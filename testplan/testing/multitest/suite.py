@@ -252,6 +252,9 @@ def _testsuite(klass):
         klass.__tags__ = {}  # used for UI
         klass.__tags_index__ = {}  # used for actual filtering
 
+    if not hasattr(klass, '__parallel__'):
+        klass.__parallel__ = False
+
     klass.get_testcases = get_testcase_methods
 
     for func in __GENERATED_TESTCASES__:
@@ -276,7 +279,7 @@ def _testsuite(klass):
     return klass
 
 
-def _testsuite_meta(tags=None):
+def _testsuite_meta(tags=None, parallel=False):
     """
     Wrapper function that allows us to call :py:func:`@testsuite <testsuite>`
     decorator with extra arguments.
@@ -289,6 +292,8 @@ def _testsuite_meta(tags=None):
             klass.__tags__ = tagging.validate_tag_value(tags)
             klass.__tags_index__ = copy.deepcopy(klass.__tags__)
 
+        klass.__parallel__ = bool(parallel)
+
         suite = _testsuite(klass)
 
         return suite
@@ -314,6 +319,16 @@ def testsuite(*args, **kwargs):
       @testsuite(tags=('server', 'keep-alive'))
       class SampleSuite(object):
         ...
+
+    Suites that do not depend on each other can be marked with
+    `@testsuite(parallel=True)`, consecutive parallel suites of a MultiTest
+    are then executed concurrently (setup, testcases and teardown).
+
+    .. code-block:: python
+
+      @testsuite(parallel=True)
+      class ReadOnlySuite(object):
+        ...
     """
     return _selective_call(
         decorator_func=_testsuite,
@@ -1,8 +1,14 @@
 """PyTest test runner."""
+import argparse
 import collections
+import importlib
 import inspect
+import json
 import os
 import re
+import subprocess
+import sys
+import time
 
 import pytest
 import schema
@@ -15,7 +21,9 @@ from testplan.testing.multitest.result import Result as MultiTestResult
 from testplan.testing.multitest.entries.schemas.base import registry as schema_registry
 from testplan.testing.multitest.entries.stdout.base import registry as stdout_registry
 from testplan.report.testing import TestGroupReport, TestCaseReport, Status
+from testplan.report.testing.schemas import TestCaseReportSchema
 from testplan.common.utils.exceptions import format_trace
+from testplan.common.utils.process import kill_process
 from testplan.common.utils import validation
 
 
@@ -35,6 +43,11 @@ class PyTestConfig(testing.TestConfig):
             config.ConfigOption('quiet', default=True): bool,
             config.ConfigOption('result', default=MultiTestResult):
                 validation.is_subclass(MultiTestResult),
+            config.ConfigOption('num_workers', default=1):
+                schema.And(int, lambda n: n >= 1),
+            config.ConfigOption('part', default=None): schema.Or(
+                None, schema.And((int,), lambda tp: len(tp) == 2 and
+                                 0 <= tp[0] < tp[1] and tp[1] > 1)),
         }
 
 
@@ -42,6 +55,16 @@ class PyTest(testing.Test):
     """
     PyTest plugin for Testplan. Allows tests written for PyTest to be run from
     Testplan, with the test results logged and included in the Testplan report.
+
+    Tests are collected once, with ``num_workers`` greater than 1 the
+    collected tests are split into contiguous blocks, each run by a separate
+    pytest process and their results are streamed back into the report. The
+    ``env`` fixture is not available to tests run by worker processes.
+
+    ``part`` i.e. ``(index, total)`` runs every ``total``-th collected test
+    starting at ``index``, so that parts can be scheduled as separate tasks
+    on pools, reports of the parts are merged if the plan has
+    ``merge_scheduled_parts`` set.
     """
 
     CONFIG = PyTestConfig
@@ -55,6 +78,21 @@ class PyTest(testing.Test):
         self._pytest_plugin = _ReportPlugin(self, self.report, self.cfg.quiet)
         self._collect_plugin = _CollectPlugin(self.cfg.quiet)
         self._pytest_args = self._build_pytest_args()
+        self._worker_processes = []
+
+    def _new_test_report(self):
+        return TestGroupReport(
+            name=self.cfg.name,
+            description=self.cfg.description,
+            category=self.__class__.__name__.lower(),
+            uid=self.uid(),
+            tags=self.cfg.tags,
+            part=self.cfg.part,
+        )
+
+    def pre_resource_steps(self):
+        """Create the runpath, worker processes write their results there."""
+        self._add_step(self.make_runpath_dirs)
 
     def main_batch_steps(self):
         """Specify the test steps: run the tests, then log the results."""
@@ -66,10 +104,25 @@ class PyTest(testing.Test):
         self._pytest_plugin.setup()
 
     def run_tests(self):
-        """Run pytest and wait for it to terminate."""
-        # Execute pytest with self as a plugin for hook support
-        return_code = pytest.main(self._pytest_args,
-                                  plugins=[self._pytest_plugin])
+        """
+        Run pytest and wait for it to terminate. Only the collected tests of
+        ``part`` are run if set, by ``num_workers`` pytest processes if more
+        than 1.
+        """
+        if self.cfg.part is None and self.cfg.num_workers == 1:
+            # Execute pytest with self as a plugin for hook support
+            return_code = pytest.main(self._pytest_args,
+                                      plugins=[self._pytest_plugin])
+        else:
+            nodeids = self._selected_nodeids()
+            if not nodeids:
+                return
+            if self.cfg.num_workers == 1:
+                return_code = pytest.main(self._nodeid_args(nodeids),
+                                          plugins=[self._pytest_plugin])
+            else:
+                return_code = self._run_workers(nodeids)
+
         if return_code != 0:
             self.result.report.status_override = Status.ERROR
             self.logger.error('pytest exited with return code %d', return_code)
@@ -82,6 +135,7 @@ class PyTest(testing.Test):
         :return: List containing pairs of suite name and testcase names.
         :rtype: List[Tuple[str, List[str]]]
         """
+        self._collect_plugin = _CollectPlugin(self.cfg.quiet)
         return_code = pytest.main(self._pytest_args + ['--collect-only'],
                                   plugins=[self._collect_plugin])
 
@@ -95,15 +149,165 @@ class PyTest(testing.Test):
         # testcase names.
         return self._collect_plugin.collected
 
-    def _build_pytest_args(self):
+    def dry_run(self, status=None):
         """
-         :return: a list of the args to be passed to PyTest
+        Create a report of the suites & testcases of the collected tests
+        without running them, it is used as placeholder when merging
+        scheduled parts.
+        """
+        self.result.report = self._new_test_report()
+        plugin = _ReportPlugin(self, self.result.report, self.cfg.quiet)
+        plugin.setup()
+        for nodeid in self._selected_nodeids():
+            report = plugin.case_report(*plugin.case_parse(nodeid))
+            if status:
+                report.status_override = status
+        plugin.collate_reports()
+        return self.result
+
+    def aborting(self):
+        """Kill the worker processes."""
+        super(PyTest, self).aborting()
+        for proc in self._worker_processes:
+            kill_process(proc)
+
+    def _selected_nodeids(self):
+        """
+        :return: node ids of the collected tests to run, as per ``part``
+        :rtype: List[str]
+        """
+        if not self.test_context:
+            return []
+        nodeids = self._collect_plugin.nodeids
+        if self.cfg.part:
+            index, total = self.cfg.part
+            nodeids = nodeids[index::total]
+        return nodeids
+
+    def _nodeid_args(self, nodeids):
+        """
+        :return: args to be passed to PyTest to run the given node ids, they
+                 are relative to the root dir found on collection
+        :rtype: List[str]
+        """
+        rootdir = self._collect_plugin.rootdir
+        return ['--rootdir', rootdir] + self._pytest_options() + [
+            os.path.join(rootdir, nodeid) for nodeid in nodeids]
+
+    def _module_args(self, nodeids):
+        """
+        :return: args to be passed to PyTest to collect only the modules of
+                 the given node ids, they are relative to the root dir found
+                 on collection
+        :rtype: List[str]
+        """
+        rootdir = self._collect_plugin.rootdir
+        modules = collections.OrderedDict(
+            (nodeid.split('::', 1)[0], None) for nodeid in nodeids)
+        return ['--rootdir', rootdir] + self._pytest_options() + [
+            os.path.join(rootdir, module) for module in modules]
+
+    def _run_workers(self, nodeids):
+        """
+        Run the given node ids split over ``num_workers`` pytest processes,
+        each worker only collects the modules of its node ids and runs the
+        node ids written to a file for it. Results written by the workers are added to the report
+        as soon as they are available.
+
+        :return: the first return code of the workers that is an error, or 0
+        :rtype: ``int``
+        """
+        # Placeholders keep the collection order of testcases, a testcase
+        # whose result never arrives, e.g. a worker crashed, is an error.
+        for nodeid in nodeids:
+            report = self._pytest_plugin.case_report(
+                *self._pytest_plugin.case_parse(nodeid))
+            report.status_override = Status.ERROR
+
+        env = os.environ.copy()
+        env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+        result_class = '{}:{}'.format(
+            self.cfg.result.__module__, self.cfg.result.__name__)
+
+        results = []
+        self._worker_processes = []
+        try:
+            for index, chunk in enumerate(
+                    _split_evenly(nodeids, self.cfg.num_workers)):
+                results_path = os.path.join(
+                    self.runpath, 'pytest_worker_{}.jsonl'.format(index))
+                open(results_path, 'w').close()
+                results.append(open(results_path, 'r'))
+
+                # Node ids are passed in a file, as there may be too many
+                # for a command line.
+                nodeids_path = os.path.join(
+                    self.runpath, 'pytest_worker_{}.nodeids'.format(index))
+                with open(nodeids_path, 'w') as nodeids_file:
+                    nodeids_file.write(''.join(
+                        nodeid + '\n' for nodeid in chunk))
+
+                cmd = [sys.executable, '-m', __name__,
+                       '--results', results_path,
+                       '--nodeids', nodeids_path,
+                       '--result-class', result_class]
+                if self.scratch:
+                    cmd.extend(['--scratch', self.scratch])
+                cmd += ['--'] + self._module_args(chunk)
+                with open(os.path.join(
+                        self.runpath,
+                        'pytest_worker_{}.out'.format(index)), 'w') as output:
+                    self._worker_processes.append(subprocess.Popen(
+                        cmd, stdout=output, stderr=subprocess.STDOUT,
+                        env=env))
+
+            running = True
+            while running:
+                running = any(proc.poll() is None
+                              for proc in self._worker_processes)
+                for results_file in results:
+                    self._consume_results(results_file)
+                if running:
+                    time.sleep(0.1)
+        finally:
+            for results_file in results:
+                results_file.close()
+            for proc in self._worker_processes:
+                if proc.poll() is None:
+                    kill_process(proc)
+
+        self._pytest_plugin.collate_reports()
+
+        return_code = 0
+        for index, proc in enumerate(self._worker_processes):
+            if proc.returncode != 0:
+                self.logger.error(
+                    'pytest worker %d exited with return code %d',
+                    index, proc.returncode)
+                return_code = return_code or proc.returncode
+        return return_code
+
+    def _consume_results(self, results_file):
+        """Add the complete result lines written so far to the report."""
+        while True:
+            position = results_file.tell()
+            line = results_file.readline()
+            if not line.endswith('\n'):
+                results_file.seek(position)
+                return
+            result = json.loads(line)
+            # The class of serialized reports is only used by tree loading
+            result['report'].pop('type', None)
+            self._pytest_plugin.add_case_report(
+                result['suite'], result['case'], result['params'],
+                TestCaseReportSchema(strict=True).load(result['report']).data)
+
+    def _pytest_options(self):
+        """
+         :return: a list of the args to be passed to PyTest after the targets
          :rtype: List[str]
          """
-        if isinstance(self.cfg.target, six.string_types):
-            pytest_args = [self.cfg.target]
-        else:
-            pytest_args = self.cfg.target[:]
+        pytest_args = []
 
         if self.cfg.select:
             pytest_args.extend(['-k', self.cfg.select])
@@ -113,6 +317,18 @@ class PyTest(testing.Test):
 
         return pytest_args
 
+    def _build_pytest_args(self):
+        """
+         :return: a list of the args to be passed to PyTest
+         :rtype: List[str]
+         """
+        if isinstance(self.cfg.target, six.string_types):
+            pytest_args = [self.cfg.target]
+        else:
+            pytest_args = self.cfg.target[:]
+
+        return pytest_args + self._pytest_options()
+
 
 class _ReportPlugin(object):
     """
@@ -212,7 +428,7 @@ class _ReportPlugin(object):
         if case_params is None:
             report = self._suite_reports[suite_name].get(case_name)
             if report is None:
-                report = TestCaseReport(case_name)
+                report = TestCaseReport(case_name, uid=case_name)
                 self._suite_reports[suite_name][case_name] = report
             return report
         else:
@@ -220,18 +436,31 @@ class _ReportPlugin(object):
             if group_report is None:
                 # create group report for parametrized testcases
                 group_report = TestGroupReport(
-                    name=case_name, category='parametrization')
+                    name=case_name, uid=case_name,
+                    category='parametrization')
                 self._suite_reports[suite_name][case_name] = group_report
 
             case_name = '{}[{}]'.format(case_name, case_params)
             try:
                 report = group_report.get_by_uid(case_name)
-            except:
+            except KeyError:
                 # create report of parametrized testcase
-                report = TestCaseReport(case_name)
+                report = TestCaseReport(case_name, uid=case_name)
                 group_report.append(report)
             return report
 
+    def add_case_report(self, suite_name, case_name, case_params, report):
+        """
+        Merge the report of a testcase run by a worker process into the case
+        report for the specified suite and case name.
+
+        :param report: the testcase report sent by the worker
+        :type report: :py:class:`testplan.report.testing.TestCaseReport`
+        """
+        case_report = self.case_report(suite_name, case_name, case_params)
+        case_report.merge(report)
+        case_report.description = report.description
+
     def pytest_runtest_setup(self, item):
         """
         Hook called by pytest to set up a test.
@@ -276,8 +505,11 @@ class _ReportPlugin(object):
         if report.when == 'setup':
             if report.skipped:
                 # Status set to be SKIPPED if testcase is marked skip or xfail
-                # lower versioned PyTest does not support this feature
-                self._current_case_report.status_override = Status.SKIPPED
+                # lower versioned PyTest does not support this feature.
+                # pytest_runtest_setup is not called for tests marked skip.
+                case_report = self.case_report(
+                    *self.case_parse(report.nodeid))
+                case_report.status_override = Status.SKIPPED
 
         elif report.when == 'call':
             # Add the assertion entry to the case report
@@ -322,7 +554,7 @@ class _ReportPlugin(object):
                 'Exception raised') if call.when == 'call' else
                     '{} - Fail'.format(call.when))
             details = 'File: {}{}Line: {}{}{}: {}'.format(
-                traceback.path.strpath,
+                str(traceback.path),
                 os.linesep,
                 traceback.lineno + 1,
                 os.linesep,
@@ -357,10 +589,13 @@ class _ReportPlugin(object):
 
         :param config: pytest config object
         """
-        # Collate suite reports
+        self.collate_reports()
+
+    def collate_reports(self):
+        """Append the suite reports to the report."""
         for suite_name, cases in self._suite_reports.items():
             suite_report = TestGroupReport(
-                name=suite_name, category='suite')
+                name=suite_name, uid=suite_name, category='suite')
 
             for case in cases.values():
                 suite_report.append(case)
@@ -377,6 +612,8 @@ class _CollectPlugin(object):
     def __init__(self, quiet):
         self._quiet = quiet
         self._collected = collections.defaultdict(list)
+        self.nodeids = []
+        self.rootdir = None
 
     @pytest.hookimpl(trylast=True)
     def pytest_configure(self, config):
@@ -385,6 +622,7 @@ class _CollectPlugin(object):
 
         :param config: pytest config object
         """
+        self.rootdir = str(config.rootdir)
         if self._quiet:
             config.pluginmanager.unregister(name='terminalreporter')
 
@@ -396,6 +634,7 @@ class _CollectPlugin(object):
         """
         for test in items:
             self._collected[test.module.__name__].append(test.name)
+            self.nodeids.append(test.nodeid)
 
     @property
     def collected(self):
@@ -412,3 +651,149 @@ class _CollectPlugin(object):
         :rtype: List[Tuple[str, List[str]]]
         """
         return list(self._collected.items())
+
+
+class _WorkerContext(object):
+    """
+    Stands for the ``PyTest`` test in worker processes, which do not have
+    access to its environment.
+    """
+
+    def __init__(self, result_class, scratch):
+        self.cfg = collections.namedtuple('WorkerConfig', 'result')(
+            result_class)
+        self.stdout_style = None
+        self.scratch = scratch
+
+    @property
+    def resources(self):
+        """The environment is not available in worker processes."""
+        raise RuntimeError(
+            'The env fixture is not available when running tests with'
+            ' num_workers greater than 1.')
+
+
+class _WorkerReportPlugin(_ReportPlugin):
+    """
+    Report plugin of worker processes, only runs the tests of the given node
+    ids and writes the report of each testcase as a JSON line once it has
+    been torn down.
+    """
+
+    def __init__(self, results_file, result_class, scratch, nodeids=None):
+        super(_WorkerReportPlugin, self).__init__(
+            _WorkerContext(result_class, scratch), report=None, quiet=True)
+        self._results_file = results_file
+        self._nodeids = nodeids
+
+    def pytest_collection_modifyitems(self, config, items):
+        """
+        Hook called by pytest after collection, the tests whose node ids
+        were not given to the worker are deselected.
+
+        :param config: pytest config object
+        :param items: list of collected test items, modified in place
+        """
+        if self._nodeids is None:
+            return
+        selected, deselected = [], []
+        for item in items:
+            if item.nodeid in self._nodeids:
+                selected.append(item)
+            else:
+                deselected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+    def pytest_runtest_logreport(self, report):
+        """
+        Hook called by pytest to report on the result of a test, the testcase
+        report is written after the teardown.
+
+        :param report: the test report for the item just tested (see pytest
+                       documentation)
+        """
+        super(_WorkerReportPlugin, self).pytest_runtest_logreport(report)
+
+        if report.when == 'teardown':
+            suite_name, case_name, case_params = self.case_parse(
+                report.nodeid)
+            case_report = self.case_report(
+                suite_name, case_name, case_params)
+            self._results_file.write(json.dumps({
+                'suite': suite_name,
+                'case': case_name,
+                'params': case_params,
+                'report': TestCaseReportSchema(strict=True).dump(
+                    case_report).data,
+            }) + '\n')
+            self._results_file.flush()
+
+    def pytest_exception_interact(self, node, call, report):
+        """
+        Hook called when an exception raised and it can be handled, errors
+        of collection are written to the output of the worker.
+        """
+        if call.when == 'memocollect':
+            sys.stderr.write(format_trace(
+                inspect.getinnerframes(call.excinfo.tb), call.excinfo.value))
+        else:
+            super(_WorkerReportPlugin, self).pytest_exception_interact(
+                node, call, report)
+
+    def collate_reports(self):
+        """Testcase reports are already written."""
+        pass
+
+
+def _split_evenly(items, count):
+    """Split ``items`` into at most ``count`` contiguous non empty chunks."""
+    size, extra = divmod(len(items), count)
+    chunks, start = [], 0
+    for index in range(count):
+        end = start + size + (1 if index < extra else 0)
+        if end > start:
+            chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def _import_class(path):
+    """Import a class given as ``module:name``."""
+    module_name, class_name = path.split(':', 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _worker_main(argv):
+    """
+    Entry point of PyTest worker processes, run pytest writing the report of
+    each testcase to a results file.
+    """
+    parser = argparse.ArgumentParser(description='Testplan PyTest worker.')
+    parser.add_argument('--results', required=True)
+    parser.add_argument('--nodeids', default=None)
+    parser.add_argument('--result-class', default=None)
+    parser.add_argument('--scratch', default=None)
+    parser.add_argument('pytest_args', nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    pytest_args = args.pytest_args
+    if pytest_args[:1] == ['--']:
+        pytest_args = pytest_args[1:]
+    result_class = _import_class(args.result_class) \
+        if args.result_class else MultiTestResult
+    nodeids = None
+    if args.nodeids:
+        with open(args.nodeids) as nodeids_file:
+            nodeids = set(line.rstrip('\n') for line in nodeids_file)
+
+    with open(args.results, 'a') as results_file:
+        plugin = _WorkerReportPlugin(
+            results_file, result_class, args.scratch, nodeids)
+        plugin.setup()
+        return pytest.main(pytest_args, plugins=[plugin])
+
+
+if __name__ == '__main__':
+    sys.exit(_worker_main(sys.argv[1:]))
@@ -3,21 +3,28 @@
 Web application for Testplan & Monitor UIs,
 """
 import os
+import re
+import gzip
+import json
 import argparse
+from io import BytesIO
 from threading import Thread
 
-from flask import Flask, send_from_directory, abort
+from flask import Flask, Response, request, send_from_directory, abort
 from flask_restplus import Resource, Api
 from werkzeug import exceptions
 from cheroot.wsgi import Server as WSGIServer, PathInfoDispatcher
 
 from testplan import defaults
 from testplan.common.utils.path import pwd
+from testplan.exporters.testing.base import SKELETON_FILE, ASSERTIONS_DIR
 
 TESTPLAN_UI_STATIC_DIR = os.path.abspath(os.path.dirname(__file__))
 INDEX_HTML = 'index.html'
 TESTPLAN_REPORT = os.path.basename(defaults.JSON_PATH)
 MONITOR_REPORT = 'monitor_report.json'
+ASSERTIONS_UID = re.compile(r'^[0-9a-f]+$')
+GZIP_MIN_SIZE = 512
 
 app = Flask(__name__)
 _api = Api(app)
@@ -30,6 +37,59 @@ def parse_cli_args():
     parser.add_argument('--report-name', nargs='?', default=None, const=pwd())
     return parser.parse_args()
 
+
+def _compress(data):
+    """Gzip ``data``, ``gzip.compress`` is not available on Python 2."""
+    buf = BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb') as gzip_file:
+        gzip_file.write(data)
+    return buf.getvalue()
+
+
+def _json_file_response(path):
+    """
+    Serve a JSON file with an ETag, so that clients revalidating an unchanged
+    report get an empty 304 response, gzip compressed if the client accepts
+    it. A JSON list can be paginated with the ``offset`` & ``limit`` query
+    arguments, the size of the full list is in the ``X-Total-Count`` header.
+    """
+    if not os.path.isfile(path):
+        raise exceptions.NotFound()
+
+    stat = os.stat(path)
+    offset = request.args.get('offset', type=int)
+    limit = request.args.get('limit', type=int)
+    etag = '{}-{}-{}-{}'.format(
+        int(stat.st_mtime * 1e6), stat.st_size, offset, limit)
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    with open(path, 'rb') as json_file:
+        data = json_file.read()
+
+    headers = {}
+    if offset is not None or limit is not None:
+        entries = json.loads(data.decode('utf-8'))
+        if not isinstance(entries, list):
+            raise exceptions.BadRequest('Only lists can be paginated.')
+        start = max(offset or 0, 0)
+        stop = None if limit is None else start + max(limit, 0)
+        headers['X-Total-Count'] = str(len(entries))
+        data = json.dumps(entries[start:stop]).encode('utf-8')
+
+    if len(data) >= GZIP_MIN_SIZE and request.accept_encodings['gzip']:
+        data = _compress(data)
+        headers['Content-Encoding'] = 'gzip'
+
+    response = Response(data, mimetype='application/json', headers=headers)
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    return response
+
+
 @_api.route('/testplan/<string:report_uid>')
 class Testplan(Resource):
     def get(self, report_uid):
@@ -64,14 +124,31 @@ class TestplanReport(Resource):
         else:
             raise exceptions.NotFound()
 
+@_api.route('/testplan/<string:report_uid>/skeleton')
+class TestplanSkeleton(Resource):
+    def get(self, report_uid):
+        """
+        Get the skeleton of a Testplan report (JSON) given it's uid: groups,
+        testcases, statuses and counts without the assertions.
+        """
+        return _json_file_response(os.path.abspath(os.path.join(
+            app.config['DATA_PATH'], defaults.REPORT_SHARDS, SKELETON_FILE
+        )))
+
 @_api.route('/testplan/<string:report_uid>/assertions/<string:assertions_uid>')
 class TestplanAssertions(Resource):
     def get(self, report_uid, assertions_uid):
         """
-        Get an Assertion report (JSON) for a specific Testplan report given
-        their uids.
+        Get the assertions (JSON) of a testcase for a specific Testplan report
+        given their uids, can be paginated with ``offset`` & ``limit``.
         """
-        raise exceptions.NotImplemented()  # pylint: disable=notimplemented-raised
+        if not ASSERTIONS_UID.match(assertions_uid):
+            raise exceptions.NotFound()
+
+        return _json_file_response(os.path.abspath(os.path.join(
+            app.config['DATA_PATH'], defaults.REPORT_SHARDS,
+            ASSERTIONS_DIR, '{}.json'.format(assertions_uid)
+        )))
 
 @_api.route('/testplan/<string:report_uid>/attachment/<path:attachment_path>')
 class TestplanAttachment(Resource):
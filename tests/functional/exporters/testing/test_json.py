@@ -1,4 +1,5 @@
 import os
+import json
 
 from testplan.testing.multitest import MultiTest, testsuite, testcase
 
@@ -58,6 +59,50 @@ def test_json_exporter(tmpdir):
     assert os.stat(json_path).st_size > 0
 
 
+def test_json_exporter_split_report(tmpdir):
+    """
+    JSON Exporter should also save the report skeleton and the assertions of
+    each testcase if `split_json_report` is set.
+    """
+    reports_dir = tmpdir.mkdir('reports')
+    json_path = reports_dir.join('report.json').strpath
+    shards_dir = os.path.join(reports_dir.strpath, defaults.REPORT_SHARDS)
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        plan = Testplan(
+            name='plan', parse_cmdline=False,
+            exporters=JSONExporter(json_path=json_path,
+                                   split_json_report=True)
+        )
+        plan.add(MultiTest(name='Primary', suites=[Alpha()]))
+        plan.add(MultiTest(name='Secondary', suites=[Beta()]))
+        plan.run()
+
+    with open(json_path) as json_file:
+        report = json.load(json_file)
+    with open(os.path.join(shards_dir, 'skeleton.json')) as skeleton_file:
+        skeleton = json.load(skeleton_file)
+
+    assert skeleton['counts'] == {'passed': 2, 'failed': 1, 'error': 1}
+    assert [mt['counts'] for mt in skeleton['entries']] == [
+        {'passed': 2}, {'failed': 1, 'error': 1}]
+
+    for multitest, full_multitest in zip(
+            skeleton['entries'], report['entries']):
+        for suite, full_suite in zip(
+                multitest['entries'], full_multitest['entries']):
+            for testcase, full_testcase in zip(
+                    suite['entries'], full_suite['entries']):
+                assert testcase['entries'] == []
+                assert testcase['entry_count'] == len(
+                    full_testcase['entries'])
+                shard_path = os.path.join(
+                    shards_dir, 'assertions',
+                    testcase['assertions_uid'] + '.json')
+                with open(shard_path) as shard_file:
+                    assert json.load(shard_file) == full_testcase['entries']
+
+
 def test_implicit_exporter_initialization(tmpdir):
     """
         An implicit JSON should be generated if `json_path` is available
@@ -1,4 +1,5 @@
 import os
+import socket
 import re
 
 from testplan.testing.multitest import MultiTest, testsuite, testcase
@@ -178,6 +179,60 @@ def test_xml_exporter_cleanup(tmpdir):
     assert os.listdir(xml_dir.strpath) == ['my-multitest.xml']
 
 
+def test_xml_exporter_copies_xml_path(tmpdir):
+    """
+        XMLExporter should copy the original XML output of a report which
+        was parsed from a file, instead of rendering it.
+    """
+    source_xml = tmpdir.join('report.xml')
+    source_xml.write('<testsuites name="AllTests"></testsuites>')
+    report = TestGroupReport(name='My GTest', category='gtest')
+    report.xml_path = source_xml.strpath
+    report.xml_host = socket.gethostname()
+    remote_report = TestGroupReport(name='Remote GTest', category='gtest')
+    remote_report.xml_path = source_xml.strpath
+    remote_report.xml_host = 'remote.{}'.format(socket.gethostname())
+    xml_dir = tmpdir.join('xml')
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        XMLExporter(xml_dir=xml_dir.strpath).export(
+            TestReport(name='plan', entries=[report, remote_report]))
+
+    assert xml_dir.join('my-gtest.xml').read() == source_xml.read()
+    # The path of a remote report is not looked up locally.
+    assert xml_dir.join('remote-gtest.xml').read() != source_xml.read()
+
+
+def test_xml_exporter_merges_xml_parts(tmpdir):
+    """
+        XMLExporter should merge the XML outputs of the parts of a report
+        into a single file, in the order of the report suites & testcases.
+    """
+    parts = []
+    for idx, case_name in enumerate(('case_2', 'case_1')):
+        source_xml = tmpdir.join('part_{}.xml'.format(idx))
+        source_xml.write(
+            '<testsuites name="AllTests" tests="1">'
+            '<testsuite name="Suite" tests="1">'
+            '<testcase name="{}"/></testsuite></testsuites>'.format(case_name))
+        parts.append({'xml_path': source_xml.strpath,
+                      'xml_host': socket.gethostname()})
+    report = TestGroupReport(name='My GTest', category='gtest', entries=[
+        TestGroupReport(name='Suite', entries=[
+            TestCaseReport(name='case_1'), TestCaseReport(name='case_2')])
+    ])
+    report.xml_parts = parts
+    xml_dir = tmpdir.join('xml')
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        XMLExporter(xml_dir=xml_dir.strpath).export(
+            TestReport(name='plan', entries=[report]))
+
+    merged = xml_dir.join('my-gtest.xml').read()
+    assert 'tests="2"' in merged
+    assert merged.index('case_1') < merged.index('case_2')
+
+
 def test_implicit_exporter_initialization(tmpdir):
     """
         An implicit XMLExporter should be generated if `xml_dir` is available
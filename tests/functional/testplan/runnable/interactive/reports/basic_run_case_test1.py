@@ -52,6 +52,8 @@ REPORT = \
                                            u'type': 'TestCaseReport',
                                            u'uid': u'basic_case__arg_2'}],
                              u'fix_spec_path': None,
+                             u'resource_usage': None,
+                             u'profile': None,
                              u'logs': [],
                              u'name': u'basic_case',
                              u'part': None,
@@ -62,6 +64,8 @@ REPORT = \
                              u'type': 'TestGroupReport',
                              u'uid': u'basic_case'}],
                u'fix_spec_path': None,
+               u'resource_usage': None,
+               u'profile': None,
                u'logs': [],
                u'name': u'BasicSuite',
                u'part': None,
@@ -86,6 +90,8 @@ REPORT = \
                              u'type': 'TestCaseReport',
                              u'uid': u'send_and_receive_msg'}],
                u'fix_spec_path': None,
+               u'resource_usage': None,
+               u'profile': None,
                u'logs': [],
                u'name': u'TCPSuite - Custom_0',
                u'part': None,
@@ -109,6 +115,8 @@ REPORT = \
                              u'type': 'TestCaseReport',
                              u'uid': u'send_and_receive_msg'}],
                u'fix_spec_path': None,
+               u'resource_usage': None,
+               u'profile': None,
                u'logs': [],
                u'name': u'TCPSuite - Custom_1',
                u'part': None,
@@ -119,6 +127,8 @@ REPORT = \
                u'type': 'TestGroupReport',
                u'uid': u'TCPSuite - Custom_1'}],
  u'fix_spec_path': None,
+ u'resource_usage': None,
+ u'profile': None,
  u'logs': [],
  u'name': u'Test1',
  u'part': None,
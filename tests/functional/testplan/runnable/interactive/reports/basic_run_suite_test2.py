@@ -41,6 +41,8 @@ REPORT =\
                                            u'type': 'TestCaseReport',
                                            u'uid': u'basic_case__arg_2'}],
                              u'fix_spec_path': None,
+                             u'resource_usage': None,
+                             u'profile': None,
                              u'logs': [],
                              u'name': u'basic_case',
                              u'part': None,
@@ -51,6 +53,8 @@ REPORT =\
                              u'type': 'TestGroupReport',
                              u'uid': u'basic_case'}],
                u'fix_spec_path': None,
+               u'resource_usage': None,
+               u'profile': None,
                u'logs': [],
                u'name': u'BasicSuite',
                u'part': None,
@@ -74,6 +78,8 @@ REPORT =\
                              u'type': 'TestCaseReport',
                              u'uid': u'send_and_receive_msg'}],
                u'fix_spec_path': None,
+               u'resource_usage': None,
+               u'profile': None,
                u'logs': [],
                u'name': u'TCPSuite - Custom_0',
                u'part': None,
@@ -119,6 +125,8 @@ REPORT =\
                              u'type': 'TestCaseReport',
                              u'uid': u'send_and_receive_msg'}],
                u'fix_spec_path': None,
+               u'resource_usage': None,
+               u'profile': None,
                u'logs': [],
                u'name': u'TCPSuite - Custom_1',
                u'part': None,
@@ -130,6 +138,8 @@ REPORT =\
                u'type': 'TestGroupReport',
                u'uid': u'TCPSuite - Custom_1'}],
  u'fix_spec_path': None,
+ u'resource_usage': None,
+ u'profile': None,
  u'logs': [],
  u'name': u'Test2',
  u'part': None,
@@ -75,6 +75,8 @@ REPORT =\
                                                          u'type': 'TestCaseReport',
                                                          u'uid': u'basic_case__arg_2'}],
                                            u'fix_spec_path': None,
+                                           u'resource_usage': None,
+                                           u'profile': None,
                                            u'logs': [],
                                            u'name': u'basic_case',
                                            u'part': None,
@@ -85,6 +87,8 @@ REPORT =\
                                            u'type': 'TestGroupReport',
                                            u'uid': u'basic_case'}],
                              u'fix_spec_path': None,
+                             u'resource_usage': None,
+                             u'profile': None,
                              u'logs': [],
                              u'name': u'BasicSuite',
                              u'part': None,
@@ -131,6 +135,8 @@ REPORT =\
                                            u'type': 'TestCaseReport',
                                            u'uid': u'send_and_receive_msg'}],
                              u'fix_spec_path': None,
+                             u'resource_usage': None,
+                             u'profile': None,
                              u'logs': [],
                              u'name': u'TCPSuite - Custom_0',
                              u'part': None,
@@ -177,6 +183,8 @@ REPORT =\
                                            u'type': 'TestCaseReport',
                                            u'uid': u'send_and_receive_msg'}],
                              u'fix_spec_path': None,
+                             u'resource_usage': None,
+                             u'profile': None,
                              u'logs': [],
                              u'name': u'TCPSuite - Custom_1',
                              u'part': None,
@@ -188,6 +196,8 @@ REPORT =\
                              u'type': 'TestGroupReport',
                              u'uid': u'TCPSuite - Custom_1'}],
                u'fix_spec_path': None,
+               u'resource_usage': None,
+               u'profile': None,
                u'logs': [],
                u'name': u'Test1',
                u'part': None,
@@ -271,6 +281,8 @@ REPORT =\
                                                          u'type': 'TestCaseReport',
                                                          u'uid': u'basic_case__arg_2'}],
                                            u'fix_spec_path': None,
+                                           u'resource_usage': None,
+                                           u'profile': None,
                                            u'logs': [],
                                            u'name': u'basic_case',
                                            u'part': None,
@@ -281,6 +293,8 @@ REPORT =\
                                            u'type': 'TestGroupReport',
                                            u'uid': u'basic_case'}],
                              u'fix_spec_path': None,
+                             u'resource_usage': None,
+                             u'profile': None,
                              u'logs': [],
                              u'name': u'BasicSuite',
                              u'part': None,
@@ -327,6 +341,8 @@ REPORT =\
                                            u'type': 'TestCaseReport',
                                            u'uid': u'send_and_receive_msg'}],
                              u'fix_spec_path': None,
+                             u'resource_usage': None,
+                             u'profile': None,
                              u'logs': [],
                              u'name': u'TCPSuite - Custom_0',
                              u'part': None,
@@ -373,6 +389,8 @@ REPORT =\
                                            u'type': 'TestCaseReport',
                                            u'uid': u'send_and_receive_msg'}],
                              u'fix_spec_path': None,
+                             u'resource_usage': None,
+                             u'profile': None,
                              u'logs': [],
                              u'name': u'TCPSuite - Custom_1',
                              u'part': None,
@@ -384,6 +402,8 @@ REPORT =\
                              u'type': 'TestGroupReport',
                              u'uid': u'TCPSuite - Custom_1'}],
                u'fix_spec_path': None,
+               u'resource_usage': None,
+               u'profile': None,
                u'logs': [],
                u'name': u'Test2',
                u'part': None,
@@ -396,6 +416,7 @@ REPORT =\
                u'uid': u'Test2'}],
  u'meta': {},
  u'name': u'InteractivePlan',
+ u'profile': None,
  u'status': u'passed',
  u'status_override': None,
  u'tags_index': {},
@@ -40,6 +40,8 @@ REPORT =\
           u'type': 'TestCaseReport',
           u'uid': u'basic_case__arg_2'}],
       u'fix_spec_path': None,
+      u'resource_usage': None,
+      u'profile': None,
       u'logs': [],
       u'name': u'basic_case',
       u'part': None,
@@ -50,6 +52,8 @@ REPORT =\
       u'type': 'TestGroupReport',
       u'uid': u'basic_case'}],
     u'fix_spec_path': None,
+    u'resource_usage': None,
+    u'profile': None,
     u'logs': [],
     u'name': u'BasicSuite',
     u'part': None,
@@ -73,6 +77,8 @@ REPORT =\
       u'type': 'TestCaseReport',
       u'uid': u'send_and_receive_msg'}],
       u'fix_spec_path': None,
+      u'resource_usage': None,
+      u'profile': None,
       u'logs': [],
       u'name': u'TCPSuite - Custom_0',
       u'part': None,
@@ -96,6 +102,8 @@ REPORT =\
       u'type': 'TestCaseReport',
       u'uid': u'send_and_receive_msg'}],
       u'fix_spec_path': None,
+      u'resource_usage': None,
+      u'profile': None,
       u'logs': [],
       u'name': u'TCPSuite - Custom_1',
       u'part': None,
@@ -106,6 +114,8 @@ REPORT =\
       u'type': 'TestGroupReport',
       u'uid': u'TCPSuite - Custom_1'}],
   u'fix_spec_path': None,
+  u'resource_usage': None,
+  u'profile': None,
   u'logs': [],
   u'name': u'Test1',
   u'part': None,
@@ -155,6 +165,8 @@ REPORT =\
           u'type': 'TestCaseReport',
           u'uid': u'basic_case__arg_2'}],
       u'fix_spec_path': None,
+      u'resource_usage': None,
+      u'profile': None,
       u'logs': [],
       u'name': u'basic_case',
       u'part': None,
@@ -165,6 +177,8 @@ REPORT =\
       u'type': 'TestGroupReport',
       u'uid': u'basic_case'}],
     u'fix_spec_path': None,
+    u'resource_usage': None,
+    u'profile': None,
     u'logs': [],
     u'name': u'BasicSuite',
     u'part': None,
@@ -188,6 +202,8 @@ REPORT =\
       u'type': 'TestCaseReport',
       u'uid': u'send_and_receive_msg'}],
       u'fix_spec_path': None,
+      u'resource_usage': None,
+      u'profile': None,
       u'logs': [],
       u'name': u'TCPSuite - Custom_0',
       u'part': None,
@@ -211,6 +227,8 @@ REPORT =\
       u'type': 'TestCaseReport',
       u'uid': u'send_and_receive_msg'}],
       u'fix_spec_path': None,
+      u'resource_usage': None,
+      u'profile': None,
       u'logs': [],
       u'name': u'TCPSuite - Custom_1',
       u'part': None,
@@ -221,6 +239,8 @@ REPORT =\
       u'type': 'TestGroupReport',
       u'uid': u'TCPSuite - Custom_1'}],
     u'fix_spec_path': None,
+    u'resource_usage': None,
+    u'profile': None,
     u'logs': [],
     u'name': u'Test2',
     u'part': None,
@@ -232,6 +252,7 @@ REPORT =\
     u'uid': u'Test2'}],
   u'meta': {},
   u'name': u'InteractivePlan',
+  u'profile': None,
   u'status': u'incomplete',
   u'status_override': None,
   u'tags_index': {},
@@ -1,12 +1,20 @@
 import os
+import sys
+import stat
+import socket
 import platform
 
 import pytest
+from lxml import etree
 
 from testplan import Testplan
 from testplan.common.utils.testing import log_propagation_disabled, check_report
 from testplan.common.utils.logger import TESTPLAN_LOGGER
+from testplan.exporters.testing import XMLExporter
 from testplan.testing.cpp import GTest
+from testplan.runners.pools import ThreadPool
+from testplan.runners.pools.tasks import Task
+from testplan.report.testing import Status
 
 from tests.functional.testplan.testing.fixtures.cpp import gtest
 
@@ -62,3 +70,134 @@ def test_gtest(binary_dir, expected_report):
         assert plan.run().run is True
 
     check_report(expected=expected_report, actual=plan.report)
+
+
+FAKE_GTEST = os.path.join(fixture_root, 'sharded', 'fake_gtest.py')
+
+EXPECTED_SHARDED_CONTEXT = [
+    ('SquareRootTest', ['PositiveNos', 'NegativeNos', 'Zero']),
+    ('SquareRootTestNonFatal', ['PositiveNos', 'NegativeNos']),
+    ('TypedTest/0', ['Sum']),
+]
+
+
+@pytest.fixture
+def fake_gtest_binary(tmpdir):
+    """Executable running the fake GTest binary with this interpreter."""
+    binary = tmpdir.join('runTests')
+    binary.write('#!/bin/sh\nexec "{}" "{}" "$@"\n'.format(
+        sys.executable, FAKE_GTEST))
+    binary.chmod(binary.stat().mode | stat.S_IXUSR)
+    return binary.strpath
+
+
+def _report_context(report):
+    return [(suite.name, [testcase.name for testcase in suite])
+            for suite in report]
+
+
+@pytest.mark.skipif(
+    platform.system() == 'Windows',
+    reason='GTest is skipped on Windows.'
+)
+def test_gtest_shards(fake_gtest_binary):
+    """Shards run as separate processes and their reports get merged."""
+    gtest = GTest(name='MyGTest', driver=fake_gtest_binary, num_shards=3)
+    plan = Testplan(name='plan', parse_cmdline=False)
+    plan.add(gtest)
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        assert plan.run().run is True
+
+    report = plan.report.entries[0]
+    assert _report_context(report) == EXPECTED_SHARDED_CONTEXT
+    assert report.status == Status.FAILED
+    assert report.entries[1].entries[1].status == Status.FAILED
+    assert report.counts.passed == 5
+    with open(report.xml_path) as report_xml:
+        assert 'tests="6" failures="1"' in report_xml.read()
+
+    with open(gtest.stdout) as stdout:
+        assert len(stdout.read().splitlines()) == 6
+    for index in range(3):
+        assert os.path.exists(
+            os.path.join(gtest.runpath, 'report-shard{}.xml'.format(index)))
+
+
+@pytest.mark.skipif(
+    platform.system() == 'Windows',
+    reason='GTest is skipped on Windows.'
+)
+def test_gtest_parts_merged(tmpdir, fake_gtest_binary):
+    """
+    Shards scheduled as tasks on a pool get merged into one report, the XML
+    outputs of all parts get merged by the XML exporter.
+    """
+    xml_dir = tmpdir.join('xml')
+    plan = Testplan(name='plan', parse_cmdline=False,
+                    merge_scheduled_parts=True,
+                    exporters=[XMLExporter(xml_dir=xml_dir.strpath)])
+    plan.add_resource(ThreadPool(name='MyPool', size=3))
+
+    for idx in range(3):
+        plan.schedule(
+            Task(target=GTest(name='MyGTest', driver=fake_gtest_binary,
+                              part=(idx, 3))),
+            resource='MyPool')
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        assert plan.run().run is True
+
+    assert len(plan.report.entries) == 1
+    report = plan.report.entries[0]
+    assert report.name == 'MyGTest'
+    assert _report_context(report) == EXPECTED_SHARDED_CONTEXT
+    assert report.counts.passed == 5
+    assert report.counts.failed == 1
+
+    assert len(report.xml_parts) == 3
+    merged = etree.parse(xml_dir.join('mygtest.xml').strpath).getroot()
+    assert (merged.get('tests'), merged.get('failures')) == ('6', '1')
+    assert [(suite.get('name'), [case.get('name') for case in suite])
+            for suite in merged] == EXPECTED_SHARDED_CONTEXT
+
+
+GTEST_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites tests="3" failures="1" disabled="1" errors="0" name="AllTests">
+  <testsuite name="Alpha" tests="2" failures="1" disabled="0" errors="0">
+    <testcase name="first" status="run" classname="Alpha" />
+    <testcase name="second" status="run" classname="Alpha">
+      <!-- comments are ignored -->
+      <failure message="Failed">Value of: 1</failure>
+    </testcase>
+  </testsuite>
+  <testsuite name="Beta" tests="1" failures="0" disabled="1" errors="0">
+    <testcase name="DISABLED_skipped" status="notrun" classname="Beta" />
+  </testsuite>
+</testsuites>
+"""
+
+
+def test_gtest_process_test_data(tmpdir):
+    """XML output should be parsed incrementally into reports."""
+    gtest = GTest(name='MyGTest', driver='runTests',
+                  runpath=tmpdir.strpath)
+    gtest.make_runpath_dirs()
+    with open(gtest.report_path, 'w') as report_xml:
+        report_xml.write(GTEST_XML)
+
+    suites = gtest.process_test_data(gtest.read_test_data())
+    assert [(suite.name, [case.name for case in suite])
+            for suite in suites] == [('Alpha', ['first', 'second'])]
+
+    first, second = suites[0]
+    assert first.entries == []
+    assert [(entry['description'], entry['content'], entry['passed'])
+            for entry in second.entries] == [
+        ('failure', 'Value of: 1', False)]
+
+    gtest._test_has_run = True
+    gtest._test_process_retcode = 1
+    gtest.update_test_report()
+    assert gtest.report.xml_path == gtest.report_path
+    assert gtest.report.xml_host == socket.gethostname()
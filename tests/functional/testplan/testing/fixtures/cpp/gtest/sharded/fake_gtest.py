@@ -0,0 +1,86 @@
+"""
+Minimal stand-in for a Google Test binary, supports test listing, sharding
+via GTEST_TOTAL_SHARDS & GTEST_SHARD_INDEX and XML output.
+"""
+import os
+import sys
+
+TESTS = [
+    ('SquareRootTest', ['PositiveNos', 'NegativeNos', 'Zero']),
+    ('SquareRootTestNonFatal', ['PositiveNos', 'NegativeNos']),
+    ('TypedTest/0', ['Sum']),
+]
+
+LIST_COMMENTS = {'TypedTest/0': '  # TypeParam = int'}
+
+FAILING = {('SquareRootTestNonFatal', 'NegativeNos')}
+
+
+def list_tests():
+    for suite, testcases in TESTS:
+        print('{}.{}'.format(suite, LIST_COMMENTS.get(suite, '')))
+        for testcase in testcases:
+            print('  {}'.format(testcase))
+
+
+def run_tests(xml_path):
+    total = int(os.environ.get('GTEST_TOTAL_SHARDS', 1))
+    index = int(os.environ.get('GTEST_SHARD_INDEX', 0))
+
+    suites = []
+    test_idx = 0
+    for suite, testcases in TESTS:
+        cases = []
+        for testcase in testcases:
+            if test_idx % total == index:
+                cases.append(testcase)
+            test_idx += 1
+        if cases:
+            suites.append((suite, cases))
+
+    failures = 0
+    lines = []
+    for suite, cases in suites:
+        suite_failures = sum((suite, case) in FAILING for case in cases)
+        failures += suite_failures
+        lines.append(
+            '  <testsuite name="{}" tests="{}" failures="{}" disabled="0"'
+            ' errors="0" time="0.001">'.format(
+                suite, len(cases), suite_failures))
+        for case in cases:
+            print('[ RUN      ] {}.{}'.format(suite, case))
+            if (suite, case) in FAILING:
+                lines.append(
+                    '    <testcase name="{}" status="run" time="0"'
+                    ' classname="{}"><failure message="Failed">'
+                    'Expected equality</failure></testcase>'.format(
+                        case, suite))
+            else:
+                lines.append(
+                    '    <testcase name="{}" status="run" time="0"'
+                    ' classname="{}" />'.format(case, suite))
+        lines.append('  </testsuite>')
+
+    with open(xml_path, 'w') as xml_file:
+        xml_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        xml_file.write(
+            '<testsuites tests="{}" failures="{}" disabled="0" errors="0"'
+            ' time="0.002" name="AllTests">\n'.format(
+                sum(len(cases) for _, cases in suites), failures))
+        xml_file.write('\n'.join(lines))
+        xml_file.write('\n</testsuites>\n')
+    return 1 if failures else 0
+
+
+def main(args):
+    if '--gtest_list_tests' in args:
+        list_tests()
+        return 0
+    for arg in args:
+        if arg.startswith('--gtest_output=xml:'):
+            return run_tests(arg[len('--gtest_output=xml:'):])
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,27 @@
+"""Tests run by the PyTest test runner, not collected by the test suite."""
+import pytest
+
+
+def test_passes(result):
+    """Passing test."""
+    result.equal(1, 1, description='equal')
+
+
+def test_fails():
+    assert 1 == 2
+
+
+@pytest.mark.skip(reason='Always skipped')
+def test_skipped():
+    pass
+
+
+@pytest.mark.parametrize('value', [1, 2, 3])
+def test_params(result, value):
+    result.true(value < 3, description='value < 3')
+
+
+class TestClass(object):
+
+    def test_method(self, result):
+        result.log('method')
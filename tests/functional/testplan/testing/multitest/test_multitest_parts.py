@@ -1,3 +1,5 @@
+import pytest
+from schema import SchemaError
 
 from testplan.testing.multitest import MultiTest, testsuite, testcase
 
@@ -180,3 +182,105 @@ def test_multi_parts_missing_parts():
     assert plan.report.entries[0].entries[1].status == Status.FAILED  # Suite2
     assert 'not all MultiTest parts had been scheduled' in \
            plan.report.entries[0].logs[0]['message']
+
+
+# Suite1 cases 0 to 4 are slow, the rest of the testcases are fast.
+DURATIONS = {
+    'Suite1': dict(
+        [('test_true__val_{}'.format(val), 10 if val < 5 else 1)
+         for val in range(10)]),
+    'Suite2': {'test_false__val_False': 1,
+               'test_false__val_True': 1,
+               'test_false__val_None': 1},
+}
+
+
+def get_cost_mtest(part=None):
+    return MultiTest(name='MTest',
+                     suites=[Suite1(), Suite2()],
+                     part=part,
+                     part_strategy='cost',
+                     part_durations=DURATIONS)
+
+
+def test_multi_parts_cost_merged():
+    """Parts balanced by testcase durations are merged into one report."""
+    plan = Testplan(name='plan', parse_cmdline=False,
+                    merge_scheduled_parts=True)
+    pool = ThreadPool(name='MyPool', size=2)
+    plan.add_resource(pool)
+
+    for idx in range(2):
+        plan.schedule(Task(target=get_cost_mtest(part=(idx, 2))),
+                      resource='MyPool')
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        assert plan.run().run is True
+
+    assert len(plan.report.entries) == 1
+    assert plan.report.entries[0].name == 'MTest'
+    assert len(plan.report.entries[0].entries[0].entries[0].entries) == 10
+    assert len(plan.report.entries[0].entries[1].entries[0].entries) == 3
+
+    part_loads = []
+    for idx in range(2):
+        mtest = get_cost_mtest(part=(idx, 2))
+        part_loads.append(sum(
+            DURATIONS[suite.__class__.__name__][testcase.__name__]
+            for suite, testcases in mtest.test_context
+            for testcase in testcases))
+    # Modulo parts would take 34s & 24s
+    assert part_loads == [30, 28]
+
+
+def test_multi_parts_scheduled_by_pool_capacity():
+    """As many parts as the pool runs concurrently are scheduled."""
+    plan = Testplan(name='plan', parse_cmdline=False,
+                    merge_scheduled_parts=True)
+    pool = ThreadPool(name='MyPool', size=4)
+    plan.add_resource(pool)
+
+    uids = plan.schedule_parts(target=get_mtest, part_arg='part_tuple',
+                               resource='MyPool')
+    assert len(uids) == 4
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        assert plan.run().run is True
+
+    assert len(plan.report.entries) == 1
+    assert plan.report.entries[0].name == 'MTest'
+    assert len(plan.report.entries[0].entries[0].entries[0].entries) == 10
+    assert len(plan.report.entries[0].entries[1].entries[0].entries) == 3
+
+
+def test_multi_parts_cost_durations_error(tmpdir):
+    """Unreadable durations are reported, parts are still run."""
+    with pytest.raises(SchemaError):
+        MultiTest(name='MTest', suites=[Suite1()], part=(0, 2),
+                  part_strategy='cost', part_durations='/nonexistent.json')
+
+    durations = tmpdir.join('durations.json')
+    durations.write('not json')
+    mtest = MultiTest(name='MTest', suites=[Suite1(), Suite2()], part=(0, 2),
+                      part_strategy='cost', part_durations=str(durations))
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        mtest.run()
+
+    assert mtest.report.status == Status.ERROR
+    assert 'Failed to load part durations' in mtest.report.logs[0]['message']
+    assert mtest.report.entries
+
+
+def test_multi_parts_scheduled_with_uid():
+    """Each part of a test scheduled with a uid gets its own uid."""
+    plan = Testplan(name='plan', parse_cmdline=False,
+                    merge_scheduled_parts=True)
+    plan.add_resource(ThreadPool(name='MyPool', size=2))
+
+    uids = plan.schedule_parts(target=get_mtest, part_arg='part_tuple',
+                               resource='MyPool', uid='MTest')
+    assert uids == ['MTest_0', 'MTest_1']
+
+    with pytest.raises(ValueError):
+        plan.schedule_parts(target=get_mtest, part_arg='part_tuple',
+                            resource='local_runner')
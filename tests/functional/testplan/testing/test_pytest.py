@@ -0,0 +1,127 @@
+import collections
+import os
+
+import pytest
+
+from testplan import Testplan
+from testplan.common.utils.testing import log_propagation_disabled
+from testplan.common.utils.logger import TESTPLAN_LOGGER
+from testplan.testing.py_test import PyTest, _WorkerReportPlugin
+from testplan.runners.pools import ThreadPool
+from testplan.runners.pools.tasks import Task
+from testplan.report.testing import TestGroupReport, Status
+
+PYTEST_TESTS = os.path.join(
+    os.path.dirname(__file__), 'fixtures', 'pytest', 'pytest_tests.py')
+
+EXPECTED_CASES = [
+    ('test_passes', Status.PASSED),
+    ('test_fails', Status.FAILED),
+    ('test_skipped', Status.SKIPPED),
+    ('test_params', [
+        ('test_params[1]', Status.PASSED),
+        ('test_params[2]', Status.PASSED),
+        ('test_params[3]', Status.FAILED),
+    ]),
+    ('test_method', Status.PASSED),
+]
+
+
+def _report_cases(report):
+    """Testcase names & statuses of the suites of a PyTest report."""
+    cases = []
+    for suite in report:
+        for case in suite:
+            if isinstance(case, TestGroupReport):
+                cases.append((case.name, [(param.name, param.status)
+                                          for param in case]))
+            else:
+                cases.append((case.name, case.status))
+    return cases
+
+
+def _run(plan, run=True):
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        assert plan.run().run is run
+    assert len(plan.report.entries) == 1
+    return plan.report.entries[0]
+
+
+@pytest.mark.parametrize('num_workers', (1, 2, 3))
+def test_pytest_workers(num_workers):
+    """Tests are reported in collection order however they are run."""
+    plan = Testplan(name='plan', parse_cmdline=False)
+    plan.add(PyTest(name='MyPyTest', target=PYTEST_TESTS,
+                    num_workers=num_workers))
+
+    report = _run(plan)
+    assert _report_cases(report) == EXPECTED_CASES
+    # pytest exits with an error code as some tests fail
+    assert report.status == Status.ERROR
+    assert report.counts.passed == 4
+    assert report.counts.failed == 2
+
+    passes = report.entries[0].entries[0]
+    assert passes.description.strip() == 'Passing test.'
+    assert passes.entries[0]['type'] == 'Equal'
+
+
+def test_pytest_parts_merged():
+    """Parts scheduled as tasks on a pool get merged into one report."""
+    plan = Testplan(name='plan', parse_cmdline=False,
+                    merge_scheduled_parts=True)
+    # pytest runs in process, its parts cannot run concurrently in threads.
+    plan.add_resource(ThreadPool(name='MyPool', size=1))
+
+    for idx in range(3):
+        plan.schedule(
+            Task(target=PyTest(name='MyPyTest', target=PYTEST_TESTS,
+                               part=(idx, 3), num_workers=2)),
+            resource='MyPool')
+
+    # Parts in error as some of their tests fail, they are merged anyway
+    report = _run(plan, run=False)
+    assert report.name == 'MyPyTest'
+    assert _report_cases(report) == EXPECTED_CASES
+    assert report.status == Status.ERROR
+
+
+def test_pytest_part():
+    """Only every total-th collected test is run."""
+    plan = Testplan(name='plan', parse_cmdline=False)
+    plan.add(PyTest(name='MyPyTest', target=PYTEST_TESTS, part=(1, 3)))
+
+    report = _run(plan)
+    assert report.name == 'MyPyTest - part(2/3)'
+    assert _report_cases(report) == [
+        ('test_fails', Status.FAILED),
+        ('test_params', [('test_params[2]', Status.PASSED)]),
+    ]
+
+
+def test_pytest_worker_nodeids(tmpdir):
+    """Workers only keep the collected tests of the node ids given."""
+    Item = collections.namedtuple('Item', 'nodeid')
+    deselected = []
+    config = collections.namedtuple('Config', 'hook')(
+        collections.namedtuple('Hook', 'pytest_deselected')(
+            lambda items: deselected.extend(items)))
+
+    with open(str(tmpdir.join('results.jsonl')), 'w') as results:
+        plugin = _WorkerReportPlugin(
+            results, None, None, nodeids={'a.py::test_1', 'a.py::test_3'})
+    items = [Item('a.py::test_{}'.format(idx)) for idx in range(4)]
+    plugin.pytest_collection_modifyitems(config, items)
+    assert items == [Item('a.py::test_1'), Item('a.py::test_3')]
+    assert deselected == [Item('a.py::test_0'), Item('a.py::test_2')]
+
+
+def test_pytest_worker_modules():
+    """Workers only collect the modules of their node ids."""
+    test = PyTest(name='MyPyTest', target=PYTEST_TESTS, select='test_p')
+    test._collect_plugin.rootdir = os.path.join(os.sep, 'root')
+    assert test._module_args(
+        ['a.py::test_1', 'sub/b.py::Suite::test_2[1]', 'a.py::test_3']) == [
+            '--rootdir', os.path.join(os.sep, 'root'), '-k', 'test_p',
+            os.path.join(os.sep, 'root', 'a.py'),
+            os.path.join(os.sep, 'root', 'sub/b.py')]
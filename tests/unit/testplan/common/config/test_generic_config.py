@@ -1,9 +1,10 @@
 """TODO."""
 
+import pickle
 import re
 from schema import Schema, And, Or, Use, SchemaError
 
-from testplan.common.config import Config, ConfigOption
+from testplan.common.config import Config, ConfigOption, DefaultFactory
 from testplan.common.utils.exceptions import should_raise
 
 
@@ -235,3 +236,71 @@ def test_getattr_propagation():
     leaf_4.parent = branch_3
     # foo -> branch default, bar -> branch local, baz -> leaf local
     assert (leaf_4.foo, leaf_4.bar, leaf_4.baz) == (50, 40, 'beta')
+
+
+class ListConfig(Config):
+
+    @classmethod
+    def get_options(cls):
+        return {ConfigOption('items', default=[]): list}
+
+
+def test_resolved_attribute_cache():
+    """
+        Resolved values are cached until the parent of the config, or of
+        one of its ancestors, is set.
+    """
+    root = Root(bar=1)
+    branch = Branch()
+    leaf = Leaf()
+    leaf.parent = branch
+    assert leaf.bar == 30
+    assert leaf.__dict__['bar'] == 30
+
+    branch.parent = root
+    assert 'bar' not in leaf.__dict__
+    assert leaf.bar == 1
+
+    leaf.set_local('bar', 7)
+    assert leaf.bar == 7
+
+    restored = pickle.loads(pickle.dumps(leaf))
+    assert 'bar' not in restored.__dict__
+    assert (restored.foo, restored.bar) == (50, 7)
+
+    assert ListConfig._compiled_schema() is ListConfig._compiled_schema()
+    first, second = ListConfig(), ListConfig()
+    first.items.append(1)
+    assert second.items == []
+
+
+SEEDS = iter(range(1000))
+
+
+class Seeded(object):
+    """Default instance of an option."""
+
+
+class DefaultsConfig(Config):
+
+    @classmethod
+    def get_options(cls):
+        return {
+            ConfigOption('name', default='name'): str,
+            ConfigOption('instance', default=Seeded()): Seeded,
+            ConfigOption('nested', default={'items': []}): dict,
+            ConfigOption('seed', default=DefaultFactory(
+                lambda: next(SEEDS))): int,
+        }
+
+
+def test_instance_defaults():
+    """Defaults that are not immutable are created for each config."""
+    first, second = DefaultsConfig(), DefaultsConfig()
+    assert first.name is second.name
+    assert first.instance is not second.instance
+    assert isinstance(first.instance, Seeded)
+    first.nested['items'].append(1)
+    assert second.nested == {'items': []}
+    assert first.seed != second.seed
+    assert DefaultsConfig(seed=-1).seed == -1
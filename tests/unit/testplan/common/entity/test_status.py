@@ -0,0 +1,41 @@
+import pickle
+import threading
+import time
+
+import pytest
+
+from testplan.common.entity.base import ResourceStatus, StatusTransitionException
+
+
+def test_wait_notified_on_change():
+    """`EntityStatus.wait` should wake up as soon as the status changes."""
+    status = ResourceStatus()
+    status.change(status.STARTING)
+
+    timer = threading.Timer(0.05, status.change, args=(status.STARTED,))
+    timer.start()
+    started = time.time()
+    assert status.wait(status.STARTED, timeout=5) is True
+    assert time.time() - started < 2
+    timer.join()
+
+
+def test_wait_timeout():
+    status = ResourceStatus()
+    assert status.wait(status.STARTED, timeout=0.05) is False
+
+
+def test_illegal_change():
+    status = ResourceStatus()
+    with pytest.raises(StatusTransitionException):
+        status.change(status.STOPPED)
+    assert status.tag is None
+
+
+def test_pickle():
+    status = ResourceStatus()
+    status.change(status.STARTING)
+    loaded = pickle.loads(pickle.dumps(status))
+    assert loaded.tag == status.STARTING
+    loaded.change(loaded.STARTED)
+    assert loaded.wait(loaded.STARTED, timeout=0) is True
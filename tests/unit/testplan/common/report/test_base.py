@@ -1,12 +1,16 @@
+import copy
+import gc
 import logging
 import functools
 import re
+import weakref
 
 import pytest
 import mock
 
 from testplan.common import report
-from testplan.common.report.log import LOGGER
+from testplan.common.report.log import LOGGER, ReportLogRecord
+from testplan.common.report.schemas import ReportLogSchema
 
 from testplan.common.utils.testing import disable_log_propagation
 
@@ -47,6 +51,70 @@ def test_exception_logger_reraise():
             raise KeyError('bar')  # raised
 
 
+@disable_log_propagation(LOGGER)
+def test_report_logs_compact_records():
+    """Log records are materialized as dicts only on serialization."""
+    rep = DummyReport()
+    rep.logger.warning('foo %s', 'bar')
+
+    record = rep.logs[0]
+    assert isinstance(record, ReportLogRecord)
+    assert record['message'] == 'foo bar'
+    assert record['levelname'] == 'WARNING'
+    assert record['created'].tzinfo is not None
+
+    data = ReportLogSchema(strict=True).dump(record).data
+    assert data['message'] == 'foo bar'
+    assert data['uid'] == str(record['uid'])
+
+    # Copies share the uid so that merging them is idempotent
+    copied = copy.deepcopy(rep)
+    assert copied.logs == rep.logs
+    rep.merge(copied)
+    assert len(rep.logs) == 1
+
+
+@disable_log_propagation(LOGGER)
+def test_report_logging_does_not_leak():
+    """Reports that logged messages are freed with their log records."""
+    def create_reports(count):
+        refs = []
+        for idx in range(count):
+            rep = DummyReport()
+            rep.logger.info('message %d', idx)
+            refs.append(weakref.ref(rep))
+        return refs
+
+    # Warm up caches of the logging module & report classes
+    create_reports(100)
+
+    tracemalloc = pytest.importorskip('tracemalloc')
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        refs = create_reports(5000)
+        gc.collect()
+        leaked = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    assert not any(ref() is not None for ref in refs)
+    # The weak references only, not the reports and their records
+    assert leaked < 5000 * 200
+
+
+@disable_log_propagation(LOGGER)
+def test_report_logger_of_freed_report():
+    """Messages logged through the logger of a freed report are dropped."""
+    logger = DummyReport().logger
+    gc.collect()
+    reports = [DummyReport() for _ in range(100)]
+
+    logger.error('foo')
+    assert not any(rep.logs for rep in reports)
+
+
 class TestReport(object):
 
     def test_equality(self):
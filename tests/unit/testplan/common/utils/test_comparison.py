@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from testplan.common.utils import comparison as cmp
 
@@ -91,3 +93,108 @@ def test_comparator_composition(
 ):
     assert composed_callable(value) == expected
     assert str(composed_callable) == description
+
+
+MATCH_CASES = (
+    ({'a': 1, 'b': 'x'}, {'a': 1, 'b': 'x'}),
+    ({'a': 1, 'b': 'x'}, {'a': 1, 'b': 'y'}),
+    ({'a': 1}, {'a': 1, 'b': 2}),
+    ({'a': 1, 'b': None}, {'a': 1}),
+    ({'a': [1, 2, {'c': 3}]}, {'a': [1, 2, {'c': 3}]}),
+    ({'a': [1, 2, {'c': 3}]}, {'a': [1, 2, {'c': 4}]}),
+    ({'a': [1, 2]}, {'a': [1, 2, 3]}),
+    ({'a': [1, 2]}, {'a': (1, 2)}),
+    ({'a': {'b': {'c': 1}}}, {'a': {'b': {'c': 1.0}}}),
+    ({'a': float('nan')}, {'a': float('nan')}),
+    ({'a': 5, 'b': 'abc'}, {'a': cmp.Greater(2), 'b': re.compile('a.c')}),
+    ({'a': 1, 'b': 'abd'}, {'a': cmp.Greater(2), 'b': re.compile('a.c')}),
+    ({'a': [{'b': 1}, {'b': 5}]}, {'a': [{'b': 1}, {'b': cmp.Less(3)}]}),
+    ({'a': 'text'}, {'a': cmp.Greater(2)}),
+    ({'a': {'b': 1, 'c': 2}}, {'a': {'b': 1, 'c': 3}}),
+    ({'a': 1}, {'a': [1]}),
+)
+
+
+@pytest.mark.parametrize('lhs,rhs', MATCH_CASES)
+@pytest.mark.parametrize(
+    'ignore,only', (([], None), (['c'], None), ([], ['a', 'c'])))
+@pytest.mark.parametrize('value_cmp_func', cmp.COMPARE_FUNCTIONS.values())
+def test_match_without_results(lhs, rhs, ignore, only, value_cmp_func):
+    """
+    Matching without building results agrees with the full comparison,
+    unless it depends on callables which are not called.
+    """
+    match, _ = cmp._cmp_dicts(
+        lhs, rhs, ignore, only, cmp.ReportOptions.ALL, value_cmp_func)
+    shortcut = cmp._can_shortcut(ignore, only, value_cmp_func)
+    for compiled in (False, True):
+        expected = cmp.compile_dict(rhs) if compiled else rhs
+        assert cmp._match_dicts(
+            lhs, expected, ignore, only, value_cmp_func, shortcut) in (
+                match, None)
+
+
+@pytest.mark.parametrize('lhs,rhs', MATCH_CASES)
+@pytest.mark.parametrize('report_mode', list(cmp.ReportOptions))
+def test_compiled_dict_compare(lhs, rhs, report_mode):
+    """Compiled expected dicts are reported like the dicts themselves."""
+    expected = cmp.compare(lhs, rhs, report_mode=report_mode)
+    compiled = cmp.compile_dict(rhs)
+    assert cmp.compare(lhs, compiled, report_mode=report_mode) == expected
+    assert cmp.compare(compiled, lhs, report_mode=report_mode)[0] == \
+        expected[0]
+
+
+def test_fails_only_formats_failures(monkeypatch):
+    """Passing keys are not formatted when only failures are reported."""
+    lhs = {'a': 1, 'b': [1, 2, {'c': 'x'}], 'd': 'y', 'e': 5}
+    rhs = {'a': 1, 'b': [1, 2, {'c': 'x'}], 'd': 'z', 'e': cmp.Greater(2)}
+    formatted = []
+    original_fmt = cmp.fmt
+
+    def fmt(obj):
+        formatted.append(obj)
+        return original_fmt(obj)
+
+    monkeypatch.setattr(cmp, 'fmt', fmt)
+
+    passed, comparisons = cmp.compare(
+        lhs, cmp.compile_dict(rhs), report_mode=cmp.ReportOptions.FAILS_ONLY)
+
+    assert not passed
+    assert comparisons == [('d', 'f', (0, 'str', 'y'), (0, 'str', 'z'))]
+    # Keys matched by callables are compared fully
+    assert formatted == ['y', 'z', 5]
+
+
+def test_fails_only_calls_callables_once():
+    """Callables are called once whether their key fails or not."""
+    calls = []
+
+    def is_even(value):
+        calls.append(value)
+        return value % 2 == 0
+
+    lhs = {'a': 2, 'b': [1, {'c': 3}], 'd': 'x'}
+    rhs = {'a': is_even, 'b': [1, {'c': is_even}], 'd': 'x'}
+    passed, comparisons = cmp.compare(
+        lhs, cmp.compile_dict(rhs), report_mode=cmp.ReportOptions.FAILS_ONLY)
+
+    assert not passed
+    assert [comparison[0] for comparison in comparisons] == ['b']
+    assert calls == [2, 3]
+
+
+def test_compiled_dict():
+    data = {'a': 1, 'b': {'c': cmp.Less(2), 'd': [1, 2]}, 'e': [{'f': 1}]}
+    compiled = cmp.compile_dict(data)
+
+    assert cmp.compile_dict(compiled) is compiled
+    assert compiled.is_plain('a') and compiled.is_plain('e')
+    assert not compiled.is_plain('b')
+    assert isinstance(compiled['b'], cmp.CompiledDict)
+    assert compiled['b'].is_plain('d')
+    assert compiled['e'] is data['e']
+    assert list(compiled) == list(data) and len(compiled) == 3
+    assert 'a' in compiled and 'x' not in compiled
+    assert compiled.typed_values is False
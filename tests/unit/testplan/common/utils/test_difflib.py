@@ -0,0 +1,139 @@
+import itertools
+import random
+
+import pytest
+
+from testplan.common.utils import difflib
+
+
+def _apply(a, b, opcodes):
+    """Rebuild ``b`` from ``a`` and the opcodes turning it into ``b``."""
+    rebuilt = []
+    for tag, alo, ahi, blo, bhi in opcodes:
+        if tag == 'equal':
+            assert a[alo:ahi] == b[blo:bhi]
+            rebuilt.extend(a[alo:ahi])
+        else:
+            rebuilt.extend(b[blo:bhi])
+    return rebuilt
+
+
+def _lcs_length(a, b):
+    lengths = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i, j in itertools.product(range(len(a)), range(len(b))):
+        lengths[i + 1][j + 1] = lengths[i][j] + 1 if a[i] == b[j] else \
+            max(lengths[i][j + 1], lengths[i + 1][j])
+    return lengths[len(a)][len(b)]
+
+
+def test_myers_shortest_edit():
+    """Myers' algorithm matches a longest common subsequence."""
+    rand = random.Random(0)
+    for _ in range(500):
+        a = [rand.choice('abc') for _ in range(rand.randint(0, 10))]
+        b = [rand.choice('abc') for _ in range(rand.randint(0, 10))]
+        blocks, cost = difflib._myers_blocks(
+            a, b, 0, len(a), 0, len(b), len(a) + len(b))
+        matched = sum(size for _, _, size in blocks)
+        assert matched == _lcs_length(a, b)
+        assert cost == len(a) + len(b) - 2 * matched
+        for i, j, size in blocks:
+            assert a[i:i + size] == b[j:j + size]
+
+        capped, capped_cost = difflib._myers_blocks(
+            a, b, 0, len(a), 0, len(b), 2)
+        assert (capped is None) is (cost > 2)
+        assert capped_cost == min(cost, 2)
+
+
+@pytest.mark.parametrize('max_cost', (0, 3, 1000))
+def test_patience_matcher(max_cost):
+    """Opcodes are valid whatever the edit budget."""
+    rand = random.Random(1)
+    for _ in range(300):
+        a = [rand.choice('abcdef') for _ in range(rand.randint(0, 30))]
+        b = [rand.choice('abcdef') for _ in range(rand.randint(0, 30))]
+        matcher = difflib.PatienceMatcher(a, b, max_cost=max_cost)
+        assert _apply(a, b, matcher.get_opcodes()) == b
+
+
+def test_patience_matcher_anchors():
+    """Unique lines anchor the match, coarse blocks once over budget."""
+    a = ['x', 'head', 'y', 'y', 'middle', 'z', 'tail']
+    b = ['head', 'z', 'y', 'middle', 'y', 'tail', 'x']
+    assert difflib.PatienceMatcher(a, b).get_opcodes() == [
+        # 'head', 'z' & 'tail' are the longest sequence of unique lines
+        ('delete', 0, 1, 0, 0),
+        ('equal', 1, 2, 0, 1),
+        ('delete', 2, 5, 1, 1),
+        ('equal', 5, 6, 1, 2),
+        ('insert', 6, 6, 2, 5),
+        ('equal', 6, 7, 5, 6),
+        ('insert', 7, 7, 6, 7),
+    ]
+
+    a = ['a', 'b', 'a', 'b']
+    b = ['b', 'a', 'b', 'a']
+    assert difflib.PatienceMatcher(a, b, max_cost=1).get_opcodes() == [
+        ('replace', 0, 4, 0, 4)]
+    assert difflib.PatienceMatcher(a, b, max_cost=2).get_opcodes() == [
+        ('delete', 0, 1, 0, 0),
+        ('equal', 1, 4, 0, 3),
+        ('insert', 4, 4, 3, 4),
+    ]
+
+
+@pytest.mark.parametrize('unified,context', (
+    (False, False), (True, False), (False, True)))
+def test_diff_large_texts(unified, context):
+    """Texts over the threshold are diffed with the patience engine."""
+    first = ['line {}\n'.format(idx) for idx in range(3000)]
+    second = list(first)
+    second[10] = 'changed\n'
+    second[2000:2001] = []
+    second[2500] = 'line   2501\n'
+
+    def diff(first, second, **options):
+        return list(difflib.diff(
+            first, second, unified=unified, context=context, **options))
+
+    delta = diff(first, second)
+    assert delta
+    assert any('changed' in line for line in delta)
+    assert any('line 2000' in line for line in delta)
+    assert any('line   2501' in line for line in delta)
+    assert not any('line 1500' in line for line in delta)
+
+    # The changed line only differs by spaces from the original one.
+    ignored = diff(first, second, ignore_space_change=True)
+    assert any('changed' in line for line in ignored)
+    assert len(ignored) < len(delta)
+
+    assert diff(first, list(first), ignore_whitespaces=True) == []
+
+
+def test_differ_threshold():
+    """The patience engine can be forced on small texts."""
+    a = ['one\n', 'two\n', 'three\n']
+    b = ['ore\n', 'three\n', 'emu\n']
+    for threshold in (0, difflib.PATIENCE_THRESHOLD):
+        differ = difflib.Differ(
+            linejunk=difflib.IS_LINE_JUNK, patience_threshold=threshold)
+        assert list(differ.get_merged_opcodes(a, b)) == [
+            ('replace', 0, 2, 0, 1),
+            ('equal', 2, 3, 1, 2),
+            ('insert', 3, 3, 2, 3),
+        ]
+
+
+def test_differ_threshold_ignore_spaces():
+    """Both engines search similar lines ignoring spaces."""
+    a = ['abc  def\n', 'abc def\n']
+    b = ['abc deg\n']
+    for threshold in (0, difflib.PATIENCE_THRESHOLD):
+        differ = difflib.Differ(
+            ignore_space_change=True, patience_threshold=threshold)
+        assert list(differ.get_opcodes(a, b)) == [
+            ('replace', 0, 1, 0, 1),
+            ('delete', 1, 2, 1, 1),
+        ]
@@ -0,0 +1,38 @@
+from lxml import etree
+
+from testplan.common.utils.junit_xml import merge_xml
+
+
+def test_merge_xml(tmpdir):
+    paths = []
+    for idx, xml in enumerate((
+        '<testsuites tests="2" failures="1" time="1.5">'
+        '<testsuite name="B" tests="1" failures="1" time="1.5">'
+        '<testcase name="b2"><failure message="boom"/></testcase>'
+        '</testsuite>'
+        '<testsuite name="A" tests="1" failures="0" time="0">'
+        '<testcase name="a1"/></testsuite>'
+        '</testsuites>',
+        '<testsuites tests="2" failures="0" time="2">'
+        '<testsuite name="A" tests="1" failures="0" time="1">'
+        '<testcase name="a2"/></testsuite>'
+        '<testsuite name="B" tests="1" failures="0" time="2">'
+        '<testcase name="b1"/></testsuite>'
+        '</testsuites>',
+    )):
+        path = tmpdir.join('{}.xml'.format(idx))
+        path.write(xml)
+        paths.append(path.strpath)
+    test_context = [('A', ['a1', 'a2']), ('B', ['b1', 'b2'])]
+    output_path = tmpdir.join('merged.xml').strpath
+
+    merge_xml(paths, output_path, test_context)
+
+    root = etree.parse(output_path).getroot()
+    assert (root.get('tests'), root.get('failures'), root.get('time')) == (
+        '4', '1', '2.0')
+    assert [(suite.get('name'), [case.get('name') for case in suite])
+            for suite in root] == [('A', ['a1', 'a2']), ('B', ['b1', 'b2'])]
+    suite_b = root[1]
+    assert (suite_b.get('tests'), suite_b.get('time')) == ('2', '3.5')
+    assert suite_b[1][0].get('message') == 'boom'
@@ -0,0 +1,97 @@
+import os
+
+from testplan.common.utils import path
+
+
+def test_cached_copy(tmpdir):
+    source = tmpdir.join('binary')
+    source.write('content')
+    source.chmod(0o755)
+    cache_dir = str(tmpdir.join('cache'))
+
+    targets = [str(tmpdir.join('target{}'.format(idx))) for idx in range(2)]
+    for target in targets:
+        path.cached_copy(str(source), target, cache_dir)
+
+    entries = os.listdir(cache_dir)
+    assert entries == [path.file_digest(str(source))]
+    entry = os.path.join(cache_dir, entries[0])
+    for target in targets:
+        assert os.path.samefile(target, entry)
+        assert os.access(target, os.X_OK)
+
+    # Changed content gets its own entry, existing targets are replaced.
+    source.write('new content')
+    path.cached_copy(str(source), targets[0], cache_dir)
+    assert len(os.listdir(cache_dir)) == 2
+    assert open(targets[0]).read() == 'new content'
+    assert open(targets[1]).read() == 'content'
+
+
+def test_file_digest(tmpdir, monkeypatch):
+    monkeypatch.setattr(path, '_DIGESTS', {})
+    monkeypatch.setattr(path, 'MAX_DIGESTS', 2)
+    sources = [tmpdir.join('file{}'.format(idx)) for idx in range(3)]
+    for idx, source in enumerate(sources):
+        source.write('content{}'.format(idx))
+
+    digest = path.file_digest(str(sources[0]))
+    sources[0].write('new content')
+    assert path.file_digest(str(sources[0])) != digest
+    assert len(path._DIGESTS) == 1
+
+    # The digests are dropped once there are too many files.
+    for source in sources:
+        path.file_digest(str(source))
+    assert len(path._DIGESTS) == 1
+
+
+def test_render_template(tmpdir, monkeypatch):
+    template = tmpdir.join('config.yaml')
+    template.write(
+        'port: {{port}}\n'
+        '{{for idx in range(count)}}item{{idx}} {{endfor}}\n'
+        '{{if name}}name: {{name.upper()}}{{endif}}\n')
+
+    substituted = []
+    substitute = path.Template.substitute
+
+    def counting_substitute(self, *args, **kwargs):
+        substituted.append(args)
+        return substitute(self, *args, **kwargs)
+
+    monkeypatch.setattr(path.Template, 'substitute', counting_substitute)
+
+    values = dict(port=80, count=2, name='a', other=object())
+    expected = 'port: 80\nitem0 item1 \nname: A\n'
+    assert path.render_template(str(template), dict(values)) == expected
+    assert path.render_template(str(template), dict(values)) == expected
+    assert len(substituted) == 1
+
+    # Values of referenced names are part of the key, with their type.
+    values['port'] = 81
+    assert path.render_template(str(template), dict(values)).startswith(
+        'port: 81')
+    values['count'] = True
+    assert path.render_template(str(template), dict(values)).startswith(
+        'port: 81\nitem0 \n')
+    assert len(substituted) == 3
+
+    # Templates referencing objects are rendered every time.
+    template.write('port: {{server.port}}\n')
+    server = type('Server', (object,), {'port': 80})()
+    for port in (80, 81):
+        server.port = port
+        assert path.render_template(
+            str(template), {'server': server}) == 'port: {}\n'.format(port)
+    assert len(substituted) == 5
+
+
+def test_instantiate(tmpdir):
+    template = tmpdir.join('template.txt')
+    template.write('{{py:value = 2 * value}}value={{value}}')
+    target = tmpdir.mkdir('etc')
+    for value in (1, 2):
+        path.instantiate(str(template), {'value': value}, str(target))
+        assert target.join('template.txt').read() == \
+            'value={}'.format(2 * value)
@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+from testplan.common.utils import profiling
+
+
+def _busy(seconds):
+    end = time.time() + seconds
+    while time.time() < end:
+        sum(range(100))
+
+
+def test_timings():
+    timings = profiling.Timings()
+    with timings.record(profiling.TESTCASE, 'busy'):
+        _busy(0.05)
+    with timings.record(profiling.TESTCASE, 'idle'):
+        time.sleep(0.05)
+
+    busy, idle = timings.to_list()
+    assert (busy['kind'], busy['name']) == (profiling.TESTCASE, 'busy')
+    assert busy['wall'] >= 0.05 and busy['cpu'] >= 0.025
+    assert idle['wall'] >= 0.05 and idle['cpu'] < 0.025
+
+
+def test_timings_cpu_of_thread():
+    """CPU time of other threads is not counted."""
+    timings = profiling.Timings()
+    thread = threading.Thread(target=_busy, args=(0.1,))
+    with timings.record(profiling.DRIVER, 'wait'):
+        thread.start()
+        thread.join()
+    assert timings.to_list()[0]['cpu'] < 0.05
+
+
+@pytest.mark.parametrize('profiler', profiling.PROFILERS)
+def test_scoped_profiler(tmpdir, profiler):
+    with profiling.ScopedProfiler(profiler) as scoped:
+        _busy(0.2)
+
+    hotspots = scoped.hotspots(top=2)
+    assert len(hotspots) <= 2
+    assert any(hotspot['function'].startswith('_busy (test_profiling.py')
+               for hotspot in hotspots)
+    assert all(hotspot['self'] <= hotspot['cumulative']
+               for hotspot in hotspots)
+
+    path = scoped.save(str(tmpdir), 'Suite:case')
+    assert path.startswith(str(tmpdir.join('suite-case.')))
+    if profiler == profiling.SAMPLING:
+        stacks = {}
+        for line in tmpdir.join('suite-case.collapsed').readlines():
+            stack, count = line.rsplit(' ', 1)
+            stacks[stack] = int(count)
+        busy = [count for stack, count in stacks.items()
+                if stack.endswith(';_busy (test_profiling.py:9)')]
+        assert sum(busy) > sum(stacks.values()) / 2
+
+
+def test_profiling_pattern(tmpdir):
+    prof = profiling.Profiling(
+        timings=True, pattern='Suite:case_*', directory=str(tmpdir))
+    for suite, case in (('Suite', 'case_1'), ('Other', 'case_2')):
+        with prof.testcase(suite, case):
+            _busy(0.01)
+    with prof.step(profiling.SUITE, 'Suite'):
+        pass
+
+    data = prof.to_dict()
+    assert [timing['name'] for timing in data['timings']] == [
+        'Suite:case_1', 'Other:case_2', 'Suite']
+    assert list(data['profiles']) == ['Suite:case_1']
+    assert tmpdir.join('suite-case_1.pstat').check()
+
+    assert profiling.Profiling(pattern='case_*').matches('Other', 'case_2')
+    assert profiling.Profiling().to_dict() is None
+
+
+def test_merge_profile():
+    def profile(name):
+        return {'timings': [{'kind': 'testcase', 'name': name}],
+                'profiles': {name: {'path': name}}}
+
+    assert profiling.merge_profile(None, profile('a')) == profile('a')
+    assert profiling.merge_profile(profile('a'), None) == profile('a')
+    merged = profiling.merge_profile(profile('a'), profile('b'))
+    assert [timing['name'] for timing in merged['timings']] == ['a', 'b']
+    assert sorted(merged['profiles']) == ['a', 'b']
+
+
+def test_merge_profile_twice():
+    """Timings of a profile merged again are not duplicated."""
+    def profile(name, start):
+        return {'timings': [{'kind': 'testcase', 'name': name,
+                             'start': start}],
+                'profiles': {}}
+
+    merged = profiling.merge_profile(profile('a', 1.0), profile('b', 2.0))
+    merged = profiling.merge_profile(merged, profile('b', 2.0))
+    assert [timing['name'] for timing in merged['timings']] == ['a', 'b']
+    # The same step run again is another timing
+    merged = profiling.merge_profile(merged, profile('b', 3.0))
+    assert [timing['name'] for timing in merged['timings']] == ['a', 'b', 'b']
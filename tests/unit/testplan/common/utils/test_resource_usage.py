@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+import time
+
+from testplan.common.utils import resource_usage
+from testplan.common.utils.process import kill_process
+
+
+def test_sampler_sums_children():
+    """Children of recursive targets are sampled along with them."""
+    proc = subprocess.Popen(
+        [sys.executable, '-c',
+         'import subprocess, sys, time;'
+         'subprocess.Popen([sys.executable, "-c", "import time;'
+         ' time.sleep(30)"]); time.sleep(30)'])
+    try:
+        sampler = resource_usage.ResourceSampler(
+            lambda: [('own', os.getpid(), False), ('app', proc.pid, True),
+                     ('missing', None, True)],
+            interval=0.05)
+        sampler.start()
+        try:
+            time.sleep(0.5)
+        finally:
+            sampler.stop()
+    finally:
+        kill_process(proc)
+
+    usage = sampler.to_dict()
+    assert usage['fields'] == ['time'] + list(resource_usage.FIELDS)
+    assert set(usage['processes']) == {'own', 'app'}
+
+    app = usage['processes']['app']
+    assert app['pid'] == proc.pid
+    assert len(app['samples']) > 1
+    # Two interpreters (parent & its child) take more than one
+    assert app['summary']['num_threads']['peak'] >= 2
+    assert app['summary']['rss']['peak'] > 0
+    for sample in app['samples']:
+        assert len(sample) == len(usage['fields'])
+
+
+def test_series_thinning(monkeypatch):
+    """Series are thinned out but summaries use all samples."""
+    monkeypatch.setattr(resource_usage, 'MAX_SAMPLES', 10)
+    series = resource_usage.ProcessSeries(pid=1)
+    for idx in range(100):
+        series.add(idx, [idx, 2 * idx, 3, 4])
+
+    assert len(series.samples) <= 10
+    assert series.samples[0] == [0, 0, 0, 3, 4]
+    times = [sample[0] for sample in series.samples]
+    assert times == sorted(times)
+    assert series.summary() == {
+        'cpu_percent': {'peak': 99, 'avg': 49.5},
+        'rss': {'peak': 198, 'avg': 99.0},
+        'num_fds': {'peak': 3, 'avg': 3.0},
+        'num_threads': {'peak': 4, 'avg': 4.0},
+    }
+
+
+def test_merge_resource_usage():
+    usage = {'interval': 1, 'fields': [], 'processes': {'a': {'pid': 1}}}
+    other = {'interval': 1, 'fields': [], 'processes': {'b': {'pid': 2}}}
+
+    assert resource_usage.merge_resource_usage(None, other) is other
+    assert resource_usage.merge_resource_usage(usage, None) is usage
+    merged = resource_usage.merge_resource_usage(usage, other)
+    assert merged['processes'] == {'a': {'pid': 1}, 'b': {'pid': 2}}
+    assert usage['processes'] == {'a': {'pid': 1}}
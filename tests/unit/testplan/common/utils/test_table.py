@@ -1,5 +1,6 @@
 import pytest
-from testplan.common.utils.table import TableEntry
+from testplan.common.utils.table import (
+    TableEntry, iter_as_dict, iter_as_list_of_dict)
 
 
 class TestTableEntry(object):
@@ -31,3 +32,24 @@ class TestTableEntry(object):
     )
     def test_validation_success(self, value):
         TableEntry(value)
+
+
+def test_iter_as_list_of_dict():
+    rows = iter([('foo', 'bar'), (1, 2), (3, 4)])
+    table = iter_as_list_of_dict(rows, keep_column_order=True)
+    assert table == TableEntry(
+        [['foo', 'bar'], [1, 2], [3, 4]]).as_list_of_dict()
+    assert list(table[0].keys()) == ['foo', 'bar']
+    assert iter_as_list_of_dict(iter([])) == []
+
+    with pytest.raises(TypeError):
+        iter_as_list_of_dict(iter([[1, 2], [3, 4]]))
+
+
+def test_iter_as_dict():
+    def rows():
+        yield ['foo', 'bar']
+        yield (1, 2)
+        raise AssertionError('Rows are consumed one at a time')
+
+    assert next(iter_as_dict(rows())) == {'foo': 1, 'bar': 2}
@@ -0,0 +1,25 @@
+import threading
+import time
+
+from testplan.common.utils.thread import DaemonThreadPoolExecutor
+
+
+def test_daemon_executor_reuses_idle_threads():
+    """Threads are only started when no worker is idle."""
+    executor = DaemonThreadPoolExecutor(4, 'Worker')
+    try:
+        for idx in range(10):
+            assert executor.submit(lambda x: x * 2, idx).result() == idx * 2
+            # The worker is idle shortly after setting the result
+            time.sleep(0.05)
+        assert len(executor.threads) == 1
+
+        release = threading.Event()
+        blocked = [executor.submit(release.wait) for _ in range(3)]
+        release.set()
+        assert all(future.result() for future in blocked)
+        assert 1 < len(executor.threads) <= 4
+        assert all(thread.daemon and thread.name.startswith('Worker_')
+                   for thread in executor.threads)
+    finally:
+        executor.shutdown()
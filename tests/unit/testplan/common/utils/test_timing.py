@@ -3,7 +3,8 @@ import datetime
 
 import pytest
 
-from testplan.common.utils.timing import Interval, Timer, utcnow
+from testplan.common.utils.timing import (
+    Interval, Timer, utcnow, wait, TimeoutException)
 
 
 def test_interval():
@@ -94,3 +95,27 @@ class TestTimer(object):
 
         # TODO check why 1 (sleep_durtion) <= 0.9999 (elapsed)
         # assert sleep_duration <= timer['my_key'].elapsed <= sleep_duration + sleeper_delta
+
+
+class TestWait(object):
+
+    def test_backoff(self):
+        """`wait` should start polling fast and back off up to `interval`."""
+        checks = []
+
+        def predicate():
+            checks.append(time.time())
+            return len(checks) == 6
+
+        assert wait(predicate, timeout=5, interval=0.008,
+                    min_interval=0.001) is True
+        gaps = [end - start for start, end in zip(checks, checks[1:])]
+        # 0.001, 0.002, 0.004, 0.008, 0.008
+        assert gaps[0] < gaps[-1]
+        assert sum(gaps) < 1
+
+    def test_timeout(self):
+        """`wait` should return the predicate result or raise on timeout."""
+        assert wait(lambda: False, timeout=0.05) is False
+        with pytest.raises(TimeoutException):
+            wait(lambda: False, timeout=0.05, raise_on_timeout=True)
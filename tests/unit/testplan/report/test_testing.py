@@ -7,7 +7,8 @@ from testplan.common.utils.testing import disable_log_propagation
 
 from testplan.report.testing.base import (
     Status, BaseReportGroup, TestCaseReport, TestGroupReport, TestReport)
-from testplan.report.testing.schemas import TestReportSchema
+from testplan.report.testing.schemas import (
+    TestReportSchema, SerializationCache, serialization_cache)
 from testplan.common import report
 from testplan.common.utils.testing import check_report
 
@@ -150,6 +151,39 @@ class TestBaseReportGroup(object):
         assert parent_orig.entries == [child_orig_1, child_clone_2]
 
 
+def test_group_report_merge_resource_usage():
+    """Resource usage of the processes of both groups should be kept."""
+    def usage(label, pid):
+        return {'interval': 1, 'fields': ['time'],
+                'processes': {label: {'pid': pid, 'samples': []}}}
+
+    report_orig = TestGroupReport(name='dummy', uid=0)
+    report_part = TestGroupReport(
+        name='dummy', uid=0, resource_usage=usage('part(0/2)', 1))
+
+    report_orig.merge(report_part)
+    assert report_orig.resource_usage == usage('part(0/2)', 1)
+
+    report_orig.merge(TestGroupReport(
+        name='dummy', uid=0, resource_usage=usage('part(1/2)', 2)))
+    assert sorted(report_orig.resource_usage['processes']) == [
+        'part(0/2)', 'part(1/2)']
+    assert report_part.resource_usage == usage('part(0/2)', 1)
+
+
+def test_group_report_merge_profile_twice():
+    """Merging the same report again should not duplicate its timings."""
+    timing = {'kind': 'testcase', 'name': 'Suite:case', 'start': 1.0,
+              'wall': 0.1, 'cpu': 0.1}
+    report_orig = TestGroupReport(name='dummy', uid=0)
+    report_part = TestGroupReport(
+        name='dummy', uid=0, profile={'timings': [timing], 'profiles': {}})
+
+    report_orig.merge(report_part)
+    report_orig.merge(report_part)
+    assert report_orig.profile['timings'] == [timing]
+
+
 class TestTestCaseReport(object):
 
     @pytest.mark.parametrize(
@@ -281,6 +315,64 @@ def test_report_json_serialization(dummy_test_plan_report):
     check_report(actual=deserialized_report, expected=dummy_test_plan_report)
 
 
+def test_report_serialization_cache(dummy_test_plan_report):
+    """
+    Cached serialization should match the schema and reuse groups & testcases
+    until they are modified, including for filtered clones.
+    """
+    cache = SerializationCache()
+    expected = TestReportSchema(strict=True).dump(dummy_test_plan_report).data
+    data = cache.dump(dummy_test_plan_report)
+    assert data == expected
+
+    group_data = data['entries'][0]
+    assert cache.dump(dummy_test_plan_report)['entries'][0] is group_data
+
+    clone = dummy_test_plan_report.filter(
+        lambda rep: rep.name != 'test_case_3')
+    clone_group = cache.dump(clone)['entries'][0]
+    assert clone_group is not group_data
+    assert clone_group['entries'][0] is group_data['entries'][0]
+    assert clone_group == TestReportSchema(strict=True).dump(clone).data[
+        'entries'][0]
+
+    testcase = dummy_test_plan_report.entries[0].entries[1]
+    testcase.append({'type': 'Log', 'message': 'hello'})
+    group_data = cache.dump(dummy_test_plan_report)['entries'][0]
+    assert group_data['entries'][1]['entries'] == [
+        {'type': 'Log', 'message': 'hello'}]
+    assert group_data['entries'][0] is clone_group['entries'][0]
+    merged = TestCaseReport(name=testcase.name, uid=testcase.uid)
+    merged.append({'type': 'Log', 'message': 'merged'})
+    testcase.merge(merged)
+    assert cache.dump(dummy_test_plan_report)['entries'][0]['entries'][1][
+        'entries'] == [{'type': 'Log', 'message': 'merged'}]
+
+    # A filtered copy and its original changed the same way do not share
+    # serialized testcases.
+    clone = dummy_test_plan_report.filter(lambda rep: True)
+    testcase.append({'type': 'Log', 'message': 'original'})
+    clone.entries[0].entries[1].append({'type': 'Log', 'message': 'clone'})
+    assert cache.dump(dummy_test_plan_report) == TestReportSchema(
+        strict=True).dump(dummy_test_plan_report).data
+    assert cache.dump(clone) == TestReportSchema(strict=True).dump(
+        clone).data
+
+
+def test_report_serialize_with_cache(dummy_test_plan_report):
+    """``TestReport.serialize`` should use the cache of the context."""
+    expected = dummy_test_plan_report.serialize()
+    with serialization_cache() as cache:
+        with serialization_cache() as nested_cache:
+            assert nested_cache is cache
+        data = dummy_test_plan_report.serialize()
+        assert data == expected
+        assert dummy_test_plan_report.serialize()['entries'][0] is \
+            data['entries'][0]
+    assert dummy_test_plan_report.serialize()['entries'][0] is not \
+        data['entries'][0]
+
+
 class TestReportTags(object):
 
     def get_reports(self):
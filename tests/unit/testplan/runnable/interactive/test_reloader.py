@@ -0,0 +1,86 @@
+"""Unit tests for the interactive module reloader."""
+
+import os
+import sys
+import textwrap
+
+import mock
+import pytest
+
+from testplan.runnable.interactive import reloader
+from testplan.runnable.interactive.reloader import (
+    ModuleReloader, scan_imports)
+
+
+PACKAGE_FILES = {
+    '__init__.py': 'from . import helper\n',
+    'helper.py': 'import os\nvalue = 1\n',
+    'suites.py': textwrap.dedent('''
+        import xml.dom
+        from .helper import value
+        from rlpkg import helper as other
+
+        def never_called():
+            from .. import outside
+        '''),
+}
+
+
+@pytest.fixture
+def package(tmpdir):
+    """Importable package ``rlpkg`` in a temporary directory."""
+    pkg_dir = tmpdir.mkdir('rlpkg')
+    for name, source in PACKAGE_FILES.items():
+        pkg_dir.join(name).write(source)
+
+    sys.path.insert(0, tmpdir.strpath)
+    try:
+        import rlpkg.suites  # pylint: disable=import-error,unused-variable
+        yield pkg_dir
+    finally:
+        sys.path.remove(tmpdir.strpath)
+        for name in ('rlpkg', 'rlpkg.helper', 'rlpkg.suites'):
+            sys.modules.pop(name, None)
+
+
+def test_scan_imports(package):
+    """Absolute, dotted & relative imports should be collected."""
+    assert scan_imports(
+        package.join('suites.py').strpath, 'rlpkg.suites') == {
+            'xml', 'xml.dom', 'rlpkg', 'rlpkg.helper', 'rlpkg.helper.value'}
+    assert scan_imports(
+        package.join('__init__.py').strpath, 'rlpkg') == {
+            'rlpkg', 'rlpkg.helper'}
+
+
+def test_scan_imports_syntax_error(tmpdir):
+    """Files which cannot be parsed have no imports."""
+    source = tmpdir.join('broken.py')
+    source.write('import os\ndef broken(:\n')
+    assert scan_imports(source.strpath, 'broken') == set()
+
+
+def test_build_dependencies(package):
+    """Only files changed since the last build should be parsed again."""
+    reloader_obj = ModuleReloader(logger=mock.MagicMock(), extra_deps=[])
+    reloader_obj.reload_dirs = [package.strpath]
+    init, helper, suites = [
+        package.join(name).strpath
+        for name in ('__init__.py', 'helper.py', 'suites.py')]
+
+    with mock.patch.object(
+            reloader, 'scan_imports', wraps=scan_imports) as scan:
+        reloader_obj._build_dependencies()
+        assert scan.call_count == 3
+
+        # Submodules are dependencies of their package, not the other way.
+        assert reloader_obj._dependencies == {
+            init: {helper, suites}, helper: set(), suites: {helper}}
+
+        scan.reset_mock()
+        reloader_obj._build_dependencies()
+        assert scan.call_count == 0
+
+        package.join('suites.py').write('from rlpkg import helper\n# edit\n')
+        reloader_obj._build_dependencies()
+        scan.assert_called_once_with(suites, 'rlpkg.suites')
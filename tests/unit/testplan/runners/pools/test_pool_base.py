@@ -1,9 +1,12 @@
 """TODO."""
 
 import os
+import pickle
 
 from testplan.common.utils.path import default_runpath
-from testplan.runners.pools.base import Pool
+from testplan.runners.pools.base import Pool, strip_streamed_entries
+from testplan.report import TestGroupReport
+from testplan.testing.multitest import MultiTest, testsuite, testcase
 from testplan import Task
 
 from tasks.data.sample_tasks import Runnable
@@ -34,3 +37,167 @@ def test_pool_basic():
            pool.results[task1.uid()].result == 10
     assert pool.get(task2.uid()).result ==\
            pool.results[task2.uid()].result == 30
+
+
+@testsuite
+class FirstSuite(object):
+
+    executed = 0
+
+    @testcase
+    def case(self, env, result):
+        FirstSuite.executed += 1
+        result.true(True)
+
+
+@testsuite
+class SecondSuite(object):
+
+    @testcase
+    def case(self, env, result):
+        result.true(True)
+
+
+def _run_in_pool(task, listener=None):
+    pool = Pool(name='MyPool', size=1, runpath=default_runpath)
+    if listener is not None:
+        pool.set_report_delta_listener(listener)
+    pool.add(task, uid=task.uid())
+    with pool:
+        while pool.ongoing:
+            pass
+    return pool
+
+
+def test_pool_report_deltas():
+    """Completed testsuite reports are streamed to the pool."""
+    deltas = []
+
+    def listener(uid, report):
+        deltas.append((uid, report))
+
+    task = Task(target=MultiTest(
+        name='MTest', suites=[FirstSuite(), SecondSuite()]))
+    pool = _run_in_pool(task, listener=listener)
+
+    assert [uid for uid, _ in deltas] == [task.uid()] * 2
+    assert [[entry.name for entry in report] for _, report in deltas] == [
+        ['FirstSuite'], ['SecondSuite']]
+    assert all(report.name == 'MTest' for _, report in deltas)
+
+    # Partial report is dropped when the task result is received.
+    assert pool.partial_reports == {}
+    assert pool.results[task.uid()].result.report.passed
+
+
+def test_pool_resume_from_partial_report():
+    """Passing testsuites of a partial report are not executed again."""
+    FirstSuite.executed = 0
+    task = Task(target=MultiTest(
+        name='MTest', suites=[FirstSuite(), SecondSuite()]))
+    _run_in_pool(task)
+    assert FirstSuite.executed == 1
+    first_report = task.resume_report.get_by_uid('FirstSuite')
+
+    task = Task(target=MultiTest(
+        name='MTest', suites=[FirstSuite(), SecondSuite()]))
+    task.resume_report = TestGroupReport(
+        name='MTest', uid='MTest', category='multitest',
+        entries=[first_report])
+    pool = _run_in_pool(task)
+
+    assert FirstSuite.executed == 1
+    report = pool.results[task.uid()].result.report
+    assert [entry.name for entry in report] == ['FirstSuite', 'SecondSuite']
+    assert report.get_by_uid('FirstSuite') is first_report
+    assert report.passed
+
+
+def test_pool_result_without_streamed_entries():
+    """Results only carry the testsuites that were not already streamed."""
+    deltas = []
+
+    def listener(uid, report):
+        deltas.append(report)
+
+    task = Task(target=MultiTest(
+        name='MTest', suites=[FirstSuite(), SecondSuite()]))
+    task_result = _run_in_pool(task, listener=listener).results[task.uid()]
+    report = task_result.result.report
+
+    stripped = strip_streamed_entries(task_result, ['FirstSuite'])
+    assert stripped.streamed == ('FirstSuite',)
+    assert stripped.task.resume_report is None
+    assert len(stripped.result.report.get_by_uid('FirstSuite')) == 0
+    assert stripped.result.report.get_by_uid('SecondSuite') is\
+        report.get_by_uid('SecondSuite')
+    # The result of the worker is left untouched.
+    assert len(report.get_by_uid('FirstSuite')) == 1
+    stripped.result.report = pickle.loads(
+        pickle.dumps(stripped.result.report))
+
+    pool = Pool(name='MyPool', size=1, runpath=default_runpath)
+    pool._input[task.uid()] = task
+    pool._merge_report_delta(task.uid(), deltas[0])
+    pool._restore_streamed_entries(task.uid(), stripped)
+
+    restored = stripped.result.report
+    assert stripped.streamed == ()
+    assert [entry.name for entry in restored] == ['FirstSuite', 'SecondSuite']
+    assert restored.get_by_uid('FirstSuite') is deltas[0].entries[0]
+    assert restored.passed
+
+
+def test_remote_child_copies_xml_to_runpath(tmpdir):
+    """
+    Remote workers copy the XML file a report was parsed from into their
+    runpath, which is fetched by the pool.
+    """
+    from testplan.runners.pools.child import RemoteChildLoop
+    from testplan.runners.pools.tasks import TaskResult
+    from testplan.testing.base import TestResult
+
+    source_xml = tmpdir.join('report.xml')
+    source_xml.write('<testsuites name="AllTests"></testsuites>')
+    runpath = tmpdir.mkdir('runpath')
+    inside_xml = runpath.join('inside.xml')
+    inside_xml.write('<testsuites name="Inside"></testsuites>')
+
+    results = {}
+    for uid, xml_path in (('outside', source_xml), ('inside', inside_xml)):
+        result = TestResult()
+        result.report = TestGroupReport(name='GTest', category='gtest')
+        result.report.xml_path = xml_path.strpath
+        results[uid] = TaskResult(task=Task(), result=result, status=True)
+
+    class LocalPool(object):
+        pass
+
+    LocalPool.results = results
+    loop = RemoteChildLoop(0, None, None, 1, None, None,
+                           runpath=runpath.strpath)
+    loop._pool = LocalPool()
+
+    sent = loop._result_to_send('outside').result.report
+    assert os.path.dirname(sent.xml_path) == runpath.join('xml').strpath
+    assert open(sent.xml_path).read() == source_xml.read()
+
+    sent = loop._result_to_send('inside').result.report
+    assert sent.xml_path == inside_xml.strpath
+
+
+def test_remote_worker_fetched_path():
+    """Files of the remote runpath are fetched under the pool runpath."""
+    from testplan.runners.pools.remote import RemoteWorker
+
+    class RemotePool(object):
+        runpath = os.path.join(os.sep, 'local', 'pool')
+
+    worker = RemoteWorker(index='host', workers=1, pool_type='thread')
+    worker.parent = RemotePool()
+    assert worker.fetched_path('/var/tmp/runpath/host/report.xml') is None
+
+    worker._remote_testplan_runpath = '/var/tmp/runpath/host'
+    assert worker.fetched_path('/var/tmp/runpath/host/test/report.xml') ==\
+        os.path.join(RemotePool.runpath, 'host', 'test', 'report.xml')
+    assert worker.fetched_path('/var/tmp/report.xml') is None
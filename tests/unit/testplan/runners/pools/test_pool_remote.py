@@ -0,0 +1,12 @@
+"""Unit tests for the remote pool configuration."""
+
+from testplan.runners.pools.remote import RemotePoolConfig
+
+
+def test_workspace_default(tmpdir, monkeypatch):
+    """The default workspace is the working directory of each config."""
+    first = RemotePoolConfig(name='Pool', hosts={'localhost': 1})
+    monkeypatch.chdir(tmpdir.strpath)
+    second = RemotePoolConfig(name='Pool', hosts={'localhost': 1})
+    assert first.workspace != tmpdir.strpath
+    assert second.workspace == tmpdir.strpath
@@ -0,0 +1,42 @@
+"""Import time regressions of the testplan package."""
+
+import subprocess
+import sys
+
+import pytest
+
+LAZY_MODULES = (
+    'reportlab',
+    'flask',
+    'zmq',
+    'marshmallow',
+    'lxml',
+    'testplan.exporters.testing.pdf',
+    'testplan.exporters.testing.webserver',
+    'testplan.runnable.interactive',
+)
+
+
+@pytest.mark.parametrize('module', ('testplan', 'testplan.runners.pools.child'))
+def test_optional_modules_imported_lazily(module):
+    """
+    Exporters, interactive mode, report schemas and XML parsing are not
+    imported along with testplan.
+    """
+    code = (
+        'import sys; import {}; '
+        'print(",".join(name for name in {!r} if name in sys.modules))'
+    ).format(module, LAZY_MODULES)
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode().strip() == ''
+
+
+def test_lazy_exporter_attributes():
+    """Exporters are still available from the exporters package."""
+    from testplan.exporters import testing as test_exporters
+    from testplan.exporters.testing.pdf import PDFExporter
+
+    assert test_exporters.PDFExporter is PDFExporter
+    assert 'XMLExporter' in dir(test_exporters)
+    with pytest.raises(AttributeError):
+        test_exporters.UnknownExporter
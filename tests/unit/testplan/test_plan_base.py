@@ -11,6 +11,8 @@ from testplan.common.utils.path import default_runpath
 from testplan.common.utils.testing import (
     argv_overridden, log_propagation_disabled)
 from testplan.common.utils.logger import TESTPLAN_LOGGER
+from testplan.common.utils.profiling import EXPORTER
+from testplan.exporters.testing import Exporter
 from testplan.report import TestGroupReport
 from testplan.runnable import TestRunnerStatus, TestRunner
 from testplan.runners.local import LocalRunner
@@ -191,3 +193,30 @@ def test_testplan_runpath():
     assert plan.runpath is None
     plan.run()
     assert plan.runpath == runpath_maker(plan._runnable)
+
+
+class DummyExporter(Exporter):
+
+    def export(self, source):
+        pass
+
+
+class FailingExporter(Exporter):
+
+    def export(self, source):
+        raise RuntimeError('Export failed')
+
+
+def test_exporter_timings():
+    """Wall & CPU time of the exporters are timings of the plan report."""
+    plan = Testplan(name='MyPlan', parse_cmdline=False,
+                    exporters=[DummyExporter(), FailingExporter()])
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        plan.run()
+
+    timings = plan.report.profile['timings']
+    assert [(timing['kind'], timing['name']) for timing in timings] == [
+        (EXPORTER, 'DummyExporter'), (EXPORTER, 'FailingExporter')]
+    assert all(timing['wall'] >= 0 and timing['cpu'] >= 0
+               for timing in timings)
+    assert plan.report.profile['profiles'] == {}
@@ -4,11 +4,18 @@ import os
 import re
 import sys
 import json
+import time
 import platform
 
+import psutil
+import pytest
+
+from testplan.common.entity import Environment, RunnableConfig
+from testplan.common.utils.logger import TESTPLAN_LOGGER
+from testplan.common.utils.path import file_digest
 from testplan.common.utils.timing import wait
 
-from testplan.testing.multitest.driver.app import App
+from testplan.testing.multitest.driver.app import App, BINARY_CACHE_DIR
 
 
 class CustomApp(App):
@@ -142,6 +149,27 @@ def test_binary_copy():
         assert app.extracts['value'] == 'started'
 
 
+def test_binary_cache():
+    binary = os.path.join(os.path.abspath(os.path.dirname(__file__)),
+                          'example_binary.py')
+    log_regexps = [re.compile(r'.*Binary=(?P<value>[a-zA-Z0-9]*).*')]
+    params = dict(name='App', binary=binary, log_regexps=log_regexps,
+                  pre_args=[sys.executable], binary_copy=True)
+
+    app = CustomApp(path_cleanup=False, binary_cache=True, **params)
+    with app:
+        assert app.extracts['value'] == 'started'
+    cache_dir = os.path.join(app.runpath, BINARY_CACHE_DIR)
+    assert os.listdir(cache_dir) == [file_digest(binary)]
+    assert os.path.samefile(
+        app.binary, os.path.join(cache_dir, file_digest(binary)))
+
+    app = CustomApp(path_cleanup=False, **params)
+    with app:
+        assert app.extracts['value'] == 'started'
+    assert os.stat(app.binary).st_nlink == 1
+
+
 def test_install_files():
     binary = os.path.join(os.path.abspath(os.path.dirname(__file__)),
                           'example_binary.py')
@@ -171,3 +199,97 @@ def test_echo_hello():
 
     with open(app.std.out_path, 'r') as fobj:
         assert fobj.read().startswith('hello')
+
+
+IGNORE_SIGTERM = (
+    'import signal, time;'
+    'signal.signal(signal.SIGTERM, signal.SIG_IGN);'
+    'print("started");'
+    'time.sleep(60)')
+
+
+def stubborn_app(name, **options):
+    """App ignoring SIGTERM, only killed once its stop timeout expires."""
+    return CustomApp(name=name, binary=sys.executable,
+                     args=['-u', '-c', IGNORE_SIGTERM],
+                     log_regexps=[re.compile(r'.*started.*')], **options)
+
+
+def _gone(pid):
+    try:
+        return psutil.Process(pid).status() == psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return True
+
+
+@pytest.mark.skipif(platform.system() == 'Windows',
+                    reason='Process groups are signalled on POSIX only.')
+def test_stop_process_group():
+    """Processes started by the binary are terminated with it."""
+    app = CustomApp(name='App', binary='sleep',
+                    args=['60', '&', 'echo', 'child=$!;', 'wait'],
+                    log_regexps=[re.compile(r'.*child=(?P<child>\d+).*')],
+                    shell=True)
+    with app:
+        child = int(app.extracts['child'])
+        assert psutil.pid_exists(child)
+    assert wait(lambda: _gone(child), 5, raise_on_timeout=False)
+
+
+@pytest.mark.skipif(platform.system() == 'Windows',
+                    reason='SIGTERM cannot be ignored on Windows.')
+def test_stop_timeout():
+    app = stubborn_app('App', stop_timeout=0.5)
+    with app:
+        pass
+    assert app.retcode == -9
+
+
+@pytest.mark.skipif(platform.system() == 'Windows',
+                    reason='Zombie processes are POSIX only.')
+def test_stop_without_wait():
+    """The binary is reaped when stopped without waiting for it."""
+    app = App(name='App', binary='sleep', args=['60'])
+    app.start()
+    app.wait(app.STATUS.STARTED)
+    pid = app.pid
+    app.stop()
+    assert wait(lambda: app.retcode is not None, 5, raise_on_timeout=False)
+    assert not psutil.pid_exists(pid)
+
+
+class EnvironmentOwner(object):
+    """Minimal parent of an environment."""
+
+    logger = TESTPLAN_LOGGER
+
+    def __init__(self, **options):
+        self.cfg = RunnableConfig(**options)
+
+
+@pytest.mark.skipif(platform.system() == 'Windows',
+                    reason='SIGTERM cannot be ignored on Windows.')
+@pytest.mark.parametrize('owner_options, app_stop_timeout', (
+    ({}, 1),
+    ({'environment_stop_timeout': 1}, 30),
+))
+def test_environment_stop_concurrently(owner_options, app_stop_timeout):
+    """
+    Apps of an environment are waited for concurrently, within the
+    environment stop timeout if any.
+    """
+    env = Environment(parent=EnvironmentOwner(**owner_options))
+    apps = [stubborn_app('App{}'.format(idx), stop_timeout=app_stop_timeout)
+            for idx in range(3)]
+    for app in apps:
+        env.add(app)
+    env.start()
+    assert not env.start_exceptions
+
+    start = time.time()
+    env.stop(reversed=True)
+    assert time.time() - start < 2.5
+    assert not env.stop_exceptions
+    for app in apps:
+        assert app.status.tag == app.STATUS.STOPPED
+        assert app.retcode == -9
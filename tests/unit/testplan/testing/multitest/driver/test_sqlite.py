@@ -0,0 +1,99 @@
+"""Unit tests for the Sqlite3 driver."""
+
+import os
+import types
+
+import pytest
+
+from testplan.testing.multitest import result as result_mod
+from testplan.testing.multitest.driver.sqlite import Sqlite3
+
+ROWS = [(idx, 'name{}'.format(idx), float(idx) / 2) for idx in range(25)]
+
+
+def create_table(db):
+    with db.commit_at_exit():
+        db.execute('CREATE TABLE items(id INTEGER, name TEXT, price REAL)')
+
+
+def test_iter_table_and_query(tmpdir):
+    with Sqlite3(name='db', db_name='items.db', runpath=str(tmpdir),
+                 arraysize=4) as db:
+        create_table(db)
+        assert db.load_rows('items', iter(ROWS)) == len(ROWS)
+
+        rows = db.iter_table('items')
+        assert isinstance(rows, types.GeneratorType)
+        assert next(rows) == ['id', 'name', 'price']
+        assert list(rows) == ROWS
+
+        rows = db.iter_query(
+            'SELECT name FROM items WHERE id < ?', (2,), arraysize=1)
+        assert list(rows) == [['name'], ('name0',), ('name1',)]
+
+        table = db.fetch_table('items', columns=['name', 'id'])
+        assert table[0] == ['name', 'id']
+        assert table[1:] == [[name, idx] for idx, name, _ in ROWS]
+
+
+def test_iter_table_match(tmpdir):
+    """Rows are fed to table assertions without building a list first."""
+    with Sqlite3(name='db', db_name='items.db', runpath=str(tmpdir)) as db:
+        create_table(db)
+        db.load_rows('items', ROWS)
+        expected = [['id', 'name', 'price']] + [list(row) for row in ROWS]
+
+        result = result_mod.Result()
+        result.table.match(db.iter_table('items'), expected)
+        result.table.column_contain(
+            db.iter_table('items', columns=['name']),
+            values=[row[1] for row in ROWS], column='name')
+        result.table.log(db.iter_table('items'))
+        assert result.passed
+        assert len(result.entries[-1].table) == len(ROWS)
+
+        assert result.entries[0].data == []
+
+        expected[1][1] = 'other'
+        assert not result.table.match(db.iter_table('items'), expected)
+        assert [row.idx for row in result.entries[-1].data] == [0]
+
+
+def test_load_csv(tmpdir):
+    csv_path = str(tmpdir.join('items.csv'))
+    with open(csv_path, 'w') as csv_file:
+        csv_file.write('price,id,name\n')
+        for idx, name, price in ROWS:
+            csv_file.write('{},{},{}\n'.format(price, idx, name))
+
+    with Sqlite3(name='db', db_name='items.db', runpath=str(tmpdir),
+                 journal_mode='WAL', synchronous='OFF') as db:
+        create_table(db)
+        assert db.load_csv('items', csv_path) == len(ROWS)
+        assert list(db.iter_table('items'))[1:] == ROWS
+        assert db.db.execute('PRAGMA journal_mode').fetchone() == ('wal',)
+        assert db.db.execute('PRAGMA synchronous').fetchone() == (0,)
+
+
+def test_load_rows_rollback(tmpdir):
+    with Sqlite3(name='db', db_name='items.db', runpath=str(tmpdir)) as db:
+        create_table(db)
+        rows = ROWS[:2] + [(1, 2)]
+        with pytest.raises(Exception):
+            db.load_rows('items', rows)
+        assert list(db.iter_table('items')) == [['id', 'name', 'price']]
+
+
+def test_in_memory_shared_cache(tmpdir):
+    with Sqlite3(name='db', db_name='shared_items', runpath=str(tmpdir),
+                 in_memory=True, shared_cache=True) as db:
+        create_table(db)
+        db.load_rows('items', ROWS, columns=['id', 'name', 'price'])
+        assert not os.path.exists(os.path.join(db.runpath, 'shared_items'))
+
+        other = db.new_connection()
+        try:
+            assert other.execute(
+                'SELECT COUNT(*) FROM items').fetchone() == (len(ROWS),)
+        finally:
+            other.close()
@@ -4,10 +4,13 @@ import fractions
 import inspect
 import os
 import re
+import warnings
 
 import pytest
 import six
 
+from testplan.common.utils import comparison
+from testplan.common.utils.convert import flatten_dict_comparison
 from testplan.common.utils.exceptions import format_trace
 from testplan.testing.multitest.entries import assertions
 
@@ -460,6 +463,113 @@ class TestRegexFindIter(BaseRegexTest):
             expected_match_indexes=expected_match_indexes, expected=False)
 
 
+class TestRegexFile(object):
+
+    @pytest.fixture
+    def log_path(self, tmpdir):
+        path = tmpdir.join('app.log')
+        path.write(multiline(
+            'Starting', 'Listening on port 8080', 'Client connected',
+            'Error: disk full', 'Stopped'))
+        return str(path)
+
+    def test_search(self, log_path):
+        """The first match of each pattern is recorded, overlaps included."""
+        assertion = assertions.RegexFileSearch(
+            log_path, [r'port (\d+)', re.compile('connect'), 'Client c'])
+        assert assertion
+        assert assertion.patterns == [r'port (\d+)', 'connect', 'Client c']
+        assert assertion.matches == [
+            {'pattern': 0, 'start': 22, 'end': 31, 'line_no': 1,
+             'snippet': 'Listening on port 8080', 'snippet_span': [13, 22]},
+            {'pattern': 1, 'start': 39, 'end': 46, 'line_no': 2,
+             'snippet': 'Client connected', 'snippet_span': [7, 14]},
+            {'pattern': 2, 'start': 32, 'end': 40, 'line_no': 2,
+             'snippet': 'Client connected', 'snippet_span': [0, 8]},
+        ]
+
+        assertion = assertions.RegexFileSearch(
+            log_path, ['stopped', 'Restarted'], flags=re.IGNORECASE)
+        assert not assertion
+        assert [match['pattern'] for match in assertion.matches] == [0]
+
+    def test_search_flags(self, log_path):
+        """Patterns with different flags are scanned together."""
+        assertion = assertions.RegexFileSearch(
+            log_path, ['Stopped', re.compile('error', re.IGNORECASE),
+                       re.compile('^client', re.IGNORECASE | re.MULTILINE),
+                       'starting'])
+        assert not assertion
+        assert [(match['pattern'], match['line_no'])
+                for match in assertion.matches] == [(0, 4), (1, 3), (2, 2)]
+
+        assertion = assertions.RegexFileSearchNotExists(
+            log_path, ['Stopped', re.compile('^client', re.I | re.M)])
+        assert [match['pattern'] for match in assertion.matches] == [1]
+
+    def test_search_not_exists(self, log_path):
+        """Scanning stops at the first match of any pattern."""
+        assert assertions.RegexFileSearchNotExists(
+            log_path, ['Traceback', 'Segmentation fault'])
+
+        assertion = assertions.RegexFileSearchNotExists(
+            log_path, ['Stopped', 'Error'])
+        assert not assertion
+        assert [match['pattern'] for match in assertion.matches] == [1]
+
+    def test_match_line(self, log_path):
+        """Patterns only match at the start of lines."""
+        assertion = assertions.RegexFileMatchLine(
+            log_path, [r'Listening on port \d+$', 'Stopped'])
+        assert assertion
+        assert [match['line_no'] for match in assertion.matches] == [1, 4]
+
+        assert not assertions.RegexFileMatchLine(log_path, 'disk full')
+
+    def test_match_line_single_line(self, log_path):
+        """Matches of lines do not span the lines that follow."""
+        assertion = assertions.RegexFileMatchLine(
+            log_path, [r'Client connected\nError', r'Error: [^x]+Stopped',
+                       r'Error: [^x]+'])
+        assert not assertion
+        assert [(match['pattern'], match['end'] - match['start'])
+                for match in assertion.matches] == [(2, 16)]
+
+    def test_missing_file(self, tmpdir):
+        """Assertions on a file that cannot be read fail with an error."""
+        path = str(tmpdir.join('missing.log'))
+        for assertion_kls in (assertions.RegexFileSearch,
+                              assertions.RegexFileSearchNotExists,
+                              assertions.RegexFileMatchLine):
+            assertion = assertion_kls(path, 'Error')
+            assert not assertion
+            assert assertion.matches == []
+            assert 'missing.log' in assertion.error
+
+    def test_inline_flags(self, log_path):
+        """Leading inline flags apply to their pattern only."""
+        with warnings.catch_warnings():
+            # Inline flags not at the start of a pattern are deprecated
+            warnings.simplefilter('error')
+            assertion = assertions.RegexFileMatchLine(
+                log_path, [r'(?i)STOPPED', 'client'])
+            assert not assertion
+            assert [(match['pattern'], match['line_no'])
+                    for match in assertion.matches] == [(0, 4)]
+
+            assert assertions.RegexFileSearch(
+                log_path, [r'(?i)error: DISK', re.compile(r'(?m)^Client')])
+
+    def test_groups(self, log_path):
+        """Patterns can repeat group names and use back references."""
+        assertion = assertions.RegexFileSearch(
+            log_path, [r'port (?P<value>\d+)', r'Error: (?P<value>\w+)',
+                       r'(?P<letter>n)(?P=letter)', r'(t)\1', r'(o)\1'])
+        assert not assertion
+        assert [(match['pattern'], match['line_no'])
+                for match in assertion.matches] == [(0, 1), (1, 3), (2, 2)]
+
+
 EQUAL_SLICES_PARAM_NAMES = 'actual,expected,slices,expected_data'
 
 
@@ -876,6 +986,21 @@ TestDiff = generate_diff_assertion_test(
 )
 
 
+def test_diff_truncated(monkeypatch):
+    """Differences are reported up to ``LineDiff.max_delta_lines``."""
+    monkeypatch.setattr(assertions.LineDiff, 'max_delta_lines', 5)
+    first = ''.join('line {}\n'.format(idx) for idx in range(10))
+    assertion = assertions.LineDiff(first, first.upper())
+    assert not assertion
+    assert len(assertion.delta) == 6
+    assert assertion.delta[-1].startswith(
+        '\\ Difference truncated after 5 lines')
+
+    assertion = assertions.LineDiff(first, first)
+    assert assertion
+    assert assertion.delta == []
+
+
 COLUMN_CONTAIN_PARAM_NAMES = 'table,expected_data,values,' \
                              'column,limit,report_fails_only'
 
@@ -1013,6 +1138,19 @@ class TestColumnContains(object):
             expected_data=expected_data,
             expected=False)
 
+    def test_evaluate_streamed(self):
+        """Iterators of rows are checked row by row, keeping failures."""
+        table = [['name']] + [['name{}'.format(idx)] for idx in range(10)]
+        values = ['name{}'.format(idx) for idx in range(10) if idx != 3]
+
+        assertion = assertions.ColumnContain(
+            table=iter(table), values=values, column='name')
+        assert not assertion
+        assert assertion.table is None
+        assert assertion.report_fails_only
+        assert assertion.data == [
+            assertions.ColumnContainComparison(3, 'name3', False)]
+
 
 GET_COMPARISON_COLUMNS_PARAM_NAMES = 'table_1,table_2,' \
                                      'include_columns,exclude_columns,expected'
@@ -1653,6 +1791,46 @@ class TestTableMatch(object):
             include_columns=include_columns, exclude_columns=exclude_columns,
             expected_message=expected_message, expected_result=False)
 
+    def test_evaluate_streamed(self):
+        """Iterators of rows are compared row by row, keeping failures."""
+        table = [['name', 'age']] + [
+            ['name{}'.format(idx), idx] for idx in range(100)]
+        expected = [list(row) for row in table]
+        expected[10][1] = 'other'
+        expected[20][1] = 'other'
+
+        assertion = assertions.TableMatch(iter(table), expected)
+        assert not assertion
+        assert assertion.table is None and assertion.expected_table is None
+        assert assertion.report_fails_only
+        assert [row.idx for row in assertion.data] == [9, 19]
+        assert assertion.message == (
+            '100 of 100 rows compared, 2 failed, only failing rows'
+            ' are reported.')
+
+        assertion = assertions.TableMatch(
+            iter(table), iter(expected), fail_limit=1)
+        assert [row.idx for row in assertion.data] == [9]
+        assert assertion.message.startswith('10 of 100 rows compared')
+
+        assert assertions.TableMatch(iter(table), table)
+        assert assertions.TableMatch(iter(table[:1]), iter([['name']]))
+
+        assertion = assertions.TableMatch(iter(table), table[:-1])
+        assert not assertion
+        assert assertion.data == []
+        assert assertion.message.startswith(
+            'Cannot run comparison on tables with different number '
+            'of rows (100 vs 99)')
+
+        assertion = assertions.TableMatch(iter([['age']]), table)
+        assert not assertion
+        assert '(0 vs 100)' in assertion.message
+
+        assertion = assertions.TableMatch(iter(table), [['nom'], ['name0']])
+        assert not assertion
+        assert assertion.message.startswith('Table columns')
+
 
 TABLEDIFF_COLUMN_NAMES = TABLEMATCH_COLUMN_NAMES
 
@@ -1845,3 +2023,28 @@ def test_dict_check(dictionary, has_keys, absent_keys, expected):
         dictionary=dictionary, has_keys=has_keys, absent_keys=absent_keys)
 
     assert bool(assertion) is expected
+
+
+@pytest.mark.parametrize('report_mode', list(comparison.ReportOptions))
+def test_dict_match_comparison(report_mode):
+    """The comparison is kept as it was on evaluation."""
+    calls = []
+
+    def check(value):
+        calls.append(value)
+        return value == 'z'
+
+    value = {'a': 1, 'b': [1, {'c': 'x'}], 'd': 'y'}
+    expected = {'a': 1, 'b': [1, {'c': 'x'}], 'd': check}
+    compared = flatten_dict_comparison(comparison.compare(
+        value, expected, ignore=['a'], report_mode=report_mode)[1])
+
+    assertion = assertions.DictMatch(
+        value, expected, exclude_keys=['a'], report_mode=report_mode)
+    assert not assertion.passed
+    evaluated_calls = list(calls)
+
+    value['b'][1]['c'] = 'changed'
+    value['d'] = 'z'
+    assert assertion.comparison == compared
+    assert calls == evaluated_calls
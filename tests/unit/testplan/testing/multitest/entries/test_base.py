@@ -1,3 +1,5 @@
+import datetime
+
 from testplan.testing.multitest.entries import base
 
 from testplan.testing.multitest.entries import assertions
@@ -123,3 +125,23 @@ def test_summary():
     assert len(alpha_category_less_failing.entries) == summary.num_failing
 
 
+
+
+def test_entry_slots():
+    """Entries keep no instance dict and derive times from one timestamp."""
+    entries = [
+        base.Log('message'),
+        assertions.Equal(1, 1),
+        assertions.DictMatch({'key': 1}, {'key': 1}),
+    ]
+    for entry in entries:
+        assert not hasattr(entry, '__dict__')
+        assert entry.utc_time.tzinfo is not None
+        assert abs((entry.utc_time.replace(tzinfo=None) -
+                    datetime.datetime.utcnow()).total_seconds()) < 60
+        assert entry.machine_time == datetime.datetime.fromtimestamp(
+            entry.timestamp)
+
+    serialized = entries[1].serialize()
+    assert serialized['utc_time'] and serialized['machine_time']
+    assert serialized['first'] == serialized['second'] == 1
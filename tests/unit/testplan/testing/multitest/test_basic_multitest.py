@@ -1,9 +1,15 @@
 """TODO."""
 
 import os
+import json
+import time
+import threading
 
 from testplan.common.utils.path import default_runpath
-from testplan.testing.multitest import MultiTest
+from testplan.common.utils.thread import SHARED_EXECUTOR_THREAD_PREFIX
+from testplan.report.testing.schemas import TestCaseReportSchema
+from testplan.testing.filtering import Pattern
+from testplan.testing.multitest import MultiTest, testsuite, testcase
 from testplan.testing.multitest.base import MultiTestConfig
 
 
@@ -47,3 +53,291 @@ def test_multitest_runpath():
     mtest.run()
     assert mtest.runpath == local_runpath
     assert mtest._runpath == local_runpath
+
+
+@testsuite
+class ExecutionGroupSuite(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.threads = set()
+
+    @testcase(execution_group='group', parameters=range(6))
+    def case(self, env, result, value):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.threads.add(threading.current_thread())
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        result.true(True)
+
+
+def test_multitest_shared_thread_pool():
+    """Execution groups run on the shared executor, bounded per MultiTest."""
+    suites = [ExecutionGroupSuite(), ExecutionGroupSuite()]
+    mtests = [MultiTest(name='Mtest{}'.format(idx), suites=[suite],
+                        thread_pool_size=2)
+              for idx, suite in enumerate(suites)]
+    threads = [threading.Thread(target=mtest.run) for mtest in mtests]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for mtest, suite in zip(mtests, suites):
+        assert mtest.report.passed
+        assert len(mtest.report.entries[0].entries[0]) == 6
+        assert suite.max_running == 2
+        assert all(thread.name.startswith(SHARED_EXECUTOR_THREAD_PREFIX)
+                   for thread in suite.threads)
+        assert all(thread.daemon for thread in suite.threads)
+
+
+class SuiteTracker(object):
+    """Records how many testsuites are running at the same time."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.all_started = threading.Event()
+
+    def enter(self, expected):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            if self.running == expected:
+                self.all_started.set()
+
+    def exit(self):
+        with self.lock:
+            self.running -= 1
+
+
+@testsuite(parallel=True)
+class ParallelSuite(object):
+
+    def __init__(self, name, tracker, expected=2, error=False):
+        self.name = name
+        self.tracker = tracker
+        self.expected = expected
+        self.error = error
+
+    def suite_name(self):
+        return self.name
+
+    def setup(self, env):
+        self.tracker.enter(self.expected)
+
+    @testcase
+    def wait_for_other_suites(self, env, result):
+        result.true(self.tracker.all_started.wait(5))
+        if self.error:
+            raise RuntimeError('Failing testcase')
+
+    @testcase
+    def other_case(self, env, result):
+        result.true(True)
+
+    def teardown(self, env):
+        self.tracker.exit()
+
+
+@testsuite
+class SerialSuite(object):
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.running_suites = None
+
+    @testcase
+    def case(self, env, result):
+        self.running_suites = self.tracker.running
+        result.true(True)
+
+
+def test_multitest_parallel_suites():
+    """Parallel suites run concurrently, serial ones run on their own."""
+    tracker = SuiteTracker()
+    serial = SerialSuite(tracker)
+    suites = [ParallelSuite('First', tracker),
+              ParallelSuite('Second', tracker, error=True),
+              serial]
+    mtest = MultiTest(name='Mtest', suites=suites)
+    mtest.run()
+
+    assert tracker.max_running == 2
+    assert serial.running_suites == 0
+
+    # Report order follows the suites order and stop_on_error is applied
+    # within each testsuite.
+    first, second, third = mtest.report.entries
+    assert first.name == 'ParallelSuite - First'
+    assert first.passed
+    assert len(first.entries) == 2
+    assert second.name == 'ParallelSuite - Second'
+    assert not second.passed
+    assert len(second.entries) == 1
+    assert third.name == 'SerialSuite'
+    assert third.passed
+
+
+def test_multitest_parallel_suites_config():
+    """All suites run concurrently with ``parallel_suites``."""
+    tracker = SuiteTracker()
+    suites = [ParallelSuite(str(idx), tracker, expected=3)
+              for idx in range(3)]
+    for suite in suites:
+        suite.__parallel__ = False
+    mtest = MultiTest(name='Mtest', suites=suites, parallel_suites=True)
+    mtest.run()
+
+    assert mtest.report.passed
+    assert tracker.max_running == 3
+    assert [entry.name for entry in mtest.report.entries] == [
+        'ParallelSuite - {}'.format(idx) for idx in range(3)]
+
+
+@testsuite
+class SleepSuite(object):
+
+    @testcase
+    def sleep(self, env, result):
+        time.sleep(0.3)
+        result.true(env.sleeper.pid is not None)
+
+
+def test_multitest_resource_usage():
+    """Resources used by drivers & tests are added to the report."""
+    from testplan.testing.multitest.driver.app import App
+
+    mtest = MultiTest(
+        name='Mtest', suites=[SleepSuite()],
+        environment=[App(name='sleeper', binary='sleep', args=['10'])],
+        resource_usage_interval=0.05)
+    mtest.run()
+
+    usage = mtest.report.resource_usage
+    assert set(usage['processes']) == {'testplan', 'sleeper'}
+    assert usage['processes']['testplan']['pid'] == os.getpid()
+    assert usage['processes']['sleeper']['samples']
+    assert mtest.report.passed
+
+    data = mtest.report.serialize()
+    assert json.loads(json.dumps(data['resource_usage'])) == usage
+
+    mtest = MultiTest(name='Mtest', suites=[SleepSuite()],
+                      environment=[App(name='sleeper', binary='sleep',
+                                       args=['10'])])
+    mtest.run()
+    assert mtest.report.resource_usage is None
+
+
+@testsuite
+class CachedSuite(object):
+
+    def __init__(self):
+        self.executed = []
+
+    def setup(self, env):
+        self.executed.append('setup')
+
+    @testcase(parameters=(1, 2))
+    def case(self, env, result, value):
+        self.executed.append(value)
+        result.equal(value, value)
+
+    @testcase
+    def failing(self, env, result):
+        self.executed.append('failing')
+        result.fail('Always failing')
+
+
+def test_multitest_result_cache(tmpdir):
+    """Passing testcases with unchanged fingerprints are not executed."""
+    cache_dir = str(tmpdir.join('cache'))
+    input_file = tmpdir.join('input.txt')
+    input_file.write('1')
+
+    def run(suite, **options):
+        mtest = MultiTest(
+            name='Mtest', suites=[suite], result_cache=cache_dir,
+            result_cache_files=[str(input_file)], **options)
+        mtest.run()
+        return mtest.report
+
+    suite = CachedSuite()
+    suite_report = run(suite).get_by_uid('CachedSuite')
+    assert suite.executed == ['setup', 1, 2, 'failing']
+    assert not any(case.cached for case in suite_report.get_by_uid('case'))
+
+    suite = CachedSuite()
+    suite_report = run(suite).get_by_uid('CachedSuite')
+    assert suite.executed == ['setup', 'failing']
+    param_report = suite_report.get_by_uid('case')
+    assert [case.name for case in param_report] == [
+        'case__value_1', 'case__value_2']
+    cached = param_report.get_by_uid('case__value_1')
+    assert cached.passed and cached.cached['fingerprint']
+    schema = TestCaseReportSchema(strict=True)
+    assert schema.dump(cached).data['cached'] == cached.cached
+    failing = suite_report.get_by_uid('failing')
+    assert failing.cached is None
+    assert 'cached' not in schema.dump(failing).data
+
+    input_file.write('2')
+    suite = CachedSuite()
+    run(suite)
+    assert suite.executed == ['setup', 1, 2, 'failing']
+
+    # Suite setup is not executed if all testcases are reused
+    suite = CachedSuite()
+    report = run(suite, test_filter=Pattern('Mtest:CachedSuite:case*'))
+    assert suite.executed == []
+    assert report.passed
+
+
+def test_multitest_profile(tmpdir):
+    """Steps are timed and matching testcases profiled."""
+    from testplan.common.utils import profiling
+    from testplan.report.testing import TestReport
+    from testplan.testing.multitest.driver.tcp import TCPServer
+
+    mtest = MultiTest(
+        name='Mtest', suites=[CachedSuite()], runpath=str(tmpdir),
+        environment=[TCPServer(name='server')],
+        profile_timings=True, profile_testcases='case__*',
+        profiler=profiling.SAMPLING)
+    mtest.run()
+
+    profile = mtest.report.profile
+    assert [(timing['kind'], timing['name'])
+            for timing in profile['timings']] == [
+        ('driver', 'server - start'),
+        ('suite', 'CachedSuite:setup'),
+        ('testcase', 'CachedSuite:case__value_1'),
+        ('testcase', 'CachedSuite:case__value_2'),
+        ('testcase', 'CachedSuite:failing'),
+        ('suite', 'CachedSuite'),
+        ('driver', 'server - stop'),
+        ('driver', 'server - wait stopped'),
+    ]
+    assert sorted(profile['profiles']) == [
+        'CachedSuite:case__value_1', 'CachedSuite:case__value_2']
+
+    path = profile['profiles']['CachedSuite:case__value_1']['path']
+    assert path == str(
+        tmpdir.join('profiles', 'cachedsuite-case__value_1.collapsed'))
+
+    report = TestReport(name='plan', entries=[mtest.report])
+    report.bubble_up_attachments()
+    attached = profile['profiles']['CachedSuite:case__value_1']['path']
+    assert report.attachments[attached] == path
+
+    mtest = MultiTest(name='Mtest', suites=[CachedSuite()])
+    mtest.run()
+    assert mtest.report.profile is None
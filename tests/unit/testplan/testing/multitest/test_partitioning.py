@@ -0,0 +1,74 @@
+import datetime
+
+from testplan.common.utils import timing
+from testplan.report.testing import TestReport, TestGroupReport, TestCaseReport
+from testplan.testing.multitest import partitioning
+
+
+def _loads(testcases, assignment, durations, total):
+    loads = [0] * total
+    for (suite, case), part in zip(testcases, assignment):
+        loads[part] += durations[suite][case]
+    return loads
+
+
+def test_assign_parts_balances_durations():
+    durations = {'Suite': {'a': 8, 'b': 1, 'c': 1, 'd': 4, 'e': 4, 'f': 2}}
+    testcases = [('Suite', name) for name in 'abcdef']
+
+    assignment = partitioning.assign_parts(testcases, 2, durations)
+    assert _loads(testcases, assignment, durations, 2) == [10, 10]
+
+    # Modulo would put a, c & e together: 13 against 7
+    assert assignment == partitioning.assign_parts(testcases, 2, durations)
+
+
+def test_assign_parts_without_durations():
+    testcases = [('Suite1', 'a'), ('Suite1', 'b'),
+                 ('Suite2', 'c'), ('Suite2', 'd')]
+    assert partitioning.assign_parts(testcases, 2) == [0, 1, 0, 1]
+    assert partitioning.assign_parts(testcases, 5) == [0, 1, 2, 3]
+
+
+def test_assign_parts_unknown_testcases_cost_average():
+    durations = {'Suite': {'a': 3, 'b': 1}}
+    testcases = [('Suite', 'a'), ('Suite', 'b'), ('Suite', 'new')]
+    # new is estimated to take 2s
+    assert partitioning.assign_parts(testcases, 2, durations) == [0, 1, 1]
+
+
+def test_assign_parts_groups_suites_with_expensive_setup():
+    durations = {
+        'Slow': {'setup': 10, 'a': 1, 'b': 1, 'c': 1},
+        'Fast': {'d': 1, 'e': 1, 'f': 1},
+    }
+    testcases = [('Slow', 'a'), ('Slow', 'b'), ('Slow', 'c'),
+                 ('Fast', 'd'), ('Fast', 'e'), ('Fast', 'f')]
+    assert partitioning.assign_parts(testcases, 2, durations) == \
+        [0, 0, 0, 1, 1, 1]
+
+
+def _timed(report, seconds):
+    start = datetime.datetime(2019, 1, 1)
+    report.timer['run'] = timing.Interval(
+        start, start + datetime.timedelta(seconds=seconds))
+    return report
+
+
+def test_durations_from_report():
+    param_group = TestGroupReport(
+        name='param', category='parametrization',
+        entries=[_timed(TestCaseReport(name='param_1'), 2)])
+    suite = _timed(TestGroupReport(
+        name='Suite', category='suite',
+        entries=[_timed(TestCaseReport(name='case'), 1),
+                 TestCaseReport(name='not_run'),
+                 param_group]), 5)
+    report = TestReport(name='plan', entries=[
+        TestGroupReport(name='MTest', category='multitest', entries=[suite]),
+        TestGroupReport(name='Other', category='multitest', entries=[
+            TestGroupReport(name='OtherSuite', category='suite')]),
+    ])
+
+    assert partitioning.durations_from_report(report, 'MTest') == {
+        'Suite': {'case': 1, 'param_1': 2, 'setup': 2}}
@@ -302,3 +302,23 @@ class TestFIXNamespace(object):
         assert len(fix_ns.result.entries) == 1
         dict_assert = fix_ns.result.entries.popleft()
         assert len(dict_assert.comparison) == 1
+
+    def test_compiled_fixmatch(self, fix_ns):
+        """Test FIX matches against a compiled expected FIX message."""
+        expected = comparison.compile_dict(testing.FixMessage(
+            ((35, 'D'), (38, comparison.Greater(0)), (44, 125.83)),
+            typed_values=True))
+        actual = testing.FixMessage(
+            ((35, 'D'), (38, 1000000), (44, 125.83)),
+            typed_values=True)
+
+        for report_mode in comparison.ReportOptions:
+            assert fix_ns.match(actual, expected, report_mode=report_mode)
+
+        actual[44] = '125.83'
+        assert not fix_ns.match(
+            actual, expected,
+            report_mode=comparison.ReportOptions.FAILS_ONLY,
+            description='Failing str/float comparison')
+        dict_assert = fix_ns.result.entries[-1]
+        assert len(dict_assert.comparison) == 1
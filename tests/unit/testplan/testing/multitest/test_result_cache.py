@@ -0,0 +1,102 @@
+import re
+
+from testplan.report.testing import TestCaseReport
+from testplan.testing.multitest import result_cache
+from testplan.testing.multitest.result import Result
+
+
+class Suite(object):
+    pass
+
+
+def _report(name, passed=True):
+    report = TestCaseReport(name=name, uid=name)
+    result = Result()
+    result.true(passed)
+    report.extend(result.serialized_entries)
+    return report
+
+
+def _fingerprint(**inputs):
+    return result_cache.testcase_fingerprint(
+        Suite(), _report, result_cache.environment_inputs(**inputs))
+
+
+def test_stable():
+    assert result_cache._stable({'b': {2, 1}, 'a': re.compile('x', re.I)}) \
+        == result_cache._stable({'a': re.compile('x', re.I), 'b': {1, 2}})
+    assert result_cache._stable(Suite()) == result_cache._stable(Suite())
+    assert result_cache._stable(_report).endswith('._report')
+
+
+def test_fingerprint_inputs(tmpdir, monkeypatch):
+    path = tmpdir.join('input.txt')
+    path.write('1')
+    fingerprint = _fingerprint(files=[str(path)], env_vars=['CACHE_VAR'])
+    assert fingerprint == _fingerprint(
+        files=[str(path)], env_vars=['CACHE_VAR'])
+
+    path.write('2')
+    assert fingerprint['files'] != _fingerprint(
+        files=[str(path)], env_vars=['CACHE_VAR'])['files']
+
+    monkeypatch.setenv('CACHE_VAR', 'value')
+    assert fingerprint['env'] != _fingerprint(
+        files=[str(path)], env_vars=['CACHE_VAR'])['env']
+
+
+def test_result_cache_parts(tmpdir):
+    directory = str(tmpdir)
+    fingerprint = _fingerprint()
+
+    part_0 = result_cache.ResultCache(directory, 'Mtest', (0, 2))
+    part_0.record('Suite', _report('passing'), fingerprint)
+    part_0.record('Suite', _report('failing', passed=False), fingerprint)
+    part_0.save()
+
+    # Testcases are looked up in the files of all parts
+    part_1 = result_cache.ResultCache(directory, 'Mtest', (1, 2))
+    part_1.load()
+    report, changed = part_1.lookup('Suite', 'passing', fingerprint)
+    assert report.passed and changed == []
+    assert report.cached['fingerprint'] == fingerprint
+    assert part_1.lookup('Suite', 'failing', fingerprint) == (
+        None, ['failed'])
+    assert part_1.lookup('Suite', 'missing', fingerprint) == (
+        None, ['missing'])
+
+    changed_fingerprint = dict(fingerprint, source='changed')
+    assert part_1.lookup('Suite', 'passing', changed_fingerprint) == (
+        None, ['source'])
+
+    # The latest result of a testcase wins
+    part_1.record('Suite', _report('passing', passed=False), fingerprint)
+    part_1.save()
+    part_0.load()
+    assert part_0.lookup('Suite', 'passing', fingerprint) == (
+        None, ['failed'])
+
+
+def test_list_and_invalidate(tmpdir):
+    directory = str(tmpdir)
+    fingerprint = _fingerprint()
+    for test in ('Mtest', 'Other'):
+        cache = result_cache.ResultCache(directory, test)
+        cache.record('Suite', _report('case1'), fingerprint)
+        cache.record('Suite', _report('case2'), fingerprint)
+        cache.save()
+
+    entries = result_cache.list_entries(directory)
+    assert [(entry['test'], entry['testcase']) for entry in entries] == [
+        ('Mtest', 'case1'), ('Mtest', 'case2'),
+        ('Other', 'case1'), ('Other', 'case2')]
+    assert all(entry['passed'] for entry in entries)
+
+    assert result_cache.invalidate(
+        directory, test='Mtest', testcase='case1') == 1
+    assert [entry['testcase'] for entry in
+            result_cache.list_entries(directory, test='Mtest')] == ['case2']
+
+    assert result_cache.invalidate(directory) == 3
+    assert result_cache.list_entries(directory) == []
+    assert tmpdir.listdir() == []
@@ -1,4 +1,7 @@
 import os
+import io
+import gzip
+import json
 import uuid
 import shutil
 import tempfile
@@ -6,6 +9,7 @@ import tempfile
 import pytest
 
 from testplan import defaults
+from testplan.exporters.testing.base import save_report_shards
 from testplan.web_ui.web_app import app as tp_web_app
 
 STATIC_REPORTS = {
@@ -32,6 +36,20 @@ DATA_REPORTS = {
     },
 }
 
+ASSERTIONS = [{'type': 'Log', 'message': str(idx)} for idx in range(100)]
+
+SERIALIZED_REPORT = {
+    'uid': 'plan',
+    'entries': [{
+        'uid': 'mtest',
+        'category': 'multitest',
+        'entries': [
+            {'uid': 'case_1', 'status': 'passed', 'entries': ASSERTIONS},
+            {'uid': 'case_2', 'status': 'failed', 'entries': []},
+        ]
+    }]
+}
+
 
 def _create_tmp_file(tmp_file, contents):
     """
@@ -83,6 +101,8 @@ def _create_tmp_data_files(base_dir):
         _create_tmp_file(tmp_file=report_file, contents=report['contents'])
     attachment_file = os.path.join(base_dir, defaults.ATTACHMENTS, 'attached.file')
     _create_tmp_file(tmp_file=attachment_file, contents=DATA_REPORTS['testplan']['contents'])
+    save_report_shards(
+        SERIALIZED_REPORT, os.path.join(base_dir, defaults.REPORT_SHARDS))
 
 
 class TestStaticEndpoints(object):
@@ -196,13 +216,66 @@ class TestDataEndpoints(object):
         assert response.status_code == 200
         assert expected_contents in str(response.data)
 
+    def test_testplan_skeleton(self):
+        """
+        Does /testplan/<uid>/skeleton return the report without assertions.
+        """
+        response = self.client.get('/testplan/123/skeleton')
+        assert response.status_code == 200
+        skeleton = json.loads(response.data.decode('utf-8'))
+        assert skeleton['counts'] == {'passed': 1, 'failed': 1}
+
+        multitest = skeleton['entries'][0]
+        assert multitest['counts'] == {'passed': 1, 'failed': 1}
+        assert [case['entry_count'] for case in multitest['entries']] == [
+            len(ASSERTIONS), 0]
+        assert all(case['entries'] == [] for case in multitest['entries'])
+
     def test_testplan_assertions(self):
         """
-        Does sending anything to /testplan/<uid>/assertions/<uid> respond with
-        501.
+        Does /testplan/<uid>/assertions/<uid> return the assertions of a
+        testcase, paginated if requested.
         """
-        response = self.client.get('testplan/123/assertions/123')
-        assert response.status_code == 501
+        skeleton = json.loads(self.client.get(
+            '/testplan/123/skeleton').data.decode('utf-8'))
+        assertions_uid = skeleton['entries'][0]['entries'][0]['assertions_uid']
+        path = '/testplan/123/assertions/{}'.format(assertions_uid)
+
+        response = self.client.get(path)
+        assert response.status_code == 200
+        assert json.loads(response.data.decode('utf-8')) == ASSERTIONS
+
+        response = self.client.get(path, query_string={
+            'offset': 10, 'limit': 5})
+        assert response.status_code == 200
+        assert response.headers['X-Total-Count'] == str(len(ASSERTIONS))
+        assert json.loads(response.data.decode('utf-8')) == ASSERTIONS[10:15]
+
+        for path in ('/testplan/123/assertions/123',
+                     '/testplan/123/assertions/..'):
+            assert self.client.get(path).status_code == 404
+
+    def test_testplan_assertions_caching(self):
+        """
+        Are assertions gzip compressed if accepted by the client and not sent
+        again if they have not changed.
+        """
+        skeleton = json.loads(self.client.get(
+            '/testplan/123/skeleton').data.decode('utf-8'))
+        assertions_uid = skeleton['entries'][0]['entries'][0]['assertions_uid']
+        path = '/testplan/123/assertions/{}'.format(assertions_uid)
+
+        response = self.client.get(
+            path, headers={'Accept-Encoding': 'gzip, deflate'})
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        data = gzip.GzipFile(fileobj=io.BytesIO(response.data)).read()
+        assert json.loads(data.decode('utf-8')) == ASSERTIONS
+
+        etag = response.headers['ETag']
+        response = self.client.get(path, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
 
     def test_testplan_attachment(self):
         """